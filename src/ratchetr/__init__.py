@@ -21,49 +21,56 @@ tracking.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from ratchetr.exceptions import (
     RatchetrError,
     RatchetrTypeError,
     RatchetrValidationError,
 )
+from ratchetr.lazy import lazy_exports
 
-from .api import (
-    AuditResult,
-    ManifestPayloadError,
-    ManifestValidationResult,
-    build_summary,
-    emit_dashboard_outputs,
-    load_manifest,
-    load_summary_from_manifest,
-    manifest_json_schema,
-    render_dashboard_summary,
-    render_html,
-    render_markdown,
-    run_audit,
-    validate_manifest_file,
-)
-from .config import AuditConfig, Config, load_config
-from .core.summary_types import SummaryData
-from .core.types import Diagnostic, RunResult
-from .manifest.typed import ToolSummary
-from .ratchet import (
-    apply_auto_update as ratchet_apply_auto_update,
-)
-from .ratchet import (
-    build_ratchet_from_manifest as ratchet_build,
-)
-from .ratchet import (
-    compare_manifest_to_ratchet as ratchet_compare,
-)
-from .ratchet import (
-    refresh_signatures as ratchet_refresh,
-)
+from ._version import __version__
+
+if TYPE_CHECKING:
+    from .api import (
+        AuditResult,
+        ManifestPayloadError,
+        ManifestValidationResult,
+        build_summary,
+        emit_dashboard_outputs,
+        load_manifest,
+        load_summary_from_manifest,
+        manifest_json_schema,
+        render_dashboard_summary,
+        render_html,
+        render_markdown,
+        run_audit,
+        validate_manifest_file,
+    )
+    from .config import AuditConfig, Config, load_config
+    from .core.summary_types import SummaryData
+    from .core.types import Diagnostic, DiagnosticTable, RunResult
+    from .manifest.typed import ToolSummary
+    from .ratchet import (
+        apply_auto_update as ratchet_apply_auto_update,
+    )
+    from .ratchet import (
+        build_ratchet_from_manifest as ratchet_build,
+    )
+    from .ratchet import (
+        compare_manifest_to_ratchet as ratchet_compare,
+    )
+    from .ratchet import (
+        refresh_signatures as ratchet_refresh,
+    )
 
 __all__ = [
     "AuditConfig",
     "AuditResult",
     "Config",
     "Diagnostic",
+    "DiagnosticTable",
     "ManifestPayloadError",
     "ManifestValidationResult",
     "RatchetrError",
@@ -90,4 +97,35 @@ __all__ = [
     "validate_manifest_file",
 ]
 
-__version__ = "0.1.0"
+# Exports resolve on first access, so `import ratchetr` (for `__version__`, the
+# exceptions, or engine plugins) does not load pydantic or the service stack.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AuditConfig": ".config",
+        "AuditResult": ".api",
+        "Config": ".config",
+        "Diagnostic": ".core.types",
+        "DiagnosticTable": ".core.types",
+        "ManifestPayloadError": ".api",
+        "ManifestValidationResult": ".api",
+        "RunResult": ".core.types",
+        "SummaryData": ".core.summary_types",
+        "ToolSummary": ".manifest.typed",
+        "build_summary": ".api",
+        "emit_dashboard_outputs": ".api",
+        "load_config": ".config",
+        "load_manifest": ".api",
+        "load_summary_from_manifest": ".api",
+        "manifest_json_schema": ".api",
+        "ratchet_apply_auto_update": ".ratchet:apply_auto_update",
+        "ratchet_build": ".ratchet:build_ratchet_from_manifest",
+        "ratchet_compare": ".ratchet:compare_manifest_to_ratchet",
+        "ratchet_refresh": ".ratchet:refresh_signatures",
+        "render_dashboard_summary": ".api",
+        "render_html": ".api",
+        "render_markdown": ".api",
+        "run_audit": ".api",
+        "validate_manifest_file": ".api",
+    },
+)
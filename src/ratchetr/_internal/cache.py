@@ -16,23 +16,43 @@
 
 from __future__ import annotations
 
+import bisect
 import hashlib
-import json
 import logging
+import mmap
+import multiprocessing
 import os
 import shutil
+import sys
+import threading
 from collections.abc import Iterable, Mapping, Sequence
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from functools import partial
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Final, Literal, cast
 
-from ratchetr._internal.utils import consume, file_lock
+from ratchetr._internal.cache_stores import (
+    CACHE_DIRNAME,
+    CacheStats,
+    CacheStore,
+    EntryPayload,
+    open_cache_store,
+)
 from ratchetr._internal.utils.process import CommandOutput, run_command
 from ratchetr.compat import TypedDict
 from ratchetr.config.validation import coerce_int, coerce_object_list, coerce_str_list
 from ratchetr.core.categories import coerce_category_key
-from ratchetr.core.model_types import LogComponent, SeverityLevel, clone_override_entries
+from ratchetr.core.model_types import (
+    CacheBackend,
+    FingerprintSource,
+    HashBackend,
+    LogComponent,
+    SeverityLevel,
+    clone_override_entries,
+)
 from ratchetr.core.type_aliases import (
     CacheKey,
     CategoryKey,
@@ -42,12 +62,14 @@ from ratchetr.core.type_aliases import (
     RelPath,
     ToolName,
 )
-from ratchetr.core.types import Diagnostic
-from ratchetr.json import JSONValue, normalise_enums_for_json
+from ratchetr.core.types import NO_RAW, Diagnostic
+from ratchetr.json import normalise_enums_for_json
 from ratchetr.logging import structured_extra
 from ratchetr.manifest.typed import ToolSummary
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     from ratchetr.core.model_types import (
         CategoryMapping,
         DiagnosticPayload,
@@ -55,12 +77,21 @@ if TYPE_CHECKING:
         Mode,
         OverrideEntry,
     )
+    from ratchetr.json import JSONValue
 
 
 logger: logging.Logger = logging.getLogger("ratchetr.cache")
-CACHE_DIRNAME: Final[str] = ".ratchetr_cache"
-CACHE_FILENAME: Final[str] = "cache.json"
 _HASH_WORKER_ENV: Final[str] = "RATCHETR_HASH_WORKERS"
+_PYTHON_SUFFIXES: Final[tuple[str, ...]] = (".py", ".pyi")
+_GIT_SUBMODULE_MODE: Final[str] = "160000"
+# Reads are sized to the file (within these bounds) so small files take a
+# single read call; files from the mmap threshold up are hashed in place.
+_MIN_READ_BUFFER: Final[int] = 64 * 1024
+_MAX_READ_BUFFER: Final[int] = 1024 * 1024
+_MMAP_THRESHOLD: Final[int] = 8 * 1024 * 1024
+# Below this many files a process pool costs more to start than it saves.
+_PROCESS_MIN_FILES: Final[int] = 512
+_PROCESS_BATCH_SIZE: Final[int] = 256
 
 
 def _default_list_str() -> list[str]:
@@ -137,6 +168,21 @@ class CachedRun:  # pylint: disable=too-many-instance-attributes
     tool_summary: ToolSummary | None = None
 
 
+@dataclass(slots=True)
+class StaleCachedRun:
+    """Cached run whose file fingerprints only partially match the current set.
+
+    Attributes:
+        run: Materialised cached run recorded against the previous fingerprints.
+        changed: Files that were added or whose fingerprint changed.
+        removed: Files present in the cached fingerprints but no longer hashed.
+    """
+
+    run: CachedRun
+    changed: list[PathKey]
+    removed: list[PathKey]
+
+
 def _resolve_hash_workers() -> int:
     raw = os.getenv(_HASH_WORKER_ENV)
     if raw is None:
@@ -175,18 +221,63 @@ def _effective_hash_workers(value: int | Literal["auto"] | None) -> int:
     return max(0, value)
 
 
+def _fingerprint_batch(
+    fingerprint: Callable[[Path], FileHashPayload],
+    paths: Sequence[str],
+) -> list[FileHashPayload]:
+    return [fingerprint(Path(path)) for path in paths]
+
+
+def _compute_hashes_in_processes(
+    pending: Sequence[tuple[PathKey, Path]],
+    workers: int,
+    fingerprint: Callable[[Path], FileHashPayload],
+) -> dict[PathKey, FileHashPayload] | None:
+    # Several batches per worker keep the pool busy while each task still
+    # amortises pickling over many paths.
+    batch_size = max(1, min(_PROCESS_BATCH_SIZE, -(-len(pending) // (workers * 4))))
+    batches = [pending[start : start + batch_size] for start in range(0, len(pending), batch_size)]
+    # forkserver/spawn avoid forking while engine threads hold locks.
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    hashes: dict[PathKey, FileHashPayload] = {}
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            results = executor.map(
+                partial(_fingerprint_batch, fingerprint),
+                [[str(path) for _key, path in batch] for batch in batches],
+            )
+            for batch, payloads in zip(batches, results, strict=True):
+                hashes.update((key, payload) for (key, _path), payload in zip(batch, payloads, strict=True))
+    except (OSError, NotImplementedError, BrokenProcessPool) as exc:
+        logger.warning(
+            "Process hashing unavailable (%s); falling back to threads",
+            exc,
+            extra=structured_extra(component=LogComponent.CACHE),
+        )
+        return None
+    return hashes
+
+
 def _compute_hashes(
     pending: Sequence[tuple[PathKey, Path]],
     workers: int,
+    fingerprint: Callable[[Path], FileHashPayload] | None = None,
+    backend: HashBackend | None = None,
 ) -> dict[PathKey, FileHashPayload]:
     if not pending:
         return {}
+    fingerprint_fn = fingerprint or _fingerprint
     if workers <= 1:
-        return {key: _fingerprint(path) for key, path in pending}
+        return {key: fingerprint_fn(path) for key, path in pending}
+    if backend is HashBackend.PROCESS and len(pending) >= _PROCESS_MIN_FILES:
+        hashes_from_processes = _compute_hashes_in_processes(pending, workers, fingerprint_fn)
+        if hashes_from_processes is not None:
+            return hashes_from_processes
     hashes: dict[PathKey, FileHashPayload] = {}
     max_workers = workers
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_map = {executor.submit(_fingerprint, path): key for key, path in pending}
+        future_map = {executor.submit(fingerprint_fn, path): key for key, path in pending}
         for future in as_completed(future_map):
             key = future_map[future]
             hashes[key] = future.result()
@@ -304,8 +395,20 @@ class _EntryJson(TypedDict, total=False):
     tool_summary: dict[str, int]
 
 
-class _Payload(TypedDict, total=False):
-    entries: dict[str, _EntryJson]
+def _diagnostic_payload(diag: Diagnostic) -> DiagnosticPayload:
+    payload: DiagnosticPayload = {
+        "tool": diag.tool,
+        "severity": diag.severity.value,
+        "path": str(diag.path),
+        "line": diag.line,
+        "column": diag.column,
+        "code": diag.code,
+        "message": diag.message,
+    }
+    # Payloads trimmed away by the raw-retention policy are not persisted at all.
+    if diag.raw:
+        payload["raw"] = dict(diag.raw)
+    return payload
 
 
 def fingerprint_path(path: Path) -> FileHashPayload:
@@ -389,67 +492,112 @@ def _parse_cache_entry(  # noqa: PLR0914, FIX002, TD003  # TODO@PantherianCodeX:
     return cache_key, cache_entry
 
 
+def _serialise_entry(entry: CacheEntry) -> EntryPayload:
+    payload = {
+        "command": entry.command,
+        "exit_code": entry.exit_code,
+        "duration_ms": entry.duration_ms,
+        "diagnostics": entry.diagnostics,
+        "file_hashes": {str(path_key): payload for path_key, payload in entry.file_hashes.items()},
+        "profile": entry.profile,
+        "config_file": entry.config_file,
+        "plugin_args": entry.plugin_args,
+        "include": entry.include,
+        "exclude": entry.exclude,
+        "overrides": clone_override_entries(entry.overrides),
+        "category_mapping": entry.category_mapping,
+        "tool_summary": entry.tool_summary,
+    }
+    return cast("EntryPayload", normalise_enums_for_json(payload))
+
+
+def read_cache_entries(
+    project_root: Path,
+    backend: CacheBackend = CacheBackend.JSON,
+) -> dict[str, EntryPayload]:
+    """Return every cached entry payload for ``backend`` in JSON-compatible form.
+
+    Args:
+        project_root: Project root hosting ``.ratchetr_cache``.
+        backend: Storage backend to read.
+
+    Returns:
+        Mapping of cache keys to entry payloads, sorted by key.
+    """
+    store = open_cache_store(project_root / CACHE_DIRNAME, backend)
+    return dict(sorted(store.read_all().items()))
+
+
+def cache_stats(project_root: Path, backend: CacheBackend = CacheBackend.JSON) -> CacheStats:
+    """Return entry, file-hash, diagnostic, and size counts for ``backend``.
+
+    Args:
+        project_root: Project root hosting ``.ratchetr_cache``.
+        backend: Storage backend to inspect.
+
+    Returns:
+        `CacheStats`describing the on-disk cache.
+    """
+    return open_cache_store(project_root / CACHE_DIRNAME, backend).stats()
+
+
 class EngineCache:
-    """In-memory representation of the on-disk engine cache."""
+    """In-memory representation of the on-disk engine cache.
 
-    def __init__(self, project_root: Path) -> None:
+    Persistence is delegated to a `CacheStore`: the default JSON backend is
+    loaded eagerly, while incremental backends (such as ``sharded``) read
+    entries lazily on first access and only write entries that changed.
+
+    Instances are safe to share between threads; entry reads, writes, and
+    persistence are serialised through an internal re-entrant lock.
+    """
+
+    def __init__(self, project_root: Path, *, backend: CacheBackend = CacheBackend.JSON) -> None:
         super().__init__()
         self.project_root = project_root
-        self.path: Path = project_root / CACHE_DIRNAME / CACHE_FILENAME
+        self.backend = backend
+        self._store: CacheStore = open_cache_store(project_root / CACHE_DIRNAME, backend)
+        self.path: Path = self._store.location
         self._entries: dict[CacheKey, CacheEntry] = {}
-        self._dirty = False
+        self._missing: set[CacheKey] = set()
+        self._dirty_keys: set[CacheKey] = set()
+        self._lock = threading.RLock()
         self._load()
 
     def _load(self) -> None:
-        if not self.path.exists():
-            return
-        try:
-            raw = json.loads(self.path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+        if self._store.incremental:
             return
-
-        payload = cast("_Payload", raw)
-        payload_entries = payload.get("entries")
-        entries: dict[str, _EntryJson] = payload_entries or {}
-        for key_str, entry in entries.items():
-            parsed = _parse_cache_entry(key_str, entry)
+        for key_str, entry in self._store.read_all().items():
+            parsed = _parse_cache_entry(key_str, cast("_EntryJson", entry))
             if parsed is None:
                 continue
             cache_key, cache_entry = parsed
             self._entries[cache_key] = cache_entry
 
+    def _lookup(self, key: CacheKey) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None or not self._store.incremental or key in self._missing:
+                return entry
+            payload = self._store.read(str(key))
+            parsed = _parse_cache_entry(str(key), cast("_EntryJson", payload)) if payload is not None else None
+            if parsed is None:
+                self._missing.add(key)
+                return None
+            self._entries[key] = parsed[1]
+            return parsed[1]
+
     def save(self) -> None:
         """Persist cache changes to disk if modified."""
-        if not self._dirty:
-            return
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {
-            "entries": {
-                str(key): {
-                    "command": entry.command,
-                    "exit_code": entry.exit_code,
-                    "duration_ms": entry.duration_ms,
-                    "diagnostics": entry.diagnostics,
-                    "file_hashes": {str(path_key): payload for path_key, payload in entry.file_hashes.items()},
-                    "profile": entry.profile,
-                    "config_file": entry.config_file,
-                    "plugin_args": entry.plugin_args,
-                    "include": entry.include,
-                    "exclude": entry.exclude,
-                    "overrides": clone_override_entries(entry.overrides),
-                    "category_mapping": entry.category_mapping,
-                    "tool_summary": entry.tool_summary,
-                }
-                for key, entry in sorted(self._entries.items())
-            },
-        }
-        payload_json = normalise_enums_for_json(payload)
-        lock_path = self.path.with_suffix(self.path.suffix + ".lock")
-        tmp_path = self.path.with_suffix(".tmp")
-        with file_lock(lock_path):
-            consume(tmp_path.write_text(json.dumps(payload_json, indent=2) + "\n", encoding="utf-8"))
-            consume(tmp_path.replace(self.path))
-        self._dirty = False
+        with self._lock:
+            if not self._dirty_keys:
+                return
+            if self._store.incremental:
+                payloads = {str(key): _serialise_entry(self._entries[key]) for key in sorted(self._dirty_keys)}
+            else:
+                payloads = {str(key): _serialise_entry(entry) for key, entry in sorted(self._entries.items())}
+            self._store.write(payloads)
+            self._dirty_keys.clear()
 
     def peek_file_hashes(self, key: CacheKey) -> dict[PathKey, FileHashPayload] | None:
         """Return file-hash payloads for a cache entry without validation.
@@ -460,7 +608,7 @@ class EngineCache:
         Returns:
             Mapping of relative paths to file hash payloads, or `None`if not cached.
         """
-        entry = self._entries.get(key)
+        entry = self._lookup(key)
         if not entry:
             return None
         return {path_key: cast("FileHashPayload", dict(payload)) for path_key, payload in entry.file_hashes.items()}
@@ -497,13 +645,36 @@ class EngineCache:
         Returns:
             `CachedRun`when a matching entry exists, otherwise ``None``.
         """
-        entry = self._entries.get(key)
+        entry = self._lookup(key)
         if not entry:
             return None
         if entry.file_hashes != file_hashes:
             return None
+        return self._materialise(entry)
+
+    def get_stale(self, key: CacheKey, file_hashes: dict[PathKey, FileHashPayload]) -> StaleCachedRun | None:
+        """Return a cached run together with the files whose fingerprints differ.
 
+        Args:
+            key: Cache key representing the engine invocation.
+            file_hashes: Hash payloads for the current file set.
+
+        Returns:
+            `StaleCachedRun`when an entry exists for ``key``, otherwise ``None``.
+            Exact matches are reported with empty ``changed``/``removed`` lists.
+        """
+        entry = self._lookup(key)
+        if not entry:
+            return None
+        changed = [path_key for path_key, payload in file_hashes.items() if entry.file_hashes.get(path_key) != payload]
+        removed = [path_key for path_key in entry.file_hashes if path_key not in file_hashes]
+        return StaleCachedRun(run=self._materialise(entry), changed=sorted(changed), removed=sorted(removed))
+
+    @staticmethod
+    def _materialise(entry: CacheEntry) -> CachedRun:
         diagnostics: list[Diagnostic] = []
+        # Diagnostics in one file share a single Path; messages are interned.
+        paths: dict[str, Path] = {}
         for raw in entry.diagnostics:
             path_val = raw.get("path")
             if not isinstance(path_val, str):
@@ -523,20 +694,22 @@ class EngineCache:
             code_val = raw.get("code")
             code_str = str(code_val) if isinstance(code_val, str) else None
             raw_val = raw.get("raw")
-            if isinstance(raw_val, Mapping):
-                raw_dict: dict[str, JSONValue] = {str(k): v for k, v in raw_val.items()}
-            else:
-                raw_dict = {}
+            raw_dict: Mapping[str, JSONValue] = (
+                {str(k): v for k, v in raw_val.items()} if isinstance(raw_val, Mapping) and raw_val else NO_RAW
+            )
+            path = paths.get(path_val)
+            if path is None:
+                path = paths[path_val] = Path(path_val)
 
             diagnostics.append(
                 Diagnostic(
                     tool=ToolName(str(raw.get("tool", ""))),
                     severity=SeverityLevel.coerce(raw.get("severity") or "error"),
-                    path=Path(path_val),
+                    path=path,
                     line=line_num,
                     column=col_num,
-                    code=code_str,
-                    message=str(raw.get("message", "")),
+                    code=sys.intern(code_str) if code_str else code_str,
+                    message=sys.intern(str(raw.get("message", ""))),
                     raw=raw_dict,
                 ),
             )
@@ -604,26 +777,11 @@ class EngineCache:
         include_list: list[RelPath] = [RelPath(str(path)) for path in include]
         exclude_list: list[RelPath] = [RelPath(str(path)) for path in exclude]
 
-        self._entries[key] = CacheEntry(
+        entry = CacheEntry(
             command=command_list,
             exit_code=exit_code,
             duration_ms=duration_ms,
-            diagnostics=[
-                cast(
-                    "DiagnosticPayload",
-                    {
-                        "tool": diag.tool,
-                        "severity": diag.severity.value,
-                        "path": str(diag.path),
-                        "line": diag.line,
-                        "column": diag.column,
-                        "code": diag.code,
-                        "message": diag.message,
-                        "raw": diag.raw,
-                    },
-                )
-                for diag in canonical_diags
-            ],
+            diagnostics=[_diagnostic_payload(diag) for diag in canonical_diags],
             file_hashes=file_hash_payloads,
             profile=profile,
             config_file=config_file.as_posix() if config_file else None,
@@ -643,7 +801,10 @@ class EngineCache:
                 else None
             ),
         )
-        self._dirty = True
+        with self._lock:
+            self._entries[key] = entry
+            self._missing.discard(key)
+            self._dirty_keys.add(key)
 
 
 def _git_repo_root(path: Path) -> Path | None:
@@ -688,8 +849,264 @@ def _git_list_files(repo_root: Path) -> set[str]:
     return {line.strip() for line in result.stdout.splitlines() if line.strip()}
 
 
+@dataclass(slots=True, frozen=True)
+class _GitIndexSnapshot:
+    """Project-relative view of the git index.
+
+    Attributes:
+        blobs: Blob ids of tracked files whose working copy matches the index.
+        local: Dirty, conflicted, or untracked files that must be hashed locally.
+    """
+
+    blobs: dict[str, str]
+    local: frozenset[str]
+
+
+def _run_git(git_cmd: str, repo_root: Path, *args: str) -> str | None:
+    try:
+        result = run_command([git_cmd, *args], cwd=repo_root, allowed={git_cmd})
+    # ignore JUSTIFIED: defensive handling for invalid argv/allowlist
+    except (TypeError, ValueError) as exc:  # pragma: no cover
+        logger.debug(
+            "git %s failed: %s",
+            args[0],
+            exc,
+            extra=structured_extra(component=LogComponent.CACHE),
+        )
+        return None
+    return None if result.exit_code else result.stdout
+
+
+def _git_index_queries(repo_root: Path) -> tuple[str, str, str] | None:
+    git_cmd = shutil.which("git")
+    if git_cmd is None:
+        return None
+    queries = (
+        ("ls-files", "--stage", "-z"),
+        ("diff", "--name-only", "--no-renames", "-z"),
+        ("ls-files", "--others", "--exclude-standard", "-z"),
+    )
+
+    def run(args: tuple[str, ...]) -> str | None:
+        """Run one git query.
+
+        Returns:
+            Standard output, or `None` when the query failed.
+        """
+        return _run_git(git_cmd, repo_root, *args)
+
+    # The queries are independent; running them together hides git's stat walks.
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        staged, dirty, untracked = executor.map(run, queries)
+    if staged is None or dirty is None or untracked is None:
+        return None
+    return staged, dirty, untracked
+
+
+def _parse_git_stage(staged: str, prefix: str, dirty_paths: set[str]) -> tuple[dict[str, str], set[str]]:
+    blobs: dict[str, str] = {}
+    local: set[str] = set()
+    for record in staged.split("\0"):
+        meta, _, repo_path = record.partition("\t")
+        try:
+            file_mode, blob, stage = meta.split(" ")
+        except ValueError:
+            continue
+        if not repo_path.startswith(prefix) or file_mode == _GIT_SUBMODULE_MODE:
+            continue
+        key = repo_path[len(prefix) :]
+        if stage != "0" or repo_path in dirty_paths:
+            local.add(key)
+        else:
+            blobs[key] = blob
+    return blobs, local
+
+
+def _git_index_snapshot(repo_root: Path, project_root: Path) -> _GitIndexSnapshot | None:
+    try:
+        relative_root = project_root.relative_to(repo_root).as_posix()
+    except ValueError:
+        return None
+    outputs = _git_index_queries(repo_root)
+    if outputs is None:
+        return None
+    staged, dirty, untracked = outputs
+    prefix = "" if relative_root == "." else f"{relative_root}/"
+    blobs, local = _parse_git_stage(staged, prefix, set(dirty.split("\0")))
+    local.update(path[len(prefix) :] for path in untracked.split("\0") if path and path.startswith(prefix))
+    return _GitIndexSnapshot(blobs=blobs, local=frozenset(local))
+
+
+def _select_git_keys(known: Sequence[str], rel: str) -> list[str]:
+    if rel == ".":
+        return [key for key in known if key.endswith(_PYTHON_SUFFIXES)]
+    prefix = f"{rel}/"
+    start = bisect.bisect_left(known, prefix)
+    selected: list[str] = []
+    for key in known[start:]:
+        if not key.startswith(prefix):
+            break
+        if key.endswith(_PYTHON_SUFFIXES):
+            selected.append(key)
+    return selected
+
+
+def _git_candidates(
+    project_root: Path,
+    paths: Iterable[str],
+    known: Sequence[str],
+) -> list[tuple[PathKey, Path | None]]:
+    known_set = set(known)
+    selected: set[str] = set()
+    outside: list[Path] = []
+    for path_str in sorted({path for path in paths if path}):
+        raw_path = Path(path_str)
+        absolute = (raw_path if raw_path.is_absolute() else project_root / raw_path).resolve()
+        try:
+            rel = absolute.relative_to(project_root).as_posix()
+        except ValueError:
+            rel = None
+        if rel is not None and rel in known_set:
+            selected.add(rel)
+        elif rel is not None and (matched := _select_git_keys(known, rel)):
+            selected.update(matched)
+        elif absolute.is_file():
+            # Explicit files git does not know about (ignored or outside the repo).
+            outside.append(absolute)
+    # Paths are only built for files that are hashed locally; clean tracked files
+    # never touch the filesystem.
+    candidates: list[tuple[PathKey, Path | None]] = [(PathKey(key), None) for key in selected]
+    candidates.extend((_relative_key(project_root, path), path) for path in outside)
+    candidates.sort(key=itemgetter(0))
+    return candidates
+
+
+def _collect_git_hashes(
+    project_root: Path,
+    paths: Iterable[str],
+    *,
+    max_files: int | None,
+    bytes_budget: int | None,
+    worker_count: int,
+    backend: HashBackend | None,
+) -> tuple[dict[PathKey, FileHashPayload], bool] | None:
+    repo_root = _git_repo_root(project_root)
+    snapshot = _git_index_snapshot(repo_root, project_root) if repo_root is not None else None
+    if snapshot is None:
+        return None
+    candidates = _git_candidates(project_root, paths, sorted({*snapshot.blobs, *snapshot.local}))
+    truncated = max_files is not None and len(candidates) > max_files
+    if max_files is not None:
+        candidates = candidates[:max_files]
+
+    hashes: dict[PathKey, FileHashPayload] = {}
+    pending: list[tuple[PathKey, Path]] = []
+    bytes_seen = 0
+    for key, candidate in candidates:
+        blob = snapshot.blobs.get(key) if candidate is None else None
+        if blob is not None:
+            hashes[key] = {"hash": blob}
+            continue
+        file_path = candidate or project_root / key
+        if bytes_budget is not None:
+            try:
+                size = file_path.stat().st_size
+            except OSError:
+                size = 0
+            if bytes_seen + size > bytes_budget:
+                truncated = True
+                break
+            bytes_seen += size
+        pending.append((key, file_path))
+    local_hashes = _compute_hashes(pending, worker_count, _git_blob_fingerprint, backend)
+    hashes.update((key, payload) for key, payload in local_hashes.items() if not payload.get("missing"))
+    return dict(sorted(hashes.items())), truncated
+
+
+def _changed_scope(project_root: Path, paths: Iterable[str]) -> tuple[list[str], set[str]] | None:
+    directories: list[str] = []
+    files: set[str] = set()
+    for path_str in sorted({path for path in paths if path}):
+        raw_path = Path(path_str)
+        absolute = (raw_path if raw_path.is_absolute() else project_root / raw_path).resolve()
+        try:
+            rel = absolute.relative_to(project_root).as_posix()
+        except ValueError:
+            return None
+        if absolute.is_dir():
+            directories.append("" if rel == "." else rel)
+        elif absolute.is_file():
+            files.add(rel)
+    return directories, files
+
+
+def _expand_changed(
+    project_root: Path,
+    changed: Iterable[str],
+    known: Sequence[str],
+    in_scope: Callable[[str], bool],
+) -> set[str]:
+    dirty: set[str] = set()
+    for rel in changed:
+        # A changed directory (moved, deleted, or created) invalidates everything below it.
+        prefix = f"{rel}/"
+        for key in known[bisect.bisect_left(known, prefix) :]:
+            if not key.startswith(prefix):
+                break
+            dirty.add(key)
+        absolute = project_root / rel
+        if absolute.is_dir() and not absolute.is_symlink():
+            for key, entry in _scan_python_files(absolute, f"{rel}/"):
+                resolved = str(_relative_key(project_root, Path(entry.path))) if entry.is_symlink() else key
+                if in_scope(resolved):
+                    dirty.add(resolved)
+        elif in_scope(rel) or rel in known:
+            dirty.add(rel)
+    return dirty
+
+
+def _collect_changed_hashes(
+    project_root: Path,
+    paths: Iterable[str],
+    *,
+    baseline: Mapping[PathKey, FileHashPayload],
+    changed: Iterable[str],
+    allowed_project_files: set[str] | None,
+    worker_count: int,
+    backend: HashBackend | None,
+) -> dict[PathKey, FileHashPayload] | None:
+    scope = _changed_scope(project_root, paths)
+    if scope is None:
+        return None
+    directories, files = scope
+
+    def in_scope(key: str) -> bool:
+        """Return whether ``key`` is one of the changed files or under a changed directory.
+
+        Returns:
+            `True` when ``key`` must be re-fingerprinted.
+        """
+        if key in files:
+            return True
+        return key.endswith(_PYTHON_SUFFIXES) and any(
+            not directory or key.startswith(f"{directory}/") for directory in directories
+        )
+
+    hashes = {key: payload for key, payload in baseline.items() if in_scope(key)}
+    dirty = files - hashes.keys()
+    dirty.update(_expand_changed(project_root, changed, sorted(hashes), in_scope))
+    if allowed_project_files is not None:
+        dirty = {key for key in dirty if key in hashes or key in allowed_project_files}
+    for key in dirty:
+        _ = hashes.pop(PathKey(key), None)
+    pending = [(PathKey(key), project_root / key) for key in sorted(dirty)]
+    fresh = _compute_hashes(pending, worker_count, backend=backend)
+    hashes.update((key, payload) for key, payload in fresh.items() if not payload.get("missing"))
+    return dict(sorted(hashes.items(), key=lambda item: str(item[0])))
+
+
 # ignore JUSTIFIED: hashing pipeline coordinates limits/baselines; extraction planned
-def collect_file_hashes(  # noqa: C901, PLR0912, PLR0914, PLR0915, FIX002, TD003  # pylint: disable=confusing-consecutive-elif  # TODO@PantherianCodeX: Extract git/file handling into helpers to shrink locals
+def collect_file_hashes(  # noqa: C901, PLR0912, PLR0913, PLR0914, PLR0915, FIX002, TD003  # pylint: disable=confusing-consecutive-elif  # TODO@PantherianCodeX: Extract git/file handling into helpers to shrink locals
     project_root: Path,
     paths: Iterable[str],
     *,
@@ -698,9 +1115,22 @@ def collect_file_hashes(  # noqa: C901, PLR0912, PLR0914, PLR0915, FIX002, TD003
     baseline: dict[PathKey, FileHashPayload] | None = None,
     max_bytes: int | None = None,
     hash_workers: int | Literal["auto"] | None = None,
+    fingerprint_source: FingerprintSource | None = None,
+    hash_backend: HashBackend | None = None,
+    changed_paths: Iterable[str] | None = None,
 ) -> tuple[dict[PathKey, FileHashPayload], bool]:
     """Collect file hash payloads for a set of project paths.
 
+    With ``fingerprint_source`` set to `FingerprintSource.GIT`, files are listed
+    from the git index instead of walking the filesystem (ignored files are
+    therefore skipped), clean tracked files reuse their index blob ids, and only
+    dirty or untracked files are read. Outside a usable git checkout the
+    filesystem walk is used instead.
+
+    With ``changed_paths`` (as reported by ``ratchetr watch``) and a
+    ``baseline``, the walk is skipped: baseline entries are kept and only the
+    changed paths, and anything below changed directories, are re-fingerprinted.
+
     Args:
         project_root: Repository root used to resolve relative paths.
         paths: Paths to hash (relative to ``project_root``).
@@ -708,7 +1138,11 @@ def collect_file_hashes(  # noqa: C901, PLR0912, PLR0914, PLR0915, FIX002, TD003
         max_files: Optional limit on the number of files to hash.
         baseline: Optional baseline hashes to reuse when unchanged.
         max_bytes: Optional byte budget for hashing; exceeding sets truncated flag.
-        hash_workers: Thread worker count or `"auto"`for CPU-based selection.
+        hash_workers: Worker count or `"auto"`for CPU-based selection.
+        fingerprint_source: Where fingerprints come from (filesystem when unset).
+        hash_backend: Executor used for hashing (threads when unset).
+        changed_paths: Project-relative paths changed since ``baseline`` was
+            collected; ignored when file or byte limits apply.
 
     Returns:
         Tuple of (hash mapping, truncated flag) where the flag is `True`when
@@ -717,40 +1151,64 @@ def collect_file_hashes(  # noqa: C901, PLR0912, PLR0914, PLR0915, FIX002, TD003
     hashes: dict[PathKey, FileHashPayload] = {}
     seen: set[PathKey] = set()
     project_root = project_root.resolve()
+    worker_count = _effective_hash_workers(hash_workers)
+    bytes_budget = max_bytes if isinstance(max_bytes, int) and max_bytes >= 0 else None
+    if fingerprint_source is FingerprintSource.GIT:
+        collected = _collect_git_hashes(
+            project_root,
+            paths,
+            max_files=max_files,
+            bytes_budget=bytes_budget,
+            worker_count=worker_count,
+            backend=hash_backend,
+        )
+        if collected is not None:
+            return collected
+        logger.debug(
+            "git index unavailable for %s; fingerprinting from the filesystem",
+            project_root,
+            extra=structured_extra(component=LogComponent.CACHE, path=project_root),
+        )
     allowed_project_files: set[str] | None = None
     if respect_gitignore:
         repo_root = _git_repo_root(project_root)
         if repo_root:
             git_files = _git_list_files(repo_root)
             if git_files:
-                allowed_project_files = set()
-                for rel_path in git_files:
-                    abs_path = (repo_root / rel_path).resolve()
-                    try:
-                        rel_to_project = abs_path.relative_to(project_root)
-                    except ValueError:
-                        continue
-                    allowed_project_files.add(rel_to_project.as_posix())
+                # Both roots are resolved, so git paths map onto keys lexically.
+                prefix = _key_prefix(repo_root, project_root)
+                allowed_project_files = {
+                    rel_path[len(prefix) :] for rel_path in git_files if rel_path.startswith(prefix)
+                }
+    if changed_paths is not None and baseline is not None and max_files is None and bytes_budget is None:
+        changed_hashes = _collect_changed_hashes(
+            project_root,
+            paths,
+            baseline=baseline,
+            changed=changed_paths,
+            allowed_project_files=allowed_project_files,
+            worker_count=worker_count,
+            backend=hash_backend,
+        )
+        if changed_hashes is not None:
+            return changed_hashes, False
     truncated = False
-    bytes_budget = max_bytes if isinstance(max_bytes, int) and max_bytes >= 0 else None
     bytes_seen = 0
     pending: list[tuple[PathKey, Path]] = []
     stop = False
-    worker_count = _effective_hash_workers(hash_workers)
 
     # ignore JUSTIFIED: helper must coordinate conditions and early exits; further
     # extraction would hurt readability
-    def _maybe_add(file_path: Path) -> None:  # noqa: C901
+    def _maybe_add(key: PathKey, file_path: str, entry: os.DirEntry[str] | None = None) -> None:  # noqa: C901
         nonlocal truncated, bytes_seen, stop
         if stop:
             return
-        key = _relative_key(project_root, file_path)
         if key in seen:
             return
         if allowed_project_files is not None and str(key) not in allowed_project_files:
             return
         try:
-            st = file_path.stat()
+            st = entry.stat() if entry is not None else Path(file_path).stat()
         except FileNotFoundError:
             st = None
         if baseline is not None and st is not None and key in baseline:
@@ -780,7 +1238,7 @@ def collect_file_hashes(  # noqa: C901, PLR0912, PLR0914, PLR0915, FIX002, TD003
                 return
             bytes_seen += size
         seen.add(key)
-        pending.append((key, file_path))
+        pending.append((key, Path(file_path)))
         if max_files is not None and len(seen) >= max_files:
             truncated = True
             stop = True
@@ -790,24 +1248,22 @@ def collect_file_hashes(  # noqa: C901, PLR0912, PLR0914, PLR0915, FIX002, TD003
         absolute = raw_path if raw_path.is_absolute() else (project_root / raw_path)
         absolute = absolute.resolve()
         if absolute.is_dir():
-            for root, dirs, files in os.walk(absolute, followlinks=False):
-                dirs[:] = sorted(d for d in dirs if not (Path(root) / d).is_symlink())
-                for fname in sorted(files):
-                    if not fname.endswith((".py", ".pyi")):
-                        continue
-                    _maybe_add(Path(root) / fname)
-                    if stop:
-                        break
+            for key, entry in _scan_python_files(absolute, _key_prefix(project_root, absolute)):
+                if entry.is_symlink():
+                    # Linked files are keyed by their target, as explicit paths are.
+                    _maybe_add(_relative_key(project_root, Path(entry.path)), entry.path)
+                else:
+                    _maybe_add(PathKey(key), entry.path, entry)
                 if stop:
                     break
             if stop:
                 break
         elif absolute.is_file():
-            _maybe_add(absolute)
+            _maybe_add(_relative_key(project_root, absolute), str(absolute))
             if stop:
                 break
 
-    new_hashes = _compute_hashes(pending, worker_count)
+    new_hashes = _compute_hashes(pending, worker_count, backend=hash_backend)
     hashes.update(new_hashes)
     ordered_hashes: dict[PathKey, FileHashPayload] = dict(
         sorted(hashes.items(), key=lambda item: str(item[0])),
@@ -815,6 +1271,42 @@ def collect_file_hashes(  # noqa: C901, PLR0912, PLR0914, PLR0915, FIX002, TD003
     return (ordered_hashes, truncated)
 
 
+def _key_prefix(project_root: Path, directory: Path) -> str:
+    try:
+        rel = directory.relative_to(project_root).as_posix()
+    except ValueError:
+        return f"{directory.as_posix().rstrip('/')}/"
+    return "" if rel == "." else f"{rel}/"
+
+
+def _scan_python_files(top: Path, prefix: str) -> Iterator[tuple[str, os.DirEntry[str]]]:
+    """Yield ``(key, entry)`` for Python files below ``top`` in ``os.walk`` order.
+
+    Keys are built by appending names to ``prefix`` instead of resolving each
+    path. Directory symlinks are not followed; file symlinks are yielded with
+    their link path so callers can resolve them.
+    """
+    stack: list[tuple[str, str]] = [(os.fspath(top), prefix)]
+    while stack:
+        directory, rel = stack.pop()
+        try:
+            with os.scandir(directory) as scanner:
+                entries = sorted(scanner, key=attrgetter("name"))
+        except OSError:
+            continue
+        subdirs: list[tuple[str, str]] = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir and not entry.is_symlink():
+                subdirs.append((entry.path, f"{rel}{entry.name}/"))
+            elif not is_dir and entry.name.endswith(_PYTHON_SUFFIXES):
+                yield f"{rel}{entry.name}", entry
+        stack.extend(reversed(subdirs))
+
+
 def _relative_key(project_root: Path, path: Path) -> PathKey:
     try:
         return PathKey(path.resolve().relative_to(project_root).as_posix())
@@ -822,15 +1314,26 @@ def _relative_key(project_root: Path, path: Path) -> PathKey:
         return PathKey(path.resolve().as_posix())
 
 
+def _hash_stream(path: Path, size: int, update: Callable[[bytes | mmap.mmap], object]) -> None:
+    with path.open("rb", buffering=0) as handle:
+        if size >= _MMAP_THRESHOLD:
+            try:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    _ = update(mapped)
+            except (OSError, ValueError):
+                pass
+            else:
+                return
+        buffer_size = min(max(size + 1, _MIN_READ_BUFFER), _MAX_READ_BUFFER)
+        for chunk in iter(partial(handle.read, buffer_size), b""):
+            _ = update(chunk)
+
+
 def _fingerprint(path: Path) -> FileHashPayload:
     try:
         stat = path.stat()
         hasher = hashlib.blake2b(digest_size=16)
-        with path.open("rb") as handle:
-            for chunk in iter(lambda: handle.read(8192), b""):
-                if not chunk:
-                    break
-                hasher.update(chunk)
+        _hash_stream(path, stat.st_size, hasher.update)
         return {
             "hash": hasher.hexdigest(),
             "mtime": int(stat.st_mtime_ns),
@@ -840,3 +1343,17 @@ def _fingerprint(path: Path) -> FileHashPayload:
         return {"missing": True}
     except OSError:
         return {"unreadable": True}
+
+
+def _git_blob_fingerprint(path: Path) -> FileHashPayload:
+    # Same digest as ``git hash-object`` so locally hashed files stay stable
+    # once they are committed and start reusing the index blob id.
+    try:
+        size = path.stat().st_size
+        hasher = hashlib.sha1(f"blob {size}\0".encode(), usedforsecurity=False)
+        _hash_stream(path, size, hasher.update)
+    except FileNotFoundError:
+        return {"missing": True}
+    except OSError:
+        return {"unreadable": True}
+    return {"hash": hasher.hexdigest()}
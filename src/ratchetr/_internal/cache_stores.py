@@ -0,0 +1,537 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Storage backends for the engine cache.
+
+Stores only deal with cache keys and JSON-compatible entry payloads; parsing
+and normalisation of entries stays in `ratchetr._internal.cache`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import zlib
+from contextlib import closing
+from typing import TYPE_CHECKING, Final, Protocol, cast
+
+from ratchetr._internal.utils import consume, file_lock
+from ratchetr.compat import TypedDict
+from ratchetr.core.model_types import CacheBackend, LogComponent
+from ratchetr.logging import structured_extra
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from pathlib import Path
+
+    from ratchetr.json import JSONValue
+
+logger: logging.Logger = logging.getLogger("ratchetr.cache")
+
+CACHE_DIRNAME: Final[str] = ".ratchetr_cache"
+CACHE_FILENAME: Final[str] = "cache.json"
+SHARD_DIRNAME: Final[str] = "shards"
+SHARD_SUFFIX: Final[str] = ".bin"
+SQLITE_FILENAME: Final[str] = "cache.sqlite3"
+_SHARD_MAGIC: Final[bytes] = b"RTCS1\n"
+_SQLITE_TIMEOUT_SECONDS: Final[float] = 30.0
+# Entry fields stored as JSON text; scalar fields use typed columns.
+_SQLITE_JSON_COLUMNS: Final[tuple[str, ...]] = (
+    "command",
+    "plugin_args",
+    "include",
+    "exclude",
+    "overrides",
+    "category_mapping",
+    "tool_summary",
+)
+_SQLITE_ENTRY_COLUMNS: Final[tuple[str, ...]] = (
+    "exit_code",
+    "duration_ms",
+    "profile",
+    "config_file",
+    *_SQLITE_JSON_COLUMNS,
+)
+# ignore JUSTIFIED: column names come from the constant tuple above, never from input
+_SQLITE_SELECT_ENTRY: Final[str] = f"SELECT {', '.join(_SQLITE_ENTRY_COLUMNS)} FROM entries WHERE key = ?"  # noqa: S608
+_SQLITE_UPSERT_ENTRY: Final[str] = (
+    # ignore JUSTIFIED: column names come from the constant tuple above, never from input
+    f"INSERT INTO entries (key, {', '.join(_SQLITE_ENTRY_COLUMNS)}) "  # noqa: S608
+    f"VALUES (?, {', '.join('?' for _ in _SQLITE_ENTRY_COLUMNS)}) "
+    "ON CONFLICT(key) DO UPDATE SET " + ", ".join(f"{column} = excluded.{column}" for column in _SQLITE_ENTRY_COLUMNS)
+)
+_SQLITE_SCHEMA: Final[tuple[str, ...]] = (
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        key TEXT PRIMARY KEY,
+        exit_code INTEGER NOT NULL,
+        duration_ms REAL NOT NULL,
+        profile TEXT,
+        config_file TEXT,
+        command TEXT NOT NULL,
+        plugin_args TEXT NOT NULL,
+        include TEXT NOT NULL,
+        exclude TEXT NOT NULL,
+        overrides TEXT NOT NULL,
+        category_mapping TEXT NOT NULL,
+        tool_summary TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS file_hashes (
+        key TEXT NOT NULL REFERENCES entries(key) ON DELETE CASCADE,
+        path TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        PRIMARY KEY (key, path)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS diagnostics (
+        key TEXT NOT NULL REFERENCES entries(key) ON DELETE CASCADE,
+        ordinal INTEGER NOT NULL,
+        payload TEXT NOT NULL,
+        PRIMARY KEY (key, ordinal)
+    )
+    """,
+)
+
+EntryPayload = dict[str, "JSONValue"]
+
+
+class CacheStore(Protocol):
+    """Persistence interface used by `EngineCache`.
+
+    Attributes:
+        location: Filesystem location backing the store.
+        incremental: Whether entries are read on demand and written per key.
+            Non-incremental stores are loaded eagerly and rewritten in full.
+    """
+
+    location: Path
+    incremental: bool
+
+    def read(self, key: str) -> EntryPayload | None:
+        """Return the payload stored for ``key`` or `None`when absent."""
+        # ignore JUSTIFIED: protocol stub; concrete stores are exercised instead
+        ...  # pragma: no cover
+
+    def read_all(self) -> dict[str, EntryPayload]:
+        """Return every stored payload keyed by cache key."""
+        # ignore JUSTIFIED: protocol stub; concrete stores are exercised instead
+        ...  # pragma: no cover
+
+    def write(self, payloads: Mapping[str, EntryPayload]) -> None:
+        """Persist ``payloads`` (all entries for non-incremental stores)."""
+        # ignore JUSTIFIED: protocol stub; concrete stores are exercised instead
+        ...  # pragma: no cover
+
+    def stats(self) -> CacheStats:
+        """Return entry, file-hash, diagnostic, and on-disk size counts."""
+        # ignore JUSTIFIED: protocol stub; concrete stores are exercised instead
+        ...  # pragma: no cover
+
+
+class CacheStats(TypedDict):
+    """Aggregate counts reported by `ratchetr cache stats`."""
+
+    backend: str
+    location: str
+    entries: int
+    file_hashes: int
+    diagnostics: int
+    bytes: int
+
+
+def _payload_stats(backend: CacheBackend, location: Path, payloads: Mapping[str, EntryPayload]) -> CacheStats:
+    file_hashes = 0
+    diagnostics = 0
+    for payload in payloads.values():
+        hashes = payload.get("file_hashes")
+        diags = payload.get("diagnostics")
+        file_hashes += len(hashes) if isinstance(hashes, dict) else 0
+        diagnostics += len(diags) if isinstance(diags, list) else 0
+    if location.is_dir():
+        size = sum(item.stat().st_size for item in location.iterdir() if item.is_file())
+    else:
+        size = location.stat().st_size if location.exists() else 0
+    return CacheStats(
+        backend=backend.value,
+        location=location.as_posix(),
+        entries=len(payloads),
+        file_hashes=file_hashes,
+        diagnostics=diagnostics,
+        bytes=size,
+    )
+
+
+class JsonCacheStore:
+    """Single-document store compatible with the historical ``cache.json``."""
+
+    incremental = False
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialise the store rooted at ``cache_dir``."""
+        super().__init__()
+        self.location: Path = cache_dir / CACHE_FILENAME
+
+    def read(self, key: str) -> EntryPayload | None:
+        """Return the payload stored for ``key`` or `None`when absent.
+
+        Args:
+            key: Cache key to look up.
+
+        Returns:
+            Stored payload or ``None``.
+        """
+        return self.read_all().get(key)
+
+    def read_all(self) -> dict[str, EntryPayload]:
+        """Return every stored payload keyed by cache key.
+
+        Returns:
+            Mapping of cache keys to payloads; empty when the file is missing or corrupt.
+        """
+        if not self.location.exists():
+            return {}
+        try:
+            raw = json.loads(self.location.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(raw, dict):
+            return {}
+        entries = cast("dict[str, object]", raw).get("entries")
+        if not isinstance(entries, dict):
+            return {}
+        return {
+            str(key): cast("EntryPayload", value)
+            for key, value in cast("dict[object, object]", entries).items()
+            if isinstance(value, dict)
+        }
+
+    def write(self, payloads: Mapping[str, EntryPayload]) -> None:
+        """Rewrite ``cache.json`` with the complete set of payloads.
+
+        Args:
+            payloads: Every cache entry, keyed by cache key.
+        """
+        self.location.parent.mkdir(parents=True, exist_ok=True)
+        document = {"entries": dict(sorted(payloads.items()))}
+        lock_path = self.location.with_suffix(self.location.suffix + ".lock")
+        tmp_path = self.location.with_suffix(".tmp")
+        with file_lock(lock_path):
+            consume(tmp_path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8"))
+            consume(tmp_path.replace(self.location))
+
+    def stats(self) -> CacheStats:
+        """Return aggregate counts for the cache document.
+
+        Returns:
+            `CacheStats`for ``cache.json``.
+        """
+        return _payload_stats(CacheBackend.JSON, self.location, self.read_all())
+
+
+class ShardedCacheStore:
+    """One compressed shard per cache key, read lazily on first access."""
+
+    incremental = True
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialise the store rooted at ``cache_dir``."""
+        super().__init__()
+        self.location: Path = cache_dir / SHARD_DIRNAME
+
+    def shard_path(self, key: str) -> Path:
+        """Return the shard file used for ``key``.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Path of the shard file (which may not exist yet).
+        """
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return self.location / f"{digest}{SHARD_SUFFIX}"
+
+    def read(self, key: str) -> EntryPayload | None:
+        """Return the payload stored for ``key`` or `None`when absent.
+
+        Args:
+            key: Cache key to look up.
+
+        Returns:
+            Stored payload or `None`when the shard is missing, corrupt, or
+            belongs to a different key.
+        """
+        decoded = self._read_shard(self.shard_path(key))
+        if decoded is None or decoded[0] != key:
+            return None
+        return decoded[1]
+
+    def read_all(self) -> dict[str, EntryPayload]:
+        """Return every stored payload keyed by cache key.
+
+        Returns:
+            Mapping of cache keys to payloads decoded from all shards.
+        """
+        payloads: dict[str, EntryPayload] = {}
+        for shard in self._iter_shards():
+            decoded = self._read_shard(shard)
+            if decoded is not None:
+                payloads[decoded[0]] = decoded[1]
+        return dict(sorted(payloads.items()))
+
+    def write(self, payloads: Mapping[str, EntryPayload]) -> None:
+        """Upsert shards for the supplied payloads.
+
+        Args:
+            payloads: Changed cache entries keyed by cache key.
+        """
+        self.location.mkdir(parents=True, exist_ok=True)
+        for key, payload in payloads.items():
+            target = self.shard_path(key)
+            encoded = json.dumps({"key": key, "entry": payload}, separators=(",", ":")).encode("utf-8")
+            tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            consume(tmp_path.write_bytes(_SHARD_MAGIC + zlib.compress(encoded, 6)))
+            consume(tmp_path.replace(target))
+
+    def stats(self) -> CacheStats:
+        """Return aggregate counts across all shards.
+
+        Returns:
+            `CacheStats`for the shard directory.
+        """
+        return _payload_stats(CacheBackend.SHARDED, self.location, self.read_all())
+
+    def _iter_shards(self) -> Iterator[Path]:
+        if not self.location.is_dir():
+            return iter(())
+        return iter(sorted(self.location.glob(f"*{SHARD_SUFFIX}")))
+
+    @staticmethod
+    def _read_shard(path: Path) -> tuple[str, EntryPayload] | None:
+        try:
+            blob = path.read_bytes()
+        except OSError:
+            return None
+        if not blob.startswith(_SHARD_MAGIC):
+            return None
+        try:
+            raw = json.loads(zlib.decompress(blob[len(_SHARD_MAGIC) :]))
+        except (zlib.error, json.JSONDecodeError, UnicodeDecodeError):
+            logger.warning(
+                "Ignoring unreadable cache shard %s",
+                path,
+                extra=structured_extra(component=LogComponent.CACHE, path=path),
+            )
+            return None
+        if not isinstance(raw, dict):
+            return None
+        document = cast("dict[str, object]", raw)
+        key = document.get("key")
+        entry = document.get("entry")
+        if not isinstance(key, str) or not isinstance(entry, dict):
+            return None
+        return key, cast("EntryPayload", entry)
+
+
+class SqliteCacheStore:
+    """SQLite database (WAL mode) with one table per cache concern.
+
+    Every write upserts only the supplied keys inside a single transaction, so
+    concurrent audits sharing a checkout merge their entries instead of the
+    last writer replacing the whole cache.
+    """
+
+    incremental = True
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialise the store rooted at ``cache_dir``."""
+        super().__init__()
+        self.location: Path = cache_dir / SQLITE_FILENAME
+
+    def _connect(self) -> sqlite3.Connection:
+        self.location.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.location, timeout=_SQLITE_TIMEOUT_SECONDS)
+        consume(connection.execute("PRAGMA journal_mode=WAL"))
+        consume(connection.execute("PRAGMA synchronous=NORMAL"))
+        consume(connection.execute("PRAGMA foreign_keys=ON"))
+        for statement in _SQLITE_SCHEMA:
+            consume(connection.execute(statement))
+        return connection
+
+    def read(self, key: str) -> EntryPayload | None:
+        """Return the payload stored for ``key`` or `None`when absent.
+
+        Args:
+            key: Cache key to look up.
+
+        Returns:
+            Stored payload or ``None``.
+        """
+        if not self.location.exists():
+            return None
+        with closing(self._connect()) as connection:
+            return self._read_entry(connection, key)
+
+    def read_all(self) -> dict[str, EntryPayload]:
+        """Return every stored payload keyed by cache key.
+
+        Returns:
+            Mapping of cache keys to payloads, sorted by key.
+        """
+        if not self.location.exists():
+            return {}
+        payloads: dict[str, EntryPayload] = {}
+        with closing(self._connect()) as connection:
+            keys = [str(row[0]) for row in connection.execute("SELECT key FROM entries ORDER BY key")]
+            for key in keys:
+                payload = self._read_entry(connection, key)
+                if payload is not None:
+                    payloads[key] = payload
+        return payloads
+
+    def write(self, payloads: Mapping[str, EntryPayload]) -> None:
+        """Upsert the supplied entries in a single transaction.
+
+        Args:
+            payloads: Changed cache entries keyed by cache key.
+        """
+        if not payloads:
+            return
+        # ignore JUSTIFIED: the inner transaction context is the connection itself, and
+        # a combined `with` would read like a tuple of managers (pylint W0124)
+        with closing(self._connect()) as connection:  # noqa: SIM117
+            with connection:
+                for key, payload in payloads.items():
+                    self._upsert(connection, key, payload)
+
+    def stats(self) -> CacheStats:
+        """Return aggregate counts using per-table ``COUNT`` queries.
+
+        Returns:
+            `CacheStats`for the SQLite database.
+        """
+        counts = {"entries": 0, "file_hashes": 0, "diagnostics": 0}
+        size = 0
+        if self.location.exists():
+            with closing(self._connect()) as connection:
+                for table in counts:
+                    # ignore JUSTIFIED: table names are the fixed keys of ``counts``
+                    row = connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()  # noqa: S608
+                    counts[table] = int(row[0]) if row else 0
+            wal_path = self.location.with_name(f"{self.location.name}-wal")
+            size = sum(candidate.stat().st_size for candidate in (self.location, wal_path) if candidate.exists())
+        return CacheStats(
+            backend=CacheBackend.SQLITE.value,
+            location=self.location.as_posix(),
+            entries=counts["entries"],
+            file_hashes=counts["file_hashes"],
+            diagnostics=counts["diagnostics"],
+            bytes=size,
+        )
+
+    @staticmethod
+    def _read_entry(connection: sqlite3.Connection, key: str) -> EntryPayload | None:
+        row = connection.execute(_SQLITE_SELECT_ENTRY, (key,)).fetchone()
+        if row is None:
+            return None
+        payload: EntryPayload = {}
+        for column, value in zip(_SQLITE_ENTRY_COLUMNS, row, strict=True):
+            payload[column] = json.loads(value) if column in _SQLITE_JSON_COLUMNS and value is not None else value
+        payload["file_hashes"] = {
+            str(path): json.loads(hash_payload)
+            for path, hash_payload in connection.execute(
+                "SELECT path, payload FROM file_hashes WHERE key = ? ORDER BY path",
+                (key,),
+            )
+        }
+        payload["diagnostics"] = [
+            json.loads(row[0])
+            for row in connection.execute("SELECT payload FROM diagnostics WHERE key = ? ORDER BY ordinal", (key,))
+        ]
+        return payload
+
+    @staticmethod
+    def _upsert(connection: sqlite3.Connection, key: str, payload: EntryPayload) -> None:
+        # ``tool_summary`` is the only nullable JSON column; missing collections become empty lists.
+        json_values = [
+            json.dumps(value)
+            if (value := payload.get(column)) is not None
+            else (None if column == "tool_summary" else "[]")
+            for column in _SQLITE_JSON_COLUMNS
+        ]
+        consume(
+            connection.execute(
+                _SQLITE_UPSERT_ENTRY,
+                (
+                    key,
+                    payload.get("exit_code", 0),
+                    payload.get("duration_ms", 0.0),
+                    payload.get("profile"),
+                    payload.get("config_file"),
+                    *json_values,
+                ),
+            ),
+        )
+        consume(connection.execute("DELETE FROM file_hashes WHERE key = ?", (key,)))
+        consume(connection.execute("DELETE FROM diagnostics WHERE key = ?", (key,)))
+        file_hashes = payload.get("file_hashes")
+        if isinstance(file_hashes, dict):
+            consume(
+                connection.executemany(
+                    "INSERT INTO file_hashes (key, path, payload) VALUES (?, ?, ?)",
+                    [(key, str(path), json.dumps(value)) for path, value in file_hashes.items()],
+                ),
+            )
+        diagnostics = payload.get("diagnostics")
+        if isinstance(diagnostics, list):
+            consume(
+                connection.executemany(
+                    "INSERT INTO diagnostics (key, ordinal, payload) VALUES (?, ?, ?)",
+                    [(key, ordinal, json.dumps(value)) for ordinal, value in enumerate(diagnostics)],
+                ),
+            )
+
+
+def open_cache_store(cache_dir: Path, backend: CacheBackend) -> CacheStore:
+    """Return the store implementation for ``backend``.
+
+    Args:
+        cache_dir: Cache directory (usually ``<project>/.ratchetr_cache``).
+        backend: Requested storage backend.
+
+    Returns:
+        Store instance rooted at ``cache_dir``.
+    """
+    if backend is CacheBackend.SHARDED:
+        return ShardedCacheStore(cache_dir)
+    if backend is CacheBackend.SQLITE:
+        return SqliteCacheStore(cache_dir)
+    return JsonCacheStore(cache_dir)
+
+
+__all__ = [
+    "CACHE_DIRNAME",
+    "CACHE_FILENAME",
+    "CacheStats",
+    "CacheStore",
+    "JsonCacheStore",
+    "ShardedCacheStore",
+    "SqliteCacheStore",
+    "open_cache_store",
+]
@@ -0,0 +1,240 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Registry of long-lived engine daemons started by ratchetr.
+
+The mypy engine's daemon mode (``dmypy``) records each daemon under
+``.ratchetr_cache/daemons/`` so later audits reuse the warm process and
+``ratchetr daemon stop`` can shut every one of them down. The registry file
+only names daemons: status files always live inside the registry directory
+and stop commands are rebuilt from the current interpreter, so a stale or
+planted registry cannot run arbitrary commands or touch other files.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import sys
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final, cast
+
+from ratchetr._internal.cache_stores import CACHE_DIRNAME
+from ratchetr._internal.utils import consume, file_lock, python_executable, run_command
+from ratchetr.core.model_types import LogComponent
+from ratchetr.logging import structured_extra
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+logger: logging.Logger = logging.getLogger("ratchetr.daemons")
+
+DAEMON_DIRNAME: Final[str] = "daemons"
+REGISTRY_FILENAME: Final[str] = "registry.json"
+
+
+@dataclass(slots=True, frozen=True)
+class DaemonRecord:
+    """Registry entry describing one engine daemon.
+
+    Attributes:
+        name: Registry key, usually ``<engine>:<mode>``.
+        status_file: Status file the daemon was started with.
+        stop_command: Command that shuts the daemon down.
+        pid: Process id reported by the status file, when available.
+        running: Whether the process still appears to be alive.
+    """
+
+    name: str
+    status_file: Path
+    stop_command: tuple[str, ...]
+    pid: int | None
+    running: bool
+
+
+def _read_pid(status_file: Path) -> int | None:
+    try:
+        payload = json.loads(status_file.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    pid = cast("dict[str, object]", payload).get("pid") if isinstance(payload, dict) else None
+    return pid if isinstance(pid, int) else None
+
+
+def _pid_alive(pid: int) -> bool:
+    if sys.platform == "win32":
+        # ``os.kill`` terminates processes on Windows; trust the status file instead.
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class DaemonRegistry:
+    """File-backed registry of engine daemons for one project."""
+
+    def __init__(self, project_root: Path) -> None:
+        """Initialise the registry for ``project_root``.
+
+        Args:
+            project_root: Project whose ``.ratchetr_cache`` hosts the registry.
+        """
+        super().__init__()
+        self.project_root: Path = project_root
+        self.directory: Path = project_root / CACHE_DIRNAME / DAEMON_DIRNAME
+        self._registry_path = self.directory / REGISTRY_FILENAME
+        self._lock_path = self.directory / f"{REGISTRY_FILENAME}.lock"
+
+    def status_file(self, name: str) -> Path:
+        """Return the status file a daemon registered as ``name`` uses.
+
+        Args:
+            name: Registry key, usually ``<engine>:<mode>``.
+
+        Returns:
+            Path inside the registry directory.
+
+        Raises:
+            ValueError: If ``name`` would place the status file outside the
+                registry directory.
+        """
+        status_file = self.directory / f"{name.replace(':', '-')}.json"
+        if status_file.resolve().parent != self.directory.resolve():
+            message = f"Daemon name {name!r} escapes the registry directory"
+            raise ValueError(message)
+        return status_file
+
+    def client_command(self, name: str) -> list[str]:
+        """Return the ``dmypy`` client invocation for the daemon ``name``.
+
+        Args:
+            name: Registry key, usually ``<engine>:<mode>``.
+
+        Returns:
+            Command prefix; the client subcommand follows.
+        """
+        return [python_executable(), "-m", "mypy.dmypy", "--status-file", str(self.status_file(name))]
+
+    def register(self, name: str) -> Path:
+        """Record a daemon so later runs can reuse or stop it.
+
+        Args:
+            name: Registry key, usually ``<engine>:<mode>``.
+
+        Returns:
+            Status file the daemon should be started with.
+        """
+        status_file = self.status_file(name)
+        with file_lock(self._lock_path):
+            entries = self._read()
+            entry: dict[str, object] = {"statusFile": status_file.name}
+            if entries.get(name) != entry:
+                entries[name] = entry
+                self._write(entries)
+        return status_file
+
+    def records(self) -> list[DaemonRecord]:
+        """Return every registered daemon with its current process state.
+
+        Returns:
+            Records sorted by registry key.
+        """
+        records: list[DaemonRecord] = []
+        for name in sorted(self._read()):
+            try:
+                status_file = self.status_file(name)
+            except ValueError:
+                logger.warning(
+                    "Ignoring daemon registry entry %r outside %s",
+                    name,
+                    self.directory,
+                    extra=structured_extra(component=LogComponent.ENGINE, path=self._registry_path),
+                )
+                continue
+            pid = _read_pid(status_file)
+            records.append(
+                DaemonRecord(
+                    name=name,
+                    status_file=status_file,
+                    stop_command=(*self.client_command(name), "stop"),
+                    pid=pid,
+                    running=pid is not None and _pid_alive(pid),
+                ),
+            )
+        return records
+
+    def stop(self, names: Iterable[str] | None = None) -> list[DaemonRecord]:
+        """Stop registered daemons and drop them from the registry.
+
+        Args:
+            names: Registry keys to stop; `None` stops every daemon.
+
+        Returns:
+            Records of the daemons that were stopped.
+        """
+        selected = set(names) if names is not None else None
+        stopped: list[DaemonRecord] = []
+        with file_lock(self._lock_path):
+            records = self.records()
+            # Entries without a valid status file are dropped rather than kept forever.
+            valid = {record.name for record in records}
+            entries = {name: entry for name, entry in self._read().items() if name in valid}
+            for record in records:
+                if selected is not None and record.name not in selected:
+                    continue
+                if record.running:
+                    argv = list(record.stop_command)
+                    result = run_command(argv, cwd=self.project_root, allowed={python_executable()})
+                    if result.exit_code:
+                        logger.warning(
+                            "Stopping daemon %s exited with %s",
+                            record.name,
+                            result.exit_code,
+                            extra=structured_extra(component=LogComponent.ENGINE, exit_code=result.exit_code),
+                        )
+                with contextlib.suppress(FileNotFoundError):
+                    record.status_file.unlink()
+                consume(entries.pop(record.name, None))
+                stopped.append(record)
+            self._write(entries)
+        return stopped
+
+    def _read(self) -> dict[str, dict[str, object]]:
+        try:
+            payload = json.loads(self._registry_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+        return {
+            str(name): cast("dict[str, object]", entry)
+            for name, entry in cast("dict[object, object]", payload).items()
+            if isinstance(entry, dict)
+        }
+
+    def _write(self, entries: dict[str, dict[str, object]]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._registry_path.with_suffix(".tmp")
+        consume(tmp_path.write_text(json.dumps(dict(sorted(entries.items())), indent=2) + "\n", encoding="utf-8"))
+        consume(tmp_path.replace(self._registry_path))
+
+
+__all__ = ["DAEMON_DIRNAME", "DaemonRecord", "DaemonRegistry"]
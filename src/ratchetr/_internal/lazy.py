@@ -0,0 +1,63 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module-level ``__getattr__`` support for lazily imported package exports."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+__all__ = ["lazy_exports"]
+
+
+def lazy_exports(
+    package: str,
+    exports: Mapping[str, str],
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` hooks resolving exports on first access.
+
+    Each export maps a public name to the module providing it, relative to
+    ``package`` (``".builder"``), optionally followed by ``":attribute"`` when
+    the export is re-named. A resolved value is stored on the package so later
+    lookups are plain attribute reads.
+
+    Args:
+        package: ``__name__`` of the package defining the exports.
+        exports: Mapping of exported name to ``"module"`` or ``"module:attribute"``.
+
+    Returns:
+        The module ``__getattr__`` and ``__dir__`` functions.
+    """
+
+    # ignore JUSTIFIED: PEP 562 requires the dunder name on the returned module hook
+    def __getattr__(name: str) -> object:  # noqa: N807
+        target = exports.get(name)
+        if target is None:
+            message = f"module '{package}' has no attribute '{name}'"
+            raise AttributeError(message)
+        module_name, _, attribute = target.partition(":")
+        value = getattr(importlib.import_module(module_name, package), attribute or name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    # ignore JUSTIFIED: PEP 562 requires the dunder name on the returned module hook
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*vars(sys.modules[package]), *exports})
+
+    return __getattr__, __dir__
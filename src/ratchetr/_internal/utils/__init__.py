@@ -19,7 +19,7 @@ from __future__ import annotations
 from .common import consume
 from .locks import file_lock
 from .paths import ROOT_MARKERS, RootMarker, default_full_paths, resolve_project_root
-from .process import CommandOutput, python_executable, run_command
+from .process import CommandOutput, python_executable, run_command, stream_command
 from .versions import detect_tool_versions
 
 __all__ = [
@@ -33,4 +33,5 @@ __all__ = [
     "python_executable",
     "resolve_project_root",
     "run_command",
+    "stream_command",
 ]
@@ -22,9 +22,10 @@ import logging
 # calls are allowlisted by callers; import is expected here
 import subprocess  # noqa: S404  # nosec B404
 import sys
+import tempfile
 import time
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from ratchetr.core.model_types import LogComponent
 from ratchetr.logging import structured_extra
@@ -32,12 +33,16 @@ from ratchetr.logging import structured_extra
 logger: logging.Logger = logging.getLogger("ratchetr.internal.process")
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
     from pathlib import Path
+    from typing import IO
 
     from ratchetr.core.type_aliases import Command
 
-__all__ = ["CommandOutput", "python_executable", "run_command"]
+__all__ = ["CommandOutput", "python_executable", "run_command", "stream_command"]
+
+_T = TypeVar("_T")
+_DRAIN_CHUNK_SIZE = 1 << 16
 
 
 @dataclass(slots=True)
@@ -81,20 +86,10 @@ def run_command(
         raise ValueError
     if not all(a for a in argv):
         raise TypeError
-    executable = argv[0]
-    if allowed is not None and executable not in allowed:
+    if allowed is not None and argv[0] not in allowed:
         raise ValueError
     start = time.perf_counter()
-    debug_details: dict[str, object] = {}
-    if cwd:
-        debug_details["cwd"] = str(cwd)
-    if allowed:
-        debug_details["allowed"] = sorted(allowed)
-    logger.debug(
-        "Executing command: %s",
-        " ".join(argv),
-        extra=_structured_extra(details=debug_details),
-    )
+    _log_start(argv, cwd, allowed)
     # ignore JUSTIFIED: subprocess is invoked with shell disabled;
     # argv is allowlisted by caller
     completed = subprocess.run(  # noqa: S603  # nosec B603
@@ -107,20 +102,7 @@ def run_command(
     )
     duration_ms = (time.perf_counter() - start) * 1000
     if completed.returncode:
-        warning_details: dict[str, object] = {}
-        if cwd:
-            warning_details["cwd"] = str(cwd)
-        logger.warning(
-            "Command failed (exit=%s): %s",
-            completed.returncode,
-            " ".join(argv),
-            extra=_structured_extra(exit_code=completed.returncode, details=warning_details),
-        )
-        logging.getLogger().warning(
-            "Command failed (exit=%s): %s",
-            completed.returncode,
-            " ".join(argv),
-        )
+        _log_failure(argv, cwd, completed.returncode)
     return CommandOutput(
         args=argv,
         stdout=completed.stdout,
@@ -130,6 +112,109 @@ def run_command(
     )
 
 
+def stream_command(
+    args: Iterable[str],
+    cwd: Path | None = None,
+    *,
+    allowed: set[str] | None = None,
+    consumer: Callable[[IO[str]], _T],
+) -> tuple[CommandOutput, _T]:
+    """Run a subprocess and hand its stdout pipe to `consumer` as it is produced.
+
+    Applies the same guardrails as `run_command`, but stdout is never
+    accumulated: `consumer` reads the pipe incrementally while the child is
+    still running. Any output left unread once `consumer` returns is drained
+    and discarded. Stderr is spooled to a temporary file so a chatty child
+    cannot block on a full pipe.
+
+    Args:
+        args: Command line to execute.
+        cwd: Optional working directory for the child process.
+        allowed: Optional allowlist of valid executables.
+        consumer: Callable receiving the text-mode stdout stream.
+
+    Returns:
+        Tuple of `CommandOutput` (with an empty `stdout`) and the value
+        returned by `consumer`.
+
+    Raises:
+        ValueError: If `args` is empty or the executable is not allowlisted.
+        TypeError: If any argument is falsy (for example `""`).
+    """
+    argv: Command = list(args)
+    if not argv:
+        raise ValueError
+    if not all(a for a in argv):
+        raise TypeError
+    if allowed is not None and argv[0] not in allowed:
+        raise ValueError
+    start = time.perf_counter()
+    _log_start(argv, cwd, allowed)
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as stderr_file:
+        # ignore JUSTIFIED: subprocess is invoked with shell disabled;
+        # argv is allowlisted by caller
+        with subprocess.Popen(  # noqa: S603  # nosec B603
+            argv,
+            cwd=str(cwd) if cwd else None,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            text=True,
+            shell=False,
+        ) as process:
+            stdout = cast("IO[str]", process.stdout)
+            try:
+                consumed = consumer(stdout)
+                while stdout.read(_DRAIN_CHUNK_SIZE):
+                    pass
+            except BaseException:
+                process.kill()
+                raise
+            exit_code = process.wait()
+        _ = stderr_file.seek(0)
+        stderr = stderr_file.read()
+    duration_ms = (time.perf_counter() - start) * 1000
+    if exit_code:
+        _log_failure(argv, cwd, exit_code)
+    output = CommandOutput(
+        args=argv,
+        stdout="",
+        stderr=stderr,
+        exit_code=exit_code,
+        duration_ms=duration_ms,
+    )
+    return output, consumed
+
+
+def _log_start(argv: Command, cwd: Path | None, allowed: set[str] | None) -> None:
+    debug_details: dict[str, object] = {}
+    if cwd:
+        debug_details["cwd"] = str(cwd)
+    if allowed:
+        debug_details["allowed"] = sorted(allowed)
+    logger.debug(
+        "Executing command: %s",
+        " ".join(argv),
+        extra=_structured_extra(details=debug_details),
+    )
+
+
+def _log_failure(argv: Command, cwd: Path | None, exit_code: int) -> None:
+    warning_details: dict[str, object] = {}
+    if cwd:
+        warning_details["cwd"] = str(cwd)
+    logger.warning(
+        "Command failed (exit=%s): %s",
+        exit_code,
+        " ".join(argv),
+        extra=_structured_extra(exit_code=exit_code, details=warning_details),
+    )
+    logging.getLogger().warning(
+        "Command failed (exit=%s): %s",
+        exit_code,
+        " ".join(argv),
+    )
+
+
 def python_executable() -> str:
     """Return the current Python interpreter path.
 
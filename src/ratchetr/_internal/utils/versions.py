@@ -12,16 +12,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Tool version detection helpers."""
+"""Tool version detection helpers.
+
+Version probes spawn a subprocess per tool, so results are memoised for the
+lifetime of the process and, when a cache directory is supplied, persisted to
+disk with a TTL. Both layers are keyed on the resolved executable path plus its
+modification time so upgrading a tool invalidates the cached version.
+"""
 
 from __future__ import annotations
 
+import importlib.util
+import json
 import logging
-from typing import TYPE_CHECKING, Any, cast
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final, TypeAlias, cast
 
 from ratchetr.core.model_types import LogComponent
 from ratchetr.logging import structured_extra
 
+from .common import consume
+from .locks import file_lock
 from .process import python_executable, run_command
 
 logger: logging.Logger = logging.getLogger("ratchetr.internal.versions")
@@ -31,7 +48,47 @@ if TYPE_CHECKING:
 
     from ratchetr.core.type_aliases import ToolName
 
-__all__ = ["detect_tool_versions"]
+__all__ = [
+    "TOOL_VERSIONS_FILENAME",
+    "TOOL_VERSION_TTL_SECONDS",
+    "clear_tool_version_cache",
+    "detect_tool_versions",
+]
+
+TOOL_VERSIONS_FILENAME: Final[str] = "tool_versions.json"
+TOOL_VERSION_TTL_SECONDS: Final[float] = 24 * 60 * 60
+
+# (tool, executable, mtime_ns) -> version; `None` records a failed probe.
+_Fingerprint: TypeAlias = tuple[str, str, int]
+_PROCESS_CACHE: dict[_Fingerprint, str | None] = {}
+_PROCESS_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
+class _VersionProbe:
+    tool: str
+    argv: tuple[str, ...]
+    executable: Path | None
+
+    def fingerprint(self) -> _Fingerprint | None:
+        """Identify the probed executable by path and modification time.
+
+        Returns:
+            Cache fingerprint, or `None` when the executable cannot be stat'ed.
+        """
+        if self.executable is None:
+            return None
+        try:
+            mtime_ns = self.executable.stat().st_mtime_ns
+        except OSError:
+            return None
+        return (self.tool, str(self.executable), mtime_ns)
+
+
+def clear_tool_version_cache() -> None:
+    """Forget every version memoised in this process."""
+    with _PROCESS_CACHE_LOCK:
+        _PROCESS_CACHE.clear()
 
 
 def _safe_version_from_output(output: str) -> str | None:
@@ -44,46 +101,179 @@ def _safe_version_from_output(output: str) -> str | None:
     return text.splitlines()[0].strip() if text else None
 
 
-def detect_tool_versions(tools: Sequence[str | ToolName]) -> dict[str, str]:
+def _mypy_executable(python: str) -> Path | None:
+    # For the running interpreter the mypy package itself changes on upgrade;
+    # other interpreters are fingerprinted by their own binary.
+    if python == sys.executable:
+        try:
+            spec = importlib.util.find_spec("mypy")
+        except (ImportError, ValueError):
+            spec = None
+        if spec is not None and spec.origin:
+            return Path(spec.origin)
+    return Path(python)
+
+
+def _probe_for(name: str) -> _VersionProbe | None:
+    # ignore JUSTIFIED: explicit branching keeps tool-specific commands clear
+    # refactor would obscure per-tool invocation details
+    if name == "pyright":
+        located = shutil.which("pyright")
+        return _VersionProbe(name, ("pyright", "--version"), Path(located).resolve() if located else None)
+    if name == "mypy":
+        py = python_executable()
+        return _VersionProbe(name, (py, "-m", "mypy", "--version"), _mypy_executable(py))
+    return None
+
+
+def _run_probe(probe: _VersionProbe) -> str | None:
+    try:
+        out = run_command(list(probe.argv), allowed={probe.argv[0]}).stdout
+    except (OSError, TypeError, ValueError, RuntimeError) as exc:
+        logger.debug(
+            "Failed to detect version for %s: %s",
+            probe.tool,
+            exc,
+            extra=_structured_extra(tool=probe.tool),
+        )
+        return None
+    return _safe_version_from_output(out)
+
+
+def _disk_key(fingerprint: _Fingerprint) -> str:
+    return f"{fingerprint[0]}:{fingerprint[1]}"
+
+
+def _read_disk_cache(path: Path) -> dict[str, dict[str, object]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    return {
+        str(key): cast("dict[str, object]", entry)
+        for key, entry in cast("dict[object, object]", payload).items()
+        if isinstance(entry, dict)
+    }
+
+
+def _lookup_disk(
+    entries: dict[str, dict[str, object]],
+    fingerprint: _Fingerprint,
+    *,
+    now: float,
+    ttl_seconds: float,
+) -> str | None:
+    entry = entries.get(_disk_key(fingerprint))
+    if entry is None or entry.get("mtimeNs") != fingerprint[2]:
+        return None
+    checked_at = entry.get("checkedAt")
+    version = entry.get("version")
+    if not isinstance(checked_at, (int, float)) or not isinstance(version, str):
+        return None
+    return version if now - checked_at <= ttl_seconds else None
+
+
+def _write_disk_cache(path: Path, fresh: dict[_Fingerprint, str], *, now: float) -> None:
+    try:
+        with file_lock(path.with_name(f"{path.name}.lock")):
+            entries = _read_disk_cache(path)
+            for fingerprint, version in fresh.items():
+                entries[_disk_key(fingerprint)] = {"mtimeNs": fingerprint[2], "version": version, "checkedAt": now}
+            tmp_path = path.with_suffix(".tmp")
+            consume(tmp_path.write_text(json.dumps(dict(sorted(entries.items())), indent=2) + "\n", encoding="utf-8"))
+            consume(tmp_path.replace(path))
+    except OSError as exc:
+        logger.debug(
+            "Failed to persist tool versions to %s: %s",
+            path,
+            exc,
+            extra=_structured_extra(path=path),
+        )
+
+
+def _cached_version(
+    fingerprint: _Fingerprint | None,
+    disk_entries: dict[str, dict[str, object]],
+    *,
+    now: float,
+    ttl_seconds: float,
+) -> tuple[bool, str | None]:
+    if fingerprint is None:
+        return False, None
+    with _PROCESS_CACHE_LOCK:
+        if fingerprint in _PROCESS_CACHE:
+            return True, _PROCESS_CACHE[fingerprint]
+    version = _lookup_disk(disk_entries, fingerprint, now=now, ttl_seconds=ttl_seconds)
+    if version is None:
+        return False, None
+    with _PROCESS_CACHE_LOCK:
+        _PROCESS_CACHE[fingerprint] = version
+    return True, version
+
+
+def _probe_all(pending: Sequence[_VersionProbe]) -> dict[str, str | None]:
+    if len(pending) <= 1:
+        return {probe.tool: _run_probe(probe) for probe in pending}
+    with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix="ratchetr-version") as pool:
+        return dict(zip((probe.tool for probe in pending), pool.map(_run_probe, pending), strict=True))
+
+
+def detect_tool_versions(
+    tools: Sequence[str | ToolName],
+    *,
+    cache_dir: Path | None = None,
+    ttl_seconds: float = TOOL_VERSION_TTL_SECONDS,
+) -> dict[str, str]:
     """Return a mapping of tool -> version by invoking their version commands.
 
+    Versions already known to this process, or recorded under ``cache_dir``
+    within ``ttl_seconds`` for the same executable, are reused. The remaining
+    tools are probed concurrently.
+
     Args:
         tools: Tool identifiers (names or `ToolName`instances) to inspect.
+        cache_dir: Directory holding the persisted version cache; `None` keeps
+            results in memory only.
+        ttl_seconds: Maximum age of a persisted version before it is re-probed.
 
     Returns:
         Mapping of tool names to detected version strings.
     """
-    versions: dict[str, str] = {}
-    seen: set[str] = set()
+    probes: dict[str, _VersionProbe] = {}
     for tool in tools:
         name = str(tool).strip().lower()
-        if not name or name in seen:
-            continue
-        seen.add(name)
-        try:
-            # ignore JUSTIFIED: explicit branching keeps tool-specific commands clear
-            # refactor would obscure per-tool invocation details
-            if name == "pyright":
-                out = run_command(["pyright", "--version"], allowed={"pyright"}).stdout
-                ver = _safe_version_from_output(out)
-                if ver:
-                    versions[name] = ver
-                continue
-            if name == "mypy":
-                py = python_executable()
-                out = run_command([py, "-m", "mypy", "--version"], allowed={py}).stdout
-                ver = _safe_version_from_output(out)
-                if ver:
-                    versions[name] = ver
-        except (OSError, TypeError, ValueError, RuntimeError) as exc:
-            logger.debug(
-                "Failed to detect version for %s: %s",
-                name,
-                exc,
-                extra=_structured_extra(tool=name),
-            )
+        if name and name not in probes and (probe := _probe_for(name)) is not None:
+            probes[name] = probe
+
+    now = time.time()
+    disk_path = cache_dir / TOOL_VERSIONS_FILENAME if cache_dir is not None else None
+    disk_entries = _read_disk_cache(disk_path) if disk_path is not None else {}
+    fingerprints = {name: probe.fingerprint() for name, probe in probes.items()}
+    resolved: dict[str, str | None] = {}
+    pending: list[_VersionProbe] = []
+    for name, probe in probes.items():
+        hit, version = _cached_version(fingerprints[name], disk_entries, now=now, ttl_seconds=ttl_seconds)
+        if hit:
+            resolved[name] = version
+        else:
+            pending.append(probe)
+
+    fresh: dict[_Fingerprint, str] = {}
+    for name, version in _probe_all(pending).items():
+        resolved[name] = version
+        fingerprint = fingerprints[name]
+        if fingerprint is None:
             continue
-    return versions
+        with _PROCESS_CACHE_LOCK:
+            _PROCESS_CACHE[fingerprint] = version
+        if version is not None:
+            fresh[fingerprint] = version
+    if disk_path is not None and fresh:
+        _write_disk_cache(disk_path, fresh, now=now)
+
+    return {name: version for name in probes if (version := resolved.get(name))}
 
 
 def _structured_extra(**kwargs: object) -> dict[str, object]:
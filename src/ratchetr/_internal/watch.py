@@ -0,0 +1,674 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Filesystem-event journal that keeps cache fingerprints hot between audits.
+
+``ratchetr watch`` follows inotify events for the project and records every
+changed path, with a monotonically increasing sequence number, in
+``.ratchetr_cache/watch/journal.json``. After each fingerprint pass the audit
+stores a checkpoint (journal session, sequence, and a digest of the hashes it
+produced) per cache key. The next audit whose baseline still matches that
+digest only re-fingerprints the paths changed since the checkpoint instead of
+walking and stat-ing the whole tree.
+
+Events reach the watcher asynchronously, so the journal also records when
+the inotify queue was last read empty. An audit only trusts a journal drained
+after the audit started; otherwise it asks the watcher to sync and, if that
+does not happen in time, falls back to walking the tree.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, cast
+
+from ratchetr._internal.cache_stores import CACHE_DIRNAME
+from ratchetr._internal.utils import consume, file_lock
+from ratchetr.core.model_types import LogComponent
+from ratchetr.logging import structured_extra
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from ratchetr.core.model_types import FileHashPayload
+    from ratchetr.core.type_aliases import CacheKey, PathKey
+
+logger: logging.Logger = logging.getLogger("ratchetr.watch")
+
+WATCH_DIRNAME: Final[str] = "watch"
+JOURNAL_FILENAME: Final[str] = "journal.json"
+CHECKPOINTS_FILENAME: Final[str] = "checkpoints.json"
+# Audits touch this file to ask the watcher for an immediate drain and flush.
+SYNC_FILENAME: Final[str] = "sync"
+# The watcher rewrites the journal at least this often; audits ignore a
+# journal whose heartbeat is older than ``STALE_AFTER_SECONDS``.
+HEARTBEAT_SECONDS: Final[float] = 1.0
+STALE_AFTER_SECONDS: Final[float] = 5.0
+# How long an audit waits for a requested sync before walking the tree.
+SYNC_TIMEOUT_SECONDS: Final[float] = 1.0
+# Directories whose churn is never fingerprinted. Baselines with files inside
+# them are invisible to the watcher, so audits walk instead.
+IGNORED_DIRNAMES: Final[frozenset[str]] = frozenset(
+    {CACHE_DIRNAME, ".git", ".hg", "__pycache__", ".mypy_cache", ".pytest_cache", ".ruff_cache"},
+)
+
+_IN_MODIFY: Final[int] = 0x00000002
+_IN_ATTRIB: Final[int] = 0x00000004
+_IN_CLOSE_WRITE: Final[int] = 0x00000008
+_IN_MOVED_FROM: Final[int] = 0x00000040
+_IN_MOVED_TO: Final[int] = 0x00000080
+_IN_CREATE: Final[int] = 0x00000100
+_IN_DELETE: Final[int] = 0x00000200
+_IN_DELETE_SELF: Final[int] = 0x00000400
+_IN_MOVE_SELF: Final[int] = 0x00000800
+_IN_Q_OVERFLOW: Final[int] = 0x00004000
+_IN_IGNORED: Final[int] = 0x00008000
+_IN_ONLYDIR: Final[int] = 0x01000000
+_IN_DONT_FOLLOW: Final[int] = 0x02000000
+_IN_ISDIR: Final[int] = 0x40000000
+_WATCH_MASK: Final[int] = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+    | _IN_DONT_FOLLOW
+)
+_EVENT_HEADER: Final[struct.Struct] = struct.Struct("iIII")
+_READ_SIZE: Final[int] = 64 * 1024
+_POLL_SECONDS: Final[float] = 0.1
+_SYNC_POLL_SECONDS: Final[float] = 0.01
+# Changes to these files re-trigger `watch_project` callbacks; other writes
+# (manifests, dashboards) are journalled but do not re-run audits.
+TRIGGER_SUFFIXES: Final[tuple[str, ...]] = (".py", ".pyi", ".toml", ".ini", ".cfg")
+
+
+@dataclass(slots=True, frozen=True)
+class WatchState:
+    """Snapshot of the journal maintained by a running watcher.
+
+    Attributes:
+        session: Identifier of the watcher session; changes when a watcher
+            restarts or loses events.
+        pid: Process id of the watcher.
+        sequence: Sequence number of the most recent recorded change.
+        heartbeat: Wall-clock time of the last journal write.
+        drained: Wall-clock time at which the watcher last found no pending
+            events; every change made before it is recorded in ``changes``.
+        floor: Sequence number up to which ``changes`` has been compacted;
+            checkpoints older than it cannot be served from the journal.
+        changes: Last sequence number at which each path changed.
+    """
+
+    session: str
+    pid: int
+    sequence: int
+    heartbeat: float
+    drained: float
+    floor: int
+    changes: dict[str, int]
+
+    @property
+    def live(self) -> bool:
+        """Return whether the watcher has written the journal recently.
+
+        Returns:
+            `True` while the last heartbeat is younger than `STALE_AFTER_SECONDS`.
+        """
+        return time.time() - self.heartbeat <= STALE_AFTER_SECONDS
+
+    def changed_since(self, sequence: int) -> frozenset[str]:
+        """Return paths that changed after ``sequence``.
+
+        Args:
+            sequence: Journal sequence number of an earlier checkpoint.
+
+        Returns:
+            Project-relative POSIX paths (files or directories).
+        """
+        return frozenset(path for path, seen in self.changes.items() if seen > sequence)
+
+
+@dataclass(slots=True, frozen=True)
+class WatchCheckpoint:
+    """Journal position to fingerprint against for one cache key.
+
+    Attributes:
+        session: Watcher session the checkpoint belongs to.
+        sequence: Journal sequence read before fingerprinting started.
+        changed: Paths changed since the baseline was fingerprinted, or `None`
+            when the baseline cannot be trusted and a full walk is required.
+    """
+
+    session: str
+    sequence: int
+    changed: frozenset[str] | None
+
+
+def _watched(keys: Iterable[str]) -> bool:
+    return all(IGNORED_DIRNAMES.isdisjoint(key.split("/")) for key in keys)
+
+
+def hashes_digest(hashes: Mapping[PathKey, FileHashPayload]) -> str:
+    """Return a digest identifying a fingerprint mapping.
+
+    Args:
+        hashes: Fingerprints keyed by project-relative path.
+
+    Returns:
+        Hex digest over every key, hash, mtime, and size.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for key in sorted(hashes):
+        payload = hashes[key]
+        hasher.update(f"{key}\0{payload.get('hash')}\0{payload.get('mtime')}\0{payload.get('size')}\n".encode())
+    return hasher.hexdigest()
+
+
+# ignore JUSTIFIED: journal state spans file paths, sync bookkeeping, and flush timing
+class ChangeJournal:  # pylint: disable=too-many-instance-attributes
+    """File-backed journal of changed paths shared by watchers and audits.
+
+    Audits create one journal when they start; `checkpoint` only serves
+    changes from a watcher that drained its events after that moment.
+    """
+
+    def __init__(self, project_root: Path) -> None:
+        """Initialise the journal for ``project_root``.
+
+        Args:
+            project_root: Project whose ``.ratchetr_cache`` hosts the journal.
+        """
+        super().__init__()
+        self.project_root: Path = project_root
+        self.directory: Path = project_root / CACHE_DIRNAME / WATCH_DIRNAME
+        self._journal_path = self.directory / JOURNAL_FILENAME
+        self._checkpoints_path = self.directory / CHECKPOINTS_FILENAME
+        self._lock_path = self.directory / f"{CHECKPOINTS_FILENAME}.lock"
+        self._sync_path = self.directory / SYNC_FILENAME
+        self._opened_at = time.time()
+        self._session = ""
+        self._sequence = 0
+        self._floor = 0
+        self._drained = 0.0
+        self._changes: dict[str, int] = {}
+        self._flushed_at = 0.0
+        self._sync_seen: int | None = None
+        self._sync_answered: int | None = None
+
+    def begin(self) -> str:
+        """Start a new watcher session and publish an empty journal.
+
+        Returns:
+            Identifier of the new session.
+        """
+        self._session = uuid.uuid4().hex
+        self._sequence = 0
+        self._floor = 0
+        self._changes = {}
+        self.flush()
+        return self._session
+
+    def record(self, paths: Iterable[str]) -> int:
+        """Record changed paths; they are published by the next flush.
+
+        Args:
+            paths: Project-relative POSIX paths that changed.
+
+        Returns:
+            Number of paths recorded.
+        """
+        recorded = 0
+        for path in paths:
+            self._sequence += 1
+            self._changes[path] = self._sequence
+            recorded += 1
+        return recorded
+
+    def drained(self, at: float) -> None:
+        """Note that every event queued before ``at`` has been recorded.
+
+        Args:
+            at: Wall-clock time at which the event queue was last read empty.
+        """
+        self._drained = max(self._drained, at)
+
+    def sync_requested(self) -> bool:
+        """Return whether an audit asked for a flush that has not happened yet.
+
+        Returns:
+            `True` when the sync file changed since the last answered request.
+        """
+        try:
+            self._sync_seen = self._sync_path.stat().st_mtime_ns
+        except OSError:
+            return False
+        return self._sync_seen != self._sync_answered
+
+    def heartbeat(self) -> None:
+        """Publish the journal when a heartbeat or a requested sync is due."""
+        if self._sync_seen != self._sync_answered or time.monotonic() - self._flushed_at >= HEARTBEAT_SECONDS:
+            self.flush()
+
+    def flush(self) -> None:
+        """Compact and rewrite the journal, refreshing its heartbeat."""
+        self._compact()
+        payload = {
+            "session": self._session,
+            "pid": os.getpid(),
+            "sequence": self._sequence,
+            "heartbeat": time.time(),
+            "drained": self._drained,
+            "floor": self._floor,
+            "changes": self._changes,
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._journal_path.with_suffix(f".{os.getpid()}.tmp")
+        consume(tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8"))
+        consume(tmp_path.replace(self._journal_path))
+        self._flushed_at = time.monotonic()
+        self._sync_answered = self._sync_seen
+
+    def _compact(self) -> None:
+        # Changes at or below the oldest checkpoint of this session can no
+        # longer be asked for; later checkpoints below the floor walk instead.
+        if not self._changes:
+            return
+        sequences = [
+            entry.get("sequence")
+            for entry in self._read_checkpoints().values()
+            if entry.get("session") == self._session
+        ]
+        floor = min((seen for seen in sequences if isinstance(seen, int)), default=self._sequence)
+        if floor <= self._floor:
+            return
+        self._floor = min(floor, self._sequence)
+        self._changes = {path: seen for path, seen in self._changes.items() if seen > self._floor}
+
+    def close(self) -> None:
+        """Remove the journal so audits stop relying on it."""
+        try:
+            state = self.read()
+            if state is not None and state.session == self._session:
+                self._journal_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def read(self) -> WatchState | None:
+        """Return the published journal, if any.
+
+        Returns:
+            `WatchState`, or `None`when no journal exists or it is unreadable.
+        """
+        try:
+            payload = json.loads(self._journal_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+        data = cast("dict[str, object]", payload)
+        changes = data.get("changes")
+        session, pid, sequence, heartbeat = (data.get(name) for name in ("session", "pid", "sequence", "heartbeat"))
+        drained, floor = data.get("drained", 0.0), data.get("floor", 0)
+        if not (
+            isinstance(session, str)
+            and isinstance(pid, int)
+            and isinstance(sequence, int)
+            and isinstance(heartbeat, (int, float))
+            and isinstance(drained, (int, float))
+            and isinstance(floor, int)
+            and isinstance(changes, dict)
+        ):
+            return None
+        return WatchState(
+            session=session,
+            pid=pid,
+            sequence=sequence,
+            heartbeat=float(heartbeat),
+            drained=float(drained),
+            floor=floor,
+            changes={
+                str(path): seen for path, seen in cast("dict[object, object]", changes).items() if isinstance(seen, int)
+            },
+        )
+
+    def checkpoint(self, key: CacheKey, baseline: Mapping[PathKey, FileHashPayload] | None) -> WatchCheckpoint | None:
+        """Return the journal position to fingerprint ``key`` against.
+
+        Args:
+            key: Cache key being fingerprinted.
+            baseline: Fingerprints stored for ``key`` by the previous audit.
+
+        Returns:
+            `WatchCheckpoint`while a live watcher has drained its events since
+            this journal was created (its ``changed`` set is `None`when the
+            baseline predates the watcher or was never checkpointed),
+            otherwise `None`.
+        """
+        state = self._synced_state()
+        if state is None:
+            return None
+        recorded = self._read_checkpoints().get(str(key))
+        changed: frozenset[str] | None = None
+        if (
+            baseline is not None
+            and recorded is not None
+            and _watched(baseline)
+            and recorded.get("session") == state.session
+            and recorded.get("digest") == hashes_digest(baseline)
+        ):
+            since = recorded.get("sequence")
+            changed = state.changed_since(since) if isinstance(since, int) and since >= state.floor else None
+        return WatchCheckpoint(session=state.session, sequence=state.sequence, changed=changed)
+
+    def _synced_state(self) -> WatchState | None:
+        # Edits made just before the audit may still sit in the inotify queue,
+        # so wait for a flush that drained the queue after the audit started.
+        state = self.read()
+        if state is None or not state.live:
+            return None
+        if state.drained >= self._opened_at:
+            return state
+        try:
+            self._sync_path.touch()
+        except OSError:
+            return None
+        deadline = time.monotonic() + SYNC_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(_SYNC_POLL_SECONDS)
+            state = self.read()
+            if state is None:
+                return None
+            if state.drained >= self._opened_at:
+                return state
+        logger.debug(
+            "Watcher did not sync within %.1fs; walking the tree",
+            SYNC_TIMEOUT_SECONDS,
+            extra=structured_extra(component=LogComponent.CACHE, path=self.project_root),
+        )
+        return None
+
+    def store_checkpoint(
+        self,
+        key: CacheKey,
+        checkpoint: WatchCheckpoint,
+        hashes: Mapping[PathKey, FileHashPayload],
+    ) -> None:
+        """Remember which journal position ``hashes`` reflect for ``key``.
+
+        Args:
+            key: Cache key that was fingerprinted.
+            checkpoint: Checkpoint returned by `checkpoint` before fingerprinting.
+            hashes: Fingerprints collected for ``key``.
+        """
+        entry: dict[str, object] = {
+            "session": checkpoint.session,
+            "sequence": checkpoint.sequence,
+            "digest": hashes_digest(hashes),
+        }
+        with file_lock(self._lock_path):
+            checkpoints = self._read_checkpoints()
+            checkpoints[str(key)] = entry
+            tmp_path = self._checkpoints_path.with_suffix(".tmp")
+            consume(tmp_path.write_text(json.dumps(checkpoints, sort_keys=True), encoding="utf-8"))
+            consume(tmp_path.replace(self._checkpoints_path))
+
+    def _read_checkpoints(self) -> dict[str, dict[str, object]]:
+        try:
+            payload = json.loads(self._checkpoints_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+        return {
+            str(key): cast("dict[str, object]", entry)
+            for key, entry in cast("dict[object, object]", payload).items()
+            if isinstance(entry, dict)
+        }
+
+
+class InotifyWatcher:
+    """Recursive inotify watcher reporting project-relative changed paths (Linux only)."""
+
+    def __init__(self, project_root: Path) -> None:
+        """Start watching every directory below ``project_root``.
+
+        Args:
+            project_root: Directory to watch recursively.
+
+        Raises:
+            OSError: If inotify is unavailable or a watch cannot be added.
+        """
+        super().__init__()
+        if not sys.platform.startswith("linux"):
+            msg = "ratchetr watch requires inotify (Linux)"
+            raise OSError(msg)
+        self.project_root: Path = project_root.resolve()
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = int(self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC))
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._fd = fd
+        self._dirs: dict[int, str] = {}
+        # Wall-clock time at which the event queue was last read empty.
+        self.drained_at: float = 0.0
+        try:
+            consume(self._watch_tree(self.project_root))
+        except OSError:
+            self.close()
+            raise
+
+    def _relative(self, path: Path) -> str:
+        rel = path.relative_to(self.project_root).as_posix()
+        return "" if rel == "." else rel
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = int(self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK))
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"Cannot watch {directory}: {os.strerror(errno)}")
+        self._dirs[wd] = self._relative(directory)
+
+    def _watch_tree(self, directory: Path) -> list[str]:
+        # Returns the files found so callers can treat them as newly created.
+        files: list[str] = []
+        for root, dirs, names in os.walk(directory, followlinks=False):
+            root_path = Path(root)
+            dirs[:] = [name for name in dirs if name not in IGNORED_DIRNAMES and not (root_path / name).is_symlink()]
+            try:
+                self._add_watch(root_path)
+            except FileNotFoundError:
+                continue
+            files.extend(self._relative(root_path / name) for name in names)
+        return files
+
+    def poll(self, timeout: float) -> tuple[set[str], bool]:
+        """Wait up to ``timeout`` seconds and return the paths that changed.
+
+        Args:
+            timeout: Maximum number of seconds to wait for events.
+
+        Returns:
+            Tuple of (changed project-relative paths, overflow flag). The flag is
+            `True`when events were lost and every fingerprint must be rechecked.
+        """
+        started = time.time()
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            # Anything queued before the wait began would have woken it.
+            self.drained_at = started
+            return set(), False
+        changed: set[str] = set()
+        overflow = False
+        while True:
+            attempt = time.time()
+            try:
+                buffer = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                self.drained_at = attempt
+                break
+            if not buffer:
+                break
+            overflow = self._parse(buffer, changed) or overflow
+        return changed, overflow
+
+    def _parse(self, buffer: bytes, changed: set[str]) -> bool:
+        overflow = False
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            raw_name = buffer[offset + _EVENT_HEADER.size : offset + _EVENT_HEADER.size + length]
+            offset += _EVENT_HEADER.size + length
+            base = self._dirs.get(wd)
+            if mask & _IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if base is None:
+                continue
+            if mask & _IN_IGNORED:
+                consume(self._dirs.pop(wd, None))
+                continue
+            name = os.fsdecode(raw_name.rstrip(b"\0"))
+            if name in IGNORED_DIRNAMES:
+                continue
+            rel = f"{base}/{name}" if base and name else (base or name)
+            if not rel:
+                # The project root itself was moved or deleted.
+                overflow = True
+                continue
+            changed.add(rel)
+            if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                try:
+                    changed.update(self._watch_tree(self.project_root / rel))
+                except OSError as exc:
+                    logger.warning(
+                        "Cannot watch new directory %s: %s",
+                        rel,
+                        exc,
+                        extra=structured_extra(component=LogComponent.CACHE, path=rel),
+                    )
+                    overflow = True
+        return overflow
+
+    def close(self) -> None:
+        """Release the inotify descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def _triggers(paths: Iterable[str]) -> bool:
+    return any(path.endswith(TRIGGER_SUFFIXES) or "." not in path.rsplit("/", 1)[-1] for path in paths)
+
+
+def watch_project(
+    project_root: Path,
+    *,
+    on_change: Callable[[frozenset[str]], object] | None = None,
+    settle_seconds: float = 0.5,
+    should_stop: Callable[[], bool] = lambda: False,
+) -> None:
+    """Journal filesystem changes below ``project_root`` until stopped.
+
+    Args:
+        project_root: Project to watch; the journal lives in its cache directory.
+        on_change: Callback invoked with the changed paths once no further source
+            or config change arrived for ``settle_seconds`` (an empty set means
+            events were lost). It runs on a background thread so the journal
+            keeps its heartbeat; changes arriving meanwhile are batched into
+            the next call.
+        settle_seconds: Quiet period before ``on_change`` runs.
+        should_stop: Polled between event batches; the watcher exits once it
+            returns `True`, after waiting for a running ``on_change``.
+    """
+    watcher = InotifyWatcher(project_root)
+    journal = ChangeJournal(watcher.project_root)
+    consume(journal.begin())
+    pending: set[str] = set()
+    triggered = False
+    last_event = 0.0
+    worker: threading.Thread | None = None
+    try:
+        while not should_stop():
+            # A pending sync request is answered without waiting for events.
+            changed, overflow = watcher.poll(0.0 if journal.sync_requested() else _POLL_SECONDS)
+            if overflow:
+                logger.warning(
+                    "Filesystem events were lost; starting a new watch session",
+                    extra=structured_extra(component=LogComponent.CACHE, path=watcher.project_root),
+                )
+                consume(journal.begin())
+                pending.clear()
+            consume(journal.record(changed))
+            journal.drained(watcher.drained_at)
+            if overflow or _triggers(changed):
+                pending.update(changed)
+                triggered = True
+                last_event = time.monotonic()
+            journal.heartbeat()
+            if (
+                on_change is not None
+                and triggered
+                and time.monotonic() - last_event >= settle_seconds
+                and (worker is None or not worker.is_alive())
+            ):
+                worker = threading.Thread(
+                    target=on_change,
+                    args=(frozenset(pending),),
+                    name="ratchetr-watch-callback",
+                    daemon=True,
+                )
+                worker.start()
+                pending.clear()
+                triggered = False
+    finally:
+        if worker is not None:
+            worker.join()
+        watcher.close()
+        journal.close()
+
+
+__all__ = [
+    "CHECKPOINTS_FILENAME",
+    "IGNORED_DIRNAMES",
+    "JOURNAL_FILENAME",
+    "SYNC_FILENAME",
+    "TRIGGER_SUFFIXES",
+    "WATCH_DIRNAME",
+    "ChangeJournal",
+    "InotifyWatcher",
+    "WatchCheckpoint",
+    "WatchState",
+    "hashes_digest",
+    "watch_project",
+]
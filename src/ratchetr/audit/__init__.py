@@ -16,6 +16,6 @@
 
 from __future__ import annotations
 
-from . import api, execution, options, paths
+from . import api, execution, incremental, options, paths, planning
 
-__all__ = ["api", "execution", "options", "paths"]
+__all__ = ["api", "execution", "incremental", "options", "paths", "planning"]
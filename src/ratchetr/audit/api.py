@@ -18,16 +18,22 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import partial
 from typing import TYPE_CHECKING
 
-from ratchetr.audit.execution import execute_engine_mode, resolve_engine_options
+from ratchetr.audit.execution import execute_engine_mode
 from ratchetr.audit.options import merge_audit_configs
 from ratchetr.audit.paths import normalise_paths
-from ratchetr.cache import EngineCache
+from ratchetr.audit.planning import PlannedRun, RunPlan, plan_runs
+from ratchetr.cache import CACHE_DIRNAME, ChangeJournal, EngineCache
 from ratchetr.config import AuditConfig, Config, load_config
-from ratchetr.core.model_types import LogComponent, Mode, SeverityLevel
+from ratchetr.core.model_types import CacheBackend, LogComponent, SeverityLevel
+from ratchetr.core.types import DEFAULT_RAW_RETENTION
 from ratchetr.dashboard import build_summary, render_html, render_markdown
+from ratchetr.dashboard.cache import SummaryCache
 from ratchetr.engines import EngineContext, resolve_engines
 from ratchetr.json import normalise_enums_for_json
 from ratchetr.logging import structured_extra
@@ -56,6 +62,7 @@ class AuditResult:
     summary: SummaryData | None = None
     error_count: int = 0
     warning_count: int = 0
+    plan: RunPlan | None = None
 
 
 @dataclass(slots=True)
@@ -66,6 +73,7 @@ class _AuditInputs:
     engines: list[BaseEngine]
     tool_versions: dict[str, str]
     cache: EngineCache
+    journal: ChangeJournal
 
 
 def _determine_full_paths(
@@ -91,9 +99,9 @@ def _prepare_audit_inputs(
     audit_config = merge_audit_configs(cfg.audit, override)
     root = resolve_project_root(project_root)
     full_paths_normalised = _determine_full_paths(root, audit_config, full_paths)
-    engines = resolve_engines(audit_config.runners)
-    tool_versions = detect_tool_versions([engine.name for engine in engines])
-    cache = EngineCache(root)
+    engines = resolve_engines(audit_config.runners, cache_dir=root / CACHE_DIRNAME)
+    tool_versions = detect_tool_versions([engine.name for engine in engines], cache_dir=root / CACHE_DIRNAME)
+    cache = EngineCache(root, backend=audit_config.cache_backend or CacheBackend.JSON)
     inputs = _AuditInputs(
         root=root,
         audit_config=audit_config,
@@ -101,6 +109,7 @@ def _prepare_audit_inputs(
         engines=engines,
         tool_versions=tool_versions,
         cache=cache,
+        journal=ChangeJournal(root),
     )
 
     logger.debug(
@@ -114,41 +123,74 @@ def _prepare_audit_inputs(
     return cfg, inputs
 
 
-def _iterate_modes(audit_config: AuditConfig) -> list[Mode]:
-    modes: list[Mode] = []
-    if not audit_config.skip_current:
-        modes.append(Mode.CURRENT)
-    if not audit_config.skip_full:
-        modes.append(Mode.FULL)
-    return modes
+def _execute_planned_run(inputs: _AuditInputs, planned: PlannedRun) -> tuple[RunResult, bool]:
+    context = EngineContext(
+        project_root=inputs.root,
+        audit_config=inputs.audit_config,
+        mode=planned.mode,
+        engine_options=planned.engine_options,
+    )
+    return execute_engine_mode(
+        engine=planned.engine,
+        mode=planned.mode,
+        context=context,
+        audit_config=inputs.audit_config,
+        cache=inputs.cache,
+        tool_versions=inputs.tool_versions,
+        root=inputs.root,
+        full_paths_normalised=inputs.full_paths_normalised,
+        journal=inputs.journal,
+    )
+
+
+def _effective_engine_workers(audit_config: AuditConfig, planned_count: int) -> int:
+    requested = audit_config.max_parallel_engines or 1
+    return max(1, min(requested, planned_count))
 
 
-def _run_engines(inputs: _AuditInputs) -> tuple[list[RunResult], bool]:
+def _plan_audit_runs(inputs: _AuditInputs) -> RunPlan:
+    plan = plan_runs(
+        project_root=inputs.root,
+        audit_config=inputs.audit_config,
+        engines=inputs.engines,
+        full_paths_normalised=inputs.full_paths_normalised,
+    )
+    for skipped in plan.skipped:
+        logger.debug(
+            "Skipping %s (%s)",
+            skipped.key,
+            skipped.reason,
+            extra=structured_extra(
+                component=LogComponent.ENGINE,
+                tool=skipped.engine,
+                mode=skipped.mode,
+                details={"reason": str(skipped.reason), "served_by": skipped.served_by},
+            ),
+        )
+    return plan
+
+
+def _run_engines(inputs: _AuditInputs, plan: RunPlan) -> tuple[list[RunResult], bool]:
+    planned = list(plan.runs)
+    workers = _effective_engine_workers(inputs.audit_config, len(planned))
+    if workers <= 1:
+        outcomes = [_execute_planned_run(inputs, item) for item in planned]
+    else:
+        logger.debug(
+            "Executing %s engine runs with %s workers",
+            len(planned),
+            workers,
+            extra=structured_extra(component=LogComponent.ENGINE, details={"workers": workers}),
+        )
+        # executor.map yields results in submission order, keeping run ordering deterministic.
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ratchetr-engine") as executor:
+            outcomes = list(executor.map(partial(_execute_planned_run, inputs), planned))
     runs: list[RunResult] = []
-    truncated_any = False
-    modes = _iterate_modes(inputs.audit_config)
-    for engine in inputs.engines:
-        engine_options = resolve_engine_options(inputs.root, inputs.audit_config, engine)
-        for mode in modes:
-            context = EngineContext(
-                project_root=inputs.root,
-                audit_config=inputs.audit_config,
-                mode=mode,
-                engine_options=engine_options,
-            )
-            run_result, truncated = execute_engine_mode(
-                engine=engine,
-                mode=mode,
-                context=context,
-                audit_config=inputs.audit_config,
-                cache=inputs.cache,
-                tool_versions=inputs.tool_versions,
-                root=inputs.root,
-                full_paths_normalised=inputs.full_paths_normalised,
-            )
-            runs.append(run_result)
-            if truncated:
-                truncated_any = True
+    for item, (run_result, _truncated) in zip(planned, outcomes, strict=True):
+        runs.append(run_result)
+        # Modes with an identical command reuse the executed run's diagnostics.
+        runs.extend(replace(run_result, mode=mode) for mode in item.serves)
+    truncated_any = any(truncated for _run_result, truncated in outcomes)
     if truncated_any:
         logger.warning(
             "Fingerprint truncated across one or more runs",
@@ -172,7 +214,11 @@ def _persist_manifest_and_dashboards(
     build_summary_output: bool,
     persist_outputs: bool,
 ) -> tuple[ManifestData, SummaryData | None]:
-    builder = ManifestBuilder(inputs.root)
+    builder = ManifestBuilder(
+        inputs.root,
+        raw_retention=inputs.audit_config.raw_retention or DEFAULT_RAW_RETENTION,
+        tool_versions=inputs.tool_versions,
+    )
     builder.fingerprint_truncated = fingerprint_truncated
     depth = inputs.audit_config.max_depth or 3
     for run in runs:
@@ -180,9 +226,15 @@ def _persist_manifest_and_dashboards(
     manifest = builder.data
 
     manifest_target = write_manifest_to or inputs.audit_config.manifest_path
+    manifest_out: Path | None = None
     if persist_outputs and manifest_target is not None:
         out = manifest_target if manifest_target.is_absolute() else (inputs.root / manifest_target)
-        builder.write(out)
+        manifest_out = out
+        builder.write(
+            out,
+            compact=bool(inputs.audit_config.compact_manifest),
+            compression=inputs.audit_config.manifest_compression,
+        )
 
     should_build_summary = build_summary_output or (
         persist_outputs
@@ -193,6 +245,9 @@ def _persist_manifest_and_dashboards(
         )
     )
     summary = build_summary(manifest) if should_build_summary else None
+    if summary is not None and manifest_out is not None:
+        # Later dashboard/query/readiness reads of this manifest reuse the summary.
+        SummaryCache.for_project(inputs.root).store(manifest_out, summary)
 
     if summary is not None and persist_outputs:
         _write_dashboard_files(inputs, summary)
@@ -246,9 +301,10 @@ def _write_dashboard_files(inputs: _AuditInputs, summary: SummaryData) -> None:
 
 
 def _compute_run_totals(runs: list[RunResult]) -> tuple[int, int]:
-    error_count = sum(run.severity_counts().get(SeverityLevel.ERROR, 0) for run in runs)
-    warning_count = sum(run.severity_counts().get(SeverityLevel.WARNING, 0) for run in runs)
-    return error_count, warning_count
+    totals: Counter[SeverityLevel] = Counter()
+    for run in runs:
+        totals.update(run.severity_counts())
+    return totals[SeverityLevel.ERROR], totals[SeverityLevel.WARNING]
 
 
 def run_audit(
@@ -284,7 +340,8 @@ def run_audit(
         override=override,
         full_paths=full_paths,
     )
-    runs, fingerprint_truncated_any = _run_engines(inputs)
+    plan = _plan_audit_runs(inputs)
+    runs, fingerprint_truncated_any = _run_engines(inputs, plan)
     manifest, summary = _persist_manifest_and_dashboards(
         inputs=inputs,
         runs=runs,
@@ -316,4 +373,5 @@ def run_audit(
         summary=summary,
         error_count=error_count,
         warning_count=warning_count,
+        plan=plan,
     )
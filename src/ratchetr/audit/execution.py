@@ -17,26 +17,37 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING, cast
 
+from ratchetr.audit.incremental import merge_incremental_diagnostics, plan_incremental_run, summarise_diagnostics
 from ratchetr.audit.options import normalise_category_mapping, prepare_category_mapping
 from ratchetr.audit.paths import fingerprint_targets as build_fingerprint_targets
 from ratchetr.audit.paths import normalise_override_entries, normalise_paths, relative_override_path
-from ratchetr.cache import CachedRun, EngineCache, collect_file_hashes, fingerprint_path
+from ratchetr.cache import CACHE_DIRNAME, CachedRun, ChangeJournal, EngineCache, collect_file_hashes, fingerprint_path
 from ratchetr.collections import merge_preserve
-from ratchetr.core.model_types import FileHashPayload, LogComponent, Mode, OverrideEntry
+from ratchetr.core.model_types import (
+    FileHashPayload,
+    FingerprintSource,
+    LogComponent,
+    Mode,
+    OverrideEntry,
+    RawRetention,
+    SeverityLevel,
+)
 from ratchetr.core.type_aliases import CacheKey, EngineName, PathKey, ProfileName, RelPath, ToolName
-from ratchetr.core.types import RunResult
-from ratchetr.engines import EngineContext, EngineOptions
+from ratchetr.core.types import DEFAULT_RAW_RETENTION, DiagnosticTable, RunResult, apply_raw_retention
+from ratchetr.engines import EngineContext, EngineOptions, EngineResult
 from ratchetr.logging import StructuredLogExtra, structured_extra
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
     from pathlib import Path
 
+    from ratchetr.audit.incremental import IncrementalPlan
+    from ratchetr.cache import StaleCachedRun
     from ratchetr.config import AuditConfig, EngineProfile, EngineSettings, PathOverride
-    from ratchetr.engines.base import BaseEngine, EngineResult
+    from ratchetr.engines.base import BaseEngine
     from ratchetr.manifest.typed import ToolSummary
 
 
@@ -236,11 +247,22 @@ def _apply_path_override(
     )
 
 
-def _paths_for_mode(
+def paths_for_mode(
     mode: Mode,
     engine_options: EngineOptions,
     full_paths_normalised: Sequence[RelPath],
 ) -> list[RelPath]:
+    """Return the explicit targets an engine receives for ``mode``.
+
+    Args:
+        mode: `Mode`being evaluated (``current``/``full``).
+        engine_options: Resolved engine options providing include/exclude filters.
+        full_paths_normalised: Canonicalised set of include paths.
+
+    Returns:
+        Filtered full paths for `Mode.FULL`; an empty list for `Mode.CURRENT`,
+        where engines fall back to their project configuration.
+    """
     if mode is Mode.FULL:
         return apply_engine_paths(
             full_paths_normalised,
@@ -254,6 +276,7 @@ def _build_cache_flags(
     engine_name: str,
     engine_options: EngineOptions,
     tool_versions: Mapping[str, str],
+    raw_retention: RawRetention = DEFAULT_RAW_RETENTION,
 ) -> list[str]:
     cache_flags = list(engine_options.plugin_args)
     if engine_options.profile:
@@ -284,6 +307,10 @@ def _build_cache_flags(
     version = tool_versions.get(engine_name)
     if version:
         cache_flags.append(f"version={version}")
+    # Entries cached under a leaner policy cannot serve a richer one; the default
+    # policy adds no flag so existing cache keys stay valid.
+    if raw_retention is not DEFAULT_RAW_RETENTION:
+        cache_flags.append(f"raw={raw_retention}")
     return cache_flags
 
 
@@ -319,10 +346,22 @@ def _prepare_cache_inputs(  # noqa: PLR0913
     root: Path,
     full_paths_normalised: Sequence[RelPath],
     mode_paths: Sequence[RelPath],
+    journal: ChangeJournal | None = None,
 ) -> tuple[CacheKey, dict[PathKey, FileHashPayload], bool]:
-    cache_flags = _build_cache_flags(engine.name, engine_options, tool_versions)
+    cache_flags = _build_cache_flags(
+        engine.name,
+        engine_options,
+        tool_versions,
+        audit_config.raw_retention or DEFAULT_RAW_RETENTION,
+    )
     cache_key = cache.key_for(engine.name, mode, list(mode_paths), cache_flags)
     prev_hashes = cache.peek_file_hashes(cache_key)
+    # A running `ratchetr watch` lets unchanged baselines skip the tree walk.
+    if audit_config.fingerprint_source is FingerprintSource.GIT:
+        journal = None
+    elif journal is None:
+        journal = ChangeJournal(root)
+    checkpoint = journal.checkpoint(cache_key, prev_hashes) if journal is not None else None
     fingerprint_targets = _fingerprint_targets_for_run(
         engine=engine,
         context=context,
@@ -338,7 +377,12 @@ def _prepare_cache_inputs(  # noqa: PLR0913
         baseline=prev_hashes,
         max_bytes=getattr(audit_config, "max_bytes", None),
         hash_workers=audit_config.hash_workers,
+        fingerprint_source=audit_config.fingerprint_source,
+        hash_backend=audit_config.hash_backend,
+        changed_paths=checkpoint.changed if checkpoint is not None else None,
     )
+    if journal is not None and checkpoint is not None and not truncated:
+        journal.store_checkpoint(cache_key, checkpoint, file_hashes)
     return cache_key, file_hashes, truncated
 
 
@@ -355,7 +399,7 @@ def _build_cached_run_result(
         command=list(cached_run.command),
         exit_code=cached_run.exit_code,
         duration_ms=cached_run.duration_ms,
-        diagnostics=list(cached_run.diagnostics),
+        diagnostics=DiagnosticTable(cached_run.diagnostics),
         cached=True,
         profile=cached_run.profile,
         config_file=cached_run.config_file,
@@ -383,7 +427,7 @@ def _build_run_result(
         command=list(result.command),
         exit_code=result.exit_code,
         duration_ms=result.duration_ms,
-        diagnostics=list(result.diagnostics),
+        diagnostics=DiagnosticTable(result.diagnostics),
         cached=False,
         profile=engine_options.profile,
         config_file=engine_options.config_file,
@@ -397,6 +441,71 @@ def _build_run_result(
     )
 
 
+def _plan_incremental(
+    *,
+    cache: EngineCache,
+    cache_key: CacheKey,
+    file_hashes: dict[PathKey, FileHashPayload],
+    audit_config: AuditConfig,
+    root: Path,
+    mode_paths: Sequence[RelPath],
+    truncated: bool,
+) -> tuple[IncrementalPlan, StaleCachedRun] | None:
+    # Targeted re-checks need explicit paths (FULL mode) and a complete
+    # fingerprint set; anything else falls back to a full engine run.
+    if not audit_config.per_file_cache or truncated or not mode_paths:
+        return None
+    stale = cache.get_stale(cache_key, file_hashes)
+    if stale is None:
+        return None
+    plan = plan_incremental_run(root, file_hashes, stale.changed, stale.removed, cache_dir=root / CACHE_DIRNAME)
+    if plan is None:
+        return None
+    return plan, stale
+
+
+def _merge_incremental_result(
+    *,
+    root: Path,
+    plan: IncrementalPlan,
+    stale: StaleCachedRun,
+    result: EngineResult,
+) -> EngineResult:
+    merged = merge_incremental_diagnostics(root, plan, stale.run.diagnostics, result.diagnostics)
+    exit_code = result.exit_code
+    if not exit_code and any(diag.severity is SeverityLevel.ERROR for diag in merged):
+        exit_code = stale.run.exit_code or 1
+    tool_summary = (
+        summarise_diagnostics(merged) if result.tool_summary is not None or stale.run.tool_summary is not None else None
+    )
+    if plan.targets:
+        logger.info(
+            "Re-checked %s:%s with %s (%.1f ms)",
+            result.engine,
+            result.mode,
+            " ".join(result.command),
+            result.duration_ms,
+            extra=structured_extra(
+                component=LogComponent.CACHE,
+                tool=result.engine,
+                mode=result.mode,
+                cached=False,
+                duration_ms=result.duration_ms,
+                exit_code=result.exit_code,
+            ),
+        )
+    # The merged result stands in for the configured full run, so it keeps that
+    # run's command and duration; the narrowed re-check is only logged above.
+    return replace(
+        result,
+        command=list(stale.run.command),
+        duration_ms=stale.run.duration_ms,
+        diagnostics=merged,
+        exit_code=exit_code,
+        tool_summary=tool_summary,
+    )
+
+
 logger: logging.Logger = logging.getLogger("ratchetr.audit.execution")
 
 
@@ -506,6 +615,7 @@ def execute_engine_mode(  # noqa: PLR0913
     tool_versions: Mapping[str, str],
     root: Path,
     full_paths_normalised: Sequence[RelPath],
+    journal: ChangeJournal | None = None,
 ) -> tuple[RunResult, bool]:
     """Execute or fetch a cached engine run and return the result.
 
@@ -519,13 +629,15 @@ def execute_engine_mode(  # noqa: PLR0913
             cache invalidation.
         root: Project root directory.
         full_paths_normalised: Canonicalised set of include paths for caching.
+        journal: Watch journal opened when the audit started; a fresh one is
+            opened when omitted.
 
     Returns:
         A tuple containing the `RunResult`(either cached or freshly executed)
         and a boolean indicating whether fingerprint inputs were truncated.
     """
     engine_options = context.engine_options
-    mode_paths = _paths_for_mode(mode, engine_options, full_paths_normalised)
+    mode_paths = paths_for_mode(mode, engine_options, full_paths_normalised)
     cache_key, file_hashes, truncated = _prepare_cache_inputs(
         engine=engine,
         mode=mode,
@@ -537,6 +649,7 @@ def execute_engine_mode(  # noqa: PLR0913
         root=root,
         full_paths_normalised=full_paths_normalised,
         mode_paths=mode_paths,
+        journal=journal,
     )
 
     cached_run = cache.get(cache_key, file_hashes)
@@ -573,8 +686,42 @@ def execute_engine_mode(  # noqa: PLR0913
         extra=cache_miss_extra,
     )
 
+    incremental = _plan_incremental(
+        cache=cache,
+        cache_key=cache_key,
+        file_hashes=file_hashes,
+        audit_config=audit_config,
+        root=root,
+        mode_paths=mode_paths,
+        truncated=truncated,
+    )
+    run_paths = list(mode_paths)
+    if incremental is not None:
+        plan, stale = incremental
+        run_paths = [RelPath(str(target)) for target in plan.targets]
+        logger.info(
+            "Incremental re-check for %s:%s (%s changed, %s removed, %s re-checked)",
+            engine.name,
+            mode,
+            len(stale.changed),
+            len(stale.removed),
+            len(run_paths),
+            extra=structured_extra(component=LogComponent.CACHE, tool=engine.name, mode=mode, cached=False),
+        )
+
     try:
-        result = engine.run(context, mode_paths)
+        if incremental is not None and not run_paths:
+            # Only deletions without importers: nothing to re-check.
+            result = EngineResult(
+                engine=ToolName(engine.name),
+                mode=mode,
+                command=list(incremental[1].run.command),
+                exit_code=0,
+                duration_ms=incremental[1].run.duration_ms,
+                diagnostics=[],
+            )
+        else:
+            result = engine.run(context, run_paths)
     # ignore JUSTIFIED: engine plugins may raise arbitrary exceptions;
     # wrapper must convert all failures into structured RunResult
     except Exception as exc:  # pylint: disable=broad-exception-caught
@@ -594,7 +741,7 @@ def execute_engine_mode(  # noqa: PLR0913
             command=[engine.name, mode],
             exit_code=1,
             duration_ms=0.0,
-            diagnostics=[],
+            diagnostics=DiagnosticTable(),
             cached=False,
             profile=engine_options.profile,
             config_file=engine_options.config_file,
@@ -609,6 +756,11 @@ def execute_engine_mode(  # noqa: PLR0913
         )
         return run_result, truncated
 
+    if incremental is not None:
+        result = _merge_incremental_result(root=root, plan=incremental[0], stale=incremental[1], result=result)
+    # Builtin engines trim while parsing; plugin engine payloads are trimmed here.
+    result.diagnostics = apply_raw_retention(result.diagnostics, audit_config.raw_retention or DEFAULT_RAW_RETENTION)
+
     run_extra: StructuredLogExtra = structured_extra(
         component=LogComponent.CLI,
         tool=engine.name,
@@ -0,0 +1,403 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-file incremental re-checking for partially stale cache entries.
+
+When only a handful of fingerprints change between runs, the engine is
+re-invoked on the changed files plus every file that (transitively) imports
+them. Diagnostics for the remaining files are reused from the cached run.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import logging
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING, Final, cast
+
+from ratchetr.core.model_types import LogComponent, SeverityLevel
+from ratchetr.core.type_aliases import PathKey
+from ratchetr.logging import structured_extra
+from ratchetr.manifest.typed import ToolSummary
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+    from pathlib import Path
+
+    from ratchetr.core.types import Diagnostic
+
+PYTHON_SUFFIXES: Final[tuple[str, ...]] = (".py", ".pyi")
+# Re-checking more than this fraction of the fingerprinted files is rarely
+# cheaper than a full run, so the planner falls back instead.
+MAX_RECHECK_RATIO: Final[float] = 0.5
+IMPORT_GRAPH_FILENAME: Final[str] = "import_graph.json"
+_IMPORT_GRAPH_VERSION: Final[int] = 1
+
+logger: logging.Logger = logging.getLogger("ratchetr.audit.incremental")
+
+# Imports parsed for each file, tagged with the content hash they were parsed from.
+_IMPORTS_BY_FILE: dict[PathKey, tuple[str, frozenset[str]]] = {}
+_IMPORTS_LOCK = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
+class IncrementalPlan:
+    """Files to re-check and drop when refreshing a stale cached run.
+
+    Attributes:
+        targets: Existing files that must be re-checked by the engine.
+        removed: Files whose cached diagnostics must be discarded.
+    """
+
+    targets: tuple[PathKey, ...]
+    removed: tuple[PathKey, ...]
+
+    @property
+    def invalidated(self) -> frozenset[PathKey]:
+        """Return every file whose cached diagnostics are no longer valid.
+
+        Returns:
+            Union of the re-check targets and the removed files.
+        """
+        return frozenset(self.targets) | frozenset(self.removed)
+
+
+def _module_names(path_key: PathKey) -> list[str]:
+    parts = list(PurePosixPath(path_key).with_suffix("").parts)
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    # Every suffix is a candidate module name because source roots (``src/``,
+    # namespace folders) are not known here; over-approximation is safe.
+    return [".".join(parts[index:]) for index in range(len(parts))]
+
+
+def _package_parts(path_key: PathKey) -> list[str]:
+    # Relative imports resolve against the containing directory for both
+    # plain modules and ``__init__`` files.
+    return list(PurePosixPath(path_key).parent.parts)
+
+
+def _with_parents(name: str) -> Iterable[str]:
+    parts = name.split(".")
+    return (".".join(parts[: index + 1]) for index in range(len(parts)))
+
+
+def _imported_modules(path_key: PathKey, source: str) -> set[str]:
+    try:
+        tree = ast.parse(source, filename=str(path_key))
+    except (SyntaxError, ValueError):
+        return set()
+    modules: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                modules.update(_with_parents(alias.name))
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                package = _package_parts(path_key)
+                anchor = package[: len(package) - (node.level - 1)] if node.level > 1 else package
+                base_parts = [*anchor, *(node.module.split(".") if node.module else [])]
+            else:
+                base_parts = node.module.split(".") if node.module else []
+            if not base_parts:
+                continue
+            base = ".".join(base_parts)
+            modules.update(_with_parents(base))
+            modules.update(f"{base}.{alias.name}" for alias in node.names if alias.name != "*")
+    return modules
+
+
+def _fingerprint_digest(payload: object) -> str | None:
+    if not isinstance(payload, dict):
+        return None
+    digest = cast("dict[str, object]", payload).get("hash")
+    return digest if isinstance(digest, str) and digest else None
+
+
+def _read_import_graph(path: Path) -> dict[PathKey, tuple[str, frozenset[str]]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    document = cast("dict[str, object]", payload)
+    if document.get("version") != _IMPORT_GRAPH_VERSION:
+        return {}
+    files = document.get("files")
+    if not isinstance(files, dict):
+        return {}
+    graph: dict[PathKey, tuple[str, frozenset[str]]] = {}
+    for key, entry in cast("dict[str, object]", files).items():
+        if not isinstance(entry, dict):
+            continue
+        record = cast("dict[str, object]", entry)
+        digest = record.get("hash")
+        imports = record.get("imports")
+        if isinstance(digest, str) and isinstance(imports, list):
+            graph[PathKey(key)] = (digest, frozenset(str(name) for name in cast("list[object]", imports)))
+    return graph
+
+
+def _write_import_graph(path: Path, graph: Mapping[PathKey, tuple[str, frozenset[str]]]) -> None:
+    payload = {
+        "version": _IMPORT_GRAPH_VERSION,
+        "files": {
+            str(key): {"hash": digest, "imports": sorted(imports)} for key, (digest, imports) in sorted(graph.items())
+        },
+    }
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _ = tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        _ = tmp_path.replace(path)
+    except OSError as exc:
+        tmp_path.unlink(missing_ok=True)
+        logger.debug(
+            "Failed to persist import graph to %s: %s",
+            path,
+            exc,
+            extra=structured_extra(component=LogComponent.CACHE, path=path),
+        )
+
+
+def _parse_imports(project_root: Path, key: PathKey) -> frozenset[str] | None:
+    try:
+        source = (project_root / key).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    return frozenset(_imported_modules(key, source))
+
+
+def _cached_imports(
+    graph: Mapping[PathKey, tuple[str, frozenset[str]]] | None,
+    key: PathKey,
+    digest: str,
+) -> frozenset[str] | None:
+    entry = graph.get(key) if graph is not None else None
+    return entry[1] if entry is not None and entry[0] == digest else None
+
+
+def _file_imports(
+    project_root: Path,
+    python_files: Sequence[PathKey],
+    fingerprints: Mapping[PathKey, object],
+    cache_dir: Path | None,
+) -> dict[PathKey, frozenset[str]]:
+    graph_path = cache_dir / IMPORT_GRAPH_FILENAME if cache_dir is not None else None
+    with _IMPORTS_LOCK:
+        memo = dict(_IMPORTS_BY_FILE)
+    disk: dict[PathKey, tuple[str, frozenset[str]]] | None = None
+    resolved: dict[PathKey, frozenset[str]] = {}
+    hashed: dict[PathKey, tuple[str, frozenset[str]]] = {}
+    for key in python_files:
+        digest = _fingerprint_digest(fingerprints.get(key))
+        imports = _cached_imports(memo, key, digest) if digest is not None else None
+        if imports is None and digest is not None and graph_path is not None:
+            if disk is None:
+                disk = _read_import_graph(graph_path)
+            imports = _cached_imports(disk, key, digest)
+        if imports is None:
+            imports = _parse_imports(project_root, key)
+            if imports is None:
+                continue
+        resolved[key] = imports
+        if digest is not None:
+            hashed[key] = (digest, imports)
+    with _IMPORTS_LOCK:
+        _IMPORTS_BY_FILE.update(hashed)
+    # The on-disk graph is rewritten only when it no longer matches this run's files.
+    if graph_path is not None and disk is not None and disk != hashed:
+        _write_import_graph(graph_path, hashed)
+    return resolved
+
+
+def _importer_map(
+    project_root: Path,
+    files: Iterable[PathKey],
+    seeds: Iterable[PathKey],
+    *,
+    fingerprints: Mapping[PathKey, object],
+    cache_dir: Path | None,
+) -> dict[PathKey, set[PathKey]]:
+    python_files = [key for key in files if str(key).endswith(PYTHON_SUFFIXES)]
+    module_index: dict[str, set[PathKey]] = {}
+    # Seeds are indexed too so importers of removed files are still discovered.
+    for key in {*python_files, *seeds}:
+        for name in _module_names(key):
+            module_index.setdefault(name, set()).add(key)
+
+    importers: dict[PathKey, set[PathKey]] = {}
+    for key, modules in _file_imports(project_root, python_files, fingerprints, cache_dir).items():
+        for module in modules:
+            for target in module_index.get(module, ()):
+                if target != key:
+                    importers.setdefault(target, set()).add(key)
+    return importers
+
+
+def reverse_import_closure(
+    project_root: Path,
+    files: Iterable[PathKey],
+    seeds: Iterable[PathKey],
+    *,
+    fingerprints: Mapping[PathKey, object] | None = None,
+    cache_dir: Path | None = None,
+) -> set[PathKey]:
+    """Return ``seeds`` plus every file that transitively imports one of them.
+
+    When ``fingerprints`` are given, the imports parsed for a file are reused
+    while its content hash is unchanged, both within the process and (with
+    ``cache_dir``) across runs.
+
+    Args:
+        project_root: Root directory that ``files`` are relative to.
+        files: Python files participating in the run.
+        seeds: Files whose importers should be discovered.
+        fingerprints: Optional fingerprint payloads of ``files``, keyed by file.
+        cache_dir: Optional cache directory persisting the parsed import graph.
+
+    Returns:
+        Set containing the seeds and all of their (transitive) importers.
+    """
+    seed_keys = set(seeds)
+    importers = _importer_map(
+        project_root,
+        files,
+        seed_keys,
+        fingerprints=fingerprints if fingerprints is not None else {},
+        cache_dir=cache_dir,
+    )
+    closure: set[PathKey] = set(seed_keys)
+    queue: deque[PathKey] = deque(closure)
+    while queue:
+        current = queue.popleft()
+        for importer in importers.get(current, ()):
+            if importer not in closure:
+                closure.add(importer)
+                queue.append(importer)
+    return closure
+
+
+def plan_incremental_run(
+    project_root: Path,
+    file_hashes: Mapping[PathKey, object],
+    changed: Sequence[PathKey],
+    removed: Sequence[PathKey],
+    *,
+    cache_dir: Path | None = None,
+) -> IncrementalPlan | None:
+    """Decide which files need re-checking for a partially stale cache entry.
+
+    Args:
+        project_root: Root directory that fingerprint keys are relative to.
+        file_hashes: Current fingerprints for the run.
+        changed: Files added or modified since the cached run.
+        removed: Files that disappeared since the cached run.
+        cache_dir: Optional cache directory persisting the parsed import graph.
+
+    Returns:
+        `IncrementalPlan`describing the targeted re-check, or `None`when a full
+        run is required (non-Python inputs changed or too many files are affected).
+    """
+    invalidated = [*changed, *removed]
+    if not invalidated or not file_hashes:
+        return None
+    if any(not str(key).endswith(PYTHON_SUFFIXES) for key in invalidated):
+        return None
+    closure = reverse_import_closure(
+        project_root,
+        file_hashes,
+        invalidated,
+        fingerprints=file_hashes,
+        cache_dir=cache_dir,
+    )
+    targets = sorted(key for key in closure if key in file_hashes)
+    if len(targets) > len(file_hashes) * MAX_RECHECK_RATIO:
+        return None
+    return IncrementalPlan(targets=tuple(targets), removed=tuple(sorted(removed)))
+
+
+def diagnostic_path_key(project_root: Path, path: Path) -> PathKey:
+    """Map a diagnostic path onto the fingerprint key space.
+
+    Args:
+        project_root: Root directory that fingerprint keys are relative to.
+        path: Diagnostic path (relative or absolute).
+
+    Returns:
+        POSIX path relative to ``project_root`` when possible.
+    """
+    if path.is_absolute():
+        try:
+            return PathKey(path.relative_to(project_root).as_posix())
+        except ValueError:
+            return PathKey(path.as_posix())
+    return PathKey(path.as_posix())
+
+
+def merge_incremental_diagnostics(
+    project_root: Path,
+    plan: IncrementalPlan,
+    cached: Sequence[Diagnostic],
+    fresh: Sequence[Diagnostic],
+) -> list[Diagnostic]:
+    """Combine cached diagnostics for untouched files with re-checked results.
+
+    Args:
+        project_root: Root directory that fingerprint keys are relative to.
+        plan: Plan used for the targeted re-check.
+        cached: Diagnostics recorded by the stale cached run.
+        fresh: Diagnostics emitted by the targeted re-check.
+
+    Returns:
+        Merged diagnostics sorted by path, line, and column.
+    """
+    invalidated = plan.invalidated
+    targets = frozenset(plan.targets)
+    merged = [diag for diag in cached if diagnostic_path_key(project_root, diag.path) not in invalidated]
+    merged.extend(diag for diag in fresh if diagnostic_path_key(project_root, diag.path) in targets)
+    merged.sort(key=lambda diag: (str(diag.path), diag.line, diag.column))
+    return merged
+
+
+def summarise_diagnostics(diagnostics: Sequence[Diagnostic]) -> ToolSummary:
+    """Return tool-summary counts recomputed from merged diagnostics.
+
+    Args:
+        diagnostics: Diagnostics to count.
+
+    Returns:
+        `ToolSummary`with error, warning, information, and total counts.
+    """
+    errors = sum(1 for diag in diagnostics if diag.severity is SeverityLevel.ERROR)
+    warnings = sum(1 for diag in diagnostics if diag.severity is SeverityLevel.WARNING)
+    information = sum(1 for diag in diagnostics if diag.severity is SeverityLevel.INFORMATION)
+    return ToolSummary(errors=errors, warnings=warnings, information=information, total=len(diagnostics))
+
+
+__all__ = [
+    "IMPORT_GRAPH_FILENAME",
+    "IncrementalPlan",
+    "diagnostic_path_key",
+    "merge_incremental_diagnostics",
+    "plan_incremental_run",
+    "reverse_import_closure",
+    "summarise_diagnostics",
+]
@@ -166,6 +166,15 @@ def clone_audit_config(source: AuditConfig) -> AuditConfig:
         skip_full=source.skip_full,
         fail_on=source.fail_on,
         hash_workers=source.hash_workers,
+        hash_backend=source.hash_backend,
+        max_parallel_engines=source.max_parallel_engines,
+        per_file_cache=source.per_file_cache,
+        daemon=source.daemon,
+        cache_backend=source.cache_backend,
+        raw_retention=source.raw_retention,
+        fingerprint_source=source.fingerprint_source,
+        compact_manifest=source.compact_manifest,
+        manifest_compression=source.manifest_compression,
         dashboard_json=source.dashboard_json,
         dashboard_markdown=source.dashboard_markdown,
         dashboard_html=source.dashboard_html,
@@ -201,6 +210,21 @@ def merge_audit_configs(base: AuditConfig, override: AuditConfig | None) -> Audi
         skip_full=override.skip_full if override.skip_full is not None else base_copy.skip_full,
         fail_on=override.fail_on or base_copy.fail_on,
         hash_workers=(override.hash_workers if override.hash_workers is not None else base_copy.hash_workers),
+        hash_backend=override.hash_backend or base_copy.hash_backend,
+        max_parallel_engines=(
+            override.max_parallel_engines
+            if override.max_parallel_engines is not None
+            else base_copy.max_parallel_engines
+        ),
+        per_file_cache=(override.per_file_cache if override.per_file_cache is not None else base_copy.per_file_cache),
+        daemon=override.daemon if override.daemon is not None else base_copy.daemon,
+        cache_backend=override.cache_backend or base_copy.cache_backend,
+        raw_retention=override.raw_retention or base_copy.raw_retention,
+        fingerprint_source=override.fingerprint_source or base_copy.fingerprint_source,
+        compact_manifest=(
+            override.compact_manifest if override.compact_manifest is not None else base_copy.compact_manifest
+        ),
+        manifest_compression=override.manifest_compression or base_copy.manifest_compression,
         dashboard_json=override.dashboard_json or base_copy.dashboard_json,
         dashboard_markdown=override.dashboard_markdown or base_copy.dashboard_markdown,
         dashboard_html=override.dashboard_html or base_copy.dashboard_html,
@@ -0,0 +1,202 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Plan the engine:mode runs executed by an audit.
+
+The planner expands the configured engines and modes into engine:mode pairs,
+drops duplicate pairs and disabled modes, and lets a single run serve both
+modes when the engine reports identical commands for them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+from ratchetr.audit.execution import paths_for_mode, resolve_engine_options
+from ratchetr.core.model_types import Mode, RunSkipReason
+from ratchetr.engines import EngineContext
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from pathlib import Path
+
+    from ratchetr.config import AuditConfig
+    from ratchetr.core.type_aliases import RelPath
+    from ratchetr.engines.base import BaseEngine, EngineOptions
+
+
+@dataclass(slots=True, frozen=True)
+class PlannedRun:
+    """Engine:mode pair the audit executes.
+
+    Attributes:
+        engine: Engine to execute.
+        mode: Mode the engine runs in.
+        engine_options: Resolved options for the engine.
+        command: Command reported by `BaseEngine.plan_command`, if any.
+        serves: Further modes whose results are copied from this run.
+    """
+
+    engine: BaseEngine
+    mode: Mode
+    engine_options: EngineOptions
+    command: tuple[str, ...] | None = None
+    serves: tuple[Mode, ...] = ()
+
+    @property
+    def key(self) -> str:
+        """Return the ``<engine>:<mode>`` label of the run.
+
+        Returns:
+            Label used in logs and dry-run output.
+        """
+        return f"{self.engine.name}:{self.mode}"
+
+
+@dataclass(slots=True, frozen=True)
+class SkippedRun:
+    """Engine:mode pair the planner decided not to execute.
+
+    Attributes:
+        engine: Name of the engine.
+        mode: Mode that is skipped.
+        reason: Why the pair is skipped.
+        served_by: Label of the planned run whose result is reused, if any.
+    """
+
+    engine: str
+    mode: Mode
+    reason: RunSkipReason
+    served_by: str | None = None
+
+    @property
+    def key(self) -> str:
+        """Return the ``<engine>:<mode>`` label of the skipped pair.
+
+        Returns:
+            Label used in logs and dry-run output.
+        """
+        return f"{self.engine}:{self.mode}"
+
+
+@dataclass(slots=True, frozen=True)
+class RunPlan:
+    """Planned and skipped engine:mode pairs for one audit.
+
+    Attributes:
+        runs: Runs to execute, in engine then mode order.
+        skipped: Pairs that are not executed.
+    """
+
+    runs: tuple[PlannedRun, ...]
+    skipped: tuple[SkippedRun, ...]
+
+
+def enabled_modes(audit_config: AuditConfig) -> list[Mode]:
+    """Return the modes an audit runs, in execution order.
+
+    Args:
+        audit_config: Audit configuration providing the skip flags.
+
+    Returns:
+        `Mode.CURRENT` and/or `Mode.FULL`.
+    """
+    modes: list[Mode] = []
+    if not audit_config.skip_current:
+        modes.append(Mode.CURRENT)
+    if not audit_config.skip_full:
+        modes.append(Mode.FULL)
+    return modes
+
+
+def _plan_engine(
+    engine: BaseEngine,
+    modes: Sequence[Mode],
+    *,
+    project_root: Path,
+    audit_config: AuditConfig,
+    full_paths_normalised: Sequence[RelPath],
+) -> tuple[list[PlannedRun], list[SkippedRun]]:
+    engine_options = resolve_engine_options(project_root, audit_config, engine)
+    runs: list[PlannedRun] = []
+    skipped: list[SkippedRun] = []
+    for mode in modes:
+        context = EngineContext(
+            project_root=project_root,
+            audit_config=audit_config,
+            mode=mode,
+            engine_options=engine_options,
+        )
+        # Structural engines written before ``plan_command`` existed may lack it.
+        describe: Callable[[EngineContext, Sequence[RelPath]], Sequence[str] | None] | None = getattr(
+            engine, "plan_command", None
+        )
+        mode_paths = paths_for_mode(mode, engine_options, full_paths_normalised)
+        command = describe(context, mode_paths) if describe is not None else None
+        planned_command = tuple(command) if command is not None else None
+        twin = next(
+            (index for index, run in enumerate(runs) if planned_command and run.command == planned_command),
+            None,
+        )
+        if twin is None:
+            runs.append(PlannedRun(engine=engine, mode=mode, engine_options=engine_options, command=planned_command))
+            continue
+        runs[twin] = replace(runs[twin], serves=(*runs[twin].serves, mode))
+        skipped.append(SkippedRun(engine.name, mode, RunSkipReason.IDENTICAL, served_by=runs[twin].key))
+    return runs, skipped
+
+
+def plan_runs(
+    *,
+    project_root: Path,
+    audit_config: AuditConfig,
+    engines: Sequence[BaseEngine],
+    full_paths_normalised: Sequence[RelPath],
+) -> RunPlan:
+    """Expand engines and modes into the runs an audit executes.
+
+    Args:
+        project_root: Project root directory.
+        audit_config: Effective audit configuration.
+        engines: Engines selected for the audit; repeated engines are skipped.
+        full_paths_normalised: Canonicalised include paths for full runs.
+
+    Returns:
+        `RunPlan` listing executed runs and skipped engine:mode pairs.
+    """
+    modes = enabled_modes(audit_config)
+    disabled = [mode for mode in Mode if mode not in modes]
+    runs: list[PlannedRun] = []
+    skipped: list[SkippedRun] = []
+    seen: set[str] = set()
+    for engine in engines:
+        if engine.name in seen:
+            skipped.extend(SkippedRun(engine.name, mode, RunSkipReason.DUPLICATE) for mode in modes)
+            continue
+        seen.add(engine.name)
+        skipped.extend(SkippedRun(engine.name, mode, RunSkipReason.DISABLED) for mode in disabled)
+        engine_runs, engine_skipped = _plan_engine(
+            engine,
+            modes,
+            project_root=project_root,
+            audit_config=audit_config,
+            full_paths_normalised=full_paths_normalised,
+        )
+        runs.extend(engine_runs)
+        skipped.extend(engine_skipped)
+    return RunPlan(runs=tuple(runs), skipped=tuple(skipped))
+
+
+__all__ = ["PlannedRun", "RunPlan", "SkippedRun", "enabled_modes", "plan_runs"]
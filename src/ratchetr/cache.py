@@ -19,13 +19,24 @@ from __future__ import annotations
 from ratchetr._internal.cache import (
     CachedRun,
     EngineCache,
+    StaleCachedRun,
+    cache_stats,
     collect_file_hashes,
     fingerprint_path,
+    read_cache_entries,
 )
+from ratchetr._internal.cache_stores import CACHE_DIRNAME
+from ratchetr._internal.watch import ChangeJournal, WatchCheckpoint
 
 __all__ = [
+    "CACHE_DIRNAME",
     "CachedRun",
+    "ChangeJournal",
     "EngineCache",
+    "StaleCachedRun",
+    "WatchCheckpoint",
+    "cache_stats",
     "collect_file_hashes",
     "fingerprint_path",
+    "read_cache_entries",
 ]
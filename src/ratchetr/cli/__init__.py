@@ -16,13 +16,20 @@
 
 from __future__ import annotations
 
-from .app import main, write_config_template
-from .helpers.formatting import (
-    SUMMARY_FIELD_CHOICES,
-    print_readiness_summary,
-    print_summary,
-    query_readiness,
-)
+from typing import TYPE_CHECKING
+
+from ratchetr.lazy import lazy_exports
+
+from .app import main
+
+if TYPE_CHECKING:
+    from .app import write_config_template
+    from .helpers.formatting import (
+        SUMMARY_FIELD_CHOICES,
+        print_readiness_summary,
+        print_summary,
+        query_readiness,
+    )
 
 # ignore JUSTIFIED: CLI version import must tolerate partial installs; defensive import
 # avoids runtime failures when metadata is unavailable
@@ -42,3 +49,16 @@ __all__ = [
     "query_readiness",
     "write_config_template",
 ]
+
+# Imported on first access so `ratchetr` startup skips the formatting helpers
+# and the init command module.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "SUMMARY_FIELD_CHOICES": ".helpers.formatting",
+        "print_readiness_summary": ".helpers.formatting",
+        "print_summary": ".helpers.formatting",
+        "query_readiness": ".helpers.formatting",
+        "write_config_template": ".app",
+    },
+)
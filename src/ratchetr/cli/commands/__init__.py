@@ -22,7 +22,20 @@ from typing import TYPE_CHECKING, Final
 if TYPE_CHECKING:
     from types import ModuleType
 
-_EXPORTED_MODULES: Final[tuple[str, ...]] = ("audit", "cache", "engines", "help", "manifest", "query", "ratchet")
+_EXPORTED_MODULES: Final[tuple[str, ...]] = (
+    "audit",
+    "cache",
+    "daemon",
+    "dashboard",
+    "engines",
+    "help",
+    "init",
+    "manifest",
+    "query",
+    "ratchet",
+    "readiness",
+    "watch",
+)
 # ignore JUSTIFIED: dynamic CLI submodule re-export; dunder-all is populated from a
 # fixed tuple of module names
 __all__ = list(_EXPORTED_MODULES)  # pyright: ignore[reportUnsupportedDunderAll]
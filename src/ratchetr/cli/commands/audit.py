@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import argparse
+import shlex
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -27,18 +28,26 @@ from ratchetr.cli.helpers import (
     collect_plugin_args,
     collect_profile_args,
     normalise_modes,
+    parse_hash_backend,
     parse_hash_workers,
+    parse_jobs,
+    parse_manifest_validation,
     parse_summary_fields,
     print_readiness_summary,
     print_summary,
     register_argument,
+    register_manifest_validation_argument,
 )
 from ratchetr.cli.helpers.io import echo as _echo
 from ratchetr.config import AuditConfig, Config, load_config
 from ratchetr.core.model_types import (
+    CacheBackend,
     DashboardView,
     FailOnPolicy,
+    FingerprintSource,
+    ManifestCompression,
     Mode,
+    RawRetention,
     ReadinessLevel,
     ReadinessStatus,
     SeverityLevel,
@@ -46,6 +55,7 @@ from ratchetr.core.model_types import (
     SummaryStyle,
 )
 from ratchetr.core.type_aliases import EngineName, ProfileName
+from ratchetr.dashboard.cache import SummaryCache
 from ratchetr.runtime import default_full_paths, resolve_project_root
 from ratchetr.services.audit import AuditResult, run_audit
 from ratchetr.services.dashboard import emit_dashboard_outputs, load_summary_from_manifest
@@ -53,6 +63,7 @@ from ratchetr.services.dashboard import emit_dashboard_outputs, load_summary_fro
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from ratchetr.audit.planning import RunPlan
     from ratchetr.cli.types import SubparserCollection
     from ratchetr.core.summary_types import SummaryData
     from ratchetr.core.types import RunResult
@@ -143,7 +154,74 @@ def register_audit_command(subparsers: SubparserCollection) -> None:
         dest="hash_workers",
         default=None,
         metavar="WORKERS",
-        help="Hash worker pool size ('auto' or non-negative integer).",
+        help=(
+            "Hash worker pool size ('auto' or non-negative integer), optionally followed by "
+            "',backend=thread|process' (e.g. 'auto,backend=process')."
+        ),
+    )
+    register_argument(
+        audit,
+        "--jobs",
+        dest="max_parallel_engines",
+        default=None,
+        metavar="N",
+        help="Maximum number of engine runs executed concurrently (default: sequential).",
+    )
+    register_argument(
+        audit,
+        "--per-file-cache",
+        dest="per_file_cache",
+        action="store_true",
+        default=None,
+        help="Re-check only changed files (and their importers) when the cache is partially stale.",
+    )
+    register_argument(
+        audit,
+        "--daemon",
+        dest="daemon",
+        action="store_true",
+        default=None,
+        help="Reuse long-lived engine daemons (dmypy for mypy) so repeated audits only pay incremental cost.",
+    )
+    register_argument(
+        audit,
+        "--compact-manifest",
+        dest="compact_manifest",
+        action="store_true",
+        default=None,
+        help="Write the manifest without indentation (smaller and faster for large projects).",
+    )
+    register_argument(
+        audit,
+        "--manifest-compression",
+        dest="manifest_compression",
+        choices=[compression.value for compression in ManifestCompression],
+        default=None,
+        help="Compress the manifest (default: inferred from a .gz/.zst manifest extension).",
+    )
+    register_argument(
+        audit,
+        "--cache-backend",
+        dest="cache_backend",
+        choices=[backend.value for backend in CacheBackend],
+        default=None,
+        help="Engine cache storage backend (default: json).",
+    )
+    register_argument(
+        audit,
+        "--raw-retention",
+        dest="raw_retention",
+        choices=[policy.value for policy in RawRetention],
+        default=None,
+        help="How much of each tool-native diagnostic payload to keep (default: minimal).",
+    )
+    register_argument(
+        audit,
+        "--fingerprint-source",
+        dest="fingerprint_source",
+        choices=[source.value for source in FingerprintSource],
+        default=None,
+        help="Where cache fingerprints come from; 'git' reuses index blob ids for clean files (default: filesystem).",
     )
     register_argument(
         audit,
@@ -222,11 +300,12 @@ def register_audit_command(subparsers: SubparserCollection) -> None:
         default=None,
         help=("Optional path to a previous manifest to compare totals against (adds deltas to CI line)."),
     )
+    register_manifest_validation_argument(audit)
     register_argument(
         audit,
         "--dry-run",
         action="store_true",
-        help="Skip writing manifests and dashboards; report summaries only.",
+        help="Skip writing manifests and dashboards; print the run plan and report summaries only.",
     )
     register_argument(
         audit,
@@ -374,7 +453,11 @@ def _build_delta_line(
     if not args.compare_to or not args.compare_to.exists():
         return ""
     try:
-        prev_summary = load_summary_from_manifest(args.compare_to)
+        prev_summary = load_summary_from_manifest(
+            args.compare_to,
+            cache=SummaryCache.for_manifest(args.compare_to),
+            validation=parse_manifest_validation(getattr(args, "validate", None)),
+        )
         prev_totals = prev_summary["tabs"]["overview"]["severityTotals"]
         de = error_count - int(prev_totals.get(SeverityLevel.ERROR, 0))
         dw = warning_count - int(prev_totals.get(SeverityLevel.WARNING, 0))
@@ -417,6 +500,17 @@ def _build_cli_override(
         skip_full=(not run_full) if modes_specified else None,
         fail_on=cli_fail_on,
         hash_workers=parse_hash_workers(args.hash_workers),
+        hash_backend=parse_hash_backend(args.hash_workers),
+        max_parallel_engines=parse_jobs(args.max_parallel_engines),
+        per_file_cache=args.per_file_cache,
+        daemon=args.daemon,
+        compact_manifest=args.compact_manifest,
+        manifest_compression=(
+            ManifestCompression.from_str(args.manifest_compression) if args.manifest_compression else None
+        ),
+        cache_backend=CacheBackend.from_str(args.cache_backend) if args.cache_backend else None,
+        raw_retention=RawRetention.from_str(args.raw_retention) if args.raw_retention else None,
+        fingerprint_source=FingerprintSource.from_str(args.fingerprint_source) if args.fingerprint_source else None,
         dashboard_json=args.dashboard_json,
         dashboard_markdown=args.dashboard_markdown,
         dashboard_html=args.dashboard_html,
@@ -504,6 +598,16 @@ def _run_audit_plan(plan: _AuditExecutionPlan) -> AuditResult:
     )
 
 
+def _echo_run_plan(run_plan: RunPlan) -> None:
+    for planned in run_plan.runs:
+        command = shlex.join(planned.command) if planned.command else "<engine-defined command>"
+        _echo(f"[ratchetr] plan: run {planned.key}: {command}")
+    for skipped in run_plan.skipped:
+        detail = f"{skipped.reason}; served by {skipped.served_by}" if skipped.served_by else skipped.reason
+        _echo(f"[ratchetr] plan: skip {skipped.key} ({detail})")
+    _echo(f"[ratchetr] plan: {len(run_plan.runs)} planned, {len(run_plan.skipped)} skipped")
+
+
 def _summarize_audit_run(
     args: argparse.Namespace,
     *,
@@ -582,6 +686,8 @@ def execute_audit(args: argparse.Namespace) -> int:
     """
     plan = _prepare_execution_plan(args)
     result = _run_audit_plan(plan)
+    if plan.dry_run and result.plan is not None:
+        _echo_run_plan(result.plan)
     audit_summary, exit_code = _summarize_audit_run(args, plan=plan, result=result)
     _persist_audit_outputs(args, plan=plan, audit_summary=audit_summary)
     return exit_code
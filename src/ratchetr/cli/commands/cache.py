@@ -17,11 +17,14 @@
 from __future__ import annotations
 
 import argparse
+import json
 import shutil
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ratchetr.cli.helpers import echo, register_argument
+from ratchetr.cache import cache_stats, read_cache_entries
+from ratchetr.cli.helpers import echo, register_argument, render_data
+from ratchetr.core.model_types import CacheBackend, DataFormat
 from ratchetr.runtime import resolve_project_root
 
 if TYPE_CHECKING:
@@ -61,6 +64,53 @@ def register_cache_command(subparsers: SubparserCollection) -> None:
         help="Explicit cache directory (default: <project>/.ratchetr_cache).",
     )
 
+    show = cache_sub.add_parser(
+        "show",
+        help="Print cached entries as JSON (readable for every backend)",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    register_argument(
+        show,
+        "--project-root",
+        type=Path,
+        default=None,
+        help="Override project root discovery (default: auto-detected).",
+    )
+    register_argument(
+        show,
+        "--backend",
+        choices=[backend.value for backend in CacheBackend],
+        default=CacheBackend.JSON.value,
+        help="Cache backend to read.",
+    )
+
+    stats = cache_sub.add_parser(
+        "stats",
+        help="Summarise cache entries, fingerprints, diagnostics, and size",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    register_argument(
+        stats,
+        "--project-root",
+        type=Path,
+        default=None,
+        help="Override project root discovery (default: auto-detected).",
+    )
+    register_argument(
+        stats,
+        "--backend",
+        choices=[backend.value for backend in CacheBackend],
+        default=CacheBackend.JSON.value,
+        help="Cache backend to inspect.",
+    )
+    register_argument(
+        stats,
+        "--format",
+        choices=[fmt.value for fmt in DataFormat],
+        default=DataFormat.TABLE.value,
+        help="Output format for the statistics.",
+    )
+
 
 def _handle_clear(args: argparse.Namespace) -> int:
     project_root = resolve_project_root(getattr(args, "project_root", None))
@@ -73,6 +123,23 @@ def _handle_clear(args: argparse.Namespace) -> int:
     return 0
 
 
+def _handle_show(args: argparse.Namespace) -> int:
+    project_root = resolve_project_root(getattr(args, "project_root", None))
+    backend = CacheBackend.from_str(getattr(args, "backend", None) or CacheBackend.JSON.value)
+    entries = read_cache_entries(project_root, backend)
+    echo(json.dumps({"entries": entries}, indent=2))
+    return 0
+
+
+def _handle_stats(args: argparse.Namespace) -> int:
+    project_root = resolve_project_root(getattr(args, "project_root", None))
+    backend = CacheBackend.from_str(getattr(args, "backend", None) or CacheBackend.JSON.value)
+    fmt = DataFormat.from_str(getattr(args, "format", None) or DataFormat.TABLE.value)
+    for line in render_data(dict(cache_stats(project_root, backend)), fmt):
+        echo(line)
+    return 0
+
+
 def execute_cache(args: argparse.Namespace) -> int:
     """Execute the cache subcommand.
 
@@ -88,6 +155,10 @@ def execute_cache(args: argparse.Namespace) -> int:
     action_value = getattr(args, "cache_action", None)
     if action_value == "clear":
         return _handle_clear(args)
+    if action_value == "show":
+        return _handle_show(args)
+    if action_value == "stats":
+        return _handle_stats(args)
     msg = f"Unknown cache action '{action_value}'"
     raise SystemExit(msg)
 
@@ -0,0 +1,139 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Engine daemon management commands for the ratchetr CLI."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ratchetr.cli.helpers import echo, register_argument, render_data
+from ratchetr.core.model_types import DataFormat
+from ratchetr.runtime import DaemonRegistry, resolve_project_root
+
+if TYPE_CHECKING:
+    from ratchetr.cli.types import SubparserCollection
+
+
+def register_daemon_command(subparsers: SubparserCollection) -> None:
+    """Attach the `ratchetr daemon`command to the CLI.
+
+    Args:
+        subparsers: Top-level argparse subparser collection to register commands on.
+    """
+    daemon = subparsers.add_parser(
+        "daemon",
+        help="Inspect or stop engine daemons started by `audit --daemon`",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    daemon_sub = daemon.add_subparsers(dest="daemon_action", required=True)
+
+    status = daemon_sub.add_parser(
+        "status",
+        help="List registered daemons and whether they are running",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    register_argument(
+        status,
+        "--project-root",
+        type=Path,
+        default=None,
+        help="Override project root discovery (default: auto-detected).",
+    )
+    register_argument(
+        status,
+        "--format",
+        choices=[fmt.value for fmt in DataFormat],
+        default=DataFormat.TABLE.value,
+        help="Output format for the daemon list.",
+    )
+
+    stop = daemon_sub.add_parser(
+        "stop",
+        help="Stop registered daemons",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    register_argument(
+        stop,
+        "--project-root",
+        type=Path,
+        default=None,
+        help="Override project root discovery (default: auto-detected).",
+    )
+    register_argument(
+        stop,
+        "names",
+        nargs="*",
+        help="Daemons to stop, e.g. 'mypy:current' (default: all).",
+    )
+
+
+def _handle_status(args: argparse.Namespace) -> int:
+    project_root = resolve_project_root(getattr(args, "project_root", None))
+    fmt = DataFormat.from_str(getattr(args, "format", None) or DataFormat.TABLE.value)
+    records = DaemonRegistry(project_root).records()
+    if not records:
+        echo("[ratchetr] No engine daemons registered")
+        return 0
+    rows = [
+        {
+            "name": record.name,
+            "pid": record.pid,
+            "running": record.running,
+            "status_file": record.status_file.as_posix(),
+        }
+        for record in records
+    ]
+    for line in render_data(rows, fmt):
+        echo(line)
+    return 0
+
+
+def _handle_stop(args: argparse.Namespace) -> int:
+    project_root = resolve_project_root(getattr(args, "project_root", None))
+    names: list[str] = list(getattr(args, "names", None) or [])
+    stopped = DaemonRegistry(project_root).stop(names or None)
+    if not stopped:
+        echo("[ratchetr] No matching engine daemons registered")
+        return 0
+    for record in stopped:
+        state = "stopped" if record.running else "removed stale entry"
+        echo(f"[ratchetr] {record.name}: {state}")
+    return 0
+
+
+def execute_daemon(args: argparse.Namespace) -> int:
+    """Execute the daemon subcommand.
+
+    Args:
+        args: Parsed CLI namespace.
+
+    Returns:
+        `0`when the requested action completes successfully.
+
+    Raises:
+        SystemExit: If the action name is unrecognised.
+    """
+    action_value = getattr(args, "daemon_action", None)
+    if action_value == "status":
+        return _handle_status(args)
+    if action_value == "stop":
+        return _handle_stop(args)
+    msg = f"Unknown daemon action '{action_value}'"
+    raise SystemExit(msg)
+
+
+__all__ = ["execute_daemon", "register_daemon_command"]
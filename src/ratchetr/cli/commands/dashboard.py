@@ -0,0 +1,118 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Dashboard rendering command for the ratchetr CLI."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ratchetr.cli.helpers import (
+    echo,
+    parse_manifest_validation,
+    register_argument,
+    register_manifest_validation_argument,
+)
+from ratchetr.core.model_types import DashboardFormat, DashboardView
+from ratchetr.dashboard.cache import SummaryCache
+from ratchetr.runtime import consume
+from ratchetr.services.dashboard import load_summary_from_manifest, render_dashboard_summary
+
+if TYPE_CHECKING:
+    from ratchetr.cli.types import SubparserCollection
+
+
+def register_dashboard_command(subparsers: SubparserCollection) -> None:
+    """Register the 'dashboard' subcommand with the argument parser.
+
+    Configures the dashboard command with arguments for manifest path, output format,
+    output file, and default view selection for HTML output.
+
+    Args:
+        subparsers: Subparser registry where the dashboard command will be added.
+    """
+    dashboard = subparsers.add_parser(
+        "dashboard",
+        help="Render a summary from an existing manifest",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    register_argument(
+        dashboard,
+        "--manifest",
+        type=Path,
+        required=True,
+        help="Path to a typing audit manifest.",
+    )
+    register_manifest_validation_argument(dashboard)
+    register_argument(
+        dashboard,
+        "--format",
+        choices=[fmt.value for fmt in DashboardFormat],
+        default=DashboardFormat.JSON.value,
+        help="Output format.",
+    )
+    register_argument(
+        dashboard,
+        "--output",
+        type=Path,
+        default=None,
+        help="Optional output file.",
+    )
+    register_argument(
+        dashboard,
+        "--view",
+        choices=[view.value for view in DashboardView],
+        default="overview",
+        help="Default tab when generating HTML.",
+    )
+
+
+def execute_dashboard(args: argparse.Namespace) -> int:
+    """Execute the 'dashboard' command to render a summary from a manifest.
+
+    Loads summary data from the specified manifest file and renders it in the requested
+    format (JSON, Markdown, or HTML). Output can be written to a file or printed to stdout.
+
+    Args:
+        args: Parsed command-line arguments containing manifest path, format, output path,
+            and view options.
+
+    Returns:
+        int: Exit code (always 0 for success).
+    """
+    summary = load_summary_from_manifest(
+        args.manifest,
+        cache=SummaryCache.for_manifest(args.manifest),
+        validation=parse_manifest_validation(getattr(args, "validate", None)),
+    )
+    dashboard_format = DashboardFormat.from_str(args.format)
+    view_choice = DashboardView.from_str(args.view)
+    rendered = render_dashboard_summary(
+        summary,
+        output_format=dashboard_format,
+        default_view=view_choice,
+    )
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        consume(args.output.write_text(rendered, encoding="utf-8"))
+    elif dashboard_format is DashboardFormat.JSON:
+        echo(rendered, newline=False)
+    else:
+        echo(rendered)
+    return 0
+
+
+__all__ = ["execute_dashboard", "register_dashboard_command"]
@@ -0,0 +1,150 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Starter configuration command for the ratchetr CLI."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from textwrap import dedent
+from typing import TYPE_CHECKING, Final
+
+from ratchetr.cli.helpers import echo, register_argument
+from ratchetr.runtime import consume
+
+if TYPE_CHECKING:
+    from ratchetr.cli.types import SubparserCollection
+
+
+CONFIG_TEMPLATE: Final[str] = dedent(
+    """\
+    # ratchetr configuration template
+    # Save this file as ratchetr.toml in the root of your project.
+    config_version = 0
+
+    [audit]
+    # Uncomment and adjust to pin the directories scanned during full audits.
+    # full_paths = ["src", "tests"]
+
+    # Engines that run by default (pyright and mypy ship with ratchetr).
+    runners = ["pyright", "mypy"]
+
+    # Configure failure thresholds or output destinations as needed:
+    # fail_on = "warnings"           # choices: never, warnings, errors
+    # manifest_path = "ratchetr/manifest.json"
+    # dashboard_json = "ratchetr/dashboard.json"
+    # dashboard_markdown = "ratchetr/dashboard.md"
+    # dashboard_html = "ratchetr/dashboard.html"
+
+    # Select default profiles per engine here, or via `ratchetr audit --profile`.
+    [audit.active_profiles]
+    # pyright = "baseline"
+    # mypy = "strict"
+
+    # Per-engine settings apply globally.
+    [audit.engines.pyright]
+    # plugin_args = ["--verifytypes"]
+    # include = ["packages/api"]
+    # exclude = ["packages/legacy"]
+    # config_file = "configs/pyrightconfig.json"
+
+    [audit.engines.pyright.profiles.strict]
+    # inherit = "baseline"
+    # plugin_args = ["--strict"]
+
+    [audit.engines.mypy]
+    # plugin_args = ["--strict"]
+    # include = ["src"]
+    # config_file = "configs/mypy.ini"
+
+    # To scope settings to a folder, create a ratchetr.dir.toml file in that
+    # directory. Example contents:
+    #
+    #   [active_profiles]
+    #   pyright = "strict"
+    #
+    #   [engines.pyright]
+    #   plugin_args = ["--warnings"]
+    #   include = ["."]
+    #   exclude = ["tests"]
+    #
+    # Files named ratchetr.dir.toml or .ratchetrdir.toml are discovered recursively.
+    """,
+)
+
+
+def write_config_template(path: Path, *, force: bool) -> int:
+    """Write the ratchetr configuration template to a file.
+
+    Args:
+        path: Target path where the configuration file will be written.
+        force: If True, overwrite the file if it already exists. If False, refuse to overwrite.
+
+    Returns:
+        int: Exit code (0 for success, 1 for failure).
+    """
+    if path.exists() and not force:
+        echo(f"[ratchetr] Refusing to overwrite existing file: {path}")
+        echo("Use --force if you want to replace it.")
+        return 1
+    path.parent.mkdir(parents=True, exist_ok=True)
+    consume(path.write_text(CONFIG_TEMPLATE, encoding="utf-8"))
+    echo(f"[ratchetr] Wrote starter config to {path}")
+    return 0
+
+
+def register_init_command(subparsers: SubparserCollection) -> None:
+    """Register the 'init' subcommand with the argument parser.
+
+    Configures the init command with arguments for output path and force overwrite option.
+    This command generates a starter ratchetr.toml configuration file.
+
+    Args:
+        subparsers: Subparser registry where the init command will be added.
+    """
+    init = subparsers.add_parser(
+        "init",
+        help="Generate a starter configuration file",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    register_argument(
+        init,
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("ratchetr.toml"),
+        help="Destination for the generated configuration file.",
+    )
+    register_argument(
+        init,
+        "--force",
+        action="store_true",
+        help="Overwrite the output file if it already exists.",
+    )
+
+
+def execute_init(args: argparse.Namespace) -> int:
+    """Execute the 'init' command to generate a configuration file.
+
+    Args:
+        args: Parsed command-line arguments containing output path and force flag.
+
+    Returns:
+        int: Exit code (0 for success, 1 for failure).
+    """
+    return write_config_template(args.output, force=args.force)
+
+
+__all__ = ["CONFIG_TEMPLATE", "execute_init", "register_init_command", "write_config_template"]
@@ -22,6 +22,7 @@ from typing import TYPE_CHECKING
 
 from ratchetr.cli.helpers import (
     echo,
+    parse_manifest_validation,
     query_engines,
     query_hotspots,
     query_overview,
@@ -29,6 +30,7 @@ from ratchetr.cli.helpers import (
     query_rules,
     query_runs,
     register_argument,
+    register_manifest_validation_argument,
     render_data,
 )
 from ratchetr.core.model_types import (
@@ -39,10 +41,12 @@ from ratchetr.core.model_types import (
     ReadinessStatus,
     SeverityLevel,
 )
+from ratchetr.dashboard.cache import SummaryCache
 from ratchetr.services.dashboard import load_summary_from_manifest
 
 if TYPE_CHECKING:
     from ratchetr.cli.types import SubparserCollection
+    from ratchetr.core.model_types import ManifestValidation
     from ratchetr.core.summary_types import SummaryData
 
 
@@ -253,10 +257,16 @@ def _register_common_manifest_argument(parser: argparse.ArgumentParser) -> None:
         required=True,
         help="Path to a typing audit manifest.",
     )
+    register_manifest_validation_argument(parser)
 
 
-def _load_summary(manifest_path: Path) -> SummaryData:
-    return load_summary_from_manifest(manifest_path)
+def _load_summary(manifest_path: Path, validation: ManifestValidation) -> SummaryData:
+    return load_summary_from_manifest(
+        manifest_path,
+        indexed=True,
+        cache=SummaryCache.for_manifest(manifest_path),
+        validation=validation,
+    )
 
 
 def _render_payload(data: object, fmt: DataFormat) -> None:
@@ -276,7 +286,7 @@ def execute_query(args: argparse.Namespace) -> int:
     Raises:
         SystemExit: If the section selector is invalid.
     """
-    summary = _load_summary(args.manifest)
+    summary = _load_summary(args.manifest, parse_manifest_validation(getattr(args, "validate", None)))
     section_value = args.query_section
     try:
         section = section_value if isinstance(section_value, QuerySection) else QuerySection.from_str(section_value)
@@ -27,8 +27,10 @@ from ratchetr.cli.helpers import (
     discover_manifest_path,
     discover_ratchet_path,
     echo,
+    parse_manifest_validation,
     parse_target_entries,
     register_argument,
+    register_manifest_validation_argument,
     resolve_limit,
     resolve_path,
     resolve_runs,
@@ -180,8 +182,13 @@ def execute_ratchet(args: argparse.Namespace) -> int:
         require_exists=action in {RatchetAction.CHECK, RatchetAction.UPDATE, RatchetAction.REBASELINE_SIGNATURE},
     )
 
-    manifest_payload = load_ratchet_manifest(manifest_path)
     runs_choice = resolve_runs(getattr(args, "runs", None), ratchet_cfg.runs)
+    # `check` only compares the selected runs, so it reads just those through the manifest index.
+    manifest_payload = load_ratchet_manifest(
+        manifest_path,
+        runs=runs_choice if action is RatchetAction.CHECK else None,
+        validation=parse_manifest_validation(getattr(args, "validate", None)),
+    )
     signature_policy = resolve_signature_policy(
         getattr(args, "signature_policy", None),
         ratchet_cfg.signature,
@@ -246,6 +253,7 @@ def _register_init_parser(subparsers: SubparserCollection) -> None:
         default=None,
         help="Manifest to use as the baseline.",
     )
+    register_manifest_validation_argument(init_inputs)
     register_argument(
         init_output,
         "--output",
@@ -308,6 +316,7 @@ def _register_check_parser(subparsers: SubparserCollection) -> None:
         default=None,
         help="Manifest produced by the latest audit.",
     )
+    register_manifest_validation_argument(check_inputs)
     register_argument(
         check_inputs,
         "--ratchet",
@@ -379,6 +388,7 @@ def _register_update_parser(subparsers: SubparserCollection) -> None:
         default=None,
         help="Manifest produced by the latest audit.",
     )
+    register_manifest_validation_argument(update_inputs)
     register_argument(
         update_inputs,
         "--ratchet",
@@ -460,6 +470,7 @@ def _register_rebaseline_parser(subparsers: SubparserCollection) -> None:
         default=None,
         help="Manifest reflecting the desired engine configuration.",
     )
+    register_manifest_validation_argument(rebase_inputs)
     register_argument(
         rebase_inputs,
         "--ratchet",
@@ -513,6 +524,7 @@ def _register_info_parser(subparsers: SubparserCollection) -> None:
         default=None,
         help="Manifest path to use when resolving defaults.",
     )
+    register_manifest_validation_argument(info_inputs)
     register_argument(
         info_inputs,
         "--ratchet",
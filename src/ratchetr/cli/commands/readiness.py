@@ -0,0 +1,128 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Readiness summary command for the ratchetr CLI."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ratchetr.cli.helpers import (
+    parse_manifest_validation,
+    print_readiness_summary,
+    register_argument,
+    register_manifest_validation_argument,
+)
+from ratchetr.core.model_types import ReadinessLevel, ReadinessStatus, SeverityLevel
+from ratchetr.dashboard.cache import SummaryCache
+from ratchetr.services.dashboard import load_summary_from_manifest
+
+if TYPE_CHECKING:
+    from ratchetr.cli.types import SubparserCollection
+    from ratchetr.core.summary_types import SummaryData
+
+
+def register_readiness_command(subparsers: SubparserCollection) -> None:
+    """Register the 'readiness' subcommand with the argument parser.
+
+    Configures the readiness command with arguments for manifest path, readiness level,
+    status filters, severity filters, display limits, and detail options. This command
+    shows top-N candidates for strict typing based on audit results.
+
+    Args:
+        subparsers: Subparser registry where the readiness command will be added.
+    """
+    readiness = subparsers.add_parser(
+        "readiness",
+        help="Show top-N candidates for strict typing",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    register_argument(
+        readiness,
+        "--manifest",
+        type=Path,
+        required=True,
+        help="Path to a typing audit manifest.",
+    )
+    register_manifest_validation_argument(readiness)
+    register_argument(
+        readiness,
+        "--level",
+        choices=[level.value for level in ReadinessLevel],
+        default=ReadinessLevel.FOLDER.value,
+    )
+    register_argument(
+        readiness,
+        "--status",
+        dest="statuses",
+        action="append",
+        choices=[status.value for status in ReadinessStatus],
+        default=None,
+        help="Status buckets to render (repeatable).",
+    )
+    register_argument(readiness, "--limit", type=int, default=10)
+    register_argument(
+        readiness,
+        "--severity",
+        dest="severities",
+        action="append",
+        choices=[severity.value for severity in SeverityLevel],
+        default=None,
+        help="Filter entries to specific severities (repeatable).",
+    )
+    register_argument(
+        readiness,
+        "--details",
+        action="store_true",
+        help="Include severity breakdown when printing readiness summaries.",
+    )
+
+
+def execute_readiness(args: argparse.Namespace) -> int:
+    """Execute the 'readiness' command to show typing readiness candidates.
+
+    Loads summary data from the manifest and displays the top-N candidates for strict
+    typing based on readiness level, status filters, severity filters, and display options.
+
+    Args:
+        args: Parsed command-line arguments containing manifest path, level, statuses,
+            limit, severities, and detail flags.
+
+    Returns:
+        int: Exit code (always 0 for success).
+    """
+    summary_map: SummaryData = load_summary_from_manifest(
+        args.manifest,
+        cache=SummaryCache.for_manifest(args.manifest),
+        validation=parse_manifest_validation(getattr(args, "validate", None)),
+    )
+    level_choice = ReadinessLevel.from_str(args.level)
+    statuses = [ReadinessStatus.from_str(status) for status in args.statuses] if args.statuses else None
+    severities = (
+        [SeverityLevel.from_str(value) for value in args.severities] if getattr(args, "severities", None) else None
+    )
+    print_readiness_summary(
+        summary_map,
+        level=level_choice,
+        statuses=statuses,
+        limit=args.limit,
+        severities=severities,
+        detailed=bool(getattr(args, "details", False)),
+    )
+    return 0
+
+
+__all__ = ["execute_readiness", "register_readiness_command"]
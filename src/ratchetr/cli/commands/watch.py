@@ -0,0 +1,135 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Filesystem watcher command for the ratchetr CLI."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ratchetr.cli.helpers import echo, register_argument
+from ratchetr.runtime import resolve_project_root, run_command, watch_project
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from ratchetr.cli.types import SubparserCollection
+
+
+def register_watch_command(subparsers: SubparserCollection) -> None:
+    """Attach the `ratchetr watch`command to the CLI.
+
+    Args:
+        subparsers: Top-level argparse subparser collection to register commands on.
+    """
+    watch = subparsers.add_parser(
+        "watch",
+        help="Journal file changes so audits skip the fingerprint walk (Linux inotify)",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    register_argument(
+        watch,
+        "--project-root",
+        type=Path,
+        default=None,
+        help="Override project root discovery (default: auto-detected).",
+    )
+    register_argument(
+        watch,
+        "--audit",
+        action="store_true",
+        help="Re-run `ratchetr audit` whenever source or config files change.",
+    )
+    register_argument(
+        watch,
+        "--audit-arg",
+        dest="audit_args",
+        action="append",
+        default=[],
+        metavar="ARG",
+        help="Extra argument forwarded to the triggered audit (repeatable).",
+    )
+    register_argument(
+        watch,
+        "--settle",
+        type=float,
+        default=0.5,
+        metavar="SECONDS",
+        help="Quiet period after the last change before a triggered audit starts.",
+    )
+    register_argument(
+        watch,
+        "--duration",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Stop watching after this many seconds (default: until interrupted).",
+    )
+
+
+def _run_audit(project_root: Path, audit_args: Sequence[str], changed: frozenset[str]) -> int:
+    summary = f"{len(changed)} changed path(s)" if changed else "lost events"
+    echo(f"[ratchetr] watch: {summary}; running audit")
+    argv = [sys.executable, "-m", "ratchetr", "audit", *audit_args]
+    result = run_command(argv, cwd=project_root, allowed={sys.executable})
+    for stream in (result.stdout, result.stderr):
+        if stream.strip():
+            echo(stream.rstrip())
+    echo(f"[ratchetr] watch: audit exited with {result.exit_code}")
+    return result.exit_code
+
+
+def execute_watch(args: argparse.Namespace) -> int:
+    """Execute the watch command.
+
+    Args:
+        args: Parsed CLI namespace.
+
+    Returns:
+        `0`when the watcher stops cleanly, `1`when it cannot start.
+    """
+    project_root = resolve_project_root(getattr(args, "project_root", None))
+    audit_args: list[str] = list(getattr(args, "audit_args", None) or [])
+    duration: float | None = getattr(args, "duration", None)
+    deadline = time.monotonic() + duration if duration is not None else None
+
+    def on_change(changed: frozenset[str]) -> int:
+        """Audit the project after ``changed`` paths settled.
+
+        Returns:
+            Exit code of the audit.
+        """
+        return _run_audit(project_root, audit_args, changed)
+
+    echo(f"[ratchetr] watching {project_root} (Ctrl+C to stop)")
+    try:
+        watch_project(
+            project_root,
+            on_change=on_change if getattr(args, "audit", False) else None,
+            settle_seconds=float(getattr(args, "settle", 0.5)),
+            should_stop=lambda: deadline is not None and time.monotonic() >= deadline,
+        )
+    except OSError as exc:
+        echo(f"[ratchetr] watch unavailable: {exc}", err=True)
+        return 1
+    except KeyboardInterrupt:
+        echo("[ratchetr] watch stopped")
+    return 0
+
+
+__all__ = ["execute_watch", "register_watch_command"]
@@ -16,50 +16,92 @@
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Final
+
 from .args import (
     ArgumentRegistrar,
     collect_plugin_args,
     collect_profile_args,
     normalise_modes,
     parse_comma_separated,
+    parse_hash_backend,
     parse_hash_workers,
     parse_int_mapping,
+    parse_jobs,
     parse_key_value_entries,
+    parse_manifest_validation,
     register_argument,
-)
-from .formatting import (
-    SUMMARY_FIELD_CHOICES,
-    format_list,
-    parse_summary_fields,
-    print_readiness_summary,
-    print_summary,
-    query_engines,
-    query_hotspots,
-    query_overview,
-    query_readiness,
-    query_rules,
-    query_runs,
-    render_data,
+    register_manifest_validation_argument,
 )
 from .io import echo
-from .ratchet import (
-    DEFAULT_RATCHET_FILENAME,
-    DEFAULT_SEVERITIES,
-    MANIFEST_CANDIDATE_NAMES,
-    apply_target_overrides,
-    discover_manifest_path,
-    discover_ratchet_path,
-    ensure_parent,
-    normalise_runs,
-    parse_target_entries,
-    resolve_limit,
-    resolve_path,
-    resolve_runs,
-    resolve_severities,
-    resolve_signature_policy,
-    resolve_summary_only,
-    split_target_mapping,
-)
+
+if TYPE_CHECKING:
+    from .formatting import (
+        SUMMARY_FIELD_CHOICES,
+        format_list,
+        parse_summary_fields,
+        print_readiness_summary,
+        print_summary,
+        query_engines,
+        query_hotspots,
+        query_overview,
+        query_readiness,
+        query_rules,
+        query_runs,
+        render_data,
+    )
+    from .ratchet import (
+        DEFAULT_RATCHET_FILENAME,
+        DEFAULT_SEVERITIES,
+        MANIFEST_CANDIDATE_NAMES,
+        apply_target_overrides,
+        discover_manifest_path,
+        discover_ratchet_path,
+        ensure_parent,
+        normalise_runs,
+        parse_target_entries,
+        resolve_limit,
+        resolve_path,
+        resolve_runs,
+        resolve_severities,
+        resolve_signature_policy,
+        resolve_summary_only,
+        split_target_mapping,
+    )
+
+# Formatting and ratchet helpers pull in the services layer and pydantic models,
+# so they are imported on first access rather than with the package.
+_LAZY_EXPORTS: Final[dict[str, str]] = {
+    "SUMMARY_FIELD_CHOICES": "formatting",
+    "format_list": "formatting",
+    "parse_summary_fields": "formatting",
+    "print_readiness_summary": "formatting",
+    "print_summary": "formatting",
+    "query_engines": "formatting",
+    "query_hotspots": "formatting",
+    "query_overview": "formatting",
+    "query_readiness": "formatting",
+    "query_rules": "formatting",
+    "query_runs": "formatting",
+    "render_data": "formatting",
+    "DEFAULT_RATCHET_FILENAME": "ratchet",
+    "DEFAULT_SEVERITIES": "ratchet",
+    "MANIFEST_CANDIDATE_NAMES": "ratchet",
+    "apply_target_overrides": "ratchet",
+    "discover_manifest_path": "ratchet",
+    "discover_ratchet_path": "ratchet",
+    "ensure_parent": "ratchet",
+    "normalise_runs": "ratchet",
+    "parse_target_entries": "ratchet",
+    "resolve_limit": "ratchet",
+    "resolve_path": "ratchet",
+    "resolve_runs": "ratchet",
+    "resolve_severities": "ratchet",
+    "resolve_signature_policy": "ratchet",
+    "resolve_summary_only": "ratchet",
+    "split_target_mapping": "ratchet",
+}
 
 __all__ = [
     "DEFAULT_RATCHET_FILENAME",
@@ -78,9 +120,12 @@ __all__ = [
     "normalise_modes",
     "normalise_runs",
     "parse_comma_separated",
+    "parse_hash_backend",
     "parse_hash_workers",
     "parse_int_mapping",
+    "parse_jobs",
     "parse_key_value_entries",
+    "parse_manifest_validation",
     "parse_summary_fields",
     "parse_target_entries",
     "print_readiness_summary",
@@ -92,6 +137,7 @@ __all__ = [
     "query_rules",
     "query_runs",
     "register_argument",
+    "register_manifest_validation_argument",
     "render_data",
     "resolve_limit",
     "resolve_path",
@@ -101,3 +147,17 @@ __all__ = [
     "resolve_summary_only",
     "split_target_mapping",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        message = f"module '{__name__}' has no attribute '{name}'"
+        raise AttributeError(message)
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -23,7 +23,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Literal, Protocol
 
-from ratchetr.core.model_types import Mode
+from ratchetr.core.model_types import HashBackend, ManifestValidation, Mode
 from ratchetr.runtime import consume
 
 if TYPE_CHECKING:
@@ -221,9 +221,51 @@ def normalise_modes(values: Sequence[str] | None) -> list[Mode]:
     return modes
 
 
+def _split_hash_workers(value: str) -> tuple[str, str | None]:
+    workers = ""
+    backend: str | None = None
+    for segment in (part.strip().lower() for part in value.split(",")):
+        key, sep, option = segment.partition("=")
+        if sep and key.strip() == "backend":
+            backend = option.strip()
+        elif sep:
+            msg = f"--hash-workers does not support option '{key.strip()}'"
+            raise SystemExit(msg)
+        elif segment:
+            workers = segment
+    return workers, backend
+
+
+def parse_hash_backend(value: str | None) -> HashBackend | None:
+    """Return the hashing backend selected via ``--hash-workers``.
+
+    Args:
+        value: CLI value supplied to ``--hash-workers`` (e.g. ``"auto,backend=process"``).
+
+    Returns:
+        `HashBackend`named by the ``backend=`` option, or `None`when absent.
+
+    Raises:
+        SystemExit: If the backend name is unknown.
+    """
+    if value is None:
+        return None
+    _, backend = _split_hash_workers(value)
+    if not backend:
+        return None
+    try:
+        return HashBackend.from_str(backend)
+    except ValueError as exc:
+        msg = f"{exc}. Valid backends: thread, process"
+        raise SystemExit(msg) from exc
+
+
 def parse_hash_workers(value: str | None) -> int | Literal["auto"] | None:
     """Return a normalised hash worker spec ('auto' or non-negative integer).
 
+    A trailing ``backend=`` option is accepted and ignored here; see
+    `parse_hash_backend`.
+
     Args:
         value: CLI value supplied to ``--hash-workers``.
 
@@ -236,7 +278,7 @@ def parse_hash_workers(value: str | None) -> int | Literal["auto"] | None:
     """
     if value is None:
         return None
-    stripped_value = value.strip().lower()
+    stripped_value, _ = _split_hash_workers(value)
     if not stripped_value:
         return None
     if stripped_value == "auto":
@@ -252,14 +294,84 @@ def parse_hash_workers(value: str | None) -> int | Literal["auto"] | None:
     return workers
 
 
+def parse_jobs(value: str | None) -> int | None:
+    """Return a normalised engine concurrency limit (non-negative integer).
+
+    Args:
+        value: CLI value supplied to ``--jobs``.
+
+    Returns:
+        `None`if no preference, otherwise an integer >= 0.
+
+    Raises:
+        SystemExit: If input cannot be parsed or specifies a negative count.
+    """
+    if value is None:
+        return None
+    stripped_value = value.strip()
+    if not stripped_value:
+        return None
+    try:
+        jobs = int(stripped_value)
+    except ValueError as exc:
+        msg = "--jobs must be a non-negative integer"
+        raise SystemExit(msg) from exc
+    if jobs < 0:
+        msg = "--jobs must be non-negative"
+        raise SystemExit(msg)
+    return jobs
+
+
+def register_manifest_validation_argument(registrar: ArgumentRegistrar) -> None:
+    """Register the ``--validate`` option shared by manifest-reading commands.
+
+    Args:
+        registrar: Parser or argument group receiving the option.
+    """
+    register_argument(
+        registrar,
+        "--validate",
+        choices=[level.value for level in ManifestValidation],
+        default=ManifestValidation.FAST.value,
+        help=(
+            "Manifest validation level: 'full' always validates, 'fast' skips manifests "
+            "ratchetr wrote and stamped, 'off' never validates."
+        ),
+    )
+
+
+def parse_manifest_validation(value: str | None) -> ManifestValidation:
+    """Return the manifest validation level selected with ``--validate``.
+
+    Args:
+        value: CLI value supplied to ``--validate``.
+
+    Returns:
+        The requested level, `ManifestValidation.FAST` when unset.
+
+    Raises:
+        SystemExit: If the value is not a known validation level.
+    """
+    if value is None:
+        return ManifestValidation.FAST
+    try:
+        return ManifestValidation.from_str(value)
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+
+
 __all__ = [
     "ArgumentRegistrar",
     "collect_plugin_args",
     "collect_profile_args",
     "normalise_modes",
     "parse_comma_separated",
+    "parse_hash_backend",
     "parse_hash_workers",
     "parse_int_mapping",
+    "parse_jobs",
     "parse_key_value_entries",
+    "parse_manifest_validation",
     "register_argument",
+    "register_manifest_validation_argument",
 ]
@@ -41,7 +41,7 @@ from ratchetr.core.model_types import (
 )
 from ratchetr.core.type_aliases import RelPath, RunId
 from ratchetr.error_codes import error_code_for
-from ratchetr.json import JSONValue, normalise_enums_for_json
+from ratchetr.json import normalise_enums_for_json
 from ratchetr.readiness.views import ReadinessValidationError, ReadinessViewResult
 from ratchetr.services.readiness import (
     collect_readiness_view as service_collect_readiness_view,
@@ -60,6 +60,7 @@ if TYPE_CHECKING:
         SummaryFolderEntry,
     )
     from ratchetr.core.types import RunResult
+    from ratchetr.json import JSONValue
 
 
 def stringify(value: object) -> str:
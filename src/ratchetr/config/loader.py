@@ -22,13 +22,19 @@ overrides (ratchetr.dir.toml, .ratchetrdir.toml).
 
 from __future__ import annotations
 
-from pathlib import Path
+import json
+import os
+import shutil
+import stat
+from contextlib import suppress
+from pathlib import Path, PurePosixPath
 from typing import TYPE_CHECKING, Final, Literal, TypeAlias, cast
 
 from pydantic import ValidationError
 
 from ratchetr.compat import tomllib
-from ratchetr.core.type_aliases import EngineName, RunnerName
+from ratchetr.core.type_aliases import EngineName, ProfileName, RunnerName
+from ratchetr.runtime import consume, run_command
 
 from .models import (
     AuditConfig,
@@ -36,6 +42,7 @@ from .models import (
     ConfigModel,
     ConfigReadError,
     DirectoryOverrideValidationError,
+    EngineProfile,
     EngineSettings,
     InvalidConfigFileError,
     PathOverride,
@@ -103,31 +110,249 @@ def _resolve_ratchet_paths(base_dir: Path, ratchet: RatchetConfig) -> None:
         ratchet.output_path = (base_dir / ratchet.output_path).resolve()
 
 
+def _override_candidates(root: Path) -> list[Path]:
+    """Find directory override files below ``root`` in a single pass.
+
+    Inside a git work tree the listing comes from ``git ls-files`` so ignored
+    paths are skipped and tracked files are always honoured; otherwise the tree
+    is walked with ``os.scandir``, pruning vendor, virtualenv, cache, and build
+    directories.
+
+    Args:
+        root: Project root to search.
+
+    Returns:
+        Override file paths ordered by filename precedence, then path.
+    """
+    candidates = _git_override_candidates(root)
+    if candidates is None:
+        candidates = _walk_override_candidates(root)
+    precedence: dict[str, int] = {name: index for index, name in enumerate(FOLDER_CONFIG_FILENAMES)}
+    return sorted(candidates, key=lambda path: (precedence[path.name], path))
+
+
+def _git_override_candidates(root: Path) -> list[Path] | None:
+    git_cmd = shutil.which("git")
+    if git_cmd is None or not any((candidate / ".git").exists() for candidate in (root, *root.parents)):
+        return None
+    pathspecs = [f"*{filename}" for filename in FOLDER_CONFIG_FILENAMES]
+    try:
+        result = run_command(
+            [git_cmd, "ls-files", "-z", "--cached", "--others", "--exclude-standard", "--", *pathspecs],
+            cwd=root,
+            allowed={git_cmd},
+        )
+    # ignore JUSTIFIED: defensive handling for invalid argv/allowlist
+    except (TypeError, ValueError):  # pragma: no cover
+        return None
+    if result.exit_code:
+        return None
+    candidates: list[Path] = []
+    for rel_path in result.stdout.split("\0"):
+        parts = PurePosixPath(rel_path).parts
+        if parts and parts[-1] in FOLDER_CONFIG_FILENAMES:
+            candidates.append(root.joinpath(*parts))
+    return candidates
+
+
+def _walk_override_candidates(root: Path) -> list[Path]:
+    candidates: list[Path] = []
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as scanner:
+                entries = list(scanner)
+        # ignore JUSTIFIED: intermediate folders may be removed by tools (e.g. hypothesis)
+        # during traversal; skip missing paths and continue scanning
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir and entry.name not in _PRUNED_DIRNAMES:
+                stack.append(entry.path)
+            elif not is_dir and entry.name in FOLDER_CONFIG_FILENAMES:
+                candidates.append(Path(entry.path))
+    return candidates
+
+
+def _parse_path_override(config_path: Path) -> PathOverride:
+    try:
+        raw = tomllib.loads(config_path.read_text(encoding="utf-8"))
+    # ignore JUSTIFIED: config files may be unreadable or malformed
+    # convert parsing issues to ConfigReadError
+    except Exception as exc:  # pragma: no cover - IO errors
+        raise ConfigReadError(config_path, exc) from exc
+    try:
+        model = PathOverrideModel.model_validate(raw)
+    except ValidationError as exc:
+        raise DirectoryOverrideValidationError(config_path, exc) from exc
+    return path_override_from_model(config_path.parent.resolve(), model)
+
+
+def _optional_path_json(value: Path | None) -> str | None:
+    return None if value is None else str(value)
+
+
+def _optional_path_from_json(value: object) -> Path | None:
+    return None if value is None else Path(cast("str", value))
+
+
+def _strings_from_json(value: object) -> list[str]:
+    return list(cast("list[str]", value))
+
+
+def _override_to_json(override: PathOverride) -> dict[str, object]:
+    """Encode a freshly parsed override (before path resolution) for the override cache.
+
+    Args:
+        override: Override parsed from a folder configuration file.
+
+    Returns:
+        JSON-compatible payload restored by `_override_from_json`.
+    """
+    engines: dict[str, object] = {}
+    for name, settings in override.engine_settings.items():
+        engines[name] = {
+            "plugin_args": list(settings.plugin_args),
+            "config_file": _optional_path_json(settings.config_file),
+            "include": list(settings.include),
+            "exclude": list(settings.exclude),
+            "default_profile": settings.default_profile,
+            "profiles": {
+                profile_name: {
+                    "inherit": profile.inherit,
+                    "plugin_args": list(profile.plugin_args),
+                    "config_file": _optional_path_json(profile.config_file),
+                    "include": list(profile.include),
+                    "exclude": list(profile.exclude),
+                }
+                for profile_name, profile in settings.profiles.items()
+            },
+        }
+    return {"engines": engines, "active_profiles": dict(override.active_profiles)}
+
+
+def _profile_from_json(payload: dict[str, object]) -> EngineProfile:
+    inherit = payload["inherit"]
+    return EngineProfile(
+        inherit=ProfileName(cast("str", inherit)) if inherit is not None else None,
+        plugin_args=_strings_from_json(payload["plugin_args"]),
+        config_file=_optional_path_from_json(payload["config_file"]),
+        include=_strings_from_json(payload["include"]),
+        exclude=_strings_from_json(payload["exclude"]),
+    )
+
+
+def _override_from_json(directory: Path, payload: dict[str, object]) -> PathOverride:
+    """Rebuild an override encoded by `_override_to_json`.
+
+    A payload with missing fields or unexpected shapes raises `KeyError` or
+    `TypeError`; callers treat that as a cache miss.
+
+    Args:
+        directory: Resolved directory holding the override file.
+        payload: Cached payload.
+
+    Returns:
+        Override for `directory` with the cached settings.
+    """
+    engines: dict[EngineName, EngineSettings] = {}
+    for name, raw_settings in cast("dict[str, object]", payload["engines"]).items():
+        settings = cast("dict[str, object]", raw_settings)
+        profiles = {
+            ProfileName(profile_name): _profile_from_json(cast("dict[str, object]", profile))
+            for profile_name, profile in cast("dict[str, object]", settings["profiles"]).items()
+        }
+        default_profile = settings["default_profile"]
+        engines[EngineName(name)] = EngineSettings(
+            plugin_args=_strings_from_json(settings["plugin_args"]),
+            config_file=_optional_path_from_json(settings["config_file"]),
+            include=_strings_from_json(settings["include"]),
+            exclude=_strings_from_json(settings["exclude"]),
+            default_profile=ProfileName(cast("str", default_profile)) if default_profile else None,
+            profiles=profiles,
+        )
+    active_profiles = {
+        EngineName(name): ProfileName(cast("str", profile))
+        for name, profile in cast("dict[str, object]", payload["active_profiles"]).items()
+    }
+    return PathOverride(path=directory, engine_settings=engines, active_profiles=active_profiles)
+
+
+def _read_override_cache(path: Path) -> dict[str, dict[str, object]]:
+    try:
+        raw = cast("object", json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    payload = cast("dict[str, object]", raw) if isinstance(raw, dict) else {}
+    if payload.get("version") != _OVERRIDE_CACHE_VERSION:
+        return {}
+    entries = payload.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    return {
+        str(key): cast("dict[str, object]", entry)
+        for key, entry in cast("dict[object, object]", entries).items()
+        if isinstance(entry, dict)
+    }
+
+
+def _write_override_cache(path: Path, entries: dict[str, dict[str, object]]) -> None:
+    payload = {"version": _OVERRIDE_CACHE_VERSION, "entries": dict(sorted(entries.items()))}
+    # The override cache is an optimisation; read-only trees still load.
+    with suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        consume(tmp_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8"))
+        consume(tmp_path.replace(path))
+
+
 def _discover_path_overrides(root: Path) -> list[PathOverride]:
+    """Load directory overrides below ``root``, reusing cached parses of unchanged files.
+
+    Parsed overrides are cached in ``.ratchetr_cache`` keyed by file path and
+    stamped with the file's modification time and size, so only new or edited
+    override files are TOML-parsed and validated.
+
+    Args:
+        root: Project root to search.
+
+    Returns:
+        Overrides ordered from the shallowest directory to the deepest.
+    """
+    cache_path = root / _CACHE_DIRNAME / OVERRIDE_CACHE_FILENAME
+    cached = _read_override_cache(cache_path)
+    entries: dict[str, dict[str, object]] = {}
     overrides: list[PathOverride] = []
-    for filename in FOLDER_CONFIG_FILENAMES:
+    for config_path in _override_candidates(root):
         try:
-            candidates = sorted(root.rglob(filename))
-        except FileNotFoundError:
-            # ignore JUSTIFIED: intermediate folders may be removed by tools (e.g. hypothesis)
-            # during traversal; skip missing paths and continue scanning
+            file_stat = config_path.stat()
+        except OSError:
             continue
-        for config_path in candidates:
-            if not config_path.is_file():
-                continue
-            directory = config_path.parent.resolve()
-            try:
-                raw = tomllib.loads(config_path.read_text(encoding="utf-8"))
-            # ignore JUSTIFIED: config files may be unreadable or malformed
-            # convert parsing issues to ConfigReadError
-            except Exception as exc:  # pragma: no cover - IO errors
-                raise ConfigReadError(config_path, exc) from exc
+        if not stat.S_ISREG(file_stat.st_mode):
+            continue
+        key = str(config_path)
+        stamp = [file_stat.st_mtime_ns, file_stat.st_size]
+        entry: dict[str, object] | None = cached.get(key)
+        override: PathOverride | None = None
+        if entry is not None and entry.get("stamp") == stamp:
             try:
-                model = PathOverrideModel.model_validate(raw)
-            except ValidationError as exc:
-                raise DirectoryOverrideValidationError(config_path, exc) from exc
-            override = path_override_from_model(directory, model)
-            overrides.append(override)
+                override = _override_from_json(
+                    config_path.parent.resolve(), cast("dict[str, object]", entry["override"])
+                )
+            except (AttributeError, KeyError, TypeError):
+                override = None
+        if entry is None or override is None:
+            override = _parse_path_override(config_path)
+            entry = {"stamp": stamp, "override": _override_to_json(override)}
+        entries[key] = entry
+        overrides.append(override)
+    if entries != cached:
+        _write_override_cache(cache_path, entries)
     overrides.sort(key=lambda item: (len(item.path.parts), item.path.as_posix()))
     return overrides
 
@@ -204,5 +429,29 @@ FOLDER_CONFIG_FILENAMES: Final[tuple[FolderConfigFilename, FolderConfigFilename]
     "ratchetr.dir.toml",
     ".ratchetrdir.toml",
 )
+# Mirrors `ratchetr.cache.CACHE_DIRNAME`, which imports this package.
+_CACHE_DIRNAME: Final[str] = ".ratchetr_cache"
+OVERRIDE_CACHE_FILENAME: Final[str] = "path_overrides.json"
+_OVERRIDE_CACHE_VERSION: Final[int] = 1
+# Directories skipped when walking the tree for override files outside git.
+_PRUNED_DIRNAMES: Final[frozenset[str]] = frozenset({
+    ".eggs",
+    ".git",
+    ".hg",
+    ".mypy_cache",
+    ".nox",
+    ".pytest_cache",
+    ".ruff_cache",
+    ".svn",
+    ".tox",
+    ".venv",
+    _CACHE_DIRNAME,
+    "__pycache__",
+    "build",
+    "dist",
+    "node_modules",
+    "site-packages",
+    "venv",
+})
 
 __all__ = ["load_config", "resolve_path_fields"]
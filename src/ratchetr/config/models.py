@@ -33,12 +33,28 @@ from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validat
 
 from ratchetr.collections import dedupe_preserve
 from ratchetr.config.validation import require_non_negative_int
-from ratchetr.core.model_types import FailOnPolicy, SeverityLevel, SignaturePolicy
+from ratchetr.core.model_types import (
+    CacheBackend,
+    FailOnPolicy,
+    FingerprintSource,
+    HashBackend,
+    ManifestCompression,
+    RawRetention,
+    SeverityLevel,
+    SignaturePolicy,
+)
 from ratchetr.core.type_aliases import EngineName, ProfileName, RunId, RunnerName
 from ratchetr.exceptions import RatchetrValidationError
 
 CONFIG_VERSION: Final[int] = 0
 FAIL_ON_ALLOWED_VALUES: Final[tuple[str, ...]] = tuple(policy.value for policy in FailOnPolicy)
+CACHE_BACKEND_ALLOWED_VALUES: Final[tuple[str, ...]] = tuple(backend.value for backend in CacheBackend)
+RAW_RETENTION_ALLOWED_VALUES: Final[tuple[str, ...]] = tuple(policy.value for policy in RawRetention)
+FINGERPRINT_SOURCE_ALLOWED_VALUES: Final[tuple[str, ...]] = tuple(source.value for source in FingerprintSource)
+HASH_BACKEND_ALLOWED_VALUES: Final[tuple[str, ...]] = tuple(backend.value for backend in HashBackend)
+MANIFEST_COMPRESSION_ALLOWED_VALUES: Final[tuple[str, ...]] = tuple(
+    compression.value for compression in ManifestCompression
+)
 
 
 class ConfigValidationError(RatchetrValidationError):
@@ -270,6 +286,22 @@ class AuditConfig:  # pylint: disable=too-many-instance-attributes
         fail_on: Policy for when the audit should fail (e.g., on errors, warnings).
         hash_workers: Number of workers for parallel file hashing, or "auto" to
             determine automatically.
+        hash_backend: Executor used for file hashing; `process` hashes batches of
+            files in worker processes (`thread` when unset).
+        max_parallel_engines: Maximum number of engine:mode runs executed
+            concurrently. `None`, `0`, or `1` keep runs sequential.
+        per_file_cache: Whether partially stale cache entries re-check only the
+            changed files (and their importers) instead of the whole run.
+        daemon: Whether engines that support it keep a long-lived daemon process
+            between audits (currently `dmypy` for mypy).
+        cache_backend: Storage backend for the engine cache (`json` when unset).
+        raw_retention: How much of each tool-native diagnostic payload is kept in
+            memory, in the engine cache, and in manifests (`minimal` when unset).
+        fingerprint_source: Where cache file fingerprints come from; `git` reuses
+            index blob ids for clean tracked files (`filesystem` when unset).
+        compact_manifest: Whether the manifest is written without indentation.
+        manifest_compression: Compression applied to the manifest; inferred from
+            the manifest extension (``.gz`` / ``.zst``) when unset.
         dashboard_json: Optional path to save JSON format dashboard output.
         dashboard_markdown: Optional path to save Markdown format dashboard output.
         dashboard_html: Optional path to save HTML format dashboard output.
@@ -290,6 +322,15 @@ class AuditConfig:  # pylint: disable=too-many-instance-attributes
     skip_full: bool | None = None
     fail_on: FailOnPolicy | None = None
     hash_workers: int | Literal["auto"] | None = None
+    hash_backend: HashBackend | None = None
+    max_parallel_engines: int | None = None
+    per_file_cache: bool | None = None
+    daemon: bool | None = None
+    cache_backend: CacheBackend | None = None
+    raw_retention: RawRetention | None = None
+    fingerprint_source: FingerprintSource | None = None
+    compact_manifest: bool | None = None
+    manifest_compression: ManifestCompression | None = None
     dashboard_json: Path | None = None
     dashboard_markdown: Path | None = None
     dashboard_html: Path | None = None
@@ -575,6 +616,15 @@ class AuditConfigModel(BaseModel):
         skip_current: Whether to skip files in the current directory.
         skip_full: Whether to skip the full audit and only check changed files.
         fail_on: Policy for when the audit should fail.
+        max_parallel_engines: Maximum number of engine:mode runs executed concurrently.
+        per_file_cache: Whether stale cache entries re-check only changed files.
+        daemon: Whether supporting engines reuse a long-lived daemon process.
+        hash_backend: Executor used for file hashing.
+        cache_backend: Storage backend for the engine cache.
+        raw_retention: Retention policy for tool-native diagnostic payloads.
+        fingerprint_source: Source of cache file fingerprints.
+        compact_manifest: Whether the manifest is written without indentation.
+        manifest_compression: Compression applied to the manifest file.
         dashboard_json: Optional path to save JSON format dashboard output.
         dashboard_markdown: Optional path to save Markdown format dashboard output.
         dashboard_html: Optional path to save HTML format dashboard output.
@@ -594,6 +644,15 @@ class AuditConfigModel(BaseModel):
     skip_current: bool | None = None
     skip_full: bool | None = None
     fail_on: FailOnPolicy | None = None
+    max_parallel_engines: int | None = None
+    per_file_cache: bool | None = None
+    daemon: bool | None = None
+    hash_backend: HashBackend | None = None
+    cache_backend: CacheBackend | None = None
+    raw_retention: RawRetention | None = None
+    fingerprint_source: FingerprintSource | None = None
+    compact_manifest: bool | None = None
+    manifest_compression: ManifestCompression | None = None
     dashboard_json: Path | None = None
     dashboard_markdown: Path | None = None
     dashboard_html: Path | None = None
@@ -608,7 +667,7 @@ class AuditConfigModel(BaseModel):
     def _coerce_list(cls, value: object) -> list[str] | None:
         return ensure_list(value)
 
-    @field_validator("max_depth", "max_files", "max_bytes", mode="before")
+    @field_validator("max_depth", "max_files", "max_bytes", "max_parallel_engines", mode="before")
     @classmethod
     def _validate_limits(cls, value: object, info: ValidationInfo) -> int | None:
         if value is None:
@@ -632,6 +691,86 @@ class AuditConfigModel(BaseModel):
         msg = "fail_on"
         raise ConfigFieldTypeError(msg)
 
+    @field_validator("hash_backend", mode="before")
+    @classmethod
+    def _normalise_hash_backend(cls, value: object) -> HashBackend | None:
+        if value is None:
+            return None
+        if isinstance(value, HashBackend):
+            return value
+        if isinstance(value, str):
+            try:
+                return HashBackend.from_str(value)
+            except ValueError as exc:
+                msg = "hash_backend"
+                raise ConfigFieldChoiceError(msg, HASH_BACKEND_ALLOWED_VALUES) from exc
+        msg = "hash_backend"
+        raise ConfigFieldTypeError(msg)
+
+    @field_validator("cache_backend", mode="before")
+    @classmethod
+    def _normalise_cache_backend(cls, value: object) -> CacheBackend | None:
+        if value is None:
+            return None
+        if isinstance(value, CacheBackend):
+            return value
+        if isinstance(value, str):
+            try:
+                return CacheBackend.from_str(value)
+            except ValueError as exc:
+                msg = "cache_backend"
+                raise ConfigFieldChoiceError(msg, CACHE_BACKEND_ALLOWED_VALUES) from exc
+        msg = "cache_backend"
+        raise ConfigFieldTypeError(msg)
+
+    @field_validator("raw_retention", mode="before")
+    @classmethod
+    def _normalise_raw_retention(cls, value: object) -> RawRetention | None:
+        if value is None:
+            return None
+        if isinstance(value, RawRetention):
+            return value
+        if isinstance(value, str):
+            try:
+                return RawRetention.from_str(value)
+            except ValueError as exc:
+                msg = "raw_retention"
+                raise ConfigFieldChoiceError(msg, RAW_RETENTION_ALLOWED_VALUES) from exc
+        msg = "raw_retention"
+        raise ConfigFieldTypeError(msg)
+
+    @field_validator("fingerprint_source", mode="before")
+    @classmethod
+    def _normalise_fingerprint_source(cls, value: object) -> FingerprintSource | None:
+        if value is None:
+            return None
+        if isinstance(value, FingerprintSource):
+            return value
+        if isinstance(value, str):
+            try:
+                return FingerprintSource.from_str(value)
+            except ValueError as exc:
+                msg = "fingerprint_source"
+                raise ConfigFieldChoiceError(msg, FINGERPRINT_SOURCE_ALLOWED_VALUES) from exc
+        msg = "fingerprint_source"
+        raise ConfigFieldTypeError(msg)
+
+    @field_validator("manifest_compression", mode="before")
+    @classmethod
+    def _normalise_manifest_compression(cls, value: object) -> ManifestCompression | None:
+        if value is None:
+            return None
+        if isinstance(value, ManifestCompression):
+            return value
+        if isinstance(value, str):
+            try:
+                return ManifestCompression.from_str(value)
+            except ValueError as exc:
+                msg = "manifest_compression"
+                raise ConfigFieldChoiceError(msg, MANIFEST_COMPRESSION_ALLOWED_VALUES) from exc
+        msg = "manifest_compression"
+        raise ConfigFieldTypeError(msg)
+
     @field_validator("plugin_args", mode="before")
     @classmethod
     def _coerce_plugin_args(cls, value: object) -> dict[str, list[str]]:
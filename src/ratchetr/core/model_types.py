@@ -564,6 +564,222 @@ class FailOnPolicy(StrEnum):
             raise ValueError(msg) from exc
 
 
+class CacheBackend(StrEnum):
+    """Enumeration of on-disk engine cache storage backends.
+
+    Attributes:
+        JSON: Single pretty-printed ``cache.json`` document.
+        SHARDED: One compressed shard file per cache key, loaded lazily.
+        SQLITE: SQLite database in WAL mode supporting concurrent writers.
+    """
+
+    JSON = "json"
+    SHARDED = "sharded"
+    SQLITE = "sqlite"
+
+    @classmethod
+    def from_str(cls, raw: str) -> CacheBackend:
+        """Create a CacheBackend enum from a string value.
+
+        Args:
+            raw: String representation of the cache backend.
+
+        Returns:
+            CacheBackend enum value.
+
+        Raises:
+            ValueError: If the string does not match any CacheBackend value.
+        """
+        value = raw.strip().lower()
+        try:
+            return cls(value)
+        except ValueError as exc:
+            msg = f"Unknown cache backend '{raw}'"
+            raise ValueError(msg) from exc
+
+
+class FingerprintSource(StrEnum):
+    """Enumeration of sources for cache file fingerprints.
+
+    Attributes:
+        FILESYSTEM: Walk the filesystem and hash every file.
+        GIT: Reuse git index blob ids for clean tracked files; hash only dirty
+            and untracked files.
+    """
+
+    FILESYSTEM = "filesystem"
+    GIT = "git"
+
+    @classmethod
+    def from_str(cls, raw: str) -> FingerprintSource:
+        """Create a FingerprintSource enum from a string value.
+
+        Args:
+            raw: String representation of the fingerprint source.
+
+        Returns:
+            FingerprintSource enum value.
+
+        Raises:
+            ValueError: If the string does not match any FingerprintSource value.
+        """
+        value = raw.strip().lower()
+        try:
+            return cls(value)
+        except ValueError as exc:
+            msg = f"Unknown fingerprint source '{raw}'"
+            raise ValueError(msg) from exc
+
+
+class HashBackend(StrEnum):
+    """Enumeration of executors used to fingerprint files for the cache.
+
+    Attributes:
+        THREAD: Hash in a thread pool inside the audit process.
+        PROCESS: Hash batches of files in a process pool, sidestepping the GIL.
+    """
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+    @classmethod
+    def from_str(cls, raw: str) -> HashBackend:
+        """Create a HashBackend enum from a string value.
+
+        Args:
+            raw: String representation of the hash backend.
+
+        Returns:
+            HashBackend enum value.
+
+        Raises:
+            ValueError: If the string does not match any HashBackend value.
+        """
+        value = raw.strip().lower()
+        try:
+            return cls(value)
+        except ValueError as exc:
+            msg = f"Unknown hash backend '{raw}'"
+            raise ValueError(msg) from exc
+
+
+class ManifestCompression(StrEnum):
+    """Enumeration of compression formats for manifest files.
+
+    Attributes:
+        NONE: Plain JSON.
+        GZIP: gzip-compressed JSON (``.json.gz``).
+        ZSTD: Zstandard-compressed JSON (``.json.zst``); requires ``zstandard``.
+    """
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    @classmethod
+    def from_str(cls, raw: str) -> ManifestCompression:
+        """Create a ManifestCompression enum from a string value.
+
+        Args:
+            raw: String representation of the compression format.
+
+        Returns:
+            ManifestCompression enum value.
+
+        Raises:
+            ValueError: If the string does not match any ManifestCompression value.
+        """
+        value = raw.strip().lower()
+        try:
+            return cls(value)
+        except ValueError as exc:
+            msg = f"Unknown manifest compression '{raw}'"
+            raise ValueError(msg) from exc
+
+
+class ManifestValidation(StrEnum):
+    """Enumeration of validation levels applied when loading manifests.
+
+    Attributes:
+        FULL: Validate every manifest against the manifest models.
+        FAST: Skip validation for manifests whose ratchetr write stamp still
+            matches their contents; validate all others in full.
+        OFF: Trust every manifest without validating it.
+    """
+
+    FULL = "full"
+    FAST = "fast"
+    OFF = "off"
+
+    @classmethod
+    def from_str(cls, raw: str) -> ManifestValidation:
+        """Create a ManifestValidation enum from a string value.
+
+        Args:
+            raw: String representation of the validation level.
+
+        Returns:
+            ManifestValidation enum value.
+
+        Raises:
+            ValueError: If the string does not match any ManifestValidation value.
+        """
+        value = raw.strip().lower()
+        try:
+            return cls(value)
+        except ValueError as exc:
+            msg = f"Unknown manifest validation level '{raw}'"
+            raise ValueError(msg) from exc
+
+
+class RawRetention(StrEnum):
+    """Enumeration of policies for keeping tool-native diagnostic payloads.
+
+    Attributes:
+        NONE: Drop the tool payload entirely.
+        MINIMAL: Keep only payload fields not already captured on `Diagnostic`.
+        FULL: Keep the complete payload and emit it in manifests.
+    """
+
+    NONE = "none"
+    MINIMAL = "minimal"
+    FULL = "full"
+
+    @classmethod
+    def from_str(cls, raw: str) -> RawRetention:
+        """Create a RawRetention enum from a string value.
+
+        Args:
+            raw: String representation of the retention policy.
+
+        Returns:
+            RawRetention enum value.
+
+        Raises:
+            ValueError: If the string does not match any RawRetention value.
+        """
+        value = raw.strip().lower()
+        try:
+            return cls(value)
+        except ValueError as exc:
+            msg = f"Unknown raw retention policy '{raw}'"
+            raise ValueError(msg) from exc
+
+
+class RunSkipReason(StrEnum):
+    """Enumeration of reasons the audit planner drops an engine:mode pair.
+
+    Attributes:
+        DISABLED: The mode is turned off for this audit.
+        DUPLICATE: The engine:mode pair was already planned.
+        IDENTICAL: Another planned run invokes the engine with the same command.
+    """
+
+    DISABLED = "disabled"
+    DUPLICATE = "duplicate"
+    IDENTICAL = "identical"
+
+
 class RatchetAction(StrEnum):
     """Enumeration of ratchet command actions.
 
@@ -21,18 +21,25 @@ throughout ratchetr for storing and processing type checker output.
 
 from __future__ import annotations
 
+from array import array
 from collections import Counter
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from collections.abc import MutableSequence
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final, Generic, TypeVar, cast, overload
+
+from ratchetr.compat import override
+
+from .model_types import RawRetention, SeverityLevel
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
     from pathlib import Path
 
     from ratchetr.json import JSONValue
     from ratchetr.manifest.typed import EngineError, ToolSummary
 
-    from .model_types import CategoryMapping, Mode, OverrideEntry, SeverityLevel
+    from .model_types import CategoryMapping, Mode, OverrideEntry
     from .type_aliases import Command, RelPath, ToolName
 
 
@@ -70,6 +77,437 @@ class Diagnostic:
     raw: Mapping[str, JSONValue] = field(default_factory=_default_raw_mapping)
 
 
+DEFAULT_RAW_RETENTION: Final[RawRetention] = RawRetention.MINIMAL
+# Tool payload fields whose content is already stored on the typed Diagnostic fields.
+_REDUNDANT_RAW_KEYS: Final[frozenset[str]] = frozenset({
+    "code",
+    "column",
+    "file",
+    "filePath",
+    "line",
+    "message",
+    "path",
+    "rule",
+    "severity",
+    "stderr",
+    "unparsed",
+})
+# Shared, read-only payload for diagnostics that keep no raw data.
+NO_RAW: Final[Mapping[str, JSONValue]] = MappingProxyType({})
+
+
+def retain_raw(raw: Mapping[str, JSONValue], policy: RawRetention) -> Mapping[str, JSONValue]:
+    """Trim a tool-native diagnostic payload according to a retention policy.
+
+    Args:
+        raw: Payload emitted by the type checker for a single diagnostic.
+        policy: Retention policy to apply.
+
+    Returns:
+        ``raw`` itself when nothing needs dropping, otherwise the trimmed payload.
+    """
+    if policy is RawRetention.FULL or not raw:
+        return raw
+    if policy is RawRetention.NONE:
+        return NO_RAW
+    if _REDUNDANT_RAW_KEYS.isdisjoint(raw):
+        return raw
+    trimmed = {key: value for key, value in raw.items() if key not in _REDUNDANT_RAW_KEYS}
+    return trimmed or NO_RAW
+
+
+def apply_raw_retention(diagnostics: Iterable[Diagnostic], policy: RawRetention) -> list[Diagnostic]:
+    """Return ``diagnostics`` with their raw payloads trimmed to ``policy``.
+
+    Args:
+        diagnostics: Diagnostics to trim.
+        policy: Retention policy to apply.
+
+    Returns:
+        List of diagnostics; entries that already satisfy the policy are reused.
+    """
+    if policy is RawRetention.FULL:
+        return list(diagnostics)
+    retained: list[Diagnostic] = []
+    for diag in diagnostics:
+        raw = retain_raw(diag.raw, policy)
+        retained.append(diag if raw is diag.raw else replace(diag, raw=raw))
+    return retained
+
+
+_T = TypeVar("_T")
+# Severity column values index into this tuple.
+_SEVERITIES: Final[tuple[SeverityLevel, ...]] = tuple(SeverityLevel)
+_SEVERITY_IDS: Final[dict[SeverityLevel, int]] = {severity: index for index, severity in enumerate(_SEVERITIES)}
+# Rule column value used for diagnostics without a rule code.
+_NO_RULE: Final[int] = -1
+
+DiagnosticRecord = tuple["Path", int, int, SeverityLevel, "str | None", str, "Mapping[str, JSONValue]"]
+DiagnosticRow = tuple[int, int, SeverityLevel, "str | None", str, "Mapping[str, JSONValue]"]
+
+
+class _InternTable(Generic[_T]):
+    """Append-only table mapping distinct values to dense integer ids."""
+
+    __slots__ = ("ids", "values")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.values: list[_T] = []
+        self.ids: dict[_T, int] = {}
+
+    def intern(self, value: _T) -> int:
+        """Return the id of ``value``, assigning the next id on first sight.
+
+        Args:
+            value: Value to intern.
+
+        Returns:
+            Dense integer id of ``value``.
+        """
+        index = self.ids.get(value)
+        if index is None:
+            index = len(self.values)
+            self.ids[value] = index
+            self.values.append(value)
+        return index
+
+
+# ignore JUSTIFIED: one typed array per column plus the intern tables backing them
+class DiagnosticTable(MutableSequence[Diagnostic]):  # pylint: disable=too-many-instance-attributes
+    """Column-oriented, list-compatible store for the diagnostics of a run.
+
+    Lines, columns, and severities live in typed arrays; tools, paths, rule
+    codes, and messages are stored once in intern tables and referenced by id.
+    Rows are materialised as `Diagnostic` objects only when accessed, while the
+    ``*counts*`` helpers group directly over the id columns.
+    """
+
+    __slots__ = (
+        "_column",
+        "_line",
+        "_message",
+        "_messages",
+        "_path",
+        "_paths",
+        "_raw",
+        "_rule",
+        "_rules",
+        "_severity",
+        "_tool",
+        "_tools",
+    )
+
+    def __init__(self, diagnostics: Iterable[Diagnostic] = ()) -> None:
+        """Initialise the table with ``diagnostics``.
+
+        Args:
+            diagnostics: Initial rows, in order.
+        """
+        super().__init__()
+        self._reset()
+        self.extend(diagnostics)
+
+    def _reset(self) -> None:
+        self._tools: _InternTable[ToolName] = _InternTable()
+        self._paths: _InternTable[Path] = _InternTable()
+        self._rules: _InternTable[str] = _InternTable()
+        self._messages: _InternTable[str] = _InternTable()
+        self._tool = array("H")
+        self._path = array("I")
+        self._line = array("i")
+        self._column = array("i")
+        self._severity = array("B")
+        self._rule = array("i")
+        self._message = array("I")
+        self._raw: list[Mapping[str, JSONValue]] = []
+
+    def _columns(self) -> tuple[array[int], ...]:
+        return (self._tool, self._path, self._line, self._column, self._severity, self._rule, self._message)
+
+    def _encode(self, diag: Diagnostic) -> tuple[int, ...]:
+        return (
+            self._tools.intern(diag.tool),
+            self._paths.intern(diag.path),
+            diag.line,
+            diag.column,
+            _SEVERITY_IDS[diag.severity],
+            _NO_RULE if diag.code is None else self._rules.intern(diag.code),
+            self._messages.intern(diag.message),
+        )
+
+    def _row(self, index: int) -> Diagnostic:
+        rule = self._rule[index]
+        return Diagnostic(
+            tool=self._tools.values[self._tool[index]],
+            severity=_SEVERITIES[self._severity[index]],
+            path=self._paths.values[self._path[index]],
+            line=self._line[index],
+            column=self._column[index],
+            code=None if rule == _NO_RULE else self._rules.values[rule],
+            message=self._messages.values[self._message[index]],
+            raw=self._raw[index],
+        )
+
+    @override
+    def __len__(self) -> int:
+        """Return the number of stored diagnostics."""
+        return len(self._line)
+
+    @overload
+    def __getitem__(self, index: int) -> Diagnostic: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> DiagnosticTable: ...
+
+    @override
+    def __getitem__(self, index: int | slice) -> Diagnostic | DiagnosticTable:
+        """Return the diagnostic at ``index`` (or a new table for a slice)."""
+        if isinstance(index, slice):
+            return DiagnosticTable(self._row(position) for position in range(len(self))[index])
+        return self._row(range(len(self))[index])
+
+    @overload
+    def __setitem__(self, index: int, value: Diagnostic) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[Diagnostic]) -> None: ...
+
+    @override
+    def __setitem__(self, index: int | slice, value: Diagnostic | Iterable[Diagnostic]) -> None:
+        """Replace the diagnostic at ``index`` (or the rows covered by a slice)."""
+        if isinstance(index, slice):
+            rows = list(self)
+            rows[index] = cast("Iterable[Diagnostic]", value)
+            self._reset()
+            self.extend(rows)
+            return
+        position = range(len(self))[index]
+        diag = cast("Diagnostic", value)
+        for column, encoded in zip(self._columns(), self._encode(diag), strict=True):
+            column[position] = encoded
+        self._raw[position] = diag.raw
+
+    @overload
+    def __delitem__(self, index: int) -> None: ...
+
+    @overload
+    def __delitem__(self, index: slice) -> None: ...
+
+    @override
+    def __delitem__(self, index: int | slice) -> None:
+        """Remove the diagnostic at ``index`` (or the rows covered by a slice)."""
+        if isinstance(index, slice):
+            rows = list(self)
+            del rows[index]
+            self._reset()
+            self.extend(rows)
+            return
+        position = range(len(self))[index]
+        for column in self._columns():
+            del column[position]
+        del self._raw[position]
+
+    @override
+    def insert(self, index: int, value: Diagnostic) -> None:
+        """Insert ``value`` before ``index``."""
+        for column, encoded in zip(self._columns(), self._encode(value), strict=True):
+            column.insert(index, encoded)
+        self._raw.insert(index, value.raw)
+
+    @override
+    def append(self, value: Diagnostic) -> None:
+        """Append ``value`` to the end of the table."""
+        for column, encoded in zip(self._columns(), self._encode(value), strict=True):
+            column.append(encoded)
+        self._raw.append(value.raw)
+
+    @override
+    def extend(self, values: Iterable[Diagnostic]) -> None:
+        """Append every diagnostic from ``values``."""
+        for value in list(values) if values is self else values:
+            self.append(value)
+
+    @override
+    def __iter__(self) -> Iterator[Diagnostic]:
+        """Iterate over the rows as `Diagnostic` objects.
+
+        Returns:
+            Iterator materialising one `Diagnostic` per row.
+        """
+        return (self._row(index) for index in range(len(self)))
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        """Compare row-by-row with another table, list, or tuple of diagnostics.
+
+        Returns:
+            Whether both sides hold equal diagnostics in the same order.
+        """
+        if not isinstance(other, (DiagnosticTable, list, tuple)):
+            return NotImplemented
+        rows = cast("Sequence[Diagnostic]", other)
+        return len(self) == len(rows) and all(left == right for left, right in zip(self, rows, strict=True))
+
+    # ignore JUSTIFIED: mutable container, unhashable like list
+    __hash__ = None  # type: ignore[assignment]
+
+    @override
+    def __repr__(self) -> str:
+        """Return a compact representation listing the row count."""
+        return f"DiagnosticTable(rows={len(self)}, paths={len(self._paths.values)})"
+
+    @property
+    def paths(self) -> tuple[Path, ...]:
+        """Return the distinct diagnostic paths in first-seen order.
+
+        Returns:
+            Tuple of distinct paths.
+        """
+        return tuple(self._paths.values)
+
+    def records(self) -> Iterator[DiagnosticRecord]:
+        """Yield ``(path, line, column, severity, code, message, raw)`` rows.
+
+        Unlike iteration, no `Diagnostic` objects are allocated.
+
+        Yields:
+            One tuple per stored diagnostic, in order.
+        """
+        paths = self._paths.values
+        rules = self._rules.values
+        messages = self._messages.values
+        for path, line, column, severity, rule, message, raw in zip(
+            self._path, self._line, self._column, self._severity, self._rule, self._message, self._raw, strict=True
+        ):
+            yield (
+                paths[path],
+                line,
+                column,
+                _SEVERITIES[severity],
+                None if rule == _NO_RULE else rules[rule],
+                messages[message],
+                raw,
+            )
+
+    def rows_by_path(self) -> dict[Path, list[DiagnosticRow]]:
+        """Return ``(line, column, severity, code, message, raw)`` rows grouped by file.
+
+        Rows are grouped on the integer path ids, so each `Path` is decoded
+        once per file rather than once per diagnostic.
+
+        Returns:
+            Mapping of diagnostic path to its rows in order, in first-seen path order.
+        """
+        rules = self._rules.values
+        messages = self._messages.values
+        grouped: dict[int, list[DiagnosticRow]] = {}
+        # zip() over seven columns is typed as Any; declare the id columns' types.
+        path: int
+        severity: int
+        rule: int
+        message: int
+        for path, line, column, severity, rule, message, raw in zip(
+            self._path, self._line, self._column, self._severity, self._rule, self._message, self._raw, strict=True
+        ):
+            rows: list[DiagnosticRow] | None = grouped.get(path)
+            if rows is None:
+                rows = grouped[path] = []
+            rows.append((
+                line,
+                column,
+                _SEVERITIES[severity],
+                None if rule == _NO_RULE else rules[rule],
+                messages[message],
+                raw,
+            ))
+        paths = self._paths.values
+        return {paths[path]: rows for path, rows in grouped.items()}
+
+    def severity_counts(self) -> Counter[SeverityLevel]:
+        """Return diagnostic counts per severity.
+
+        Returns:
+            Counter keyed by `SeverityLevel`.
+        """
+        return Counter({_SEVERITIES[severity]: count for severity, count in Counter(self._severity).items()})
+
+    def counts_by_path(self) -> Counter[Path]:
+        """Return diagnostic counts per file.
+
+        Returns:
+            Counter keyed by diagnostic path, in first-seen order.
+        """
+        paths = self._paths.values
+        return Counter({paths[path]: count for path, count in Counter(self._path).items()})
+
+    def counts_by_rule(self) -> Counter[str | None]:
+        """Return diagnostic counts per rule code (`None` for diagnostics without one).
+
+        Returns:
+            Counter keyed by rule code, in first-seen order.
+        """
+        rules = self._rules.values
+        return Counter({
+            None if rule == _NO_RULE else rules[rule]: count for rule, count in Counter(self._rule).items()
+        })
+
+    def counts_by_folder(self, depth: int) -> Counter[str]:
+        """Return diagnostic counts per folder prefix of ``depth`` path parts.
+
+        Paths with fewer than ``depth`` parts are not counted.
+
+        Args:
+            depth: Number of leading path components forming the folder key.
+
+        Returns:
+            Counter keyed by POSIX folder prefix.
+        """
+        counts: Counter[str] = Counter()
+        for path, count in self.counts_by_path().items():
+            parts = path.as_posix().split("/")
+            if len(parts) >= depth:
+                counts["/".join(parts[:depth])] += count
+        return counts
+
+    def severity_counts_by_path(self) -> dict[Path, Counter[SeverityLevel]]:
+        """Return per-file severity counts.
+
+        Returns:
+            Mapping of diagnostic path to a severity counter, in first-seen order.
+        """
+        paths = self._paths.values
+        grouped: dict[Path, Counter[SeverityLevel]] = {}
+        for (path, severity), count in Counter(zip(self._path, self._severity, strict=True)).items():
+            grouped.setdefault(paths[path], Counter())[_SEVERITIES[severity]] = count
+        return grouped
+
+    def rule_counts_by_path(self) -> dict[Path, Counter[str | None]]:
+        """Return per-file rule-code counts.
+
+        Returns:
+            Mapping of diagnostic path to a rule counter, in first-seen order.
+        """
+        paths = self._paths.values
+        rules = self._rules.values
+        grouped: dict[Path, Counter[str | None]] = {}
+        for (path, rule), count in Counter(zip(self._path, self._rule, strict=True)).items():
+            grouped.setdefault(paths[path], Counter())[None if rule == _NO_RULE else rules[rule]] = count
+        return grouped
+
+
+def _as_diagnostic_table(diagnostics: Iterable[Diagnostic]) -> DiagnosticTable:
+    """Return ``diagnostics`` as a `DiagnosticTable`, converting other iterables.
+
+    Args:
+        diagnostics: Table or plain iterable of diagnostics.
+
+    Returns:
+        ``diagnostics`` itself when already a table, otherwise a new table.
+    """
+    return diagnostics if isinstance(diagnostics, DiagnosticTable) else DiagnosticTable(diagnostics)
+
+
 def _default_str_list() -> list[str]:
     """Create an empty string list.
 
@@ -120,7 +558,8 @@ class RunResult:  # pylint: disable=too-many-instance-attributes
         command: Full command line used to execute the tool.
         exit_code: Exit code returned by the type checker process.
         duration_ms: Execution duration in milliseconds.
-        diagnostics: List of all diagnostics found during the run.
+        diagnostics: Columnar table of all diagnostics found during the run; any
+            other iterable of `Diagnostic` passed in is converted to one.
         cached: Whether results were retrieved from cache.
         profile: Optional type checking profile name used.
         config_file: Optional path to the type checker configuration file.
@@ -139,7 +578,7 @@ class RunResult:  # pylint: disable=too-many-instance-attributes
     command: Command
     exit_code: int
     duration_ms: float
-    diagnostics: list[Diagnostic]
+    diagnostics: DiagnosticTable
     cached: bool = False
     profile: str | None = None
     config_file: Path | None = None
@@ -153,13 +592,14 @@ class RunResult:  # pylint: disable=too-many-instance-attributes
     scanned_paths: list[RelPath] = field(default_factory=_default_relpath_list)
     engine_error: EngineError | None = None
 
+    def __post_init__(self) -> None:
+        """Store diagnostics passed as a plain iterable in a `DiagnosticTable`."""
+        self.diagnostics = _as_diagnostic_table(self.diagnostics)
+
     def severity_counts(self) -> Counter[SeverityLevel]:
         """Calculate the count of diagnostics by severity level.
 
         Returns:
             Counter mapping each severity level to its diagnostic count.
         """
-        counts: Counter[SeverityLevel] = Counter()
-        for diag in self.diagnostics:
-            counts[diag.severity] += 1
-        return counts
+        return self.diagnostics.severity_counts()
@@ -21,13 +21,16 @@ for visualizing type checking diagnostics and readiness metrics.
 
 from __future__ import annotations
 
-from .build import DashboardTypeError, build_summary, load_manifest
+from .build import DashboardTypeError, build_summary, build_summary_from_index, load_manifest
+from .cache import SummaryCache
 from .render_html import render_html
 from .render_markdown import render_markdown
 
 __all__ = [
     "DashboardTypeError",
+    "SummaryCache",
     "build_summary",
+    "build_summary_from_index",
     "load_manifest",
     "render_html",
     "render_markdown",
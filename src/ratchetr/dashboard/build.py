@@ -21,7 +21,6 @@ and structures the data for rendering in HTML or Markdown formats.
 
 from __future__ import annotations
 
-import json
 import logging
 from collections import Counter, defaultdict
 from collections.abc import Mapping, Sequence
@@ -38,6 +37,7 @@ from ratchetr.core.categories import coerce_category_key
 from ratchetr.core.model_types import (
     CategoryMapping,
     LogComponent,
+    ManifestValidation,
     OverrideEntry,
     ReadinessStatus,
     SeverityLevel,
@@ -66,7 +66,10 @@ from ratchetr.core.summary_types import (
 from ratchetr.core.type_aliases import CategoryKey, RelPath, RunId
 from ratchetr.exceptions import RatchetrTypeError
 from ratchetr.logging import structured_extra
+from ratchetr.manifest.compression import read_manifest_json
+from ratchetr.manifest.index import count_diagnostic_rules
 from ratchetr.manifest.loader import load_manifest_data
+from ratchetr.manifest.trust import needs_validation
 from ratchetr.readiness.compute import (
     DEFAULT_CLOSE_THRESHOLD,
     ReadinessEntry,
@@ -76,9 +79,11 @@ from ratchetr.readiness.compute import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
     from pathlib import Path
 
     from ratchetr.json import JSONValue
+    from ratchetr.manifest.index import ManifestIndex
     from ratchetr.manifest.typed import EngineOptionsEntry, ManifestData, ToolSummary
 
 logger: logging.Logger = logging.getLogger("ratchetr.dashboard")
@@ -223,17 +228,19 @@ def _coerce_rel_paths(values: Sequence[str]) -> list[RelPath]:
     return [RelPath(str(item)) for item in values if str(item)]
 
 
-def load_manifest(path: Path) -> ManifestData:
+def load_manifest(path: Path, *, validation: ManifestValidation = ManifestValidation.FAST) -> ManifestData:
     """Load and parse a manifest file from disk.
 
     Args:
-        path: Path to the manifest JSON file.
+        path: Path to the manifest JSON file (plain, gzip, or zstd).
+        validation: Validation level; `FAST` skips validating manifests whose
+            ratchetr write stamp still matches.
 
     Returns:
         Parsed manifest data structure containing type checking runs and diagnostics.
     """
-    raw = json.loads(path.read_text(encoding="utf-8"))
-    return load_manifest_data(raw)
+    raw = read_manifest_json(path)
+    return load_manifest_data(raw, validate=needs_validation(path, validation))
 
 
 def _collect_readiness(folder_entries: Sequence[ReadinessEntry]) -> ReadinessPayload:
@@ -429,11 +436,9 @@ def _update_folder_metrics(
                 folder_stats.recommendations[path].add(rec_text)
 
 
-def _update_file_metrics(
+def _file_metric_rows(
     per_file_entries: Sequence[Mapping[str, JSONValue]],
-    file_entries: list[tuple[str, int, int, int]],
-    rule_file_counts: dict[str, Counter[str]],
-) -> None:
+) -> Iterator[tuple[str, int, int, int, Mapping[str, int]]]:
     for entry in per_file_entries:
         path_obj = entry.get("path")
         if not isinstance(path_obj, str) or not path_obj:
@@ -443,24 +448,36 @@ def _update_file_metrics(
         information = coerce_int(entry.get("information"))
         if not errors and not warnings:
             continue
-        file_entries.append((path_obj, errors, warnings, information))
-        diagnostics = coerce_object_list(entry.get("diagnostics"))
-        if not diagnostics:
+        yield path_obj, errors, warnings, information, count_diagnostic_rules(entry.get("diagnostics"))
+
+
+def _update_file_metrics(
+    per_file_entries: Sequence[Mapping[str, JSONValue]],
+    file_entries: list[tuple[str, int, int, int]],
+    rule_file_counts: dict[str, Counter[str]],
+) -> None:
+    _record_file_metrics(_file_metric_rows(per_file_entries), file_entries, rule_file_counts)
+
+
+def _record_file_metrics(
+    rows: Iterable[tuple[str, int, int, int, Mapping[str, int]]],
+    file_entries: list[tuple[str, int, int, int]],
+    rule_file_counts: dict[str, Counter[str]],
+) -> None:
+    for path, errors, warnings, information, rule_counts in rows:
+        if not errors and not warnings:
             continue
-        per_file_rule_counts: Counter[str] = Counter()
-        for diag in diagnostics:
-            if not isinstance(diag, Mapping):
-                continue
-            diag_map = coerce_mapping(cast("Mapping[object, object]", diag))
-            code_obj = diag_map.get("code")
-            code = str(code_obj).strip() if isinstance(code_obj, str) else ""
-            if code:
-                per_file_rule_counts[code] += 1
-        for rule, count in per_file_rule_counts.items():
-            rule_file_counts[rule][path_obj] += count
+        file_entries.append((path, errors, warnings, information))
+        for rule, count in rule_counts.items():
+            rule_file_counts[rule][path] += count
 
 
-def _consume_run(run: Mapping[str, JSONValue], *, state: _SummaryState) -> None:
+def _consume_run(
+    run: Mapping[str, JSONValue],
+    *,
+    state: _SummaryState,
+    file_rows: Iterable[tuple[str, int, int, int, Mapping[str, int]]] | None = None,
+) -> None:
     payload = _prepare_run_payload(run)
     if payload is None:
         return
@@ -502,8 +519,10 @@ def _consume_run(run: Mapping[str, JSONValue], *, state: _SummaryState) -> None:
 
     folder_entries = _coerce_folder_entries(run.get("perFolder"))
     _update_folder_metrics(folder_entries, state.folder_stats)
-    file_entries_raw = _coerce_file_entries(run.get("perFile"))
-    _update_file_metrics(file_entries_raw, state.file_entries, state.rule_file_counts)
+    if file_rows is None:
+        _update_file_metrics(_coerce_file_entries(run.get("perFile")), state.file_entries, state.rule_file_counts)
+    else:
+        _record_file_metrics(file_rows, state.file_entries, state.rule_file_counts)
 
 
 def _create_summary_state() -> _SummaryState:
@@ -728,7 +747,85 @@ def build_summary(manifest: ManifestData) -> SummaryData:
     state = _create_summary_state()
     for run in _coerce_run_entries(manifest):
         _consume_run(run, state=state)
+    return _finalise_summary(state, manifest)
+
+
+def build_summary_from_index(index: ManifestIndex) -> SummaryData:
+    """Build the dashboard summary of an indexed manifest.
+
+    Equivalent to `build_summary` on the full manifest, but per-file totals and
+    rule counts come from the index, so the ``perFile`` sections are never
+    parsed (nor validated).
+
+    Args:
+        index: Offset index of the manifest.
+
+    Returns:
+        Structured summary data, as returned by `build_summary`.
+    """
+    state = _create_summary_state()
+    for run in index.runs:
+        rows = ((path, row[2], row[3], row[4], row[5]) for path, row in run.files.items())
+        _consume_run(index.read_run(run, per_file=False), state=state, file_rows=rows)
+    return _finalise_summary(state, cast("ManifestData", index.metadata))
+
+
+def summary_from_json(payload: Mapping[str, JSONValue]) -> SummaryData:
+    """Rebuild a summary from its JSON form (as written by ``normalise_enums_for_json``).
+
+    Restores the enum keys and tuples that JSON cannot represent so the result
+    is interchangeable with the output of `build_summary`.
+
+    Args:
+        payload: Decoded JSON summary.
+
+    Returns:
+        Structured summary data.
+
+    Raises:
+        DashboardTypeError: If the payload does not have the shape of a summary.
+    """
+    tabs_raw = payload.get("tabs")
+    if not isinstance(tabs_raw, Mapping):
+        msg = "summary.tabs"
+        raise DashboardTypeError(msg, "a mapping")
+    tabs = coerce_mapping(cast("Mapping[object, object]", tabs_raw))
+    run_summary = {
+        RunId(run_id): cast("SummaryRunEntry", {**entry, "severityBreakdown": _parse_severity_breakdown(entry)})
+        for run_id, entry in (
+            (run_id, coerce_mapping(value)) for run_id, value in coerce_mapping(payload.get("runSummary")).items()
+        )
+    }
+    severity_totals = _parse_severity_breakdown({"severityBreakdown": payload.get("severityTotals")})
+    readiness_tab = _validate_readiness_tab(
+        cast("Mapping[object, object]", coerce_mapping(tabs.get(TAB_KEY_READINESS))),
+    )
+    for entries in readiness_tab.get("strict", {}).values():
+        for entry in entries:
+            if "categoryStatus" in entry:
+                entry["categoryStatus"] = {
+                    name: _coerce_status_key(status) for name, status in entry["categoryStatus"].items()
+                }
+    restored: dict[str, object] = dict(payload)
+    restored.update({
+        "runSummary": run_summary,
+        "severityTotals": severity_totals,
+        "tabs": {
+            **tabs,
+            TAB_KEY_OVERVIEW: {
+                **coerce_mapping(tabs.get(TAB_KEY_OVERVIEW)),
+                "severityTotals": dict(severity_totals),
+                "runSummary": run_summary,
+            },
+            TAB_KEY_ENGINES: {"runSummary": run_summary},
+            TAB_KEY_READINESS: readiness_tab,
+            TAB_KEY_RUNS: {"runSummary": run_summary},
+        },
+    })
+    return cast("SummaryData", restored)
+
 
+def _finalise_summary(state: _SummaryState, manifest: ManifestData) -> SummaryData:
     folder_entries_full = state.folder_stats.build_entries()
     readiness_tab = _build_readiness_section(folder_entries_full)
     top_rules_dict = _build_top_rules(state.rule_totals)
@@ -0,0 +1,306 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""On-disk cache of dashboard summaries keyed by manifest content.
+
+Summaries are stored as JSON under ``.ratchetr_cache/summaries`` and keyed by
+a digest of the manifest bytes and the ratchetr version, so an unchanged
+manifest is summarised once and every later ``dashboard``, ``query``,
+``readiness``, or ``--compare-to`` lookup skips validation and aggregation.
+The digest of each manifest is remembered against its size and modification
+time, like the manifest index, so unchanged manifests are not re-hashed.
+The least recently used entries are evicted once the cache is full.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final, cast
+
+from ratchetr._version import __version__
+from ratchetr.cache import CACHE_DIRNAME
+from ratchetr.core.model_types import LogComponent
+from ratchetr.json import normalise_enums_for_json
+from ratchetr.logging import structured_extra
+from ratchetr.runtime import ROOT_MARKERS, resolve_project_root
+
+from .build import DashboardTypeError, summary_from_json
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from ratchetr.core.summary_types import SummaryData
+    from ratchetr.json import JSONValue
+
+logger: logging.Logger = logging.getLogger("ratchetr.dashboard.cache")
+
+SUMMARY_CACHE_DIRNAME: Final[str] = "summaries"
+# Maps manifest paths to their (size, mtime, version) and digest.
+MANIFEST_KEYS_FILENAME: Final[str] = "manifests.keys"
+DEFAULT_MAX_ENTRIES: Final[int] = 32
+_CHUNK_SIZE: Final[int] = 1 << 20
+
+
+def manifest_digest(path: Path, *, version: str) -> str:
+    """Return the cache key of a manifest.
+
+    Args:
+        path: Manifest file (hashed as stored, so compressed manifests work).
+        version: ratchetr version the summary is built with.
+
+    Returns:
+        Hex digest of ``version`` and the manifest bytes.
+    """
+    digest = hashlib.blake2b(f"{version}\0".encode(), digest_size=20)
+    with path.open("rb") as handle:
+        while chunk := handle.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass(slots=True, frozen=True)
+class SummaryCache:
+    """LRU cache of summaries stored one JSON file per manifest digest.
+
+    Only summaries of validated or ratchetr-written manifests are stored, so
+    loaders serve a hit without validating the manifest again.
+
+    Attributes:
+        directory: Directory holding the cached summaries.
+        version: ratchetr version; part of every key so upgrades never reuse
+            summaries built by older code.
+        max_entries: Number of summaries kept before the least recently used
+            ones are evicted.
+    """
+
+    directory: Path
+    version: str
+    max_entries: int = DEFAULT_MAX_ENTRIES
+
+    @classmethod
+    def for_project(cls, project_root: Path, *, version: str | None = None) -> SummaryCache:
+        """Return the summary cache of ``project_root``.
+
+        Args:
+            project_root: Project whose ``.ratchetr_cache`` holds the summaries.
+            version: ratchetr version used in cache keys (defaults to the
+                running version).
+
+        Returns:
+            Cache rooted at ``<project root>/.ratchetr_cache/summaries``.
+        """
+        return cls(
+            project_root / CACHE_DIRNAME / SUMMARY_CACHE_DIRNAME,
+            version=version if version is not None else __version__,
+        )
+
+    @classmethod
+    def for_manifest(cls, manifest_path: Path, *, version: str | None = None) -> SummaryCache | None:
+        """Return the cache of the project containing ``manifest_path``.
+
+        Manifests outside any project (no ``ratchetr.toml`` or
+        ``pyproject.toml`` above them) are not cached, so no cache directory
+        is created beside them.
+
+        Args:
+            manifest_path: Manifest whose summaries will be cached.
+            version: ratchetr version used in cache keys (defaults to the
+                running version).
+
+        Returns:
+            Cache rooted at ``<project root>/.ratchetr_cache/summaries``, or
+            `None` outside a project or when that directory cannot be written.
+        """
+        project_root = resolve_project_root(manifest_path.parent)
+        if not any((project_root / marker).is_file() for marker in ROOT_MARKERS):
+            return None
+        cache = cls.for_project(project_root, version=version)
+        return cache if _writable(cache.directory) else None
+
+    def load(self, manifest_path: Path, build: Callable[[], SummaryData]) -> SummaryData:
+        """Return the cached summary of ``manifest_path``, building it on a miss.
+
+        Args:
+            manifest_path: Manifest to summarise.
+            build: Builds the summary when it is not cached.
+
+        Returns:
+            Structured summary data.
+        """
+        key = self.key_for(manifest_path)
+        cached = self.get(key)
+        if cached is not None:
+            logger.debug(
+                "Summary cache hit for %s",
+                manifest_path,
+                extra=structured_extra(component=LogComponent.DASHBOARD, manifest=manifest_path),
+            )
+            return cached
+        summary = build()
+        self.put(key, summary)
+        return summary
+
+    def store(self, manifest_path: Path, summary: SummaryData) -> None:
+        """Cache ``summary`` as the summary of ``manifest_path``.
+
+        Args:
+            manifest_path: Manifest the summary was built from.
+            summary: Summary to cache.
+        """
+        try:
+            key = self.key_for(manifest_path)
+        except OSError:
+            return
+        self.put(key, summary)
+
+    def key_for(self, manifest_path: Path) -> str:
+        """Return the cache key of ``manifest_path``.
+
+        The manifest is only hashed when its size or modification time differ
+        from the last lookup.
+
+        Args:
+            manifest_path: Manifest to key.
+
+        Returns:
+            Digest returned by `manifest_digest`.
+        """
+        stat = manifest_path.stat()
+        source = str(manifest_path.resolve())
+        stamp: list[JSONValue] = [stat.st_size, stat.st_mtime_ns, self.version]
+        known = self._read_keys()
+        entry = known.get(source)
+        if isinstance(entry, list) and len(entry) == len(stamp) + 1 and entry[:3] == stamp:
+            cached_key = entry[3]
+            if isinstance(cached_key, str):
+                return cached_key
+        key = manifest_digest(manifest_path, version=self.version)
+        known[source] = [*stamp, key]
+        self._write_keys(known, source)
+        return key
+
+    def get(self, key: str) -> SummaryData | None:
+        """Return the summary stored under ``key`` and mark it recently used.
+
+        Args:
+            key: Digest returned by `manifest_digest`.
+
+        Returns:
+            Cached summary, or `None` when absent or unreadable.
+        """
+        path = self._entry_path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            path.unlink(missing_ok=True)
+            return None
+        if not isinstance(payload, dict):
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            summary = summary_from_json(cast("dict[str, JSONValue]", payload))
+        except DashboardTypeError:
+            path.unlink(missing_ok=True)
+            return None
+        with suppress(OSError):
+            os.utime(path)
+        return summary
+
+    def put(self, key: str, summary: SummaryData) -> None:
+        """Store ``summary`` under ``key`` and evict the oldest entries.
+
+        Args:
+            key: Digest returned by `manifest_digest`.
+            summary: Summary to cache.
+        """
+        path = self._entry_path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            _ = tmp_path.write_text(
+                json.dumps(normalise_enums_for_json(summary), separators=(",", ":")),
+                encoding="utf-8",
+            )
+            _ = tmp_path.replace(path)
+        except OSError as exc:
+            tmp_path.unlink(missing_ok=True)
+            logger.debug(
+                "Cannot cache dashboard summary %s: %s",
+                path,
+                exc,
+                extra=structured_extra(component=LogComponent.DASHBOARD, path=path),
+            )
+            return
+        self._evict()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _read_keys(self) -> dict[str, JSONValue]:
+        try:
+            payload = json.loads((self.directory / MANIFEST_KEYS_FILENAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return cast("dict[str, JSONValue]", payload) if isinstance(payload, dict) else {}
+
+    def _write_keys(self, known: dict[str, JSONValue], source: str) -> None:
+        # Keep the manifest just keyed plus those whose summary is still cached.
+        cached = {path.stem for path in self.directory.glob("*.json")}
+        kept = {
+            path: entry
+            for path, entry in known.items()
+            if path == source or (isinstance(entry, list) and entry and entry[-1] in cached)
+        }
+        keys_path = self.directory / MANIFEST_KEYS_FILENAME
+        tmp_path = keys_path.with_name(f"{keys_path.name}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            _ = tmp_path.write_text(json.dumps(kept, separators=(",", ":")), encoding="utf-8")
+            _ = tmp_path.replace(keys_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        entries: list[tuple[int, Path]] = []
+        for path in self.directory.glob("*.json"):
+            with suppress(OSError):
+                entries.append((path.stat().st_mtime_ns, path))
+        entries.sort(reverse=True)
+        for _, path in entries[self.max_entries :]:
+            path.unlink(missing_ok=True)
+
+
+def _writable(directory: Path) -> bool:
+    # The cache directory may not exist yet; check the nearest existing parent.
+    existing = directory
+    while not existing.exists() and existing != existing.parent:
+        existing = existing.parent
+    return existing.is_dir() and os.access(existing, os.W_OK | os.X_OK)
+
+
+__all__ = [
+    "DEFAULT_MAX_ENTRIES",
+    "MANIFEST_KEYS_FILENAME",
+    "SUMMARY_CACHE_DIRNAME",
+    "SummaryCache",
+    "manifest_digest",
+]
@@ -22,8 +22,15 @@ The main entry point for working with engines is the `resolve_engines` function,
 which discovers both builtin and plugin-provided type checker engines.
 """
 
-from .base import BaseEngine, EngineContext, EngineOptions, EngineResult
-from .registry import resolve_engines
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ratchetr.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import BaseEngine, EngineContext, EngineOptions, EngineResult
+    from .registry import resolve_engines
 
 __all__ = [
     "BaseEngine",
@@ -32,3 +39,14 @@ __all__ = [
     "EngineResult",
     "resolve_engines",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BaseEngine": ".base",
+        "EngineContext": ".base",
+        "EngineOptions": ".base",
+        "EngineResult": ".base",
+        "resolve_engines": ".registry",
+    },
+)
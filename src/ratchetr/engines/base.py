@@ -169,8 +169,9 @@ class BaseEngine(Protocol):
 
     Any type checker engine (builtin or plugin) must conform to this protocol,
     providing a name attribute and implementing the run method. The optional
-    category_mapping and fingerprint_targets methods provide additional metadata
-    for diagnostic categorization and cache invalidation.
+    category_mapping, fingerprint_targets, and plan_command methods provide
+    additional metadata for diagnostic categorization, cache invalidation, and
+    run planning.
 
     Attributes:
         name: Unique identifier for the engine (e.g., "mypy", "pyright").
@@ -238,3 +239,28 @@ class BaseEngine(Protocol):
         _ = self
         del context, paths
         return []
+
+    # ignore JUSTIFIED: the default documents the override contract and returns None
+    # explicitly so subclasses see the fallback value
+    def plan_command(  # pylint: disable=redundant-returns-doc,useless-return
+        self,
+        context: EngineContext,
+        paths: Sequence[RelPath],
+    ) -> Sequence[str] | None:
+        """Describe the command ``run`` would execute, without side effects.
+
+        This optional method lets the audit planner show invocations in
+        ``--dry-run`` output and share one run between modes whose commands
+        are identical.
+
+        Args:
+            context: Execution context including project root and configuration.
+            paths: Sequence of relative paths that would be analyzed.
+
+        Returns:
+            Sequence[str] | None: Command-line arguments, or None when the
+                engine cannot describe its invocation ahead of time.
+        """
+        _ = self
+        del context, paths
+        return None
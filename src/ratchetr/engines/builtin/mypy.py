@@ -21,13 +21,14 @@ configuration file detection, and result parsing for mypy.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from ratchetr.compat import override
 from ratchetr.core.model_types import CategoryMapping, Mode
+from ratchetr.core.types import DEFAULT_RAW_RETENTION
 from ratchetr.engines.base import BaseEngine, EngineContext, EngineResult
 from ratchetr.engines.execution import run_mypy
-from ratchetr.runtime import python_executable
+from ratchetr.runtime import DaemonRegistry, python_executable
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -35,6 +36,9 @@ if TYPE_CHECKING:
 
     from ratchetr.core.type_aliases import Command, RelPath
 
+# Idle dmypy daemons shut themselves down after this many seconds.
+DMYPY_IDLE_TIMEOUT_SECONDS: Final[int] = 3600
+
 
 class MypyEngine(BaseEngine):
     """Type checker engine implementation for mypy.
@@ -80,7 +84,33 @@ class MypyEngine(BaseEngine):
         candidate = context.project_root / "mypy.ini"
         return candidate if candidate.exists() else None
 
-    def _build_command(self, context: EngineContext, paths: Sequence[RelPath]) -> Command:
+    def _daemon_base(self, context: EngineContext, *, register: bool = True) -> Command:
+        """Build the ``dmypy run`` prefix and register the daemon it starts.
+
+        Each mode gets its own daemon so concurrent current/full runs with
+        different flags do not force each other to restart.
+
+        Args:
+            context: Execution context with mode and project root.
+            register: Whether to record the daemon in the registry.
+
+        Returns:
+            Command: ``dmypy`` invocation; mypy flags and paths follow ``--``.
+        """
+        name = f"{self.name}:{context.mode}"
+        registry = DaemonRegistry(context.project_root)
+        client = registry.client_command(name)
+        if register:
+            _ = registry.register(name)
+        return [*client, "run", "--timeout", str(DMYPY_IDLE_TIMEOUT_SECONDS), "--"]
+
+    def _build_command(
+        self,
+        context: EngineContext,
+        paths: Sequence[RelPath],
+        *,
+        register_daemon: bool = True,
+    ) -> Command:
         """Build the mypy command-line invocation.
 
         Constructs the complete command to run mypy, including the Python
@@ -91,12 +121,17 @@ class MypyEngine(BaseEngine):
         Args:
             context: Execution context with mode, config, and project info.
             paths: Sequence of relative paths to analyze (used in DELTA mode).
+            register_daemon: Whether daemon mode records the daemon it starts.
 
         Returns:
             Command: Complete command-line as a list of strings.
         """
         args = self._args(context)
-        base = [python_executable(), "-m", "mypy"]
+        base = (
+            self._daemon_base(context, register=register_daemon)
+            if context.audit_config.daemon
+            else [python_executable(), "-m", "mypy"]
+        )
         config_file = self._config_file(context)
         if config_file:
             base.extend(["--config-file", str(config_file)])
@@ -114,6 +149,21 @@ class MypyEngine(BaseEngine):
             ]
         return command
 
+    @override
+    def plan_command(self, context: EngineContext, paths: Sequence[RelPath]) -> Command:
+        """Return the mypy invocation ``run`` would execute.
+
+        Daemons are not registered, so planning leaves no trace on disk.
+
+        Args:
+            context: Execution context with mode, config, and project info.
+            paths: Sequence of relative paths to analyze.
+
+        Returns:
+            Command: Complete command-line as a list of strings.
+        """
+        return self._build_command(context, paths, register_daemon=False)
+
     @override
     def run(self, context: EngineContext, paths: Sequence[RelPath]) -> EngineResult:
         """Execute mypy on the specified paths.
@@ -129,7 +179,12 @@ class MypyEngine(BaseEngine):
             EngineResult: Results including diagnostics, exit code, and timing.
         """
         command = self._build_command(context, paths)
-        return run_mypy(context.project_root, mode=context.mode, command=command)
+        return run_mypy(
+            context.project_root,
+            mode=context.mode,
+            command=command,
+            raw_retention=context.audit_config.raw_retention or DEFAULT_RAW_RETENTION,
+        )
 
     @override
     @staticmethod
@@ -25,6 +25,7 @@ from typing import TYPE_CHECKING
 
 from ratchetr.compat import override
 from ratchetr.core.model_types import CategoryMapping, Mode
+from ratchetr.core.types import DEFAULT_RAW_RETENTION
 from ratchetr.engines.base import BaseEngine, EngineContext, EngineResult
 from ratchetr.engines.execution import run_pyright
 
@@ -99,6 +100,19 @@ class PyrightEngine(BaseEngine):
             command.append(str(context.project_root))
         return command
 
+    @override
+    def plan_command(self, context: EngineContext, paths: Sequence[RelPath]) -> Command:
+        """Return the pyright invocation ``run`` would execute.
+
+        Args:
+            context: Execution context with mode, config, and project info.
+            paths: Sequence of relative paths to analyze.
+
+        Returns:
+            Command: Complete command-line as a list of strings.
+        """
+        return self._build_command(context, paths)
+
     @override
     def run(self, context: EngineContext, paths: Sequence[RelPath]) -> EngineResult:
         """Execute pyright on the specified paths.
@@ -114,7 +128,12 @@ class PyrightEngine(BaseEngine):
             EngineResult: Results including diagnostics, exit code, and timing.
         """
         command = self._build_command(context, paths)
-        return run_pyright(context.project_root, mode=context.mode, command=command)
+        return run_pyright(
+            context.project_root,
+            mode=context.mode,
+            command=command,
+            raw_retention=context.audit_config.raw_retention or DEFAULT_RAW_RETENTION,
+        )
 
     @override
     @staticmethod
@@ -24,20 +24,24 @@ from __future__ import annotations
 
 import logging
 import re
+import sys
+from collections import Counter
 from pathlib import Path
 from typing import TYPE_CHECKING, Final, cast
 
-from ratchetr.core.model_types import LogComponent, Mode, SeverityLevel
+from ratchetr.core.model_types import LogComponent, Mode, RawRetention, SeverityLevel
 from ratchetr.core.type_aliases import BuiltinEngineName, Command, ToolName
-from ratchetr.core.types import Diagnostic
+from ratchetr.core.types import DEFAULT_RAW_RETENTION, Diagnostic, retain_raw
 from ratchetr.engines.base import EngineResult
-from ratchetr.json import JSONValue, as_int, as_list, as_mapping, as_str, require_json
+from ratchetr.json import as_int, as_list, as_mapping, as_str, require_json, stream_json_object
 from ratchetr.logging import StructuredLogExtra, structured_extra
-from ratchetr.runtime import run_command
+from ratchetr.runtime import run_command, stream_command
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
+    from typing import IO
 
+    from ratchetr.json import JSONValue
     from ratchetr.manifest.typed import ToolSummary
 
 logger: logging.Logger = logging.getLogger("ratchetr.engines.execution")
@@ -67,29 +71,173 @@ def _make_diag_path(project_root: Path, file_path: str) -> Path:
         return path.resolve()
 
 
-# ignore JUSTIFIED: wrapper orchestrates parsing and timing; refactor tracked separately
-def run_pyright(  # noqa: PLR0914, FIX002, TD003  # TODO@PantherianCodeX: Extract sub-steps to reduce locals flagged by PLR0914
+def _memo_diag_path(cache: dict[str, Path], project_root: Path, file_path: str) -> Path:
+    """Return a shared `Path` per distinct file, resolving each file only once.
+
+    Args:
+        cache: Per-run memo of raw file path to project-relative path.
+        project_root: Root directory of the project.
+        file_path: File path from the diagnostic.
+
+    Returns:
+        Path: The memoised result of `_make_diag_path`.
+    """
+    path = cache.get(file_path)
+    if path is None:
+        path = cache[file_path] = _make_diag_path(project_root, file_path)
+    return path
+
+
+class _PyrightCollector:
+    """Convert pyright diagnostics one at a time while tallying severities.
+
+    Used as the per-element handler for the streamed `generalDiagnostics`
+    array so the counts needed for the summary cross-check are gathered in
+    the same pass that builds each `Diagnostic`. Paths and messages are
+    shared across diagnostics and raw payloads are trimmed as they arrive.
+    """
+
+    __slots__ = ("_paths", "counts", "diagnostics", "project_root", "raw_retention")
+
+    def __init__(self, project_root: Path, raw_retention: RawRetention) -> None:
+        super().__init__()
+        self.project_root = project_root
+        self.raw_retention = raw_retention
+        self.diagnostics: list[Diagnostic] = []
+        self.counts: Counter[SeverityLevel] = Counter()
+        self._paths: dict[str, Path] = {}
+
+    def __call__(self, item: JSONValue) -> None:
+        d = as_mapping(item)
+        file_path = as_str(d.get("filePath") or d.get("file") or "")
+        if not file_path:
+            return
+        rng = as_mapping(d.get("range") or {})
+        start = as_mapping(rng.get("start") or {})
+        line_num = as_int(start.get("line", 0), 0) + 1  # pyright uses 0-based
+        col_num = as_int(start.get("character", 0), 0) + 1
+        rule_obj = d.get("rule")
+        rule = sys.intern(rule_obj) if isinstance(rule_obj, str) else None
+        severity = SeverityLevel.coerce(d.get("severity") or SeverityLevel.ERROR)
+        self.counts[severity] += 1
+        self.diagnostics.append(
+            Diagnostic(
+                tool=PYRIGHT_TOOL,
+                severity=severity,
+                path=_memo_diag_path(self._paths, self.project_root, file_path),
+                line=line_num,
+                column=col_num,
+                code=rule,
+                message=sys.intern(str(d.get("message", "")).strip()),
+                raw=retain_raw(d, self.raw_retention),
+            ),
+        )
+
+    def consume(self, stream: IO[str]) -> dict[str, JSONValue] | None:
+        """Parse pyright's JSON report from `stream`, streaming `generalDiagnostics`.
+
+        Returns:
+            Remaining top-level members, or `None` when pyright wrote nothing to stdout.
+        """
+        return stream_json_object(stream, array_handlers={"generalDiagnostics": self})
+
+
+def _pyright_tool_summary(payload: Mapping[str, JSONValue]) -> ToolSummary | None:
+    """Extract pyright's own summary counts from its JSON report.
+
+    Args:
+        payload: Top-level report members.
+
+    Returns:
+        Normalised `ToolSummary`, or `None` when the summary is malformed.
+    """
+    tool_summary_raw = as_mapping(payload.get("summary") or {})
+    try:
+        ts_errors = as_int(tool_summary_raw.get("errorCount", 0), 0)
+        ts_warnings = as_int(tool_summary_raw.get("warningCount", 0), 0)
+        ts_info = as_int(tool_summary_raw.get("informationCount", 0), 0)
+    except (TypeError, ValueError, KeyError):
+        return None
+    return {
+        "errors": ts_errors,
+        "warnings": ts_warnings,
+        "information": ts_info,
+        "total": ts_errors + ts_warnings + ts_info,
+    }
+
+
+def _warn_on_summary_mismatch(
+    counts: Counter[SeverityLevel],
+    tool_summary: ToolSummary,
+    *,
+    mode: Mode,
+) -> None:
+    """Log a warning when parsed severity counts disagree with pyright's summary.
+
+    Args:
+        counts: Severity tallies gathered while parsing diagnostics.
+        tool_summary: Counts reported by pyright itself.
+        mode: Execution mode, for structured logging.
+    """
+    parsed_errors = counts[SeverityLevel.ERROR]
+    parsed_warnings = counts[SeverityLevel.WARNING]
+    parsed_total = counts.total()
+    if (
+        parsed_errors == tool_summary.get("errors", parsed_errors)
+        and parsed_warnings == tool_summary.get("warnings", parsed_warnings)
+        and parsed_total == tool_summary.get("total", parsed_total)
+    ):
+        return
+    logger.warning(
+        "pyright summary mismatch: parsed=%s/%s/%s tool=%s/%s/%s",
+        parsed_errors,
+        parsed_warnings,
+        parsed_total,
+        tool_summary.get("errors"),
+        tool_summary.get("warnings"),
+        tool_summary.get("total"),
+        extra=structured_extra(
+            component=LogComponent.ENGINE,
+            tool="pyright",
+            mode=mode,
+            details={
+                "parsed": (parsed_errors, parsed_warnings, parsed_total),
+                "tool": (
+                    tool_summary.get("errors"),
+                    tool_summary.get("warnings"),
+                    tool_summary.get("total"),
+                ),
+            },
+        ),
+    )
+
+
+def run_pyright(
     project_root: Path,
     *,
     mode: Mode,
     command: Sequence[str],
+    raw_retention: RawRetention = DEFAULT_RAW_RETENTION,
 ) -> EngineResult:
     """Execute pyright and parse its JSON output into diagnostics.
 
-    Runs pyright as a subprocess with the given command, parses the JSON output
-    to extract diagnostics, and constructs an EngineResult with timing information.
-    Also extracts and validates the tool's own summary counts if available.
+    Runs pyright as a subprocess and parses its JSON report straight from the
+    stdout pipe: `generalDiagnostics` entries are converted one at a time and
+    severities are tallied in the same pass, so the raw report is never held
+    in memory as a single string. The tool's own summary counts are extracted
+    and cross-checked against the tallies when available.
 
     Args:
         project_root: Root directory of the project being analyzed.
         mode: Execution mode (CURRENT or DELTA).
         command: Complete pyright command to execute.
+        raw_retention: How much of each pyright diagnostic payload to keep on `Diagnostic.raw`.
 
     Returns:
         EngineResult: Structured results including diagnostics and metadata.
 
     Raises:
-        Various exceptions from run_command or JSON parsing if pyright fails
+        Various exceptions from stream_command or JSON parsing if pyright fails
         to execute or returns invalid output.
     """
     start_extra: StructuredLogExtra = structured_extra(
@@ -103,84 +251,20 @@ def run_pyright(  # noqa: PLR0914, FIX002, TD003  # TODO@PantherianCodeX: Extrac
         " ".join(argv),
         extra=start_extra,
     )
-    result = run_command(argv, cwd=project_root, allowed={"pyright"})
-    payload_str = result.stdout or result.stderr
-    payload: dict[str, JSONValue] = require_json(payload_str)
+    collector = _PyrightCollector(project_root, raw_retention)
+    result, payload = stream_command(argv, cwd=project_root, allowed={"pyright"}, consumer=collector.consume)
+    if payload is None:
+        # Nothing on stdout: pyright reports start-up failures on stderr instead.
+        payload = require_json(result.stderr)
+        for item in as_list(payload.pop("generalDiagnostics", [])):
+            collector(item)
 
-    diagnostics: list[Diagnostic] = []
-    raw_diags = as_list(payload.get("generalDiagnostics", []))
-    # Capture tool-provided summary if present
-    tool_summary_raw = as_mapping(payload.get("summary") or {})
-    try:
-        ts_errors = as_int(tool_summary_raw.get("errorCount", 0), 0)
-        ts_warnings = as_int(tool_summary_raw.get("warningCount", 0), 0)
-        ts_info = as_int(tool_summary_raw.get("informationCount", 0), 0)
-        ts_total = ts_errors + ts_warnings + ts_info
-        tool_summary: ToolSummary | None = {
-            "errors": ts_errors,
-            "warnings": ts_warnings,
-            "information": ts_info,
-            "total": ts_total,
-        }
-    except (TypeError, ValueError, KeyError):
-        tool_summary = None
-    for item in raw_diags:
-        d = as_mapping(item)
-        file_path = as_str(d.get("filePath") or d.get("file") or "")
-        if not file_path:
-            continue
-        rng = as_mapping(d.get("range") or {})
-        start = as_mapping(rng.get("start") or {})
-        line_num = as_int(start.get("line", 0), 0) + 1  # pyright uses 0-based
-        col_num = as_int(start.get("character", 0), 0) + 1
-        rule_obj = d.get("rule")
-        rule = rule_obj if isinstance(rule_obj, str) else None
-        severity = SeverityLevel.coerce(d.get("severity") or SeverityLevel.ERROR)
-        diagnostics.append(
-            Diagnostic(
-                tool=PYRIGHT_TOOL,
-                severity=severity,
-                path=_make_diag_path(project_root, file_path),
-                line=line_num,
-                column=col_num,
-                code=rule,
-                message=str(d.get("message", "")).strip(),
-                raw=d,
-            ),
-        )
+    diagnostics = collector.diagnostics
     diagnostics.sort(key=lambda d: (str(d.path), d.line, d.column))
+    tool_summary = _pyright_tool_summary(payload)
     # If pyright's own summary (if present) disagrees with parsed diagnostics, log a warning
     if tool_summary is not None:
-        parsed_errors = sum(1 for d in diagnostics if d.severity is SeverityLevel.ERROR)
-        parsed_warnings = sum(1 for d in diagnostics if d.severity is SeverityLevel.WARNING)
-        parsed_total = len(diagnostics)
-        if (
-            parsed_errors != tool_summary.get("errors", parsed_errors)
-            or parsed_warnings != tool_summary.get("warnings", parsed_warnings)
-            or parsed_total != tool_summary.get("total", parsed_total)
-        ):
-            logger.warning(
-                "pyright summary mismatch: parsed=%s/%s/%s tool=%s/%s/%s",
-                parsed_errors,
-                parsed_warnings,
-                parsed_total,
-                tool_summary.get("errors"),
-                tool_summary.get("warnings"),
-                tool_summary.get("total"),
-                extra=structured_extra(
-                    component=LogComponent.ENGINE,
-                    tool="pyright",
-                    mode=mode,
-                    details={
-                        "parsed": (parsed_errors, parsed_warnings, parsed_total),
-                        "tool": (
-                            tool_summary.get("errors"),
-                            tool_summary.get("warnings"),
-                            tool_summary.get("total"),
-                        ),
-                    },
-                ),
-            )
+        _warn_on_summary_mismatch(collector.counts, tool_summary, mode=mode)
     engine_result = EngineResult(
         engine=PYRIGHT_TOOL,
         mode=mode,
@@ -212,6 +296,8 @@ _MYPY_LINE: Final[re.Pattern[str]] = re.compile(
     r"(?P<severity>error|note|warning): (?P<message>.*?)"
     r"(?: \[(?P<code>[^\]]+)\])?$"
 )
+# Summary lines from mypy plus lifecycle messages printed by ``dmypy run``.
+_MYPY_STATUS_PREFIXES: Final[tuple[str, ...]] = ("Found ", "Success:", "Daemon started", "Restarting: ")
 
 
 def run_mypy(
@@ -219,6 +305,7 @@ def run_mypy(
     *,
     mode: Mode,
     command: Sequence[str],
+    raw_retention: RawRetention = DEFAULT_RAW_RETENTION,
 ) -> EngineResult:
     """Execute mypy and parse its text output into diagnostics.
 
@@ -231,6 +318,7 @@ def run_mypy(
         project_root: Root directory of the project being analyzed.
         mode: Execution mode (CURRENT or DELTA).
         command: Complete mypy command to execute.
+        raw_retention: How much of each parsed mypy line to keep on `Diagnostic.raw`.
 
     Returns:
         EngineResult: Structured results including diagnostics and metadata.
@@ -255,6 +343,7 @@ def run_mypy(
         allowed={argv[0]},
     )
     diagnostics: list[Diagnostic] = []
+    paths: dict[str, Path] = {}
     remaining_stderr = result.stderr.strip()
     if remaining_stderr:
         # mypy may emit structural errors here (e.g., config issues). capture as pseudo diagnostics.
@@ -267,12 +356,12 @@ def run_mypy(
                 column=0,
                 code=None,
                 message=remaining_stderr,
-                raw={"stderr": remaining_stderr},
+                raw=retain_raw({"stderr": remaining_stderr}, raw_retention),
             ),
         )
     for line in result.stdout.splitlines():
         line_ = line.strip()
-        if not line_ or line_.startswith(("Found ", "Success:")):
+        if not line_ or line_.startswith(_MYPY_STATUS_PREFIXES):
             continue
         match = _MYPY_LINE.match(line)
         if not match:
@@ -285,13 +374,14 @@ def run_mypy(
                     column=0,
                     code=None,
                     message=line,
-                    raw={"unparsed": line},
+                    raw=retain_raw({"unparsed": line}, raw_retention),
                 ),
             )
             continue
         data = match.groupdict()
-        diag_path = _make_diag_path(project_root, data["path"])
+        diag_path = _memo_diag_path(paths, project_root, data["path"])
         severity = SeverityLevel.coerce(data.get("severity") or SeverityLevel.ERROR)
+        code = data.get("code")
         diagnostics.append(
             Diagnostic(
                 tool=MYPY_TOOL,
@@ -299,9 +389,9 @@ def run_mypy(
                 path=diag_path,
                 line=int(data["line"]),
                 column=int(data.get("column") or 0),
-                code=data.get("code"),
-                message=data["message"].strip(),
-                raw=cast("dict[str, JSONValue]", dict(data)),
+                code=sys.intern(code) if code else code,
+                message=sys.intern(data["message"].strip()),
+                raw=retain_raw(cast("dict[str, JSONValue]", dict(data)), raw_retention),
             ),
         )
     diagnostics.sort(key=lambda d: (str(d.path), d.line, d.column))
@@ -22,16 +22,23 @@ for engine resolution and metadata queries.
 
 from __future__ import annotations
 
+import hashlib
 import inspect
+import json
 import logging
+import os
+import sys
+import threading
 from dataclasses import dataclass
 from functools import lru_cache
 from importlib import metadata
+from pathlib import Path
 from typing import TYPE_CHECKING, Final, cast
 
 from ratchetr.core.model_types import LogComponent
 from ratchetr.core.type_aliases import EngineName
 from ratchetr.logging import structured_extra
+from ratchetr.runtime import consume
 
 from .builtin.mypy import MypyEngine
 from .builtin.pyright import PyrightEngine
@@ -65,6 +72,14 @@ def _is_engine_like(value: object) -> bool:
 
 
 ENTRY_POINT_GROUP: Final = "ratchetr.engines"
+ENTRY_POINTS_FILENAME: Final[str] = "engine_entry_points.json"
+
+# Environment key -> discovered entry points; holds only the current environment.
+_DISCOVERY_CACHE: dict[str, tuple[metadata.EntryPoint, ...]] = {}
+# Entry point name -> name of the engine it provided when loaded; persisted with
+# the discovery cache so later runs know which plugins override which engines.
+_PROVIDED_ENGINES: dict[str, EngineName] = {}
+_DISCOVERY_LOCK = threading.Lock()
 
 
 def _engine_name(value: str) -> EngineName:
@@ -123,19 +138,31 @@ def _instantiate_engine(obj: object, *, source: str) -> BaseEngine:
     return cast("BaseEngine", candidate)
 
 
-@lru_cache
-def entrypoint_engines() -> dict[EngineName, BaseEngine]:
-    """Discover and load type checker engines from entry points.
+def _environment_key() -> str:
+    """Digest ``sys.path`` and the modification time of each entry.
 
-    Searches for plugins registered under the 'ratchetr.engines' entry point
-    group, loads them, and validates them as BaseEngine instances. Failed
-    loads are logged but don't cause the entire discovery to fail.
+    Installing or removing a distribution adds or deletes its metadata
+    directory, which touches the site-packages directory holding it.
 
     Returns:
-        dict[EngineName, BaseEngine]: Mapping of plugin engine names to instances,
-            sorted alphabetically by name.
+        str: Hex digest identifying the current import environment.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for entry in sys.path:
+        try:
+            mtime_ns = Path(entry or ".").stat().st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+        digest.update(f"{entry}\0{mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _scan_entry_points() -> tuple[metadata.EntryPoint, ...]:
+    """Scan installed distributions for entry points in the engine group.
+
+    Returns:
+        tuple[metadata.EntryPoint, ...]: Engine entry points, not yet loaded.
     """
-    engines: dict[EngineName, BaseEngine] = {}
     try:
         eps = metadata.entry_points()
     # ignore JUSTIFIED: entry point discovery failures are non-fatal; log and continue
@@ -146,29 +173,192 @@ def entrypoint_engines() -> dict[EngineName, BaseEngine]:
             exc,
             extra=structured_extra(component=LogComponent.ENGINE),
         )
-        return engines
-    for entry_point in eps.select(group=ENTRY_POINT_GROUP):
-        try:
-            loaded = entry_point.load()
-            engine = _instantiate_engine(loaded, source=entry_point.name)
-        # ignore JUSTIFIED: plugin loading may fail for many reasons; log and skip bad
-        # entry points
-        except (ImportError, AttributeError, TypeError, ValueError) as exc:  # pragma: no cover - plugin errors
-            # ImportError: plugin module not found
-            # AttributeError: missing required attributes
-            # TypeError: invalid plugin class signature
-            # ValueError: invalid plugin configuration
-            logger.debug(
-                "Failed to load engine entry point '%s': %s",
-                entry_point.name,
-                exc,
-                extra=structured_extra(component=LogComponent.ENGINE, tool=entry_point.name),
-            )
-            continue
-        name = getattr(engine, "name", None)
-        if not isinstance(name, str) or not name:
-            continue
-        engines[_engine_name(name)] = engine
+        return ()
+    return tuple(eps.select(group=ENTRY_POINT_GROUP))
+
+
+def _read_discovery_cache(path: Path, key: str) -> tuple[metadata.EntryPoint, ...] | None:
+    """Load persisted entry points recorded for environment ``key``.
+
+    Args:
+        path: Discovery cache file.
+        key: Current environment key.
+
+    Returns:
+        tuple[metadata.EntryPoint, ...] | None: Cached entry points, or `None` when
+            the file is missing, malformed, or recorded for another environment.
+    """
+    try:
+        raw = cast("object", json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, json.JSONDecodeError):
+        return None
+    payload = cast("dict[str, object]", raw) if isinstance(raw, dict) else {}
+    if payload.get("environment") != key:
+        return None
+    entries = payload.get("entryPoints")
+    if not isinstance(entries, list):
+        return None
+    entry_points: list[metadata.EntryPoint] = []
+    provided: dict[str, EngineName] = {}
+    for entry in cast("list[object]", entries):
+        if not isinstance(entry, dict):
+            return None
+        name = cast("dict[str, object]", entry).get("name")
+        value = cast("dict[str, object]", entry).get("value")
+        if not isinstance(name, str) or not isinstance(value, str):
+            return None
+        entry_points.append(metadata.EntryPoint(name=name, value=value, group=ENTRY_POINT_GROUP))
+        engine = cast("dict[str, object]", entry).get("engine")
+        if isinstance(engine, str):
+            provided[name] = _engine_name(engine)
+    with _DISCOVERY_LOCK:
+        _PROVIDED_ENGINES.update(provided)
+    return tuple(entry_points)
+
+
+def _write_discovery_cache(path: Path, key: str, entry_points: tuple[metadata.EntryPoint, ...]) -> None:
+    """Persist discovered entry points for environment ``key``, ignoring I/O errors.
+
+    Entry points that were loaded also record the name of the engine they provide.
+
+    Args:
+        path: Discovery cache file.
+        key: Current environment key.
+        entry_points: Entry points to record.
+    """
+    with _DISCOVERY_LOCK:
+        provided = dict(_PROVIDED_ENGINES)
+    entries: list[dict[str, str]] = []
+    for entry_point in entry_points:
+        entry = {"name": entry_point.name, "value": entry_point.value}
+        if entry_point.name in provided:
+            entry["engine"] = str(provided[entry_point.name])
+        entries.append(entry)
+    payload = {"environment": key, "entryPoints": entries}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        consume(tmp_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8"))
+        consume(tmp_path.replace(path))
+    except OSError as exc:
+        logger.debug(
+            "Failed to persist engine entry points to %s: %s",
+            path,
+            exc,
+            extra=structured_extra(component=LogComponent.ENGINE, path=path),
+        )
+
+
+def engine_entry_points(*, cache_dir: Path | None = None) -> tuple[metadata.EntryPoint, ...]:
+    """Discover the entry points registered under the engine group without loading them.
+
+    Scanning distribution metadata is slow in large environments, so results
+    are memoised for the process and, when ``cache_dir`` is supplied, persisted
+    to disk. Both layers are keyed on ``sys.path`` and the modification times
+    of its entries.
+
+    Args:
+        cache_dir: Directory holding the persisted discovery cache; `None` keeps
+            results in memory only.
+
+    Returns:
+        tuple[metadata.EntryPoint, ...]: Engine entry points in discovery order.
+    """
+    key = _environment_key()
+    with _DISCOVERY_LOCK:
+        cached = _DISCOVERY_CACHE.get(key)
+    if cached is not None:
+        return cached
+    disk_path = cache_dir / ENTRY_POINTS_FILENAME if cache_dir is not None else None
+    discovered = _read_discovery_cache(disk_path, key) if disk_path is not None else None
+    if discovered is None:
+        discovered = _scan_entry_points()
+        if disk_path is not None:
+            _write_discovery_cache(disk_path, key, discovered)
+    with _DISCOVERY_LOCK:
+        _DISCOVERY_CACHE.clear()
+        _DISCOVERY_CACHE[key] = discovered
+    return discovered
+
+
+def clear_engine_discovery_cache() -> None:
+    """Forget entry points discovered (and plugin engines loaded) by this process."""
+    with _DISCOVERY_LOCK:
+        _DISCOVERY_CACHE.clear()
+        _PROVIDED_ENGINES.clear()
+    entrypoint_engine.cache_clear()
+    entrypoint_engines.cache_clear()
+
+
+def _load_entry_point(entry_point: metadata.EntryPoint) -> BaseEngine | None:
+    """Load and instantiate the engine behind ``entry_point``.
+
+    Args:
+        entry_point: Entry point registered under the engine group.
+
+    Returns:
+        BaseEngine | None: Engine instance, or `None` when the plugin fails to load
+            or does not provide a named engine.
+    """
+    try:
+        loaded = entry_point.load()
+        engine = _instantiate_engine(loaded, source=entry_point.name)
+    # ignore JUSTIFIED: plugin loading may fail for many reasons; log and skip bad
+    # entry points
+    except (ImportError, AttributeError, TypeError, ValueError) as exc:  # pragma: no cover - plugin errors
+        # ImportError: plugin module not found
+        # AttributeError: missing required attributes
+        # TypeError: invalid plugin class signature
+        # ValueError: invalid plugin configuration
+        logger.debug(
+            "Failed to load engine entry point '%s': %s",
+            entry_point.name,
+            exc,
+            extra=structured_extra(component=LogComponent.ENGINE, tool=entry_point.name),
+        )
+        return None
+    name = getattr(engine, "name", None)
+    if not isinstance(name, str) or not name:
+        return None
+    with _DISCOVERY_LOCK:
+        _PROVIDED_ENGINES[entry_point.name] = _engine_name(name)
+    return engine
+
+
+@lru_cache
+def entrypoint_engine(name: str) -> BaseEngine | None:
+    """Load only the plugin engine registered under entry point ``name``.
+
+    Args:
+        name: Entry point name within the 'ratchetr.engines' group.
+
+    Returns:
+        BaseEngine | None: Engine instance, or `None` when no entry point has that
+            name or it fails to load.
+    """
+    for entry_point in engine_entry_points():
+        if entry_point.name == name:
+            return _load_entry_point(entry_point)
+    return None
+
+
+@lru_cache
+def entrypoint_engines() -> dict[EngineName, BaseEngine]:
+    """Discover and load type checker engines from entry points.
+
+    Searches for plugins registered under the 'ratchetr.engines' entry point
+    group, loads them, and validates them as BaseEngine instances. Failed
+    loads are logged but don't cause the entire discovery to fail.
+
+    Returns:
+        dict[EngineName, BaseEngine]: Mapping of plugin engine names to instances,
+            sorted alphabetically by name.
+    """
+    engines: dict[EngineName, BaseEngine] = {}
+    for entry_point in engine_entry_points():
+        engine = _load_entry_point(entry_point)
+        if engine is not None:
+            engines[_engine_name(engine.name)] = engine
     return dict(sorted(engines.items()))
 
 
@@ -186,15 +376,50 @@ def engine_map() -> dict[EngineName, BaseEngine]:
     return mapping
 
 
-def resolve_engines(names: Iterable[str | EngineName] | None) -> list[BaseEngine]:
+def _selected_engine(name: EngineName, entry_points: tuple[metadata.EntryPoint, ...]) -> BaseEngine | None:
+    """Resolve one engine, loading only the plugins that may provide it.
+
+    The entry point registered under ``name`` is tried first. Plugins may also
+    provide (or override a builtin) engine under a different entry point name,
+    so every other entry point not known to provide another engine is loaded
+    before falling back to the builtin.
+
+    Args:
+        name: Engine name requested by the caller.
+        entry_points: Discovered engine entry points.
+
+    Returns:
+        BaseEngine | None: Matching engine, or `None` when no engine has that name.
+    """
+    with _DISCOVERY_LOCK:
+        provided = dict(_PROVIDED_ENGINES)
+    candidates = sorted(
+        (entry_point.name for entry_point in entry_points if provided.get(entry_point.name, name) == name),
+        key=lambda candidate: candidate != name,
+    )
+    for candidate in candidates:
+        engine = entrypoint_engine(candidate)
+        if engine is not None and engine.name == name:
+            return engine
+    return builtin_engines().get(name)
+
+
+def resolve_engines(
+    names: Iterable[str | EngineName] | None,
+    *,
+    cache_dir: Path | None = None,
+) -> list[BaseEngine]:
     """Resolve engine names to their BaseEngine instances.
 
     Given a list of engine names, looks them up in the engine registry and
     returns the corresponding instances. If names is None or empty, returns
-    all available engines.
+    all available engines. Otherwise only plugins that may provide a requested
+    engine are imported; the engine each loaded plugin provides is remembered
+    in the discovery cache so later runs skip plugins providing other engines.
 
     Args:
         names: Iterable of engine names to resolve, or None for all engines.
+        cache_dir: Directory holding the persisted entry point discovery cache.
 
     Returns:
         list[BaseEngine]: List of resolved engine instances in the order specified.
@@ -202,16 +427,22 @@ def resolve_engines(names: Iterable[str | EngineName] | None) -> list[BaseEngine
     Raises:
         ValueError: If any requested engine name is not found in the registry.
     """
-    mapping = engine_map()
+    entry_points = engine_entry_points(cache_dir=cache_dir)
     if not names:
-        return list(mapping.values())
+        return list(engine_map().values())
+    with _DISCOVERY_LOCK:
+        known = len(_PROVIDED_ENGINES)
     resolved: list[BaseEngine] = []
     for name in names:
-        engine_name = _engine_name(str(name))
-        if engine_name not in mapping:
+        engine = _selected_engine(_engine_name(str(name)), entry_points)
+        if engine is None:
             message = f"Unknown engine '{name}'"
             raise ValueError(message)
-        resolved.append(mapping[engine_name])
+        resolved.append(engine)
+    with _DISCOVERY_LOCK:
+        learned = len(_PROVIDED_ENGINES) != known
+    if learned and cache_dir is not None:
+        _write_discovery_cache(cache_dir / ENTRY_POINTS_FILENAME, _environment_key(), entry_points)
     return resolved
 
 
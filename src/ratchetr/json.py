@@ -22,11 +22,21 @@ simple and acyclic.
 
 from __future__ import annotations
 
+import importlib
 import json
 from enum import Enum
-from typing import TypeAlias, cast
+from types import GenericAlias
+from typing import TYPE_CHECKING, Final, TypeAlias, cast
 
-from pydantic import JsonValue
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from typing import IO
+
+    from pydantic import JsonValue
+
+    JSONValue: TypeAlias = JsonValue
+    JSONMapping: TypeAlias = dict[str, JsonValue]
+    JSONList: TypeAlias = list[JsonValue]
 
 __all__ = [
     "JSONList",
@@ -38,11 +48,26 @@ __all__ = [
     "as_str",
     "normalise_enums_for_json",
     "require_json",
+    "stream_json_object",
 ]
 
-JSONValue: TypeAlias = JsonValue
-JSONMapping = dict[str, JsonValue]
-JSONList = list[JsonValue]
+_PYDANTIC_ALIASES: Final[frozenset[str]] = frozenset({"JSONValue", "JSONMapping", "JSONList"})
+
+
+def __getattr__(name: str) -> object:
+    # Only pydantic models need the aliases at runtime, so pydantic is imported on
+    # first access instead of by every module that logs or parses JSON.
+    if name not in _PYDANTIC_ALIASES:
+        message = f"module '{__name__}' has no attribute '{name}'"
+        raise AttributeError(message)
+    json_value: object = importlib.import_module("pydantic").JsonValue
+    aliases: dict[str, object] = {
+        "JSONValue": json_value,
+        "JSONMapping": GenericAlias(dict, (str, json_value)),
+        "JSONList": GenericAlias(list, json_value),
+    }
+    globals().update(aliases)
+    return aliases[name]
 
 
 def require_json(payload: str, fallback: str | None = None) -> JSONMapping:
@@ -161,3 +186,163 @@ def normalise_enums_for_json(value: object) -> JSONValue:
         return cast("JSONValue", str(obj))
 
     return _convert(value)
+
+
+_STREAM_CHUNK_SIZE: Final[int] = 1 << 16
+_JSON_WHITESPACE: Final[frozenset[str]] = frozenset(" \t\n\r")
+# Characters that can end a number token; anything else may continue it.
+_JSON_NUMBER_TERMINATORS: Final[frozenset[str]] = _JSON_WHITESPACE | frozenset(",:]}")
+_DECODER: Final[json.JSONDecoder] = json.JSONDecoder()
+
+
+class _StreamCursor:
+    """Sliding window over a text stream used by `stream_json_object`."""
+
+    __slots__ = ("_buffer", "_chunk_size", "_eof", "_pos", "_stream")
+
+    def __init__(self, stream: IO[str], chunk_size: int) -> None:
+        super().__init__()
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> bool:
+        if self._eof:
+            return False
+        chunk = self._stream.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        # Drop consumed text so the window only ever holds the current value.
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str | None:
+        """Skip whitespace and return the next character without consuming it.
+
+        Returns:
+            The next non-whitespace character, or `None` at the end of the stream.
+        """
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _JSON_WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill(self._chunk_size):
+                return None
+
+    def expect(self, *tokens: str) -> str:
+        """Consume the next character, which must be one of ``tokens``.
+
+        Args:
+            *tokens: Accepted structural characters.
+
+        Returns:
+            The consumed character.
+
+        Raises:
+            ValueError: If the stream ends or holds a different character.
+        """
+        token = self.peek()
+        if token is None or token not in tokens:
+            message = f"Expected one of {tokens!r} in JSON stream but found {token!r}"
+            raise ValueError(message)
+        self._pos += 1
+        return token
+
+    def _complete(self, decoded: object, end: int) -> bool:
+        # A value touching the window edge may be truncated, and a number can
+        # also stop short of it ("1." or "1e" decode as 1); only a terminator
+        # after a number proves that the next chunk does not continue it.
+        if end >= len(self._buffer):
+            return False
+        if isinstance(decoded, bool) or not isinstance(decoded, int | float):
+            return True
+        return self._buffer[end] in _JSON_NUMBER_TERMINATORS
+
+    def value(self) -> JSONValue:
+        """Decode the next JSON value, reading more of the stream as needed.
+
+        Returns:
+            The decoded value.
+
+        Raises:
+            json.JSONDecodeError: If the stream ends before a complete value.
+        """
+        _ = self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                decoded, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill(size):
+                    raise
+            else:
+                if self._complete(decoded, end) or not self._fill(size):
+                    self._pos = end
+                    return cast("JSONValue", decoded)
+            # Grow reads geometrically so one oversized value stays linear.
+            size *= 2
+
+
+def stream_json_object(
+    stream: IO[str],
+    *,
+    array_handlers: Mapping[str, Callable[[JSONValue], None]],
+    chunk_size: int = _STREAM_CHUNK_SIZE,
+) -> JSONMapping | None:
+    """Parse a JSON object from `stream` without reading it into memory at once.
+
+    Top-level members named in `array_handlers` whose value is an array are
+    not materialised: each element is decoded and passed to the matching
+    handler as soon as it is complete. All other members are returned.
+
+    Args:
+        stream: Text stream positioned at the start of a JSON object.
+        array_handlers: Mapping of member name to per-element callback.
+        chunk_size: Number of characters requested per read.
+
+    Returns:
+        Mapping of the non-streamed members, or `None` when the stream is empty.
+
+    Raises:
+        ValueError: If the stream does not hold a single well-formed JSON object.
+        TypeError: If an object key is not a string.
+    """
+    cursor = _StreamCursor(stream, chunk_size)
+    if cursor.peek() is None:
+        return None
+    _ = cursor.expect("{")
+    members: JSONMapping = {}
+    if cursor.peek() == "}":
+        _ = cursor.expect("}")
+    else:
+        while True:
+            key = cursor.value()
+            if not isinstance(key, str):
+                message = f"Expected JSON object key but found {key!r}"
+                raise TypeError(message)
+            _ = cursor.expect(":")
+            handler = array_handlers.get(key)
+            if handler is not None and cursor.peek() == "[":
+                _ = cursor.expect("[")
+                if cursor.peek() == "]":
+                    _ = cursor.expect("]")
+                else:
+                    handler(cursor.value())
+                    while cursor.expect(",", "]") == ",":
+                        handler(cursor.value())
+            else:
+                members[key] = cursor.value()
+            if cursor.expect(",", "}") == "}":
+                break
+    if cursor.peek() is not None:
+        message = "Unexpected trailing data after JSON object"
+        raise ValueError(message)
+    return members
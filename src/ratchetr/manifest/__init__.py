@@ -20,6 +20,7 @@ of typing health across projects.
 
 Key components:
     - ManifestBuilder: Constructs manifests from type checking runs
+    - ManifestIndex: Byte-offset index for reading parts of large manifests
     - ManifestModel: Pydantic models for validation and schema generation
     - ManifestData: TypedDict definitions for typed manifest structures
     - Versioning: Schema version management and validation
@@ -27,41 +28,47 @@ Key components:
 
 from __future__ import annotations
 
-from .builder import ManifestBuilder
-from .loader import load_manifest_data
-from .models import (
-    EngineErrorModel,
-    EngineOptionsModel,
-    FileDiagnosticModel,
-    FileEntryModel,
-    FolderEntryModel,
-    ManifestModel,
-    ManifestValidationError,
-    OverrideEntryModel,
-    RunPayloadModel,
-    RunSummaryModel,
-    ToolSummaryModel,
-    manifest_from_model,
-    manifest_to_model,
-    validate_manifest_payload,
-)
-from .typed import (
-    AggregatedData,
-    EngineError,
-    EngineOptionsEntry,
-    ManifestData,
-    RunPayload,
-    ToolSummary,
-)
-from .versioning import (
-    CURRENT_MANIFEST_VERSION,
-    InvalidManifestRunsError,
-    InvalidManifestVersionTypeError,
-    ManifestVersion,
-    ManifestVersionError,
-    UnsupportedManifestVersionError,
-    ensure_current_manifest_version,
-)
+from typing import TYPE_CHECKING
+
+from ratchetr.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .builder import ManifestBuilder
+    from .index import IndexedRun, ManifestIndex
+    from .loader import load_manifest_data
+    from .models import (
+        EngineErrorModel,
+        EngineOptionsModel,
+        FileDiagnosticModel,
+        FileEntryModel,
+        FolderEntryModel,
+        ManifestModel,
+        ManifestValidationError,
+        OverrideEntryModel,
+        RunPayloadModel,
+        RunSummaryModel,
+        ToolSummaryModel,
+        manifest_from_model,
+        manifest_to_model,
+        validate_manifest_payload,
+    )
+    from .typed import (
+        AggregatedData,
+        EngineError,
+        EngineOptionsEntry,
+        ManifestData,
+        RunPayload,
+        ToolSummary,
+    )
+    from .versioning import (
+        CURRENT_MANIFEST_VERSION,
+        InvalidManifestRunsError,
+        InvalidManifestVersionTypeError,
+        ManifestVersion,
+        ManifestVersionError,
+        UnsupportedManifestVersionError,
+        ensure_current_manifest_version,
+    )
 
 __all__ = [
     "CURRENT_MANIFEST_VERSION",
@@ -73,10 +80,12 @@ __all__ = [
     "FileDiagnosticModel",
     "FileEntryModel",
     "FolderEntryModel",
+    "IndexedRun",
     "InvalidManifestRunsError",
     "InvalidManifestVersionTypeError",
     "ManifestBuilder",
     "ManifestData",
+    "ManifestIndex",
     "ManifestModel",
     "ManifestValidationError",
     "ManifestVersion",
@@ -94,3 +103,40 @@ __all__ = [
     "manifest_to_model",
     "validate_manifest_payload",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AggregatedData": ".typed",
+        "CURRENT_MANIFEST_VERSION": ".versioning",
+        "EngineError": ".typed",
+        "EngineErrorModel": ".models",
+        "EngineOptionsEntry": ".typed",
+        "EngineOptionsModel": ".models",
+        "FileDiagnosticModel": ".models",
+        "FileEntryModel": ".models",
+        "FolderEntryModel": ".models",
+        "IndexedRun": ".index",
+        "InvalidManifestRunsError": ".versioning",
+        "InvalidManifestVersionTypeError": ".versioning",
+        "ManifestBuilder": ".builder",
+        "ManifestData": ".typed",
+        "ManifestIndex": ".index",
+        "ManifestModel": ".models",
+        "ManifestValidationError": ".models",
+        "ManifestVersion": ".versioning",
+        "ManifestVersionError": ".versioning",
+        "OverrideEntryModel": ".models",
+        "RunPayload": ".typed",
+        "RunPayloadModel": ".models",
+        "RunSummaryModel": ".models",
+        "ToolSummary": ".typed",
+        "ToolSummaryModel": ".models",
+        "UnsupportedManifestVersionError": ".versioning",
+        "ensure_current_manifest_version": ".versioning",
+        "load_manifest_data": ".loader",
+        "manifest_from_model": ".models",
+        "manifest_to_model": ".models",
+        "validate_manifest_payload": ".models",
+    },
+)
@@ -23,8 +23,10 @@ improvements.
 from __future__ import annotations
 
 import operator
+import re
 from collections import Counter
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Final, cast
 
@@ -36,7 +38,7 @@ from ratchetr.readiness.compute import CATEGORY_PATTERNS
 if TYPE_CHECKING:
     from collections.abc import Iterable, Mapping
 
-    from ratchetr.core.types import RunResult
+    from ratchetr.core.types import DiagnosticRow, RunResult
     from ratchetr.manifest.typed import AggregatedData, FileDiagnostic, FileEntry, FolderEntry
 
 
@@ -227,6 +229,7 @@ _FALLBACK_CATEGORY_LOOKUPS: Final[tuple[tuple[CategoryKey, tuple[str, ...]], ...
     for category, patterns in CATEGORY_PATTERNS.items()
     if category != _GENERAL_CATEGORY
 )
+_MAX_SHARED_CATEGORISERS: Final[int] = 32
 
 
 def _build_category_lookup(
@@ -248,13 +251,37 @@ def _build_category_lookup(
     return tuple(lookups)
 
 
+def _compile_category_matcher(
+    lookups: tuple[tuple[CategoryKey, tuple[str, ...]], ...],
+) -> re.Pattern[str]:
+    """Compile ordered category lookups into a single regular expression.
+
+    Each category becomes one alternative anchored at the start of the code:
+    a lookahead for any of its patterns followed by an empty named group.
+    Alternatives are tried in order, so the first category with a matching
+    pattern wins, exactly as a category-by-category substring scan would.
+
+    Args:
+        lookups: Ordered (category, patterns) pairs.
+
+    Returns:
+        Pattern whose ``lastgroup`` names the index of the matching lookup.
+    """
+    branches = [
+        f"(?=.*?(?:{'|'.join(re.escape(pattern) for pattern in patterns)}))(?P<c{index}>)"
+        for index, (_category, patterns) in enumerate(lookups)
+    ]
+    return re.compile(f"^(?:{'|'.join(branches)})", re.DOTALL)
+
+
 class _Categoriser:
     """Categorizes diagnostic codes into semantic categories.
 
-    Uses custom and fallback pattern matching with caching for performance.
+    Custom and fallback patterns are compiled into one matcher, and results
+    are memoised per code.
     """
 
-    __slots__ = ("_cache", "_custom_lookup")
+    __slots__ = ("_cache", "_categories", "_matcher")
 
     def __init__(self, mapping: Mapping[CategoryKey, Iterable[str]]) -> None:
         """Initialize categoriser with custom category patterns.
@@ -263,13 +290,15 @@ class _Categoriser:
             mapping: Custom category to pattern mapping.
         """
         super().__init__()
-        self._custom_lookup = _build_category_lookup(mapping)
+        lookups = _build_category_lookup(mapping) + _FALLBACK_CATEGORY_LOOKUPS
+        self._categories: tuple[CategoryKey, ...] = tuple(category for category, _patterns in lookups)
+        self._matcher = _compile_category_matcher(lookups)
         self._cache: dict[str, CategoryKey] = {}
 
     def categorise(self, code: str | None) -> CategoryKey:
         """Categorize a diagnostic code into a semantic category.
 
-        First checks custom patterns, then falls back to default patterns.
+        Custom patterns take precedence over the default patterns.
         Results are cached for performance.
 
         Args:
@@ -283,17 +312,27 @@ class _Categoriser:
         cached = self._cache.get(code)
         if cached is not None:
             return cached
-        lowered = code.lower()
-        for category, patterns in self._custom_lookup:
-            if any(pattern in lowered for pattern in patterns):
-                self._cache[code] = category
-                return category
-        for category, patterns in _FALLBACK_CATEGORY_LOOKUPS:
-            if any(pattern in lowered for pattern in patterns):
-                self._cache[code] = category
-                return category
-        self._cache[code] = _GENERAL_CATEGORY
-        return _GENERAL_CATEGORY
+        match = self._matcher.match(code.lower())
+        category = (
+            self._categories[int(match.lastgroup[1:])]
+            if match is not None and match.lastgroup is not None
+            else _GENERAL_CATEGORY
+        )
+        self._cache[code] = category
+        return category
+
+
+@lru_cache(maxsize=_MAX_SHARED_CATEGORISERS)
+def _shared_categoriser(mapping: tuple[tuple[CategoryKey, tuple[str, ...]], ...]) -> _Categoriser:
+    """Return the categoriser for ``mapping``, shared by runs with identical mappings.
+
+    Args:
+        mapping: Canonical category mapping as ordered (category, patterns) pairs.
+
+    Returns:
+        Categoriser whose compiled matcher and memo are reused across runs.
+    """
+    return _Categoriser(dict(mapping))
 
 
 def _normalise_rel_path(path: Path) -> str:
@@ -325,12 +364,8 @@ def _ensure_file_summary(files: dict[str, FileSummary], rel_path: str) -> FileSu
     return summary
 
 
-_PATH_PART_CACHE: dict[str, tuple[str, ...]] = {}
-_MAX_PATH_CACHE_SIZE: Final[int] = 4096
-
-
 def _split_rel_path(rel_path: str) -> tuple[str, ...]:
-    """Split path into parts with caching for performance.
+    """Split path into parts.
 
     Args:
         rel_path: Relative path string to split.
@@ -338,112 +373,50 @@ def _split_rel_path(rel_path: str) -> tuple[str, ...]:
     Returns:
         Tuple of path components, excluding "." and empty strings.
     """
-    cached = _PATH_PART_CACHE.get(rel_path)
-    if cached is not None:
-        return cached
-    parts = tuple(part for part in Path(rel_path).parts if part not in {".", ""})
-    if len(_PATH_PART_CACHE) >= _MAX_PATH_CACHE_SIZE:
-        _PATH_PART_CACHE.clear()
-    _PATH_PART_CACHE[rel_path] = parts
-    return parts
-
-
-# ignore JUSTIFIED: summary helper updates several global counters in one place;
-# extra wrapper objects would harm readability
-def _update_file_summary(  # noqa: PLR0913
-    summary: FileSummary,
-    *,
-    severity: SeverityLevel,
-    code: str | None,
-    diagnostic: FileDiagnostic,
-    severity_totals: Counter[SeverityLevel],
-    rule_totals: Counter[RuleName],
-    category_totals: Counter[CategoryKey],
-    categoriser: _Categoriser,
-) -> CategoryKey:
-    """Update file summary and global totals with a new diagnostic.
+    return tuple(part for part in Path(rel_path).parts if part not in {".", ""})
 
-    Args:
-        summary: FileSummary to update.
-        severity: Severity level of the diagnostic.
-        code: Diagnostic code (e.g., "attr-defined").
-        diagnostic: FileDiagnostic entry to append.
-        severity_totals: Global counter for severity levels.
-        rule_totals: Global counter for rule names.
-        category_totals: Global counter for categories.
-        categoriser: Categoriser instance for code categorization.
 
-    Returns:
-        CategoryKey assigned to this diagnostic.
+def _add_severity_counts(summary: FileSummary | FolderSummary, counts: Mapping[SeverityLevel, int]) -> None:
+    """Add grouped severity counts to a file or folder summary.
+
+    Args:
+        summary: Summary to update.
+        counts: Diagnostic counts keyed by severity.
     """
-    if severity is SeverityLevel.ERROR:
-        summary.errors += 1
-    elif severity is SeverityLevel.WARNING:
-        summary.warnings += 1
-    else:
-        summary.information += 1
-    summary.diagnostics.append(diagnostic)
-    severity_totals[severity] += 1
-    if code:
-        rule_totals[RuleName(code)] += 1
-    category = categoriser.categorise(code)
-    category_totals[category] += 1
-    return category
-
-
-def _folder_summaries_for_path(
+    for severity, count in counts.items():
+        if severity is SeverityLevel.ERROR:
+            summary.errors += count
+        elif severity is SeverityLevel.WARNING:
+            summary.warnings += count
+        else:
+            summary.information += count
+
+
+def _folder_summaries_for_prefix(
     folder_levels: dict[int, dict[str, FolderSummary]],
-    rel_path: str,
-    max_depth: int,
-) -> Iterable[FolderSummary]:
+    prefix: tuple[str, ...],
+) -> tuple[FolderSummary, ...]:
     """Get or create FolderSummary objects for all ancestor folders.
 
-    Creates folder summaries for each depth level from 1 to max_depth
-    along the path hierarchy.
+    Creates one folder summary per depth level along ``prefix``.
 
     Args:
         folder_levels: Nested dict mapping depth -> folder path -> FolderSummary.
-        rel_path: Relative path to the file.
-        max_depth: Maximum folder depth to track.
+        prefix: Leading path parts of a file, truncated to the maximum depth.
 
-    Yields:
-        FolderSummary for each ancestor folder up to max_depth.
+    Returns:
+        FolderSummary for each ancestor folder, shallowest first.
     """
-    parts = _split_rel_path(rel_path)
-    for depth in range(1, min(len(parts), max_depth) + 1):
-        folder = "/".join(parts[:depth])
+    buckets: list[FolderSummary] = []
+    for depth in range(1, len(prefix) + 1):
+        folder = "/".join(prefix[:depth])
         level = folder_levels.setdefault(depth, {})
         bucket = level.get(folder)
         if bucket is None:
             bucket = FolderSummary(path=folder, depth=depth)
             level[folder] = bucket
-        yield bucket
-
-
-def _update_folder_summary(
-    bucket: FolderSummary,
-    *,
-    severity: SeverityLevel,
-    code: str | None,
-    category: CategoryKey,
-) -> None:
-    """Update folder summary counters with a diagnostic.
-
-    Args:
-        bucket: FolderSummary to update.
-        severity: Severity level of the diagnostic.
-        code: Diagnostic code.
-        category: Category assigned to the diagnostic.
-    """
-    if severity is SeverityLevel.ERROR:
-        bucket.errors += 1
-    elif severity is SeverityLevel.WARNING:
-        bucket.warnings += 1
-    else:
-        bucket.information += 1
-    if code:
-        bucket.code_counts[code] += 1
-    bucket.category_counts[category] += 1
+        buckets.append(bucket)
+    return tuple(buckets)
 
 
 def _finalise_file_entries(files: dict[str, FileSummary]) -> list[FileEntry]:
@@ -513,9 +486,10 @@ def _build_summary_counts(
         Dictionary with summary statistics including breakdowns by severity, rule, and category.
     """
     return {
-        "errors": sum(1 for diag in run.diagnostics if diag.severity is SeverityLevel.ERROR),
-        "warnings": sum(1 for diag in run.diagnostics if diag.severity is SeverityLevel.WARNING),
-        "information": sum(1 for diag in run.diagnostics if diag.severity is SeverityLevel.INFORMATION),
+        # Severity tallies are gathered in the main aggregation pass; avoid re-walking diagnostics.
+        "errors": severity_totals[SeverityLevel.ERROR],
+        "warnings": severity_totals[SeverityLevel.WARNING],
+        "information": severity_totals[SeverityLevel.INFORMATION],
         "total": len(run.diagnostics),
         "severityBreakdown": {
             severity: severity_totals[severity] for severity in sorted(severity_totals, key=lambda item: item.value)
@@ -525,7 +499,103 @@ def _build_summary_counts(
     }
 
 
-def summarise_run(run: RunResult, *, max_depth: int = 3) -> AggregatedData:
+def _resolve_file_buckets(
+    paths: Iterable[Path],
+    *,
+    files: dict[str, FileSummary],
+    folder_levels: dict[int, dict[str, FolderSummary]],
+    max_depth: int,
+) -> tuple[dict[Path, FileSummary], dict[Path, tuple[FolderSummary, ...]]]:
+    """Resolve the file summary and folder buckets of each distinct file once.
+
+    Files sharing their leading ``max_depth`` parts share one bucket tuple.
+
+    Args:
+        paths: Distinct diagnostic paths.
+        files: File summaries keyed by normalised relative path.
+        folder_levels: Nested dict mapping depth -> folder path -> FolderSummary.
+        max_depth: Maximum folder depth to aggregate.
+
+    Returns:
+        Tuple of (file summary per path, folder buckets per path).
+    """
+    file_summaries: dict[Path, FileSummary] = {}
+    path_buckets: dict[Path, tuple[FolderSummary, ...]] = {}
+    prefix_buckets: dict[tuple[str, ...], tuple[FolderSummary, ...]] = {}
+    for path in paths:
+        rel_path = _normalise_rel_path(path)
+        file_summaries[path] = _ensure_file_summary(files, rel_path)
+        prefix = _split_rel_path(rel_path)[:max_depth]
+        buckets = prefix_buckets.get(prefix)
+        if buckets is None:
+            buckets = prefix_buckets[prefix] = _folder_summaries_for_prefix(folder_levels, prefix)
+        path_buckets[path] = buckets
+    return file_summaries, path_buckets
+
+
+def _fold_rule_counts(
+    rules_by_path: Mapping[Path, Counter[str | None]],
+    *,
+    path_buckets: Mapping[Path, tuple[FolderSummary, ...]],
+    categoriser: _Categoriser,
+) -> tuple[Counter[RuleName], Counter[CategoryKey]]:
+    """Fold per-file rule counts into folder buckets and run-wide totals.
+
+    Args:
+        rules_by_path: Rule-code counts grouped by file.
+        path_buckets: Folder buckets of each file.
+        categoriser: Maps rule codes to readiness categories.
+
+    Returns:
+        Tuple of (rule totals, category totals) for the run.
+    """
+    rule_totals: Counter[RuleName] = Counter()
+    category_totals: Counter[CategoryKey] = Counter()
+    for path, rules in rules_by_path.items():
+        buckets = path_buckets[path]
+        for code, count in rules.items():
+            category = categoriser.categorise(code)
+            category_totals[category] += count
+            if code:
+                rule_totals[RuleName(code)] += count
+            for bucket in buckets:
+                if code:
+                    bucket.code_counts[code] += count
+                bucket.category_counts[category] += count
+    return rule_totals, category_totals
+
+
+def _file_diagnostics(rows: Iterable[DiagnosticRow], *, include_raw: bool) -> list[FileDiagnostic]:
+    """Build the per-file diagnostic entries of one file.
+
+    Args:
+        rows: The file's diagnostic rows in table order.
+        include_raw: Whether entries carry the tool-native payload.
+
+    Returns:
+        Per-file diagnostic entries.
+    """
+    if not include_raw:
+        return [
+            {"line": line, "column": column, "severity": severity, "code": code, "message": message}
+            for line, column, severity, code, message, _raw in rows
+        ]
+    diagnostics: list[FileDiagnostic] = []
+    for line, column, severity, code, message, raw in rows:
+        file_diag: FileDiagnostic = {
+            "line": line,
+            "column": column,
+            "severity": severity,
+            "code": code,
+            "message": message,
+        }
+        if raw:
+            file_diag["raw"] = dict(raw)
+        diagnostics.append(file_diag)
+    return diagnostics
+
+
+def summarise_run(run: RunResult, *, max_depth: int = 3, include_raw: bool = False) -> AggregatedData:
     """Aggregate and summarize diagnostics from a type checking run.
 
     Processes all diagnostics to create:
@@ -536,46 +606,37 @@ def summarise_run(run: RunResult, *, max_depth: int = 3) -> AggregatedData:
     Args:
         run: RunResult containing diagnostics and configuration.
         max_depth: Maximum folder depth to aggregate (default: 3).
+        include_raw: Whether per-file diagnostics carry the tool-native payload.
 
     Returns:
         AggregatedData containing summary, file entries, and folder entries.
     """
     files: dict[str, FileSummary] = {}
     folder_levels: dict[int, dict[str, FolderSummary]] = {depth: {} for depth in range(1, max_depth + 1)}
+    table = run.diagnostics
+    severities_by_path = table.severity_counts_by_path()
+    file_summaries, path_buckets = _resolve_file_buckets(
+        severities_by_path,
+        files=files,
+        folder_levels=folder_levels,
+        max_depth=max_depth,
+    )
 
-    severity_totals: Counter[SeverityLevel] = Counter()
-    rule_totals: Counter[RuleName] = Counter()
-    category_totals: Counter[CategoryKey] = Counter()
-    category_mapping = _canonical_category_mapping(run.category_mapping)
-    categoriser = _Categoriser(category_mapping)
+    # Counts come from the table's grouped id columns, so file, folder, rule, and
+    # category totals are folded once per distinct (path, severity/rule) pair.
+    for path, severities in severities_by_path.items():
+        _add_severity_counts(file_summaries[path], severities)
+        for bucket in path_buckets[path]:
+            _add_severity_counts(bucket, severities)
+    rule_totals, category_totals = _fold_rule_counts(
+        table.rule_counts_by_path(),
+        path_buckets=path_buckets,
+        categoriser=_shared_categoriser(tuple(_canonical_category_mapping(run.category_mapping).items())),
+    )
 
-    for diag in run.diagnostics:
-        rel_path = _normalise_rel_path(diag.path)
-        summary = _ensure_file_summary(files, rel_path)
-        file_diag: FileDiagnostic = {
-            "line": diag.line,
-            "column": diag.column,
-            "severity": diag.severity,
-            "code": diag.code,
-            "message": diag.message,
-        }
-        category = _update_file_summary(
-            summary,
-            severity=diag.severity,
-            code=diag.code,
-            diagnostic=file_diag,
-            severity_totals=severity_totals,
-            rule_totals=rule_totals,
-            category_totals=category_totals,
-            categoriser=categoriser,
-        )
-        for bucket in _folder_summaries_for_path(folder_levels, rel_path, max_depth):
-            _update_folder_summary(
-                bucket,
-                severity=diag.severity,
-                code=diag.code,
-                category=category,
-            )
+    # Rows arrive grouped by file, so each file's diagnostics are built in one pass.
+    for path, rows in table.rows_by_path().items():
+        file_summaries[path].diagnostics.extend(_file_diagnostics(rows, include_raw=include_raw))
 
     per_file = _finalise_file_entries(files)
     folder_entries = _finalise_folder_entries(folder_levels)
@@ -585,7 +646,7 @@ def summarise_run(run: RunResult, *, max_depth: int = 3) -> AggregatedData:
         {
             "summary": _build_summary_counts(
                 run,
-                severity_totals=severity_totals,
+                severity_totals=table.severity_counts(),
                 rule_totals=rule_totals,
                 category_totals=category_totals,
             ),
@@ -21,24 +21,27 @@ and writes them to JSON format with tool version detection and metadata.
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, cast
 
 from ratchetr.compat import UTC
-from ratchetr.core.model_types import LogComponent, clone_override_entries
-from ratchetr.json import normalise_enums_for_json
+from ratchetr.core.model_types import LogComponent, RawRetention, clone_override_entries
+from ratchetr.core.types import DEFAULT_RAW_RETENTION
 from ratchetr.logging import structured_extra
-from ratchetr.runtime import consume, detect_tool_versions
+from ratchetr.runtime import detect_tool_versions
 
 from .aggregate import summarise_run
+from .trust import stamp_manifest
 from .versioning import CURRENT_MANIFEST_VERSION
+from .writer import write_manifest
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from pathlib import Path
 
+    from ratchetr.core.model_types import ManifestCompression
     from ratchetr.core.types import RunResult
 
     from .typed import (
@@ -63,11 +66,16 @@ class ManifestBuilder:
         project_root: Root directory of the project being audited.
         data: ManifestData dictionary containing all manifest content.
         fingerprint_truncated: Whether fingerprint data was truncated.
+        raw_retention: Raw payload policy; only `full` emits payloads per diagnostic.
+        tool_versions: Versions detected earlier in the audit; when set, `write`
+            reuses them instead of probing the tools again.
     """
 
     project_root: Path
     data: ManifestData = field(init=False)
     fingerprint_truncated: bool = False
+    raw_retention: RawRetention = DEFAULT_RAW_RETENTION
+    tool_versions: Mapping[str, str] | None = None
 
     def __post_init__(self) -> None:
         """Initialize manifest data with metadata and empty runs list."""
@@ -102,7 +110,11 @@ class ManifestBuilder:
                 details={"max_depth": max_depth},
             ),
         )
-        summary: AggregatedData = summarise_run(run, max_depth=max_depth)
+        summary: AggregatedData = summarise_run(
+            run,
+            max_depth=max_depth,
+            include_raw=self.raw_retention is RawRetention.FULL,
+        )
         options: EngineOptionsEntry = {
             "profile": run.profile,
             "configFile": run.config_file.as_posix() if run.config_file else None,
@@ -150,14 +162,24 @@ class ManifestBuilder:
         runs_list = self.data.setdefault("runs", [])
         runs_list.append(payload)
 
-    def write(self, path: Path) -> None:
+    def write(
+        self,
+        path: Path,
+        *,
+        compact: bool = False,
+        compression: ManifestCompression | None = None,
+    ) -> None:
         """Write the manifest to a JSON file.
 
         Creates parent directories if needed, detects tool versions from runs,
-        normalizes enums for JSON serialization, and writes formatted output.
+        and streams the manifest to disk one per-file entry at a time. The
+        manifest is then stamped so loaders can skip re-validating it.
 
         Args:
             path: Path where the manifest JSON file should be written.
+            compact: Write without indentation or inter-token whitespace.
+            compression: Compression format; inferred from the extension of
+                ``path`` (``.json.gz`` / ``.json.zst``) when `None`.
         """
         path.parent.mkdir(parents=True, exist_ok=True)
         logger.info(
@@ -168,7 +190,10 @@ class ManifestBuilder:
         # Fill in toolVersions based on tools present in runs
         try:
             tools = sorted({run.get("tool", "") for run in self.data.get("runs", []) if run})
-            versions = detect_tool_versions(tools)
+            if self.tool_versions is not None:
+                versions = {tool: self.tool_versions[tool] for tool in tools if tool in self.tool_versions}
+            else:
+                versions = detect_tool_versions(tools)
             if versions:
                 self.data["toolVersions"] = versions
         # ignore JUSTIFIED: tool version detection is best-effort; failures are logged
@@ -184,5 +209,5 @@ class ManifestBuilder:
             )
         if self.fingerprint_truncated:
             self.data["fingerprintTruncated"] = True
-        payload = normalise_enums_for_json(self.data)
-        consume(path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8"))
+        write_manifest(self.data, path, compact=compact, compression=compression)
+        stamp_manifest(path)
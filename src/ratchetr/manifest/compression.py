@@ -0,0 +1,197 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Transparent compression for manifest files.
+
+Writers pick the format from an explicit setting or the file extension
+(``.gz`` / ``.zst``); readers sniff the leading magic bytes, so a compressed
+manifest loads the same way regardless of its name. Both directions stream
+through the (de)compressor rather than materialising the compressed bytes.
+"""
+
+from __future__ import annotations
+
+import gzip
+import importlib
+import io
+import json
+from contextlib import ExitStack, contextmanager
+from typing import IO, TYPE_CHECKING, Final, Protocol, cast
+
+from ratchetr.core.model_types import ManifestCompression
+from ratchetr.exceptions import RatchetrError
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+GZIP_MAGIC: Final[bytes] = b"\x1f\x8b"
+ZSTD_MAGIC: Final[bytes] = b"\x28\xb5\x2f\xfd"
+GZIP_LEVEL: Final[int] = 6
+ZSTD_LEVEL: Final[int] = 3
+_SUFFIXES: Final[dict[str, ManifestCompression]] = {
+    ".gz": ManifestCompression.GZIP,
+    ".zst": ManifestCompression.ZSTD,
+    ".zstd": ManifestCompression.ZSTD,
+}
+
+
+class ManifestCompressionUnavailableError(RatchetrError):
+    """Raised when a manifest needs a compression module that is not installed."""
+
+    def __init__(self, compression: ManifestCompression, module: str) -> None:
+        """Initialise the error.
+
+        Args:
+            compression: Format that was requested or detected.
+            module: Name of the missing module.
+        """
+        self.compression = compression
+        self.module = module
+        super().__init__(f"{compression.value} manifests require the '{module}' package")
+
+
+class _ZstdCompressor(Protocol):
+    def stream_writer(self, writer: IO[bytes]) -> IO[bytes]: ...
+
+
+class _ZstdDecompressor(Protocol):
+    def stream_reader(self, source: IO[bytes]) -> IO[bytes]: ...
+
+
+class _ZstandardModule(Protocol):
+    # ignore JUSTIFIED: protocol mirrors the zstandard module's class-style factory names
+    def ZstdCompressor(self, level: int) -> _ZstdCompressor: ...  # pylint: disable=invalid-name
+
+    # ignore JUSTIFIED: protocol mirrors the zstandard module's class-style factory names
+    def ZstdDecompressor(self) -> _ZstdDecompressor: ...  # pylint: disable=invalid-name
+
+
+def _zstandard() -> _ZstandardModule:
+    try:
+        return cast("_ZstandardModule", importlib.import_module("zstandard"))
+    except ModuleNotFoundError as exc:
+        raise ManifestCompressionUnavailableError(ManifestCompression.ZSTD, "zstandard") from exc
+
+
+def compression_for_path(path: Path) -> ManifestCompression:
+    """Return the compression implied by the extension of ``path``.
+
+    Args:
+        path: Manifest destination.
+
+    Returns:
+        `GZIP` for ``.gz``, `ZSTD` for ``.zst``/``.zstd``, otherwise `NONE`.
+    """
+    return _SUFFIXES.get(path.suffix.lower(), ManifestCompression.NONE)
+
+
+def detect_compression(path: Path) -> ManifestCompression:
+    """Return the compression of an existing manifest from its magic bytes.
+
+    Args:
+        path: Manifest file to inspect.
+
+    Returns:
+        Detected compression format (`NONE` for plain JSON).
+    """
+    with path.open("rb") as handle:
+        head = handle.read(len(ZSTD_MAGIC))
+    if head.startswith(GZIP_MAGIC):
+        return ManifestCompression.GZIP
+    if head.startswith(ZSTD_MAGIC):
+        return ManifestCompression.ZSTD
+    return ManifestCompression.NONE
+
+
+@contextmanager
+def open_manifest_reader(path: Path) -> Generator[IO[str]]:
+    """Open a manifest for streaming text reads, decompressing transparently.
+
+    Args:
+        path: Plain, gzip, or zstd manifest file.
+
+    Yields:
+        Text stream over the decoded JSON document.
+    """
+    compression = detect_compression(path)
+    with ExitStack() as stack:
+        if compression is ManifestCompression.GZIP:
+            yield stack.enter_context(gzip.open(path, "rt", encoding="utf-8"))
+            return
+        if compression is ManifestCompression.ZSTD:
+            module = _zstandard()
+            raw = stack.enter_context(path.open("rb"))
+            reader = stack.enter_context(module.ZstdDecompressor().stream_reader(raw))
+            yield stack.enter_context(io.TextIOWrapper(reader, encoding="utf-8"))
+            return
+        yield stack.enter_context(path.open(encoding="utf-8"))
+
+
+@contextmanager
+def open_manifest_writer(
+    path: Path,
+    compression: ManifestCompression,
+    *,
+    buffering: int = -1,
+) -> Generator[IO[str]]:
+    """Open ``path`` for streaming text writes through ``compression``.
+
+    Args:
+        path: Destination file; it is created or truncated.
+        compression: Format to write.
+        buffering: Buffer size for the underlying file.
+
+    Yields:
+        Text stream whose output is compressed as it is written.
+    """
+    with ExitStack() as stack:
+        if compression is ManifestCompression.NONE:
+            yield stack.enter_context(path.open("w", encoding="utf-8", buffering=buffering))
+            return
+        raw = stack.enter_context(path.open("wb", buffering=buffering))
+        if compression is ManifestCompression.GZIP:
+            # mtime=0 keeps identical manifests byte-identical once compressed.
+            gzipped = stack.enter_context(
+                gzip.GzipFile(filename="", mode="wb", fileobj=raw, compresslevel=GZIP_LEVEL, mtime=0),
+            )
+            yield stack.enter_context(io.TextIOWrapper(gzipped, encoding="utf-8"))
+            return
+        compressed = stack.enter_context(_zstandard().ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw))
+        yield stack.enter_context(io.TextIOWrapper(compressed, encoding="utf-8"))
+
+
+def read_manifest_json(path: Path) -> object:
+    """Parse a plain or compressed manifest file.
+
+    Args:
+        path: Manifest file to load.
+
+    Returns:
+        Decoded JSON payload.
+    """
+    with open_manifest_reader(path) as handle:
+        return cast("object", json.load(handle))
+
+
+__all__ = [
+    "GZIP_MAGIC",
+    "ZSTD_MAGIC",
+    "ManifestCompressionUnavailableError",
+    "compression_for_path",
+    "detect_compression",
+    "open_manifest_reader",
+    "open_manifest_writer",
+    "read_manifest_json",
+]
@@ -0,0 +1,558 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Byte-offset index for lazily reading large manifests.
+
+The first time a manifest is opened through `ManifestIndex` it is scanned
+once and a sidecar index (``.<manifest name>.index``) is written next to it.
+The index records the byte span of every run, of each top-level section of a
+run, and of every per-file entry, together with the per-file severity totals
+and rule counts that summaries need. Later readers seek straight to the spans
+they need instead of parsing (and validating) the whole document.
+
+Only plain JSON manifests can be indexed; compressed manifests cannot be
+seeked and are read in full by the regular loaders.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, BinaryIO, Final, TypeAlias, cast
+
+from ratchetr.config.validation import coerce_int
+from ratchetr.core.model_types import LogComponent, ManifestCompression
+from ratchetr.core.type_aliases import RunId
+from ratchetr.logging import structured_extra
+
+from .compression import detect_compression
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Iterable, Mapping
+    from pathlib import Path
+
+    from ratchetr.json import JSONValue
+
+logger: logging.Logger = logging.getLogger("ratchetr.manifest.index")
+
+INDEX_VERSION: Final[int] = 1
+PER_FILE_KEY: Final[str] = "perFile"
+_WHITESPACE: Final[re.Pattern[str]] = re.compile(r"[ \t\n\r]*")
+
+Span: TypeAlias = tuple[int, int]
+# (start, end, errors, warnings, information, rule counts) of one perFile entry.
+FileIndexRow: TypeAlias = tuple[int, int, int, int, int, dict[str, int]]
+
+
+class _UnindexableManifestError(ValueError):
+    """Raised while scanning when the manifest does not have the expected shape."""
+
+
+def count_diagnostic_rules(diagnostics: object) -> Counter[str]:
+    """Count diagnostics per rule code.
+
+    Args:
+        diagnostics: ``diagnostics`` list of a per-file manifest entry.
+
+    Returns:
+        Counter of non-empty rule codes.
+    """
+    counts: Counter[str] = Counter()
+    if not isinstance(diagnostics, list):
+        return counts
+    for diagnostic in cast("list[object]", diagnostics):
+        if not isinstance(diagnostic, dict):
+            continue
+        code = cast("dict[str, object]", diagnostic).get("code")
+        rule = code.strip() if isinstance(code, str) else ""
+        if rule:
+            counts[rule] += 1
+    return counts
+
+
+@dataclass(slots=True, frozen=True)
+class IndexedRun:
+    """Location of one run inside an indexed manifest.
+
+    Attributes:
+        run_id: ``tool:mode`` identifier of the run.
+        span: Byte span of the run object.
+        sections: Byte span of each top-level member of the run.
+        files: Per-file rows keyed by path.
+    """
+
+    run_id: RunId
+    span: Span
+    sections: dict[str, Span]
+    files: dict[str, FileIndexRow]
+
+
+@dataclass(slots=True, frozen=True)
+class ManifestIndex:
+    """Offset index over a plain JSON manifest.
+
+    Attributes:
+        path: Indexed manifest file.
+        metadata: Top-level manifest members other than ``runs``.
+        runs: Indexed runs in manifest order.
+    """
+
+    path: Path
+    metadata: dict[str, JSONValue]
+    runs: tuple[IndexedRun, ...]
+
+    @classmethod
+    def open(cls, path: Path, *, cache: bool = True) -> ManifestIndex | None:
+        """Return the index for ``path``, building and caching it when stale.
+
+        Args:
+            path: Manifest file.
+            cache: Whether to read and write the sidecar index file.
+
+        Returns:
+            `ManifestIndex`, or `None` when the manifest is compressed or does
+            not have the shape of a manifest (callers then fall back to the
+            validating loaders).
+        """
+        stat = path.stat()
+        index_path = index_path_for(path)
+        if cache:
+            cached = _read_cached(path, index_path, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            if cached is not None:
+                return cached
+        if detect_compression(path) is not ManifestCompression.NONE:
+            return None
+        try:
+            payload = _scan_manifest(path.read_bytes())
+        except ValueError as exc:
+            logger.debug(
+                "Manifest %s cannot be indexed: %s",
+                path,
+                exc,
+                extra=structured_extra(component=LogComponent.MANIFEST, path=path),
+            )
+            return None
+        payload.update({"version": INDEX_VERSION, "size": stat.st_size, "mtimeNs": stat.st_mtime_ns})
+        if cache:
+            _write_cached(index_path, payload)
+        return _from_payload(path, payload)
+
+    def select(self, run_ids: Collection[str] | None = None) -> list[IndexedRun]:
+        """Return the indexed runs whose identifier is in ``run_ids``.
+
+        Args:
+            run_ids: Run identifiers to keep; `None` keeps every run.
+
+        Returns:
+            Matching runs in manifest order.
+        """
+        if run_ids is None:
+            return list(self.runs)
+        wanted = {str(run_id).strip() for run_id in run_ids}
+        return [run for run in self.runs if run.run_id in wanted]
+
+    def read_run(self, run: IndexedRun, *, per_file: bool = True) -> dict[str, JSONValue]:
+        """Parse one run from the manifest.
+
+        Args:
+            run: Run returned by this index.
+            per_file: Whether to parse the (usually dominant) ``perFile`` list.
+
+        Returns:
+            Run payload; without ``perFile`` when ``per_file`` is `False`.
+        """
+        with self.path.open("rb") as handle:
+            if per_file:
+                return cast("dict[str, JSONValue]", _read_span(handle, run.span))
+            return {
+                key: cast("JSONValue", _read_span(handle, span))
+                for key, span in run.sections.items()
+                if key != PER_FILE_KEY
+            }
+
+    def read_file(self, run: IndexedRun, path: str) -> dict[str, JSONValue] | None:
+        """Parse the per-file entry of ``path`` in ``run``.
+
+        Args:
+            run: Run returned by this index.
+            path: Project-relative file path as recorded in the manifest.
+
+        Returns:
+            Per-file payload, or `None` when the run has no entry for ``path``.
+        """
+        row = run.files.get(path)
+        if row is None:
+            return None
+        with self.path.open("rb") as handle:
+            return cast("dict[str, JSONValue]", _read_span(handle, (row[0], row[1])))
+
+    def files_for_rule(self, rule: str) -> list[tuple[RunId, str, int]]:
+        """Return every file reporting ``rule`` without reading the manifest.
+
+        Args:
+            rule: Diagnostic rule code.
+
+        Returns:
+            ``(run id, path, count)`` tuples in manifest order.
+        """
+        return [
+            (run.run_id, path, row[5][rule]) for run in self.runs for path, row in run.files.items() if rule in row[5]
+        ]
+
+    def read_manifest(self, run_ids: Collection[str] | None = None) -> dict[str, JSONValue]:
+        """Assemble a manifest payload containing only the selected runs.
+
+        Args:
+            run_ids: Run identifiers to include; `None` includes every run.
+
+        Returns:
+            Manifest payload (metadata plus the selected runs, parsed in full).
+        """
+        runs: list[JSONValue] = []
+        with self.path.open("rb") as handle:
+            runs.extend(cast("JSONValue", _read_span(handle, run.span)) for run in self.select(run_ids))
+        return {**self.metadata, "runs": runs}
+
+
+def index_path_for(path: Path) -> Path:
+    """Return the sidecar index location for a manifest.
+
+    Args:
+        path: Manifest file.
+
+    Returns:
+        Hidden ``.<name>.index`` sibling of ``path``.
+    """
+    return path.with_name(f".{path.name}.index")
+
+
+def _read_span(handle: BinaryIO, span: Span) -> object:
+    _ = handle.seek(span[0])
+    return cast("object", json.loads(handle.read(span[1] - span[0])))
+
+
+def _read_cached(path: Path, index_path: Path, *, size: int, mtime_ns: int) -> ManifestIndex | None:
+    try:
+        payload = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    data = cast("dict[str, object]", payload)
+    if data.get("version") != INDEX_VERSION or data.get("size") != size or data.get("mtimeNs") != mtime_ns:
+        return None
+    try:
+        return _from_payload(path, data)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _write_cached(index_path: Path, payload: Mapping[str, object]) -> None:
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    try:
+        _ = tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        _ = tmp_path.replace(index_path)
+    except OSError as exc:
+        tmp_path.unlink(missing_ok=True)
+        logger.debug(
+            "Cannot cache manifest index %s: %s",
+            index_path,
+            exc,
+            extra=structured_extra(component=LogComponent.MANIFEST, path=index_path),
+        )
+
+
+def _from_payload(path: Path, payload: Mapping[str, object]) -> ManifestIndex:
+    runs: list[IndexedRun] = []
+    for raw_run in cast("list[dict[str, object]]", payload["runs"]):
+        start, end = cast("list[int]", raw_run["span"])
+        sections = {
+            key: (value[0], value[1]) for key, value in cast("dict[str, list[int]]", raw_run["sections"]).items()
+        }
+        files = {
+            str(row[0]): (row[1], row[2], row[3], row[4], row[5], row[6])
+            for row in cast("list[tuple[str, int, int, int, int, int, dict[str, int]]]", raw_run["files"])
+        }
+        runs.append(IndexedRun(run_id=RunId(str(raw_run["id"])), span=(start, end), sections=sections, files=files))
+    return ManifestIndex(
+        path=path,
+        metadata=cast("dict[str, JSONValue]", payload["metadata"]),
+        runs=tuple(runs),
+    )
+
+
+class _Scanner:
+    """Walks a manifest with ``JSONDecoder.raw_decode``, recording offsets."""
+
+    def __init__(self, text: str) -> None:
+        super().__init__()
+        self.text = text
+        self._decode = json.JSONDecoder().raw_decode
+        self.positions: list[int] = []
+
+    def skip(self, pos: int) -> int:
+        """Skip whitespace.
+
+        Args:
+            pos: Offset to start from.
+
+        Returns:
+            Offset of the next non-whitespace character.
+        """
+        match = _WHITESPACE.match(self.text, pos)
+        return match.end() if match else pos
+
+    def expect(self, pos: int, char: str) -> int:
+        """Consume ``char`` after any whitespace.
+
+        Args:
+            pos: Offset to start from.
+            char: Structural character that must come next.
+
+        Returns:
+            Offset just past ``char``.
+
+        Raises:
+            _UnindexableManifestError: If a different character comes next.
+        """
+        pos = self.skip(pos)
+        if self.text[pos : pos + 1] != char:
+            msg = f"expected {char!r} at offset {pos}"
+            raise _UnindexableManifestError(msg)
+        return pos + 1
+
+    def value(self, pos: int) -> tuple[object, int]:
+        """Decode the JSON value at ``pos``.
+
+        Args:
+            pos: Offset to start from.
+
+        Returns:
+            The decoded value and the offset just past it.
+        """
+        return cast("tuple[object, int]", self._decode(self.text, self.skip(pos)))
+
+    def walk_object(self, pos: int, on_member: Callable[[str, int], int]) -> int:
+        """Walk the members of the object at ``pos``.
+
+        Args:
+            pos: Offset of the object.
+            on_member: Receives each key and the offset of its value and
+                returns the offset just past the value.
+
+        Returns:
+            Offset just past the closing brace.
+
+        Raises:
+            _UnindexableManifestError: If a key is not a string.
+        """
+        pos = self.skip(self.expect(pos, "{"))
+        if self.text[pos : pos + 1] == "}":
+            return pos + 1
+        while True:
+            key, pos = self.value(pos)
+            if not isinstance(key, str):
+                msg = f"expected an object key at offset {pos}"
+                raise _UnindexableManifestError(msg)
+            pos = self.skip(self.expect(pos, ":"))
+            pos = self.skip(on_member(key, pos))
+            if self.text[pos : pos + 1] == "}":
+                return pos + 1
+            pos = self.expect(pos, ",")
+
+    def walk_array(self, pos: int, on_item: Callable[[int], int]) -> int:
+        """Walk the items of the array at ``pos``.
+
+        Args:
+            pos: Offset of the array.
+            on_item: Receives the offset of each item and returns the offset
+                just past it.
+
+        Returns:
+            Offset just past the closing bracket.
+        """
+        pos = self.skip(self.expect(pos, "["))
+        if self.text[pos : pos + 1] == "]":
+            return pos + 1
+        while True:
+            pos = self.skip(on_item(self.skip(pos)))
+            if self.text[pos : pos + 1] == "]":
+                return pos + 1
+            pos = self.expect(pos, ",")
+
+    def span(self, start: int, end: int) -> list[int]:
+        """Record a span so it can be converted to byte offsets later.
+
+        Args:
+            start: Offset where the span starts.
+            end: Offset just past the span.
+
+        Returns:
+            The ``[start, end]`` pair stored in the index.
+        """
+        self.positions.extend((start, end))
+        return [start, end]
+
+
+def _scan_run(scanner: _Scanner, start: int) -> tuple[dict[str, object], int]:
+    """Index one run object.
+
+    Args:
+        scanner: Scanner over the manifest text.
+        start: Offset of the run object.
+
+    Returns:
+        The run's index entry and the offset just past the run.
+    """
+    run: dict[str, object] = {}
+    sections: dict[str, list[int]] = {}
+    files: list[list[object]] = []
+
+    def on_file(entry_start: int) -> int:
+        """Record one per-file entry.
+
+        Args:
+            entry_start: Offset of the entry.
+
+        Returns:
+            Offset just past the entry.
+
+        Raises:
+            _UnindexableManifestError: If the entry is not an object.
+        """
+        entry, end = scanner.value(entry_start)
+        if not isinstance(entry, dict):
+            msg = f"per-file entry at offset {entry_start} is not an object"
+            raise _UnindexableManifestError(msg)
+        data = cast("dict[str, object]", entry)
+        path = data.get("path")
+        if isinstance(path, str) and path:
+            counts = [coerce_int(data.get(key)) for key in ("errors", "warnings", "information")]
+            files.append([
+                path,
+                *scanner.span(entry_start, end),
+                *counts,
+                count_diagnostic_rules(data.get("diagnostics")),
+            ])
+        return end
+
+    def on_member(key: str, value_start: int) -> int:
+        """Record the span of one run section.
+
+        Args:
+            key: Section name.
+            value_start: Offset of the section value.
+
+        Returns:
+            Offset just past the section value.
+        """
+        if key == PER_FILE_KEY and scanner.text[value_start : value_start + 1] == "[":
+            end = scanner.walk_array(value_start, on_file)
+        else:
+            value, end = scanner.value(value_start)
+            if key in {"tool", "mode"}:
+                run[key] = value
+        sections[key] = scanner.span(value_start, end)
+        return end
+
+    end = scanner.walk_object(start, on_member)
+    tool, mode = run.get("tool"), run.get("mode")
+    run_id = f"{tool}:{mode}" if isinstance(tool, str) and isinstance(mode, str) else ""
+    return {"id": run_id, "span": scanner.span(start, end), "sections": sections, "files": files}, end
+
+
+def _scan_manifest(raw: bytes) -> dict[str, object]:
+    """Build the index payload for a plain JSON manifest.
+
+    Args:
+        raw: Manifest bytes.
+
+    Returns:
+        Top-level metadata and the indexed runs.
+
+    Raises:
+        _UnindexableManifestError: If trailing data follows the manifest object.
+    """
+    text = raw.decode("utf-8")
+    scanner = _Scanner(text)
+    metadata: dict[str, object] = {}
+    runs: list[dict[str, object]] = []
+
+    def on_run(start: int) -> int:
+        """Index one run.
+
+        Args:
+            start: Offset of the run object.
+
+        Returns:
+            Offset just past the run.
+        """
+        run, end = _scan_run(scanner, start)
+        runs.append(run)
+        return end
+
+    def on_member(key: str, value_start: int) -> int:
+        """Collect one top-level member, walking ``runs`` in place.
+
+        Args:
+            key: Member name.
+            value_start: Offset of the member value.
+
+        Returns:
+            Offset just past the member value.
+        """
+        if key == "runs":
+            return scanner.walk_array(value_start, on_run)
+        value, end = scanner.value(value_start)
+        metadata[key] = value
+        return end
+
+    if scanner.skip(scanner.walk_object(0, on_member)) != len(text):
+        msg = "trailing data after the manifest object"
+        raise _UnindexableManifestError(msg)
+    if not text.isascii():
+        _to_byte_offsets(text, scanner.positions, runs)
+    return {"metadata": metadata, "runs": runs}
+
+
+def _to_byte_offsets(text: str, positions: Iterable[int], runs: list[dict[str, object]]) -> None:
+    # Offsets were recorded as character positions; convert them in one
+    # forward pass so non-ASCII manifests still seek to the right bytes.
+    mapping: dict[int, int] = {}
+    previous_char = previous_byte = 0
+    for position in sorted(set(positions)):
+        previous_byte += len(text[previous_char:position].encode("utf-8"))
+        previous_char = position
+        mapping[position] = previous_byte
+    for run in runs:
+        span = cast("list[int]", run["span"])
+        span[:] = [mapping[span[0]], mapping[span[1]]]
+        for section in cast("dict[str, list[int]]", run["sections"]).values():
+            section[:] = [mapping[section[0]], mapping[section[1]]]
+        for row in cast("list[list[object]]", run["files"]):
+            row[1:3] = [mapping[cast("int", row[1])], mapping[cast("int", row[2])]]
+
+
+__all__ = [
+    "INDEX_VERSION",
+    "FileIndexRow",
+    "IndexedRun",
+    "ManifestIndex",
+    "count_diagnostic_rules",
+    "index_path_for",
+]
@@ -20,7 +20,7 @@ sources (typically JSON files) and validating them against the manifest schema.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from .models import validate_manifest_payload
 
@@ -30,13 +30,17 @@ if TYPE_CHECKING:
 
 # ignore JUSTIFIED: raw manifest payloads come from untyped JSON and are validated
 # into ManifestData by this function
-def load_manifest_data(raw: Any) -> ManifestData:  # noqa: ANN401
+def load_manifest_data(raw: Any, *, validate: bool = True) -> ManifestData:  # noqa: ANN401
     """Parse manifest payloads using strict validation.
 
     Args:
         raw: Raw manifest data from any source (typically parsed JSON).
+        validate: Whether to validate ``raw``; pass `False` only for payloads
+            ratchetr wrote itself (see `ratchetr.manifest.trust`).
 
     Returns:
         Validated ManifestData TypedDict.
     """
+    if not validate:
+        return cast("ManifestData", raw)
     return validate_manifest_payload(raw)
@@ -163,6 +163,7 @@ class FileDiagnosticModel(BaseModel):
         severity: Severity level (error, warning, or information).
         code: Optional diagnostic code (e.g., "attr-defined").
         message: Human-readable diagnostic message.
+        raw: Optional tool-native payload (only with `raw_retention = "full"`).
     """
 
     model_config: ClassVar[ConfigDict] = STRICT_MODEL_CONFIG
@@ -172,6 +173,7 @@ class FileDiagnosticModel(BaseModel):
     severity: SeverityLevel
     code: str | None = None
     message: str
+    raw: dict[str, JSONValue] | None = None
 
 
 class FileEntryModel(BaseModel):
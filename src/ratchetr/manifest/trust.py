@@ -0,0 +1,163 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Write stamps that let ratchetr skip re-validating the manifests it wrote.
+
+`ManifestBuilder.write` records a stamp (``.<manifest name>.stamp``) next to
+the manifest it writes. The stamp holds the file size, a BLAKE2 digest of the
+file's bytes, and the ratchetr and schema versions that produced it. In
+`ManifestValidation.FAST` mode, loaders skip model validation when the stamp
+still matches the file. Edited, replaced, or foreign manifests are validated
+in full. Hashing the file is much cheaper than validating large manifests.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from typing import TYPE_CHECKING, Final, cast
+
+from ratchetr._version import __version__
+from ratchetr.core.model_types import LogComponent, ManifestValidation
+from ratchetr.logging import structured_extra
+
+from .versioning import CURRENT_MANIFEST_VERSION
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger: logging.Logger = logging.getLogger("ratchetr.manifest.trust")
+
+STAMP_VERSION: Final[int] = 1
+_DIGEST_CHUNK_SIZE: Final[int] = 1024 * 1024
+
+
+def stamp_path_for(path: Path) -> Path:
+    """Return the write stamp location for a manifest.
+
+    Args:
+        path: Manifest file.
+
+    Returns:
+        Hidden ``.<name>.stamp`` sibling of ``path``.
+    """
+    return path.with_name(f".{path.name}.stamp")
+
+
+def manifest_file_digest(path: Path) -> str:
+    """Return the BLAKE2 digest of a manifest file's bytes (compressed or not).
+
+    Args:
+        path: Manifest file.
+
+    Returns:
+        Hex digest of the file contents.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb", buffering=0) as handle:
+        while chunk := handle.read(_DIGEST_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stamp_manifest(path: Path) -> None:
+    """Record that ``path`` was written by this ratchetr version.
+
+    Failures are logged and ignored; an unstamped manifest is simply validated
+    the next time it is loaded.
+
+    Args:
+        path: Manifest file that ratchetr has just written.
+    """
+    stamp_path = stamp_path_for(path)
+    tmp_path = stamp_path.with_name(f"{stamp_path.name}.{os.getpid()}.tmp")
+    try:
+        payload = {
+            "version": STAMP_VERSION,
+            "ratchetrVersion": __version__,
+            "schemaVersion": CURRENT_MANIFEST_VERSION,
+            "size": path.stat().st_size,
+            "digest": manifest_file_digest(path),
+        }
+        _ = tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        _ = tmp_path.replace(stamp_path)
+    except OSError as exc:
+        tmp_path.unlink(missing_ok=True)
+        logger.debug(
+            "Cannot stamp manifest %s: %s",
+            path,
+            exc,
+            extra=structured_extra(component=LogComponent.MANIFEST, path=path),
+        )
+
+
+def is_trusted_manifest(path: Path) -> bool:
+    """Return whether ``path`` still matches the stamp ratchetr wrote for it.
+
+    Args:
+        path: Manifest file.
+
+    Returns:
+        `True` when the stamp was written by this ratchetr version for the
+        current schema and the file's size and digest are unchanged.
+    """
+    try:
+        payload = json.loads(stamp_path_for(path).read_text(encoding="utf-8"))
+        size = path.stat().st_size
+    except (OSError, ValueError):
+        return False
+    if not isinstance(payload, dict):
+        return False
+    stamp = cast("dict[str, object]", payload)
+    if (
+        stamp.get("version") != STAMP_VERSION
+        or stamp.get("ratchetrVersion") != __version__
+        or stamp.get("schemaVersion") != CURRENT_MANIFEST_VERSION
+        or stamp.get("size") != size
+    ):
+        return False
+    try:
+        return stamp.get("digest") == manifest_file_digest(path)
+    except OSError:
+        return False
+
+
+def needs_validation(path: Path, validation: ManifestValidation) -> bool:
+    """Return whether a manifest loaded from ``path`` must be validated.
+
+    Args:
+        path: Manifest file.
+        validation: Requested validation level.
+
+    Returns:
+        `False` for `ManifestValidation.OFF` and for trusted manifests under
+        `ManifestValidation.FAST`; `True` otherwise.
+    """
+    if validation is ManifestValidation.OFF:
+        return False
+    if validation is ManifestValidation.FULL:
+        return True
+    return not is_trusted_manifest(path)
+
+
+__all__ = [
+    "STAMP_VERSION",
+    "is_trusted_manifest",
+    "manifest_file_digest",
+    "needs_validation",
+    "stamp_manifest",
+    "stamp_path_for",
+]
@@ -28,10 +28,11 @@ from ratchetr.compat import TypedDict
 if TYPE_CHECKING:
     from ratchetr.core.model_types import CategoryMapping, Mode, OverrideEntry, SeverityLevel
     from ratchetr.core.type_aliases import CategoryKey, Command, RelPath
+    from ratchetr.json import JSONValue
 
 
-class FileDiagnostic(TypedDict):
-    """A single diagnostic message within a file.
+class FileDiagnosticRequired(TypedDict):
+    """Required fields for a single diagnostic message within a file.
 
     Attributes:
         line: Line number where the diagnostic occurs (1-indexed).
@@ -48,6 +49,18 @@ class FileDiagnostic(TypedDict):
     message: str
 
 
+class FileDiagnostic(FileDiagnosticRequired, total=False):
+    """A single diagnostic message within a file.
+
+    Inherits all required fields from FileDiagnosticRequired.
+
+    Attributes:
+        raw: Tool-native payload, present only with `raw_retention = "full"`.
+    """
+
+    raw: dict[str, JSONValue]
+
+
 class FileEntry(TypedDict):
     """File-level diagnostic summary.
 
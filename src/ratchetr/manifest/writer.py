@@ -0,0 +1,140 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming JSON writer for manifests.
+
+The manifest is written container by container down to the per-file entries,
+so only one entry is ever serialised in memory at a time. Keys and values are
+normalised with `normalise_enums_for_json` one entry at a time instead of
+deep-copying the manifest first, so the indented output is byte-for-byte
+identical to ``json.dumps(normalise_enums_for_json(data), indent=2)``.
+Compressed manifests are encoded through the same stream.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from enum import Enum
+from typing import IO, TYPE_CHECKING, Final, cast
+
+from ratchetr.json import normalise_enums_for_json
+from ratchetr.runtime import consume
+
+from .compression import compression_for_path, open_manifest_writer
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ratchetr.core.model_types import ManifestCompression
+
+    from .typed import ManifestData
+
+MANIFEST_INDENT: Final[int] = 2
+# Containers nested up to this depth are streamed; the manifest object (0),
+# its runs list (1), each run (2), and each run's perFile/perFolder lists (3).
+STREAM_DEPTH: Final[int] = 3
+_BUFFER_SIZE: Final[int] = 1024 * 1024
+
+
+def _json_key(key: object) -> str:
+    if isinstance(key, Enum):
+        return str(key.value)
+    return key if isinstance(key, str) else str(key)
+
+
+class _StreamEncoder:
+    def __init__(self, handle: IO[str], *, compact: bool) -> None:
+        super().__init__()
+        self._handle = handle
+        self._indent = None if compact else MANIFEST_INDENT
+        self._key_separator = ":" if compact else ": "
+        self._encoder = json.JSONEncoder(indent=self._indent, separators=(",", self._key_separator))
+
+    def _newline(self, level: int) -> str:
+        if self._indent is None:
+            return ""
+        return "\n" + " " * (self._indent * level)
+
+    def _write_leaf(self, value: object, level: int) -> None:
+        # Leaves are small (one per-file entry at most), so normalising a copy
+        # keeps enum, None/bool, and non-JSON keys and values as before.
+        text = self._encoder.encode(normalise_enums_for_json(value))
+        if self._indent is not None and level:
+            # JSON strings never contain raw newlines, so re-indenting is safe.
+            text = text.replace("\n", self._newline(level))
+        consume(self._handle.write(text))
+
+    def write(self, value: object, level: int = 0) -> None:
+        """Encode ``value``, streaming containers nested up to `STREAM_DEPTH`.
+
+        Args:
+            value: JSON-compatible value to write.
+            level: Nesting depth of ``value`` within the manifest.
+        """
+        if level > STREAM_DEPTH or not isinstance(value, (dict, list, tuple)):
+            self._write_leaf(value, level)
+            return
+        container = cast("dict[object, object] | list[object] | tuple[object, ...]", value)
+        if not container:
+            self._write_leaf(container, level)
+            return
+        inner = self._newline(level + 1)
+        if isinstance(container, dict):
+            consume(self._handle.write("{"))
+            for index, (key, item) in enumerate(container.items()):
+                prefix = "," if index else ""
+                consume(self._handle.write(f"{prefix}{inner}{json.dumps(_json_key(key))}{self._key_separator}"))
+                self.write(item, level + 1)
+            consume(self._handle.write(f"{self._newline(level)}}}"))
+            return
+        consume(self._handle.write("["))
+        for index, item in enumerate(container):
+            consume(self._handle.write(f"{',' if index else ''}{inner}"))
+            self.write(item, level + 1)
+        consume(self._handle.write(f"{self._newline(level)}]"))
+
+
+def write_manifest(
+    data: ManifestData,
+    path: Path,
+    *,
+    compact: bool = False,
+    compression: ManifestCompression | None = None,
+) -> None:
+    """Stream ``data`` to ``path`` as JSON.
+
+    The file is written to a temporary sibling and moved into place, so readers
+    never observe a partially written manifest.
+
+    Args:
+        data: Manifest payload; enum keys and values are written as their
+            values and other non-JSON keys and values as their ``str()``.
+        path: Destination file.
+        compact: Omit indentation and whitespace between tokens.
+        compression: Compression format; inferred from the extension of
+            ``path`` (``.gz`` / ``.zst``) when `None`.
+    """
+    resolved = compression if compression is not None else compression_for_path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open_manifest_writer(tmp_path, resolved, buffering=_BUFFER_SIZE) as handle:
+            _StreamEncoder(handle, compact=compact).write(data)
+            consume(handle.write("\n"))
+        consume(tmp_path.replace(path))
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+__all__ = ["MANIFEST_INDENT", "STREAM_DEPTH", "write_manifest"]
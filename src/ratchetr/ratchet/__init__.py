@@ -14,14 +14,21 @@
 
 """Ratchet package public API."""
 
-from .core import (
-    apply_auto_update,
-    build_ratchet_from_manifest,
-    compare_manifest_to_ratchet,
-    refresh_signatures,
-)
-from .io import load_ratchet, write_ratchet
-from .models import RatchetModel, RatchetRunBudgetModel
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ratchetr.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .core import (
+        apply_auto_update,
+        build_ratchet_from_manifest,
+        compare_manifest_to_ratchet,
+        refresh_signatures,
+    )
+    from .io import load_ratchet, write_ratchet
+    from .models import RatchetModel, RatchetRunBudgetModel
 
 __all__ = [
     "RatchetModel",
@@ -33,3 +40,17 @@ __all__ = [
     "refresh_signatures",
     "write_ratchet",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "RatchetModel": ".models",
+        "RatchetRunBudgetModel": ".models",
+        "apply_auto_update": ".core",
+        "build_ratchet_from_manifest": ".core",
+        "compare_manifest_to_ratchet": ".core",
+        "load_ratchet": ".io",
+        "refresh_signatures": ".core",
+        "write_ratchet": ".io",
+    },
+)
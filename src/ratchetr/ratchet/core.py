@@ -27,7 +27,7 @@ from ratchetr.config.validation import coerce_int, coerce_mapping, coerce_object
 from ratchetr.core.categories import coerce_category_key
 from ratchetr.core.model_types import DEFAULT_SEVERITIES, Mode, SeverityLevel
 from ratchetr.core.type_aliases import CategoryKey, RunId, ToolName
-from ratchetr.json import JSONValue, normalise_enums_for_json
+from ratchetr.json import normalise_enums_for_json
 
 from .models import (
     RATCHET_SCHEMA_VERSION,
@@ -40,6 +40,7 @@ from .models import (
 from .summary import RatchetFinding, RatchetReport, RatchetRunReport
 
 if TYPE_CHECKING:
+    from ratchetr.json import JSONValue
     from ratchetr.manifest.typed import ManifestData
 
 
@@ -21,12 +21,17 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from ratchetr.compat import UTC
+from ratchetr.core.model_types import ManifestValidation
 from ratchetr.json import normalise_enums_for_json
+from ratchetr.manifest.compression import read_manifest_json
+from ratchetr.manifest.index import ManifestIndex
 from ratchetr.manifest.loader import load_manifest_data
+from ratchetr.manifest.trust import needs_validation
 
 from .models import RatchetModel
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
     from pathlib import Path
 
     from ratchetr.manifest.typed import ManifestData
@@ -62,17 +67,27 @@ def write_ratchet(path: Path, model: RatchetModel) -> None:
     _ = path.write_text(json.dumps(payload_json, indent=2) + "\n", encoding="utf-8")
 
 
-def load_manifest(path: Path) -> ManifestData:
+def load_manifest(
+    path: Path,
+    *,
+    runs: Collection[str] | None = None,
+    validation: ManifestValidation = ManifestValidation.FAST,
+) -> ManifestData:
     """Load and validate a manifest file.
 
     Args:
-        path: Location of the manifest JSON file.
+        path: Location of the manifest JSON file (plain, gzip, or zstd).
+        runs: When given, only these runs are read (through the manifest's
+            offset index) and validated; other runs are left out of the result.
+        validation: Validation level; `FAST` skips validating manifests whose
+            ratchetr write stamp still matches.
 
     Returns:
         `ManifestData`mapping ready for downstream processing.
     """
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    return load_manifest_data(payload)
+    index = ManifestIndex.open(path) if runs else None
+    payload = index.read_manifest(runs) if index is not None else read_manifest_json(path)
+    return load_manifest_data(payload, validate=needs_validation(path, validation))
 
 
 def write_text(path: Path, content: str) -> None:
@@ -16,6 +16,8 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from ratchetr._internal.utils import (
     ROOT_MARKERS,
     CommandOutput,
@@ -26,9 +28,9 @@ from ratchetr._internal.utils import (
     python_executable,
     resolve_project_root,
     run_command,
+    stream_command,
 )
 from ratchetr.json import (
-    JSONValue,
     as_int,
     as_list,
     as_mapping,
@@ -36,12 +38,22 @@ from ratchetr.json import (
     normalise_enums_for_json,
     require_json,
 )
+from ratchetr.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ratchetr._internal.daemons import DaemonRecord, DaemonRegistry
+    from ratchetr._internal.watch import ChangeJournal, WatchState, watch_project
+    from ratchetr.json import JSONValue
 
 __all__ = [
     "ROOT_MARKERS",
+    "ChangeJournal",
     "CommandOutput",
+    "DaemonRecord",
+    "DaemonRegistry",
     "JSONValue",
     "RootMarker",
+    "WatchState",
     "as_int",
     "as_list",
     "as_mapping",
@@ -54,4 +66,20 @@ __all__ = [
     "require_json",
     "resolve_project_root",
     "run_command",
+    "stream_command",
+    "watch_project",
 ]
+
+# The daemon registry and the inotify watcher (ctypes, select) are only needed
+# by the commands that use them, so they load on first access.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ChangeJournal": "ratchetr._internal.watch",
+        "DaemonRecord": "ratchetr._internal.daemons",
+        "DaemonRegistry": "ratchetr._internal.daemons",
+        "JSONValue": "ratchetr.json",
+        "WatchState": "ratchetr._internal.watch",
+        "watch_project": "ratchetr._internal.watch",
+    },
+)
@@ -25,16 +25,20 @@ import json
 import logging
 from typing import TYPE_CHECKING
 
-from ratchetr.core.model_types import DashboardFormat, DashboardView, LogComponent
-from ratchetr.dashboard import build_summary, load_manifest, render_markdown
+from ratchetr.core.model_types import DashboardFormat, DashboardView, LogComponent, ManifestValidation
+from ratchetr.dashboard import build_summary, build_summary_from_index, load_manifest, render_markdown
 from ratchetr.dashboard.render_html import render_html
-from ratchetr.json import JSONValue, normalise_enums_for_json
+from ratchetr.json import normalise_enums_for_json
 from ratchetr.logging import structured_extra
+from ratchetr.manifest.index import ManifestIndex
+from ratchetr.manifest.trust import is_trusted_manifest, needs_validation
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     from ratchetr.core.summary_types import SummaryData
+    from ratchetr.dashboard.cache import SummaryCache
+    from ratchetr.json import JSONValue
 
 logger: logging.Logger = logging.getLogger("ratchetr.services.dashboard")
 
@@ -48,17 +52,54 @@ def _ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def load_summary_from_manifest(manifest_path: Path) -> SummaryData:
+def load_summary_from_manifest(
+    manifest_path: Path,
+    *,
+    indexed: bool = False,
+    cache: SummaryCache | None = None,
+    validation: ManifestValidation = ManifestValidation.FAST,
+) -> SummaryData:
     """Load a manifest file and build a dashboard summary from it.
 
+    Only summaries of validated or ratchetr-written (trusted) manifests are
+    cached, so a cache hit for the manifest's current contents needs no
+    further validation: it is served without re-validating or re-hashing the
+    manifest (its cache key is remembered against its size and modification
+    time). On a miss, manifests that need validation at the requested level
+    are parsed and validated in full before anything else, so neither the
+    offset index nor the summary cache can mask an invalid manifest.
+    ``ManifestValidation.FULL`` always validates.
+
     Args:
         manifest_path: Filesystem path to the manifest JSON file.
+        indexed: Build the summary from the manifest's offset index (created
+            and cached on first use) instead of parsing the whole manifest.
+            Compressed manifests are always read in full.
+        cache: Optional summary cache; an unchanged manifest is then only
+            validated and summarised once.
+        validation: Manifest validation level.
 
     Returns:
         Structured summary data suitable for dashboard rendering.
     """
-    manifest = load_manifest(manifest_path)
-    summary = build_summary(manifest)
+    cached = None if validation is ManifestValidation.FULL else _cached_summary(manifest_path, cache)
+    if cached is not None:
+        summary = cached
+    elif needs_validation(manifest_path, validation):
+        summary = build_summary(load_manifest(manifest_path, validation=ManifestValidation.FULL))
+        if cache is not None:
+            cache.store(manifest_path, summary)
+    else:
+        index = ManifestIndex.open(manifest_path) if indexed else None
+        summary = (
+            build_summary_from_index(index)
+            if index is not None
+            else build_summary(load_manifest(manifest_path, validation=ManifestValidation.OFF))
+        )
+        # Without validation only trusted manifests may be cached; under FAST
+        # reaching this branch already proves the manifest is trusted.
+        if cache is not None and (validation is ManifestValidation.FAST or is_trusted_manifest(manifest_path)):
+            cache.store(manifest_path, summary)
     logger.info(
         "Loaded dashboard summary from %s",
         manifest_path,
@@ -67,6 +108,32 @@ def load_summary_from_manifest(manifest_path: Path) -> SummaryData:
     return summary
 
 
+def _cached_summary(manifest_path: Path, cache: SummaryCache | None) -> SummaryData | None:
+    """Return the cached summary of the manifest's current contents, if any.
+
+    Args:
+        manifest_path: Manifest to look up.
+        cache: Summary cache, or `None` when caching is disabled.
+
+    Returns:
+        Cached summary, or `None` on a miss or when the manifest cannot be read.
+    """
+    if cache is None:
+        return None
+    try:
+        key = cache.key_for(manifest_path)
+    except OSError:
+        return None
+    cached = cache.get(key)
+    if cached is not None:
+        logger.debug(
+            "Summary cache hit for %s",
+            manifest_path,
+            extra=structured_extra(component=LogComponent.DASHBOARD, manifest=manifest_path),
+        )
+    return cached
+
+
 def render_dashboard_summary(
     summary: SummaryData,
     *,
@@ -25,11 +25,13 @@ import importlib
 import json
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, cast
 
 from ratchetr.core.model_types import LogComponent
 from ratchetr.error_codes import error_code_for
 from ratchetr.logging import structured_extra
+from ratchetr.manifest.compression import read_manifest_json
 from ratchetr.manifest.models import (
     ManifestValidationError,
     manifest_json_schema,
@@ -37,6 +39,7 @@ from ratchetr.manifest.models import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
     from ratchetr.json import JSONValue
@@ -88,13 +91,16 @@ class ManifestValidationResult:
 def load_manifest_json(path: Path) -> dict[str, object]:
     """Load and parse a manifest JSON file from disk.
 
+    gzip and zstd manifests are detected from their magic bytes and
+    decompressed while parsing.
+
     Args:
         path: Filesystem path to the manifest JSON file.
 
     Returns:
         Dictionary containing the parsed manifest data.
     """
-    payload = cast("dict[str, object]", json.loads(path.read_text(encoding="utf-8")))
+    payload = cast("dict[str, object]", read_manifest_json(path))
     logger.debug(
         "Loaded manifest JSON from %s",
         path,
@@ -174,6 +180,24 @@ def _validate_payload(payload: dict[str, object]) -> list[ManifestPayloadError]:
     return []
 
 
+@lru_cache(maxsize=8)
+# ignore JUSTIFIED: jsonschema is an optional dependency without type information
+def _schema_validator(validator_cls: Callable[[dict[str, Any]], Any], schema_text: str | None) -> Any | None:  # noqa: ANN401
+    """Return a JSON Schema validator, built once per validator class and schema.
+
+    Args:
+        validator_cls: ``jsonschema.Draft7Validator`` (or a compatible class).
+        schema_text: Custom schema document; `None` selects the built-in schema.
+
+    Returns:
+        Validator for the schema, or `None` when there is no schema.
+    """
+    schema_payload: dict[str, Any] | None = (
+        json.loads(schema_text) if schema_text is not None else manifest_json_schema()
+    )
+    return None if schema_payload is None else validator_cls(schema_payload)
+
+
 def _validate_schema(
     payload: dict[str, object],
     schema_path: Path | None,
@@ -187,13 +211,7 @@ def _validate_schema(
     Returns:
         Tuple of (schema_errors, warnings).
     """
-    schema_payload: dict[str, Any] | None
-    if schema_path is not None:
-        schema_payload = json.loads(schema_path.read_text(encoding="utf-8"))
-    else:
-        schema_payload = manifest_json_schema()
-    if schema_payload is None:
-        return [], []
+    schema_text = schema_path.read_text(encoding="utf-8") if schema_path is not None else None
     warnings: list[str] = []
     try:
         jsonschema_module = importlib.import_module("jsonschema")
@@ -207,7 +225,9 @@ def _validate_schema(
                 extra=structured_extra(component=LogComponent.MANIFEST),
             )
         return [], warnings
-    validator = jsonschema_module.Draft7Validator(schema_payload)
+    validator = _schema_validator(jsonschema_module.Draft7Validator, schema_text)
+    if validator is None:
+        return [], []
     errors = sorted(validator.iter_errors(payload), key=lambda err: err.path)
     schema_errors: list[str] = []
     for err in errors:
@@ -41,6 +41,7 @@ def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line("markers", "property: Property-based tests")
     config.addinivalue_line("markers", "benchmark: Performance benchmark tests")
     config.addinivalue_line("markers", "slow: Slow-running tests")
+    config.addinivalue_line("markers", "large: Benchmarks on large inputs (run only when benchmarks are timed)")
     config.addinivalue_line("markers", "smoke: Smoke tests (fast end-to-end checks)")
     config.addinivalue_line("markers", "e2e: End-to-end workflow tests")
     config.addinivalue_line("markers", "cli: CLI-related tests")
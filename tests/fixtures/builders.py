@@ -43,7 +43,7 @@ from ratchetr.core.summary_types import (
     SummaryTabs,
 )
 from ratchetr.core.type_aliases import CategoryKey, CategoryName, RelPath, RunId, ToolName
-from ratchetr.core.types import Diagnostic, RunResult
+from ratchetr.core.types import Diagnostic, DiagnosticTable, RunResult
 from ratchetr.manifest.versioning import CURRENT_MANIFEST_VERSION
 
 if TYPE_CHECKING:
@@ -521,7 +521,7 @@ class TestDataBuilder:
             command=["pyright", "--strict"],
             exit_code=1,
             duration_ms=1.0,
-            diagnostics=[diagnostic],
+            diagnostics=DiagnosticTable([diagnostic]),
             profile="strict",
             config_file=Path("pyrightconfig.json"),
         )
@@ -599,7 +599,7 @@ class TestDataBuilder:
             command=["pyright"],
             exit_code=0,
             duration_ms=0.0,
-            diagnostics=diagnostics,
+            diagnostics=DiagnosticTable(diagnostics),
             category_mapping={"unknownChecks": ["reportunknown"], "optionalChecks": ["optional"]},
         )
 
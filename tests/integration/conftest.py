@@ -22,7 +22,7 @@ import pytest
 
 from ratchetr.core.model_types import Mode, SeverityLevel
 from ratchetr.core.type_aliases import ToolName
-from ratchetr.core.types import Diagnostic, RunResult
+from ratchetr.core.types import Diagnostic, DiagnosticTable, RunResult
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -54,5 +54,5 @@ def fake_run(tmp_path: Path) -> RunResult:
         command=["stub"],
         exit_code=1,
         duration_ms=1.0,
-        diagnostics=[diag],
+        diagnostics=DiagnosticTable([diag]),
     )
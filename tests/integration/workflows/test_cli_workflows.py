@@ -36,7 +36,8 @@ from ratchetr.core.model_types import (
     SeverityLevel,
 )
 from ratchetr.core.type_aliases import EngineName, RelPath, RunnerName, ToolName
-from ratchetr.core.types import Diagnostic, RunResult
+from ratchetr.core.types import Diagnostic, DiagnosticTable, RunResult
+from ratchetr.manifest.models import ManifestValidationError
 from ratchetr.manifest.versioning import CURRENT_MANIFEST_VERSION
 from tests.fixtures.builders import build_cli_manifest, build_empty_summary
 from tests.fixtures.stubs import StubEngine
@@ -66,7 +67,7 @@ class AuditFullOutputsContext:
 
 
 def _patch_engine_resolution(monkeypatch: pytest.MonkeyPatch, engine: StubEngine) -> None:
-    def _resolve(_: Sequence[str]) -> list[StubEngine]:
+    def _resolve(_: Sequence[str], **_kwargs: object) -> list[StubEngine]:
         return [engine]
 
     monkeypatch.setattr("ratchetr.engines.resolve_engines", _resolve)
@@ -140,7 +141,7 @@ def _arrange_cli_audit_full_outputs(
         command=["pyright", "pkg"],
         exit_code=0,
         duration_ms=1.0,
-        diagnostics=[diag],
+        diagnostics=DiagnosticTable([diag]),
         profile="strict",
         config_file=tmp_path / "pyrightconfig.json",
         plugin_args=["--strict"],
@@ -183,7 +184,7 @@ def _arrange_cli_audit_full_outputs(
 
     monkeypatch.setattr("ratchetr.cli.commands.audit.build_summary", _fake_build_summary)
 
-    def _load_prev_summary(_: Path) -> SummaryData:
+    def _load_prev_summary(_: Path, **_kwargs: object) -> SummaryData:
         return prev_summary
 
     monkeypatch.setattr(
@@ -325,6 +326,33 @@ def test_cli_dashboard_output(tmp_path: Path) -> None:
     assert exit_code == 0
 
 
+def _write_invalid_cli_manifest(tmp_path: Path) -> Path:
+    manifest_path = build_cli_manifest(tmp_path)
+    payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+    payload["unexpected"] = True
+    consume(manifest_path.write_text(json.dumps(payload), encoding="utf-8"))
+    return manifest_path
+
+
+def test_cli_query_validate_full_rejects_invalid_manifest(tmp_path: Path) -> None:
+    manifest_path = _write_invalid_cli_manifest(tmp_path)
+    query = ["query", "overview", "--manifest", str(manifest_path), "--format", "json"]
+
+    assert _run_cli_command([*query, "--validate", "off"]) == 0
+    with pytest.raises(ManifestValidationError):
+        consume(_run_cli_command([*query, "--validate", "full"]))
+
+
+def test_cli_dashboard_validate_full_does_not_read_cached_summary(tmp_path: Path) -> None:
+    consume((tmp_path / "ratchetr.toml").write_text("[audit]\n", encoding="utf-8"))
+    manifest_path = _write_invalid_cli_manifest(tmp_path)
+    dashboard = ["dashboard", "--manifest", str(manifest_path), "--format", "json"]
+
+    assert _run_cli_command([*dashboard, "--validate", "off"]) == 0
+    with pytest.raises(ManifestValidationError):
+        consume(_run_cli_command([*dashboard, "--validate", "full"]))
+
+
 def test_cli_version_flag(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
     monkeypatch.setenv("RATCHETR_LICENSE_KEY", "test")
     exit_code = _run_cli_command(["--version"])
@@ -552,6 +580,8 @@ def test_cli_audit_dry_run(
     assert not manifest_path.exists()
     output = capsys.readouterr().out
     assert "--dry-run enabled" in output
+    assert "[ratchetr] plan: run stub:current" in output
+    assert "[ratchetr] plan: 2 planned, 0 skipped" in output
 
 
 def test_cli_audit_hash_workers_override(
@@ -660,7 +690,7 @@ def test_cli_plugin_arg_validation(monkeypatch: pytest.MonkeyPatch, tmp_path: Pa
             command=["stub"],
             exit_code=0,
             duration_ms=0.0,
-            diagnostics=[],
+            diagnostics=DiagnosticTable(),
         ),
     )
     _patch_engine_resolution(monkeypatch, engine)
@@ -763,11 +793,11 @@ def test_cli_dashboard_outputs(
 
     summary = build_empty_summary()
 
-    def _load_summary(_: Path) -> SummaryData:
+    def _load_summary(_: Path, **_kwargs: object) -> SummaryData:
         return summary
 
     monkeypatch.setattr(
-        "ratchetr.cli.app.load_summary_from_manifest",
+        "ratchetr.cli.commands.dashboard.load_summary_from_manifest",
         _load_summary,
     )
     renderer = _make_dashboard_renderer(
@@ -775,7 +805,7 @@ def test_cli_dashboard_outputs(
         allowed_views={"overview", "engines", "hotspots", "readiness", "runs"},
     )
     monkeypatch.setattr(
-        "ratchetr.cli.app.render_dashboard_summary",
+        "ratchetr.cli.commands.dashboard.render_dashboard_summary",
         renderer,
     )
 
@@ -0,0 +1,91 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Import footprint of ratchetr CLI startup."""
+
+from __future__ import annotations
+
+import json
+
+# ignore JUSTIFIED: the benchmark measures a fresh interpreter in a child process
+import subprocess  # noqa: S404  # nosec B404
+import sys
+import textwrap
+from typing import Final
+
+import pytest
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+# Modules `ratchetr --help` must not import. Asserting on imports rather than
+# timing them keeps the check stable on loaded machines (e.g. under xdist).
+HEAVY_STARTUP_MODULES: Final[tuple[str, ...]] = (
+    "pydantic",
+    "ratchetr._internal.daemons",
+    "ratchetr._internal.watch",
+    "ratchetr.cli.helpers.formatting",
+    "ratchetr.config",
+    "ratchetr.services",
+)
+
+# Runs the CLI entry point in a fresh interpreter and prints the modules it imported.
+_RUN_SCRIPT = textwrap.dedent(
+    """
+    import json
+    import sys
+    from contextlib import redirect_stdout
+    from io import StringIO
+
+    from ratchetr.cli import main
+
+    with redirect_stdout(StringIO()):
+        try:
+            main(sys.argv[1:])
+        except SystemExit:
+            pass
+    print(json.dumps(sorted(sys.modules)))
+    """
+)
+
+
+def _run_cli(*argv: str) -> list[str]:
+    # ignore JUSTIFIED: runs the current interpreter on a fixed in-repo script
+    completed = subprocess.run(  # nosec B603
+        [sys.executable, "-c", _RUN_SCRIPT, *argv],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected_commands"),
+    [
+        (("--help",), []),
+        (("init", "--help"), ["ratchetr.cli.commands.init"]),
+        (("query", "overview", "--help"), ["ratchetr.cli.commands.query"]),
+        (("ratchet", "--help"), ["ratchetr.cli.commands.ratchet"]),
+    ],
+)
+def test_cli_imports_only_the_selected_command(argv: tuple[str, ...], expected_commands: list[str]) -> None:
+    modules = _run_cli(*argv)
+
+    assert [name for name in modules if name.startswith("ratchetr.cli.commands.")] == expected_commands
+
+
+def test_cli_help_skips_heavy_modules() -> None:
+    modules = set(_run_cli("--help"))
+
+    assert modules.isdisjoint(HEAVY_STARTUP_MODULES)
@@ -16,7 +16,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Protocol, cast
 
 import pytest
 
@@ -27,6 +27,8 @@ from tests.fixtures.builders import TestDataBuilder
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from ratchetr.core.types import RunResult
+
 pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
 
 pytest.importorskip("pytest_benchmark")
@@ -48,5 +50,29 @@ def test_compute_readiness_benchmark(benchmark: BenchmarkRunner) -> None:
     benchmark(lambda: compute_readiness(READINESS_SAMPLE))
 
 
-def test_summarise_run_benchmark(benchmark: BenchmarkRunner) -> None:
-    benchmark(lambda: summarise_run(RUN_SAMPLE, max_depth=4))
+@pytest.fixture(
+    scope="module",
+    params=[
+        pytest.param(None, id="sample"),
+        pytest.param(100_000, id="100k"),
+        pytest.param(1_000_000, id="1m", marks=pytest.mark.large),
+    ],
+)
+def summarise_run_sample(request: pytest.FixtureRequest) -> RunResult:
+    diagnostics = cast("int | None", request.param)
+    if diagnostics is None:
+        return RUN_SAMPLE
+    return _TEST_DATA_BUILDER.build_sample_run(num_files=diagnostics // 100, diagnostics_per_file=100)
+
+
+def test_summarise_run_benchmark(benchmark: BenchmarkRunner, summarise_run_sample: RunResult) -> None:
+    benchmark(lambda: summarise_run(summarise_run_sample, max_depth=4))
+
+
+def test_diagnostic_table_group_by_benchmark(benchmark: BenchmarkRunner) -> None:
+    table = _TEST_DATA_BUILDER.build_sample_run(num_files=1_000, diagnostics_per_file=100).diagnostics
+
+    def group() -> object:
+        return table.severity_counts(), table.rule_counts_by_path(), table.counts_by_folder(1)
+
+    benchmark(group)
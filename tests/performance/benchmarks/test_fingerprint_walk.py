@@ -0,0 +1,84 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Walk-time and syscall measurements for the fingerprint traverser."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Protocol
+
+import pytest
+
+from ratchetr._internal.cache import collect_file_hashes
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+pytest.importorskip("pytest_benchmark")
+
+FILE_COUNT = 20_000
+FILES_PER_PACKAGE = 200
+
+
+class BenchmarkRunner(Protocol):
+    """Subset of pytest-benchmark's `benchmark` fixture used here."""
+
+    extra_info: dict[str, object]
+
+    def pedantic(self, target: Callable[[], object], *, rounds: int, iterations: int) -> object:
+        """Run ``target`` a fixed number of times."""
+
+
+@pytest.fixture(scope="module")
+def source_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    root = tmp_path_factory.mktemp("walk")
+    for index in range(FILE_COUNT):
+        package = root / "src" / f"group_{index // (FILES_PER_PACKAGE * 10)}" / f"pkg_{index // FILES_PER_PACKAGE}"
+        package.mkdir(parents=True, exist_ok=True)
+        _ = (package / f"module_{index}.py").write_text(f"value = {index}\n", encoding="utf-8")
+    return root
+
+
+def test_warm_fingerprint_walk(
+    benchmark: BenchmarkRunner,
+    source_tree: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    baseline, _ = collect_file_hashes(source_tree, ["src"], hash_workers=0)
+    lstat_calls = 0
+    original_lstat = os.lstat
+
+    # Path.resolve() issues one lstat per path component; the scandir walk should not.
+    def counting_lstat(path: str | bytes | os.PathLike[str] | os.PathLike[bytes], **kwargs: object) -> os.stat_result:
+        nonlocal lstat_calls
+        lstat_calls += 1
+        return original_lstat(path, **kwargs)
+
+    monkeypatch.setattr(os, "lstat", counting_lstat)
+    hashed: dict[str, int] = {}
+
+    def run() -> None:
+        hashes, _ = collect_file_hashes(source_tree, ["src"], baseline=baseline, hash_workers=0)
+        hashed["files"] = len(hashes)
+
+    _ = benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["files"] = FILE_COUNT
+    benchmark.extra_info["lstat_calls_per_walk"] = lstat_calls // 3
+
+    assert hashed["files"] == FILE_COUNT
+    assert lstat_calls // 3 < FILE_COUNT // 100
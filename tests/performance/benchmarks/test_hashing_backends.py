@@ -0,0 +1,86 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks comparing file hashing backends on synthetic source trees."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+import pytest
+
+from ratchetr._internal.cache import collect_file_hashes
+from ratchetr.core.model_types import HashBackend
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+pytest.importorskip("pytest_benchmark")
+
+FILES_PER_PACKAGE = 500
+HASH_WORKERS = 8
+
+
+class BenchmarkRunner(Protocol):
+    """Subset of pytest-benchmark's `benchmark` fixture used here."""
+
+    extra_info: dict[str, object]
+
+    def pedantic(self, target: Callable[[], object], *, rounds: int, iterations: int) -> object:
+        """Run ``target`` a fixed number of times."""
+
+
+def _build_tree(root: Path, file_count: int) -> Path:
+    body = "".join(f"def func_{index}(value: int) -> int:\n    return value + {index}\n\n" for index in range(20))
+    for index in range(file_count):
+        package = root / "src" / f"pkg_{index // FILES_PER_PACKAGE}"
+        package.mkdir(parents=True, exist_ok=True)
+        _ = (package / f"module_{index}.py").write_text(f"# module {index}\n{body}", encoding="utf-8")
+    return root
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        pytest.param(1_000, id="1k"),
+        pytest.param(10_000, id="10k", marks=pytest.mark.large),
+        pytest.param(100_000, id="100k", marks=pytest.mark.large),
+    ],
+)
+def source_tree(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, int]:
+    file_count = int(request.param)
+    return _build_tree(tmp_path_factory.mktemp(f"tree_{file_count}"), file_count), file_count
+
+
+@pytest.mark.parametrize("backend", list(HashBackend), ids=[backend.value for backend in HashBackend])
+def test_hash_backend_throughput(
+    benchmark: BenchmarkRunner,
+    source_tree: tuple[Path, int],
+    backend: HashBackend,
+) -> None:
+    root, file_count = source_tree
+    hashed: dict[str, int | bool] = {}
+
+    def run() -> None:
+        hashes, truncated = collect_file_hashes(root, ["src"], hash_workers=HASH_WORKERS, hash_backend=backend)
+        hashed.update(files=len(hashes), truncated=truncated)
+
+    _ = benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["files"] = file_count
+    benchmark.extra_info["backend"] = backend.value
+
+    assert hashed == {"files": file_count, "truncated": False}
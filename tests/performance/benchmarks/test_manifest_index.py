@@ -0,0 +1,113 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Query latency through the manifest offset index versus a full load."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import TYPE_CHECKING, Protocol
+
+import pytest
+
+from ratchetr.manifest.index import ManifestIndex
+from ratchetr.manifest.versioning import CURRENT_MANIFEST_VERSION
+from ratchetr.services.dashboard import load_summary_from_manifest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from ratchetr.json import JSONValue
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+pytest.importorskip("pytest_benchmark")
+
+FILE_COUNT = 5_000
+DIAGNOSTICS_PER_FILE = 20
+FOLDER_COUNT = 50
+
+
+class BenchmarkRunner(Protocol):
+    """Subset of pytest-benchmark's `benchmark` fixture used here."""
+
+    extra_info: dict[str, object]
+
+    def pedantic(self, target: Callable[[], object], *, rounds: int, iterations: int) -> object:
+        """Run ``target`` a fixed number of times."""
+
+
+def _run(mode: str) -> dict[str, JSONValue]:
+    per_file: list[JSONValue] = []
+    for file_index in range(FILE_COUNT):
+        diagnostics: list[JSONValue] = [
+            {
+                "line": diag_index + 1,
+                "column": 1,
+                "severity": "error" if diag_index % 3 == 0 else "warning",
+                "code": f"reportUnknown{diag_index % 4}",
+                "message": "example diagnostic message of a realistic length",
+            }
+            for diag_index in range(DIAGNOSTICS_PER_FILE)
+        ]
+        errors = sum(1 for diag_index in range(DIAGNOSTICS_PER_FILE) if diag_index % 3 == 0)
+        per_file.append({
+            "path": f"pkg/sub_{file_index % FOLDER_COUNT}/module_{file_index}.py",
+            "errors": errors,
+            "warnings": DIAGNOSTICS_PER_FILE - errors,
+            "information": 0,
+            "diagnostics": diagnostics,
+        })
+    return {
+        "tool": "pyright",
+        "mode": mode,
+        "command": ["pyright"],
+        "exitCode": 1,
+        "durationMs": 1.0,
+        "summary": {"errors": 0, "warnings": 0, "information": 0, "total": 0},
+        "engineOptions": {},
+        "perFolder": [],
+        "perFile": per_file,
+    }
+
+
+@pytest.fixture(scope="module")
+def large_manifest(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("index") / "typing_audit.json"
+    payload = {
+        "generatedAt": "2025-01-01T00:00:00Z",
+        "projectRoot": "/project",
+        "schemaVersion": CURRENT_MANIFEST_VERSION,
+        "runs": [_run("current"), _run("full")],
+    }
+    _ = path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def test_indexed_query_summary(benchmark: BenchmarkRunner, large_manifest: Path) -> None:
+    started = time.perf_counter()
+    full_summary = load_summary_from_manifest(large_manifest)
+    full_seconds = time.perf_counter() - started
+    assert ManifestIndex.open(large_manifest) is not None
+
+    def run() -> object:
+        return load_summary_from_manifest(large_manifest, indexed=True)
+
+    indexed_summary = benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["manifest_mb"] = round(large_manifest.stat().st_size / 1_000_000, 1)
+    benchmark.extra_info["full_load_seconds"] = round(full_seconds, 2)
+
+    assert indexed_summary == full_summary
@@ -0,0 +1,90 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Import-time budget for the ratchetr package and its public subpackages."""
+
+from __future__ import annotations
+
+import json
+
+# ignore JUSTIFIED: the benchmark measures a fresh interpreter in a child process
+import subprocess  # noqa: S404  # nosec B404
+import sys
+import textwrap
+from typing import Final
+
+import pytest
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+# Microseconds of cumulative import time allowed for `import ratchetr`.
+PACKAGE_IMPORT_BUDGET_US: Final[int] = 60_000
+# Number of `ratchetr` modules allowed to load for `import ratchetr`.
+PACKAGE_MODULE_BUDGET: Final[int] = 10
+
+# Imports a module in a fresh interpreter under `-X importtime` and prints the
+# ratchetr modules it loaded and whether pydantic came along with them.
+_IMPORT_SCRIPT = textwrap.dedent(
+    """
+    import json
+    import sys
+
+    __import__(sys.argv[1])
+    print(
+        json.dumps(
+            {
+                "modules": sorted(name for name in sys.modules if name.split(".")[0] == "ratchetr"),
+                "pydantic": "pydantic" in sys.modules,
+            }
+        )
+    )
+    """
+)
+
+
+def _import(module: str) -> tuple[dict[str, object], dict[str, int]]:
+    # ignore JUSTIFIED: runs the current interpreter on a fixed in-repo script
+    completed = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", _IMPORT_SCRIPT, module],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self_us, cumulative_us, name = (part.strip() for part in line.removeprefix("import time:").split("|"))
+        if cumulative_us.isdigit():
+            cumulative[name] = int(cumulative_us)
+    return json.loads(completed.stdout.strip().splitlines()[-1]), cumulative
+
+
+def test_package_import_time_budget() -> None:
+    loaded, cumulative = _import("ratchetr")
+
+    modules = loaded["modules"]
+    assert isinstance(modules, list)
+    assert len(modules) <= PACKAGE_MODULE_BUDGET
+    assert cumulative["ratchetr"] <= PACKAGE_IMPORT_BUDGET_US
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["ratchetr", "ratchetr.engines", "ratchetr.manifest", "ratchetr.ratchet", "ratchetr.runtime"],
+)
+def test_package_import_defers_pydantic(module: str) -> None:
+    loaded, _cumulative = _import(module)
+
+    assert loaded["pydantic"] is False
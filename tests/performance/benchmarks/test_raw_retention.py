@@ -0,0 +1,125 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Memory measurements for diagnostic raw-payload retention policies."""
+
+from __future__ import annotations
+
+import json
+
+# ignore JUSTIFIED: the benchmark measures a fresh interpreter in a child process
+import subprocess  # noqa: S404  # nosec B404
+import sys
+import textwrap
+from typing import TYPE_CHECKING, Protocol
+
+import pytest
+
+from ratchetr.core.model_types import RawRetention
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("resource")
+
+DIAGNOSTIC_COUNT = 50_000
+
+# Parses a pyright report through run_pyright in a fresh interpreter and prints
+# the bytes still held by the parsed diagnostics plus the process peak RSS (KiB
+# on Linux) so each policy is measured in isolation.
+_MEASURE_SCRIPT = textwrap.dedent(
+    """
+    import resource
+    import sys
+    import tracemalloc
+    from pathlib import Path
+
+    from ratchetr.core.model_types import Mode, RawRetention
+    from ratchetr.engines import execution
+    from ratchetr.runtime import CommandOutput
+
+    report, policy = Path(sys.argv[1]), RawRetention.from_str(sys.argv[2])
+
+    def fake_stream_command(argv, cwd=None, *, allowed=None, consumer):
+        with report.open(encoding="utf-8") as stream:
+            parsed = consumer(stream)
+        return CommandOutput(args=list(argv), stdout="", stderr="", exit_code=1, duration_ms=0.0), parsed
+
+    execution.stream_command = fake_stream_command
+    tracemalloc.start()
+    result = execution.run_pyright(report.parent, mode=Mode.FULL, command=["pyright"], raw_retention=policy)
+    retained, _ = tracemalloc.get_traced_memory()
+    assert len(result.diagnostics) == int(sys.argv[3])
+    print(retained, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    """
+)
+
+
+class BenchmarkRunner(Protocol):
+    """Subset of pytest-benchmark's `benchmark` fixture used here."""
+
+    extra_info: dict[str, object]
+
+    def pedantic(self, target: Callable[[], object], *, rounds: int, iterations: int) -> object:
+        """Run ``target`` a fixed number of times."""
+
+
+def _write_report(tmp_path: Path) -> Path:
+    diagnostics = [
+        {
+            "file": str(tmp_path / "pkg" / f"module_{index % 500}.py"),
+            "severity": "error" if index % 3 else "warning",
+            "message": f"Type of parameter 'value' is partially unknown (case {index % 40})",
+            "range": {"start": {"line": index % 800, "character": 4}, "end": {"line": index % 800, "character": 19}},
+            "rule": "reportUnknownParameterType",
+        }
+        for index in range(DIAGNOSTIC_COUNT)
+    ]
+    report = tmp_path / "pyright.json"
+    summary = {"errorCount": sum(1 for item in diagnostics if item["severity"] == "error")}
+    summary["warningCount"] = DIAGNOSTIC_COUNT - summary["errorCount"]
+    document = {"version": "1.1.400", "generalDiagnostics": diagnostics, "summary": summary}
+    _ = report.write_text(json.dumps(document), encoding="utf-8")
+    return report
+
+
+def _measure(report: Path, policy: RawRetention) -> tuple[int, int]:
+    # ignore JUSTIFIED: runs the current interpreter on a fixed in-repo script
+    completed = subprocess.run(  # nosec B603
+        [sys.executable, "-c", _MEASURE_SCRIPT, str(report), policy.value, str(DIAGNOSTIC_COUNT)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    retained, peak_rss = completed.stdout.strip().splitlines()[-1].split()
+    return int(retained), int(peak_rss)
+
+
+def test_raw_retention_memory(benchmark: BenchmarkRunner, tmp_path: Path) -> None:
+    report = _write_report(tmp_path)
+    samples: dict[RawRetention, tuple[int, int]] = {}
+
+    def measure() -> None:
+        samples.update({policy: _measure(report, policy) for policy in RawRetention})
+
+    _ = benchmark.pedantic(measure, rounds=1, iterations=1)
+    retained = {policy: sample[0] for policy, sample in samples.items()}
+    benchmark.extra_info["retained_bytes"] = {policy.value: value for policy, value in retained.items()}
+    benchmark.extra_info["peak_rss_kib"] = {policy.value: sample[1] for policy, sample in samples.items()}
+
+    assert retained[RawRetention.NONE] <= retained[RawRetention.MINIMAL] < retained[RawRetention.FULL]
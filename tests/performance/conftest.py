@@ -16,4 +16,29 @@
 
 from __future__ import annotations
 
-# Placeholder for fixtures that will arrive in later phases.
+import pytest
+
+
+def _benchmarks_timed(config: pytest.Config) -> bool:
+    # pytest-benchmark only times benchmarks when enabled and outside xdist workers.
+    if config.getoption("benchmark_only", default=False):
+        return True
+    if hasattr(config, "workerinput"):
+        return False
+    disabled = bool(config.getoption("benchmark_disable", default=False))
+    return not disabled or bool(config.getoption("benchmark_enable", default=False))
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip `large` benchmarks unless the session actually times benchmarks.
+
+    Building their inputs takes far longer than the untimed single pass the
+    default (``--benchmark-disable``) run would make, so they only run with
+    ``--benchmark-only`` or ``--benchmark-enable`` outside xdist.
+    """
+    if _benchmarks_timed(config):
+        return
+    skip_large = pytest.mark.skip(reason="large benchmark inputs need --benchmark-enable without xdist")
+    for item in items:
+        if item.get_closest_marker("large") is not None:
+            item.add_marker(skip_large)
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING
 
 import pytest
@@ -32,10 +33,11 @@ from ratchetr.core.model_types import (
     DashboardView,
     Mode,
     ReadinessStatus,
+    RunSkipReason,
     SeverityLevel,
 )
 from ratchetr.core.type_aliases import EngineName, ProfileName, RunnerName, ToolName
-from ratchetr.core.types import Diagnostic, RunResult
+from ratchetr.core.types import Diagnostic, DiagnosticTable, RunResult
 from ratchetr.manifest.typed import ManifestData, ToolSummary
 from ratchetr.manifest.versioning import CURRENT_MANIFEST_VERSION
 from tests.fixtures.stubs import AuditStubEngine, RecordingEngine
@@ -44,6 +46,8 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
     from pathlib import Path
 
+    from ratchetr.engines.base import EngineContext, EngineResult
+
 pytestmark = pytest.mark.unit
 
 STUB_TOOL = ToolName("stub")
@@ -70,7 +74,7 @@ def fake_run_result(tmp_path: Path) -> RunResult:
         command=["stub"],
         exit_code=1,
         duration_ms=5.0,
-        diagnostics=diagnostics,
+        diagnostics=DiagnosticTable(diagnostics),
         tool_summary=ToolSummary(errors=1, warnings=0, information=0, total=1),
     )
 
@@ -80,7 +84,7 @@ def test_run_audit_programmatic(
     tmp_path: Path,
     fake_run_result: RunResult,
 ) -> None:
-    def _resolve_stub(_: Sequence[str]) -> list[AuditStubEngine]:
+    def _resolve_stub(_: Sequence[str], **_kwargs: object) -> list[AuditStubEngine]:
         return [AuditStubEngine(fake_run_result)]
 
     monkeypatch.setattr("ratchetr.engines.resolve_engines", _resolve_stub)
@@ -142,7 +146,7 @@ def test_run_audit_programmatic(
 def test_run_audit_applies_engine_profiles(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     engine = RecordingEngine()
 
-    def _resolve_recording(_: Sequence[str]) -> list[RecordingEngine]:
+    def _resolve_recording(_: Sequence[str], **_kwargs: object) -> list[RecordingEngine]:
         return [engine]
 
     monkeypatch.setattr("ratchetr.engines.resolve_engines", _resolve_recording)
@@ -194,7 +198,7 @@ def test_run_audit_respects_folder_overrides(
 ) -> None:
     engine = RecordingEngine()
 
-    def _resolve_folder(_: Sequence[str]) -> list[RecordingEngine]:
+    def _resolve_folder(_: Sequence[str], **_kwargs: object) -> list[RecordingEngine]:
         return [engine]
 
     monkeypatch.setattr("ratchetr.engines.resolve_engines", _resolve_folder)
@@ -286,7 +290,7 @@ def test_run_audit_cache_preserves_tool_summary(
         current_exit_code=0,
     )
 
-    def _resolve_cache(_: Sequence[str]) -> list[RecordingEngine]:
+    def _resolve_cache(_: Sequence[str], **_kwargs: object) -> list[RecordingEngine]:
         return [engine]
 
     monkeypatch.setattr("ratchetr.engines.resolve_engines", _resolve_cache)
@@ -351,6 +355,129 @@ def test_api_exposes_dashboard_and_manifest_helpers(tmp_path: Path) -> None:
     assert validation.is_valid
 
 
+def test_run_audit_per_file_cache_rechecks_changed_files_and_importers(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    pkg = tmp_path / "pkg"
+    pkg.mkdir(parents=True, exist_ok=True)
+    consume((pkg / "__init__.py").write_text("", encoding="utf-8"))
+    consume((pkg / "a.py").write_text("x = 1\n", encoding="utf-8"))
+    consume((pkg / "b.py").write_text("from pkg.a import x\n", encoding="utf-8"))
+    consume((pkg / "c.py").write_text("y = 2\n", encoding="utf-8"))
+    consume((pkg / "d.py").write_text("z = 3\n", encoding="utf-8"))
+
+    def _diag(name: str) -> Diagnostic:
+        return Diagnostic(
+            tool=STUB_TOOL,
+            severity=SeverityLevel.ERROR,
+            path=pkg / name,
+            line=1,
+            column=1,
+            code="E001",
+            message=f"issue in {name}",
+            raw={},
+        )
+
+    engine = RecordingEngine(diagnostics=[_diag("a.py"), _diag("c.py")], full_exit_code=1)
+
+    def _resolve_incremental(_: Sequence[str], **_kwargs: object) -> list[RecordingEngine]:
+        return [engine]
+
+    monkeypatch.setattr("ratchetr.engines.resolve_engines", _resolve_incremental)
+    monkeypatch.setattr("ratchetr.audit.api.resolve_engines", _resolve_incremental)
+    override = AuditConfig(full_paths=["pkg"], skip_current=True, per_file_cache=True)
+
+    first = run_audit(project_root=tmp_path, override=override, build_summary_output=False)
+    assert engine.invocations[-1].paths == ["pkg"]
+    assert len(first.runs[0].diagnostics) == 2
+
+    consume((pkg / "a.py").write_text("x = 10\n", encoding="utf-8"))
+    second = run_audit(project_root=tmp_path, override=override, build_summary_output=False)
+
+    assert len(engine.invocations) == 2
+    assert engine.invocations[-1].paths == ["pkg/a.py", "pkg/b.py"]
+    full_run = second.runs[0]
+    assert full_run.cached is False
+    assert [diag.path.name for diag in full_run.diagnostics] == ["a.py", "c.py"]
+    assert full_run.exit_code == 1
+    # The merged run still reports the configured full run, not the narrowed re-check.
+    assert full_run.command == first.runs[0].command
+    assert full_run.duration_ms == first.runs[0].duration_ms
+
+
+class _BarrierEngine(RecordingEngine):
+    """Recording engine that blocks until every parallel run has started."""
+
+    def __init__(self, name: str, barrier: threading.Barrier) -> None:
+        super().__init__()
+        self.name = name
+        self._barrier = barrier
+
+    def run(self, context: EngineContext, paths: Sequence[str]) -> EngineResult:
+        consume(self._barrier.wait(timeout=5))
+        return super().run(context, paths)
+
+
+def test_run_audit_runs_engines_in_parallel_with_stable_order(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    barrier = threading.Barrier(2)
+    engines = [_BarrierEngine("alpha", barrier), _BarrierEngine("beta", barrier)]
+
+    def _resolve_parallel(_: Sequence[str], **_kwargs: object) -> list[_BarrierEngine]:
+        return engines
+
+    monkeypatch.setattr("ratchetr.engines.resolve_engines", _resolve_parallel)
+    monkeypatch.setattr("ratchetr.audit.api.resolve_engines", _resolve_parallel)
+
+    (tmp_path / "pkg").mkdir(parents=True, exist_ok=True)
+    consume((tmp_path / "pkg" / "module.py").write_text("x = 1\n", encoding="utf-8"))
+    override = AuditConfig(full_paths=["pkg"], skip_current=True, max_parallel_engines=2)
+
+    result = run_audit(project_root=tmp_path, override=override, build_summary_output=False)
+
+    assert [str(run.tool) for run in result.runs] == ["alpha", "beta"]
+    assert all(len(engine.invocations) == 1 for engine in engines)
+    assert (tmp_path / ".ratchetr_cache" / "cache.json").exists()
+
+
+class _ModeAgnosticEngine(RecordingEngine):
+    """Recording engine whose command does not depend on the mode."""
+
+    def plan_command(self, context: EngineContext, paths: Sequence[str]) -> list[str]:
+        _ = self
+        del context, paths
+        return ["stub", "--check", "."]
+
+
+def test_run_audit_shares_identical_runs_and_skips_duplicate_engines(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    engine = _ModeAgnosticEngine()
+
+    def _resolve_twice(_: Sequence[str], **_kwargs: object) -> list[_ModeAgnosticEngine]:
+        return [engine, engine]
+
+    monkeypatch.setattr("ratchetr.engines.resolve_engines", _resolve_twice)
+    monkeypatch.setattr("ratchetr.audit.api.resolve_engines", _resolve_twice)
+    (tmp_path / "pkg").mkdir(parents=True, exist_ok=True)
+
+    result = run_audit(project_root=tmp_path, override=AuditConfig(full_paths=["pkg"]), build_summary_output=False)
+
+    assert len(engine.invocations) == 1
+    assert [(str(run.tool), run.mode) for run in result.runs] == [("stub", Mode.CURRENT), ("stub", Mode.FULL)]
+    assert result.plan is not None
+    assert [run.key for run in result.plan.runs] == ["stub:current"]
+    assert [(item.key, item.reason, item.served_by) for item in result.plan.skipped] == [
+        ("stub:full", RunSkipReason.IDENTICAL, "stub:current"),
+        ("stub:current", RunSkipReason.DUPLICATE, None),
+        ("stub:full", RunSkipReason.DUPLICATE, None),
+    ]
+
+
 STUB = EngineName("stub")
 STUB_RUNNER = RunnerName(STUB)
 STRICT_PROFILE = ProfileName("strict")
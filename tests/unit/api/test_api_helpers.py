@@ -23,7 +23,9 @@ from typing import TYPE_CHECKING
 import pytest
 
 from ratchetr._internal.utils import consume
+from ratchetr.audit import incremental
 from ratchetr.audit.execution import apply_engine_paths, resolve_engine_options
+from ratchetr.audit.incremental import IMPORT_GRAPH_FILENAME, plan_incremental_run, reverse_import_closure
 from ratchetr.audit.options import merge_engine_settings_map
 from ratchetr.audit.paths import (
     fingerprint_targets,
@@ -31,9 +33,11 @@ from ratchetr.audit.paths import (
     normalise_paths,
     relative_override_path,
 )
+from ratchetr.audit.planning import enabled_modes, plan_runs
 from ratchetr.compat import override
 from ratchetr.config import AuditConfig, EngineProfile, EngineSettings, PathOverride
-from ratchetr.core.type_aliases import EngineName, ProfileName, RelPath
+from ratchetr.core.model_types import Mode, RunSkipReason
+from ratchetr.core.type_aliases import EngineName, PathKey, ProfileName, RelPath
 from ratchetr.engines.base import BaseEngine, EngineContext, EngineResult
 
 if TYPE_CHECKING:
@@ -211,3 +215,100 @@ def test_resolve_engine_options_with_overrides(tmp_path: Path) -> None:
     assert engine_options.profile == strict_profile
     assert engine_options.category_mapping["unknownChecks"] == ["reportGeneralTypeIssues"]
     assert engine_options.overrides
+
+
+def test_reverse_import_closure_follows_transitive_importers(tmp_path: Path) -> None:
+    pkg = tmp_path / "src" / "pkg"
+    pkg.mkdir(parents=True)
+    consume((pkg / "__init__.py").write_text("", encoding="utf-8"))
+    consume((pkg / "core.py").write_text("VALUE = 1\n", encoding="utf-8"))
+    consume((pkg / "mid.py").write_text("from .core import VALUE\n", encoding="utf-8"))
+    consume((pkg / "top.py").write_text("import pkg.mid\n", encoding="utf-8"))
+    consume((pkg / "other.py").write_text("import json\n", encoding="utf-8"))
+    files = [PathKey(f"src/pkg/{name}") for name in ("__init__.py", "core.py", "mid.py", "top.py", "other.py")]
+
+    closure = reverse_import_closure(tmp_path, files, [PathKey("src/pkg/core.py")])
+
+    assert closure == {PathKey("src/pkg/core.py"), PathKey("src/pkg/mid.py"), PathKey("src/pkg/top.py")}
+
+
+def test_plan_incremental_run_falls_back_for_non_python_or_wide_changes(tmp_path: Path) -> None:
+    files = {PathKey(f"mod{index}.py"): {} for index in range(4)}
+    files[PathKey("pyrightconfig.json")] = {}
+    for key in files:
+        consume((tmp_path / key).write_text("", encoding="utf-8"))
+
+    assert plan_incremental_run(tmp_path, files, [PathKey("pyrightconfig.json")], []) is None
+    assert plan_incremental_run(tmp_path, files, [PathKey(f"mod{index}.py") for index in range(3)], []) is None
+    plan = plan_incremental_run(tmp_path, files, [PathKey("mod0.py")], [PathKey("gone.py")])
+    assert plan is not None
+    assert plan.targets == (PathKey("mod0.py"),)
+    assert plan.removed == (PathKey("gone.py"),)
+
+
+def test_reverse_import_closure_reuses_imports_parsed_for_unchanged_hashes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    consume((tmp_path / "core.py").write_text("VALUE = 1\n", encoding="utf-8"))
+    consume((tmp_path / "user.py").write_text("import core\n", encoding="utf-8"))
+    files = {PathKey("core.py"): {"hash": "c1"}, PathKey("user.py"): {"hash": "u1"}}
+    cache_dir = tmp_path / ".ratchetr_cache"
+    monkeypatch.setattr(incremental, "_IMPORTS_BY_FILE", {})
+
+    first = reverse_import_closure(tmp_path, files, [PathKey("core.py")], fingerprints=files, cache_dir=cache_dir)
+
+    # A fresh process reads the persisted graph instead of parsing again.
+    monkeypatch.setattr(incremental, "_IMPORTS_BY_FILE", {})
+    monkeypatch.setattr(incremental, "_imported_modules", lambda *_args: pytest.fail("re-parsed an unchanged file"))
+    second = reverse_import_closure(tmp_path, files, [PathKey("core.py")], fingerprints=files, cache_dir=cache_dir)
+
+    assert first == second == {PathKey("core.py"), PathKey("user.py")}
+    assert (cache_dir / IMPORT_GRAPH_FILENAME).exists()
+
+
+class _PathEchoEngine(MinimalEngine):
+    """Engine whose planned command lists the targets it receives."""
+
+    @override
+    def plan_command(self, context: EngineContext, paths: Sequence[RelPath]) -> list[str]:
+        _ = self
+        return ["stub", str(context.mode), *paths]
+
+
+def test_enabled_modes_respects_skip_flags() -> None:
+    assert enabled_modes(AuditConfig()) == [Mode.CURRENT, Mode.FULL]
+    assert enabled_modes(AuditConfig(skip_current=True)) == [Mode.FULL]
+    assert enabled_modes(AuditConfig(skip_current=True, skip_full=True)) == []
+
+
+def test_plan_runs_reports_disabled_modes_and_distinct_commands(tmp_path: Path) -> None:
+    (tmp_path / "src").mkdir()
+    plan = plan_runs(
+        project_root=tmp_path,
+        audit_config=AuditConfig(skip_current=True),
+        engines=[_PathEchoEngine()],
+        full_paths_normalised=[RelPath("src")],
+    )
+    assert [(run.key, run.command, run.serves) for run in plan.runs] == [("stub:full", ("stub", "full", "src"), ())]
+    assert [(item.key, item.reason) for item in plan.skipped] == [("stub:current", RunSkipReason.DISABLED)]
+
+    both = plan_runs(
+        project_root=tmp_path,
+        audit_config=AuditConfig(),
+        engines=[_PathEchoEngine()],
+        full_paths_normalised=[RelPath("src")],
+    )
+    assert [run.key for run in both.runs] == ["stub:current", "stub:full"]
+    assert not both.skipped
+
+
+def test_plan_runs_without_planned_commands_never_shares_runs(tmp_path: Path) -> None:
+    plan = plan_runs(
+        project_root=tmp_path,
+        audit_config=AuditConfig(),
+        engines=[MinimalEngine()],
+        full_paths_normalised=[],
+    )
+    assert [(run.key, run.command) for run in plan.runs] == [("stub:current", None), ("stub:full", None)]
+    assert not plan.skipped
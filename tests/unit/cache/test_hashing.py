@@ -16,6 +16,10 @@
 
 from __future__ import annotations
 
+import shutil
+
+# ignore JUSTIFIED: tests build throwaway git repositories with the git CLI
+import subprocess  # noqa: S404  # nosec B404
 from typing import TYPE_CHECKING, Any
 
 import pytest
@@ -23,6 +27,7 @@ import pytest
 from ratchetr._internal import cache as cache_module
 from ratchetr._internal.cache import collect_file_hashes
 from ratchetr._internal.utils import consume
+from ratchetr.core.model_types import FingerprintSource
 from ratchetr.core.type_aliases import PathKey
 
 if TYPE_CHECKING:
@@ -111,6 +116,7 @@ def test_collect_file_hashes_honours_worker_env(
     def fake_compute(
         pending: Sequence[tuple[PathKey, Path]],
         workers: int,
+        **_: object,
     ) -> dict[PathKey, FileHashPayload]:
         recorded["workers"] = workers
         return {key: {"hash": "stub", "mtime": 0, "size": 0} for key, _ in pending}
@@ -177,3 +183,125 @@ def test_collect_file_hashes_stops_after_max_files(tmp_path: Path) -> None:
     )
     assert truncated is True
     assert len(hashes) == 1
+
+
+def _git(repo: Path, *args: str) -> str:
+    git_cmd = shutil.which("git")
+    assert git_cmd is not None
+    # ignore JUSTIFIED: drives a throwaway repository created by the test
+    completed = subprocess.run(  # noqa: S603  # nosec B603
+        [git_cmd, "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return completed.stdout.strip()
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git executable not available")
+def test_collect_file_hashes_git_source_uses_index_blob_ids(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    project_root = repo / "project"
+    _write(project_root / "pkg" / "clean.py", "x = 1\n")
+    _write(project_root / "pkg" / "dirty.py", "y = 1\n")
+    _write(project_root / "pkg" / "notes.txt", "not python\n")
+    _write(repo / "outside.py", "z = 1\n")
+    consume(_git(repo, "init", "-q"))
+    consume(_git(repo, "add", "."))
+    consume(_git(repo, "commit", "-q", "-m", "init"))
+    _write(project_root / "pkg" / "dirty.py", "y = 2\n")
+    _write(project_root / "pkg" / "new.py", "w = 1\n")
+
+    hashes, truncated = collect_file_hashes(project_root, paths=["pkg"], fingerprint_source=FingerprintSource.GIT)
+
+    assert not truncated
+    assert list(hashes) == [PathKey("pkg/clean.py"), PathKey("pkg/dirty.py"), PathKey("pkg/new.py")]
+    for key, payload in hashes.items():
+        assert payload == {"hash": _git(repo, "hash-object", f"project/{key}")}
+
+    limited, limited_truncated = collect_file_hashes(
+        project_root,
+        paths=["pkg"],
+        max_files=1,
+        fingerprint_source=FingerprintSource.GIT,
+    )
+    assert limited_truncated
+    assert list(limited) == [PathKey("pkg/clean.py")]
+
+
+def test_collect_file_hashes_git_source_falls_back_without_repo(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _write(tmp_path / "a.py", "print('a')\n")
+
+    def no_repo(_: Path) -> None:
+        return None
+
+    monkeypatch.setattr("ratchetr._internal.cache._git_repo_root", no_repo)
+
+    hashes, _ = collect_file_hashes(tmp_path, paths=["."], fingerprint_source=FingerprintSource.GIT)
+    expected, _ = collect_file_hashes(tmp_path, paths=["."])
+
+    assert hashes == expected
+
+
+def test_collect_file_hashes_rehashes_only_changed_paths(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _write(tmp_path / "src" / "keep.py", "keep = 1\n")
+    _write(tmp_path / "src" / "edit.py", "edit = 1\n")
+    _write(tmp_path / "src" / "gone" / "old.py", "old = 1\n")
+    baseline, _ = collect_file_hashes(tmp_path, paths=["src"])
+    _write(tmp_path / "src" / "edit.py", "edit = 2\n")
+    _write(tmp_path / "src" / "new" / "mod.py", "mod = 1\n")
+    shutil.rmtree(tmp_path / "src" / "gone")
+    fingerprinted: list[str] = []
+    original = cache_module._fingerprint
+
+    def record_fingerprint(path: Path) -> FileHashPayload:
+        fingerprinted.append(path.relative_to(tmp_path).as_posix())
+        return original(path)
+
+    def fail_walk(*_: object, **__: object) -> object:
+        pytest.fail("changed_paths must not walk the whole tree")
+
+    monkeypatch.setattr("ratchetr._internal.cache._fingerprint", record_fingerprint)
+    hashes, truncated = collect_file_hashes(
+        tmp_path,
+        paths=["src"],
+        baseline=baseline,
+        changed_paths=["src/edit.py", "src/new", "src/gone"],
+    )
+    monkeypatch.setattr("ratchetr._internal.cache._scan_python_files", fail_walk)
+    unchanged, _ = collect_file_hashes(tmp_path, paths=["src"], baseline=hashes, changed_paths=[])
+
+    assert not truncated
+    assert sorted(fingerprinted) == ["src/edit.py", "src/gone/old.py", "src/new/mod.py"]
+    assert list(hashes) == [PathKey("src/edit.py"), PathKey("src/keep.py"), PathKey("src/new/mod.py")]
+    assert hashes[PathKey("src/keep.py")] == baseline[PathKey("src/keep.py")]
+    assert hashes[PathKey("src/edit.py")] != baseline[PathKey("src/edit.py")]
+    assert unchanged == hashes
+
+
+def test_collect_file_hashes_scan_keys_match_resolved_paths(tmp_path: Path) -> None:
+    _write(tmp_path / "src" / "b.py", "b = 1\n")
+    _write(tmp_path / "src" / "pkg" / "a.py", "a = 1\n")
+    _write(tmp_path / "src" / "notes.txt", "skip\n")
+    _write(tmp_path / "outside" / "linked_dir" / "c.py", "c = 1\n")
+    (tmp_path / "src" / "link.py").symlink_to(tmp_path / "src" / "pkg" / "a.py")
+    (tmp_path / "src" / "dirlink").symlink_to(tmp_path / "outside" / "linked_dir", target_is_directory=True)
+
+    _write(tmp_path / "ordered" / "m.py", "m = 1\n")
+    _write(tmp_path / "ordered" / "a" / "x.py", "x = 1\n")
+
+    hashes, _ = collect_file_hashes(tmp_path, paths=["src"])
+    truncated_hashes, truncated = collect_file_hashes(tmp_path, paths=["ordered"], max_files=1)
+
+    # File symlinks are keyed by their target; directory symlinks are not followed.
+    assert list(hashes) == [PathKey("src/b.py"), PathKey("src/pkg/a.py")]
+    # Files in a directory are visited before its subdirectories, as with os.walk.
+    assert truncated
+    assert list(truncated_hashes) == [PathKey("ordered/m.py")]
@@ -22,9 +22,10 @@ from typing import TYPE_CHECKING, cast
 import pytest
 
 from ratchetr._internal import cache as cache_module
-from ratchetr._internal.cache import EngineCache
-from ratchetr.core.model_types import FileHashPayload, Mode, SeverityLevel
-from ratchetr.core.type_aliases import PathKey, RelPath, ToolName
+from ratchetr._internal.cache import EngineCache, cache_stats, read_cache_entries
+from ratchetr._internal.cache_stores import ShardedCacheStore
+from ratchetr.core.model_types import CacheBackend, FileHashPayload, HashBackend, Mode, SeverityLevel
+from ratchetr.core.type_aliases import CacheKey, PathKey, RelPath, ToolName
 from ratchetr.core.types import Diagnostic
 
 if TYPE_CHECKING:
@@ -147,6 +148,104 @@ def test_engine_cache_round_trip(tmp_path: Path) -> None:
     assert mismatch is None
 
 
+def test_engine_cache_skips_empty_raw_and_shares_paths(tmp_path: Path) -> None:
+    cache = EngineCache(tmp_path)
+    key = cache.key_for("pyright", Mode.CURRENT, [RelPath("src")], [])
+    file_hashes: dict[PathKey, FileHashPayload] = {PathKey("src/app.py"): {"hash": "abc"}}
+    diagnostics = [_make_diagnostic(Path("src/app.py")), _make_diagnostic(Path("src/app.py"))]
+    cache.update(
+        key,
+        file_hashes,
+        command=["pyright"],
+        exit_code=1,
+        duration_ms=1.0,
+        diagnostics=diagnostics,
+        profile=None,
+        config_file=None,
+        plugin_args=[],
+        include=[],
+        exclude=[],
+        overrides=[],
+        category_mapping=None,
+        tool_summary=None,
+    )
+    cache.save()
+
+    stored = cast("list[dict[str, object]]", read_cache_entries(tmp_path)[key]["diagnostics"])
+    assert all("raw" not in payload for payload in stored)
+    cached = EngineCache(tmp_path).get(key, file_hashes)
+    assert cached is not None
+    first, second = cached.diagnostics
+    assert first.path is second.path
+    assert first.message is second.message
+
+
+def _populate(cache: EngineCache, key: CacheKey, file_hashes: dict[PathKey, FileHashPayload]) -> None:
+    cache.update(
+        key,
+        file_hashes,
+        command=["pyright"],
+        exit_code=1,
+        duration_ms=2.0,
+        diagnostics=[_make_diagnostic(Path("src/app.py"))],
+        profile=None,
+        config_file=None,
+        plugin_args=[],
+        include=[],
+        exclude=[],
+        overrides=[],
+        category_mapping=None,
+        tool_summary=None,
+    )
+
+
+def test_sharded_engine_cache_round_trip_is_lazy(tmp_path: Path) -> None:
+    cache = EngineCache(tmp_path, backend=CacheBackend.SHARDED)
+    file_hashes: dict[PathKey, FileHashPayload] = {PathKey("src/app.py"): {"hash": "abc", "mtime": 1, "size": 3}}
+    current_key = cache.key_for("pyright", Mode.CURRENT, [], [])
+    full_key = cache.key_for("pyright", Mode.FULL, [RelPath("src")], [])
+    _populate(cache, current_key, file_hashes)
+    _populate(cache, full_key, file_hashes)
+    cache.save()
+
+    shards = sorted((tmp_path / ".ratchetr_cache" / "shards").glob("*.bin"))
+    assert len(shards) == 2
+    assert not (tmp_path / ".ratchetr_cache" / "cache.json").exists()
+
+    reloaded = EngineCache(tmp_path, backend=CacheBackend.SHARDED)
+    cached = reloaded.get(full_key, file_hashes)
+    assert cached is not None
+    assert cached.exit_code == 1
+    assert [diag.path for diag in cached.diagnostics] == [Path("src/app.py")]
+    assert list(reloaded._entries) == [full_key]
+
+    _ = ShardedCacheStore(tmp_path / ".ratchetr_cache").shard_path(current_key).write_bytes(b"corrupt")
+    assert EngineCache(tmp_path, backend=CacheBackend.SHARDED).get(current_key, file_hashes) is None
+    assert set(read_cache_entries(tmp_path, CacheBackend.SHARDED)) == {str(full_key)}
+
+
+def test_sqlite_engine_cache_merges_concurrent_writers(tmp_path: Path) -> None:
+    file_hashes: dict[PathKey, FileHashPayload] = {PathKey("src/app.py"): {"hash": "abc", "mtime": 1, "size": 3}}
+    first = EngineCache(tmp_path, backend=CacheBackend.SQLITE)
+    second = EngineCache(tmp_path, backend=CacheBackend.SQLITE)
+    pyright_key = first.key_for("pyright", Mode.FULL, [RelPath("src")], [])
+    mypy_key = second.key_for("mypy", Mode.FULL, [RelPath("src")], [])
+    _populate(first, pyright_key, file_hashes)
+    _populate(second, mypy_key, file_hashes)
+    first.save()
+    second.save()
+
+    reloaded = EngineCache(tmp_path, backend=CacheBackend.SQLITE)
+    for key in (pyright_key, mypy_key):
+        cached = reloaded.get(key, file_hashes)
+        assert cached is not None
+        assert cached.command == ["pyright"]
+        assert [diag.path for diag in cached.diagnostics] == [Path("src/app.py")]
+        assert cached.tool_summary is None
+    stats = cache_stats(tmp_path, CacheBackend.SQLITE)
+    assert (stats["entries"], stats["file_hashes"], stats["diagnostics"]) == (2, 2, 2)
+
+
 def test_collect_file_hashes_respects_limits(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     src_dir = tmp_path / "src"
     src_dir.mkdir()
@@ -206,6 +305,26 @@ def test_compute_hashes_with_workers(tmp_path: Path) -> None:
     assert set(hashes) == {PathKey("a.py"), PathKey("b.py")}
 
 
+def test_compute_hashes_process_backend_matches_threads(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache_module, "_PROCESS_MIN_FILES", 0)
+    pending: list[tuple[PathKey, Path]] = []
+    for index in range(6):
+        path = tmp_path / f"mod_{index}.py"
+        _ = path.write_text(f"value = {index}\n", encoding="utf-8")
+        pending.append((PathKey(path.name), path))
+    threaded = cache_module._compute_hashes(pending, workers=2, backend=HashBackend.THREAD)
+    processed = cache_module._compute_hashes(pending, workers=2, backend=HashBackend.PROCESS)
+    assert processed == threaded
+
+
+def test_fingerprint_uses_mmap_for_large_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    target = tmp_path / "large.bin"
+    _ = target.write_bytes(bytes(range(256)) * 64)
+    buffered = cache_module._fingerprint(target)
+    monkeypatch.setattr(cache_module, "_MMAP_THRESHOLD", 1)
+    assert cache_module._fingerprint(target) == buffered
+
+
 def test_fingerprint_path_handles_missing_and_unreadable(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     missing = tmp_path / "missing.py"
     assert cache_module._fingerprint(missing) == {"missing": True}
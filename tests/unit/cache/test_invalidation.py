@@ -35,7 +35,7 @@ pytestmark = pytest.mark.unit
 
 
 def _patch_engine_resolution(monkeypatch: pytest.MonkeyPatch, engine: RecordingEngine) -> None:
-    def _resolve(_: Sequence[str]) -> list[RecordingEngine]:
+    def _resolve(_: Sequence[str], **_kwargs: object) -> list[RecordingEngine]:
         return [engine]
 
     monkeypatch.setattr("ratchetr.engines.resolve_engines", _resolve)
@@ -60,7 +60,7 @@ def test_cache_invalidation_on_tool_version_change(
     _prepare_workspace(tmp_path)
 
     # First run with version 1.0
-    def _versions_v1(_: Sequence[str]) -> dict[str, str]:
+    def _versions_v1(_: Sequence[str], **__: object) -> dict[str, str]:
         return {"stub": "1.0"}
 
     monkeypatch.setattr("ratchetr.audit.api.detect_tool_versions", _versions_v1)
@@ -69,7 +69,7 @@ def test_cache_invalidation_on_tool_version_change(
     assert _full_invocation_count(engine) == 1
 
     # Second run with version 2.0 should bypass cache
-    def _versions_v2(_: Sequence[str]) -> dict[str, str]:
+    def _versions_v2(_: Sequence[str], **__: object) -> dict[str, str]:
         return {"stub": "2.0"}
 
     monkeypatch.setattr("ratchetr.audit.api.detect_tool_versions", _versions_v2)
@@ -16,12 +16,15 @@
 
 from __future__ import annotations
 
+import json
 from argparse import Namespace
 from typing import TYPE_CHECKING
 
 import pytest
 
+from ratchetr._internal.cache import EngineCache
 from ratchetr.cli.commands import cache as cache_cmd
+from ratchetr.core.model_types import CacheBackend, Mode
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -65,6 +68,68 @@ def test_handle_clear_handles_missing_directory(tmp_path: Path, monkeypatch: pyt
     assert exit_code == 0
 
 
+def test_handle_show_renders_sharded_entries_as_json(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # Arrange
+    cache = EngineCache(tmp_path, backend=CacheBackend.SHARDED)
+    key = cache.key_for("pyright", Mode.CURRENT, [], [])
+    cache.update(
+        key,
+        {},
+        command=["pyright"],
+        exit_code=0,
+        duration_ms=1.0,
+        diagnostics=[],
+        profile=None,
+        config_file=None,
+        plugin_args=[],
+        include=[],
+        exclude=[],
+        overrides=[],
+        category_mapping=None,
+        tool_summary=None,
+    )
+    cache.save()
+
+    def fake_root(_: object) -> Path:
+        return tmp_path
+
+    monkeypatch.setattr(cache_cmd, "resolve_project_root", fake_root)
+
+    # Act
+    exit_code = cache_cmd.execute_cache(Namespace(cache_action="show", project_root=None, backend="sharded"))
+
+    # Assert
+    assert exit_code == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["entries"][str(key)]["command"] == ["pyright"]
+
+
+def test_handle_stats_reports_sqlite_counts(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # Arrange
+    def fake_root(_: object) -> Path:
+        return tmp_path
+
+    monkeypatch.setattr(cache_cmd, "resolve_project_root", fake_root)
+    args = Namespace(cache_action="stats", project_root=None, backend="sqlite", format="json")
+
+    # Act
+    exit_code = cache_cmd.execute_cache(args)
+
+    # Assert
+    assert exit_code == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["backend"] == "sqlite"
+    assert payload["entries"] == 0
+
+
 def test_execute_cache_unknown_action() -> None:
     # Act / Assert
     with pytest.raises(SystemExit, match=r".*"):
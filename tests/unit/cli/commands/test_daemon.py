@@ -0,0 +1,151 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the daemon CLI command flows."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from argparse import Namespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ratchetr._internal import daemons
+from ratchetr._internal.utils import CommandOutput
+from ratchetr.cli.commands import daemon as daemon_cmd
+from ratchetr.runtime import DaemonRegistry
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = [pytest.mark.unit, pytest.mark.cli]
+
+
+def _registry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> DaemonRegistry:
+    def fake_root(_: object) -> Path:
+        return tmp_path
+
+    monkeypatch.setattr(daemon_cmd, "resolve_project_root", fake_root)
+    return DaemonRegistry(tmp_path)
+
+
+def _record_stop_commands(monkeypatch: pytest.MonkeyPatch) -> list[tuple[list[str], set[str] | None]]:
+    calls: list[tuple[list[str], set[str] | None]] = []
+
+    def fake_run_command(args: list[str], cwd: Path | None = None, *, allowed: set[str] | None = None) -> CommandOutput:
+        del cwd
+        calls.append((list(args), allowed))
+        return CommandOutput(args=list(args), stdout="", stderr="", exit_code=0, duration_ms=0.0)
+
+    monkeypatch.setattr(daemons, "python_executable", lambda: sys.executable)
+    monkeypatch.setattr(daemons, "run_command", fake_run_command)
+    return calls
+
+
+def test_handle_status_lists_registered_daemons(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # Arrange
+    registry = _registry(tmp_path, monkeypatch)
+    status_file = registry.register("mypy:current")
+    _ = status_file.write_text(json.dumps({"pid": os.getpid()}), encoding="utf-8")
+    _ = registry.register("mypy:full")
+
+    # Act
+    exit_code = daemon_cmd.execute_daemon(Namespace(daemon_action="status", project_root=None, format="json"))
+
+    # Assert
+    assert exit_code == 0
+    rows = json.loads(capsys.readouterr().out)
+    assert [(row["name"], row["pid"], row["running"]) for row in rows] == [
+        ("mypy:current", os.getpid(), True),
+        ("mypy:full", None, False),
+    ]
+
+
+def test_handle_stop_runs_stop_command_and_clears_registry(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # Arrange
+    registry = _registry(tmp_path, monkeypatch)
+    calls = _record_stop_commands(monkeypatch)
+    status_file = registry.register("mypy:current")
+    _ = status_file.write_text(json.dumps({"pid": os.getpid()}), encoding="utf-8")
+    _ = registry.register("mypy:full")
+
+    # Act
+    exit_code = daemon_cmd.execute_daemon(Namespace(daemon_action="stop", project_root=None, names=["mypy:current"]))
+
+    # Assert
+    assert exit_code == 0
+    assert calls == [
+        ([sys.executable, "-m", "mypy.dmypy", "--status-file", str(status_file), "stop"], {sys.executable}),
+    ]
+    assert not status_file.exists()
+    assert [record.name for record in registry.records()] == ["mypy:full"]
+    assert "mypy:current: stopped" in capsys.readouterr().out
+
+
+def test_handle_stop_ignores_planted_registry_entries(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    registry = _registry(tmp_path, monkeypatch)
+    calls = _record_stop_commands(monkeypatch)
+    _ = registry.register("mypy:current")
+    victim = tmp_path / "victim.json"
+    _ = victim.write_text(json.dumps({"pid": os.getpid()}), encoding="utf-8")
+    registry_path = registry.directory / "registry.json"
+    entries = json.loads(registry_path.read_text(encoding="utf-8"))
+    entries["../../victim"] = {"statusFile": "../../victim.json", "stopCommand": ["rm", "-rf", str(tmp_path)]}
+    _ = registry_path.write_text(json.dumps(entries), encoding="utf-8")
+
+    # Act
+    stopped = registry.stop()
+
+    # Assert
+    assert [record.name for record in stopped] == ["mypy:current"]
+    assert not calls
+    assert victim.exists()
+    assert json.loads(registry_path.read_text(encoding="utf-8")) == {}
+
+
+def test_handle_stop_without_daemons(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # Arrange
+    _ = _registry(tmp_path, monkeypatch)
+
+    # Act
+    exit_code = daemon_cmd.execute_daemon(Namespace(daemon_action="stop", project_root=None, names=[]))
+
+    # Assert
+    assert exit_code == 0
+    assert "No matching engine daemons" in capsys.readouterr().out
+
+
+def test_execute_daemon_unknown_action() -> None:
+    # Act / Assert
+    with pytest.raises(SystemExit, match=r".*"):
+        _ = daemon_cmd.execute_daemon(Namespace(daemon_action="invalid"))
@@ -505,7 +505,7 @@ def test_execute_ratchet_unknown_action_raises(monkeypatch: pytest.MonkeyPatch)
         assert require_exists is False
         return tmp_root / "ratchet.json"
 
-    def fake_load_manifest(_path: Path) -> ManifestData:
+    def fake_load_manifest(_path: Path, **_: object) -> ManifestData:
         return cast(
             "ManifestData",
             {"generatedAt": "2024-01-01", "schemaVersion": CURRENT_MANIFEST_VERSION, "runs": []},
@@ -614,7 +614,7 @@ def test_execute_ratchet_dispatches_actions(  # noqa: C901
         assert isinstance(require_exists, bool)
         return tmp_path / "ratchet.json"
 
-    def fake_load_manifest(_: Path) -> ManifestData:
+    def fake_load_manifest(_: Path, **__: object) -> ManifestData:
         return cast("ManifestData", {"generatedAt": "2024-01-01", "schemaVersion": CURRENT_MANIFEST_VERSION})
 
     def passthrough_runs(
@@ -0,0 +1,305 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the watch command and its change journal."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from argparse import Namespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ratchetr._internal import watch as watch_module
+from ratchetr._internal.watch import InotifyWatcher, watch_project
+from ratchetr.cache import ChangeJournal
+from ratchetr.cli.commands import watch as watch_cmd
+from ratchetr.core.type_aliases import CacheKey, PathKey
+from ratchetr.runtime import CommandOutput
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from pathlib import Path
+
+    from ratchetr.core.model_types import FileHashPayload
+
+pytestmark = [pytest.mark.unit, pytest.mark.cli]
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+
+
+def _namespace(**overrides: object) -> Namespace:
+    values: dict[str, object] = {
+        "project_root": None,
+        "audit": False,
+        "audit_args": [],
+        "settle": 0.0,
+        "duration": 0.0,
+    }
+    values.update(overrides)
+    return Namespace(**values)
+
+
+def _publish(journal: ChangeJournal) -> None:
+    journal.drained(time.time())
+    journal.flush()
+
+
+def test_change_journal_checkpoint_reports_changes_since_baseline(tmp_path: Path) -> None:
+    # Arrange
+    watcher = ChangeJournal(tmp_path)
+    _ = watcher.begin()
+    key = CacheKey("pyright:current")
+    hashes: dict[PathKey, FileHashPayload] = {PathKey("src/app.py"): {"hash": "a", "mtime": 1, "size": 1}}
+    first_audit = ChangeJournal(tmp_path)
+    _publish(watcher)
+    first = first_audit.checkpoint(key, None)
+    assert first is not None
+    assert first.changed is None
+    first_audit.store_checkpoint(key, first, hashes)
+
+    # Act
+    _ = watcher.record(["src/app.py", "src/new.py"])
+    audit = ChangeJournal(tmp_path)
+    _publish(watcher)
+    current = audit.checkpoint(key, hashes)
+    mismatched = audit.checkpoint(key, {PathKey("src/app.py"): {"hash": "b", "mtime": 2, "size": 1}})
+
+    # Assert
+    assert current is not None
+    assert current.changed == frozenset({"src/app.py", "src/new.py"})
+    assert mismatched is not None
+    assert mismatched.changed is None
+
+
+def test_change_journal_waits_for_drain_after_audit_start(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    monkeypatch.setattr(watch_module, "SYNC_TIMEOUT_SECONDS", 0.05)
+    watcher = ChangeJournal(tmp_path)
+    _ = watcher.begin()
+    _publish(watcher)
+    audit = ChangeJournal(tmp_path)
+
+    # Act
+    stale = audit.checkpoint(CacheKey("k"), None)
+    requested = watcher.sync_requested()
+    watcher.drained(time.time())
+    watcher.heartbeat()
+    synced = audit.checkpoint(CacheKey("k"), None)
+
+    # Assert
+    assert stale is None
+    assert requested
+    assert not watcher.sync_requested()
+    assert synced is not None
+
+
+def test_change_journal_compacts_changes_behind_checkpoints(tmp_path: Path) -> None:
+    # Arrange
+    watcher = ChangeJournal(tmp_path)
+    _ = watcher.begin()
+    key = CacheKey("pyright:current")
+    stale_key = CacheKey("mypy:current")
+    hashes: dict[PathKey, FileHashPayload] = {PathKey("src/app.py"): {"hash": "a", "mtime": 1, "size": 1}}
+    _ = watcher.record(["src/old.py"])
+    audit = ChangeJournal(tmp_path)
+    _publish(watcher)
+    stale = audit.checkpoint(stale_key, None)
+    assert stale is not None
+    audit.store_checkpoint(stale_key, stale, hashes)
+    _ = watcher.record(["src/app.py"])
+    audit = ChangeJournal(tmp_path)
+    _publish(watcher)
+    first = audit.checkpoint(key, None)
+    assert first is not None
+    audit.store_checkpoint(key, first, hashes)
+    audit.store_checkpoint(stale_key, first, hashes)
+
+    # Act
+    _ = watcher.record(["src/new.py"])
+    audit = ChangeJournal(tmp_path)
+    _publish(watcher)
+    state = watcher.read()
+    current = audit.checkpoint(key, hashes)
+    audit.store_checkpoint(stale_key, stale, hashes)
+    behind = audit.checkpoint(stale_key, hashes)
+
+    # Assert
+    assert state is not None
+    assert state.changes == {"src/new.py": 3}
+    assert current is not None
+    assert current.changed == frozenset({"src/new.py"})
+    assert behind is not None
+    assert behind.changed is None
+
+
+def test_change_journal_ignored_without_live_watcher(tmp_path: Path) -> None:
+    journal = ChangeJournal(tmp_path)
+    assert journal.checkpoint(CacheKey("k"), None) is None
+
+    _ = journal.begin()
+    journal.close()
+
+    assert journal.checkpoint(CacheKey("k"), None) is None
+
+
+@linux_only
+def test_inotify_watcher_reports_created_and_modified_paths(tmp_path: Path) -> None:
+    # Arrange
+    module = tmp_path / "src" / "app.py"
+    module.parent.mkdir()
+    _ = module.write_text("x = 1\n", encoding="utf-8")
+    watcher = InotifyWatcher(tmp_path)
+    changed: set[str] = set()
+
+    # Act
+    try:
+        _ = module.write_text("x = 2\n", encoding="utf-8")
+        (tmp_path / "src" / "pkg").mkdir()
+        _ = (tmp_path / "src" / "pkg" / "mod.py").write_text("y = 1\n", encoding="utf-8")
+        (tmp_path / "__pycache__").mkdir()
+        for _attempt in range(20):
+            batch, overflow = watcher.poll(0.05)
+            assert not overflow
+            changed.update(batch)
+    finally:
+        watcher.close()
+
+    # Assert
+    assert {"src/app.py", "src/pkg", "src/pkg/mod.py"} <= changed
+    assert "__pycache__" not in changed
+
+
+@linux_only
+def test_execute_watch_publishes_and_removes_journal(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    seen: list[bool] = []
+    original = watch_cmd.watch_project
+
+    def fake_root(_: object) -> Path:
+        return tmp_path
+
+    def observing_watch(project_root: Path, **_: object) -> None:
+        def should_stop() -> bool:
+            seen.append(ChangeJournal(tmp_path).read() is not None)
+            return True
+
+        original(project_root, should_stop=should_stop)
+
+    monkeypatch.setattr(watch_cmd, "resolve_project_root", fake_root)
+    monkeypatch.setattr(watch_cmd, "watch_project", observing_watch)
+
+    # Act
+    exit_code = watch_cmd.execute_watch(_namespace())
+
+    # Assert
+    assert exit_code == 0
+    assert seen == [True]
+    assert ChangeJournal(tmp_path).read() is None
+
+
+@linux_only
+def test_watch_project_keeps_polling_while_callback_runs(tmp_path: Path) -> None:
+    # Arrange
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[frozenset[str]] = []
+    polls_during_callback = 0
+
+    def on_change(changed: frozenset[str]) -> None:
+        calls.append(changed)
+        started.set()
+        _ = release.wait(5.0)
+
+    def should_stop() -> bool:
+        nonlocal polls_during_callback
+        if not calls:
+            _ = (tmp_path / "app.py").write_text("x = 1\n", encoding="utf-8")
+            return False
+        polls_during_callback += 1
+        if polls_during_callback >= 3:
+            release.set()
+            return True
+        return False
+
+    # Act
+    thread = threading.Thread(
+        target=watch_project,
+        args=(tmp_path,),
+        kwargs={"on_change": on_change, "settle_seconds": 0.0, "should_stop": should_stop},
+    )
+    thread.start()
+    thread.join(10.0)
+
+    # Assert
+    assert not thread.is_alive()
+    assert started.is_set()
+    assert calls[0] >= {"app.py"}
+    assert polls_during_callback == 3
+
+
+def test_execute_watch_triggers_audit_with_forwarded_args(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # Arrange
+    commands: list[list[str]] = []
+
+    def fake_root(_: object) -> Path:
+        return tmp_path
+
+    def fake_watch(_root: Path, *, on_change: Callable[[frozenset[str]], object] | None, **_kwargs: object) -> None:
+        assert on_change is not None
+        _ = on_change(frozenset({"src/app.py"}))
+
+    def fake_run(argv: Sequence[str], **_: object) -> CommandOutput:
+        commands.append(list(argv))
+        return CommandOutput(args=list(argv), stdout="audit ok\n", stderr="", exit_code=0, duration_ms=1.0)
+
+    monkeypatch.setattr(watch_cmd, "resolve_project_root", fake_root)
+    monkeypatch.setattr(watch_cmd, "watch_project", fake_watch)
+    monkeypatch.setattr(watch_cmd, "run_command", fake_run)
+
+    # Act
+    exit_code = watch_cmd.execute_watch(_namespace(audit=True, audit_args=["--per-file-cache"]))
+
+    # Assert
+    assert exit_code == 0
+    assert commands == [[sys.executable, "-m", "ratchetr", "audit", "--per-file-cache"]]
+    output = capsys.readouterr().out
+    assert "1 changed path(s)" in output
+    assert "audit ok" in output
+
+
+def test_execute_watch_reports_unavailable_watcher(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    def fake_root(_: object) -> Path:
+        return tmp_path
+
+    def failing_watch(*_: object, **__: object) -> None:
+        msg = "ratchetr watch requires inotify (Linux)"
+        raise OSError(msg)
+
+    monkeypatch.setattr(watch_cmd, "resolve_project_root", fake_root)
+    monkeypatch.setattr(watch_cmd, "watch_project", failing_watch)
+
+    assert watch_cmd.execute_watch(_namespace()) == 1
+    assert "requires inotify" in capsys.readouterr().err
@@ -0,0 +1,45 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for lazy CLI command registration."""
+
+from __future__ import annotations
+
+import argparse
+from typing import cast
+
+import pytest
+
+from ratchetr.cli.app import COMMANDS, CommandSpec, _build_parser
+
+pytestmark = pytest.mark.unit
+
+
+def _subparser_help(parser: argparse.ArgumentParser) -> dict[str, str | None]:
+    action = next(action for action in parser._actions if isinstance(action, argparse._SubParsersAction))
+    subparsers = cast("argparse._SubParsersAction[argparse.ArgumentParser]", action)
+    return {choice.dest: choice.help for choice in subparsers._choices_actions}
+
+
+@pytest.mark.parametrize("spec", COMMANDS, ids=[spec.name for spec in COMMANDS])
+def test_stub_help_matches_registered_command(spec: CommandSpec) -> None:
+    assert _subparser_help(_build_parser(spec))[spec.name] == spec.help
+    assert _subparser_help(_build_parser())[spec.name] == spec.help
+
+
+def test_stub_parser_accepts_any_command_arguments() -> None:
+    args, extras = _build_parser().parse_known_args(["query", "overview", "--manifest", "m.json"])
+
+    assert args.command == "query"
+    assert extras == ["overview", "--manifest", "m.json"]
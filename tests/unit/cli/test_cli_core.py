@@ -44,7 +44,7 @@ from ratchetr.core.model_types import (
     SummaryStyle,
 )
 from ratchetr.core.type_aliases import RelPath, ToolName
-from ratchetr.core.types import RunResult
+from ratchetr.core.types import DiagnosticTable, RunResult
 from tests.fixtures.builders import build_diagnostic, build_readiness_summary
 
 if TYPE_CHECKING:
@@ -91,7 +91,7 @@ def _build_cli_runs(tmp_path: Path) -> tuple[RunResult, RunResult]:
         command=["pyright", "--project"],
         exit_code=0,
         duration_ms=0.1,
-        diagnostics=[diagnostic],
+        diagnostics=DiagnosticTable([diagnostic]),
         profile=None,
         config_file=None,
         plugin_args=["--strict"],
@@ -105,7 +105,7 @@ def _build_cli_runs(tmp_path: Path) -> tuple[RunResult, RunResult]:
         command=["pyright", "."],
         exit_code=0,
         duration_ms=0.1,
-        diagnostics=[],
+        diagnostics=DiagnosticTable(),
         profile="strict",
         config_file=tmp_path / "pyrightconfig.json",
         plugin_args=[],
@@ -23,8 +23,10 @@ import pytest
 from ratchetr.cli.helpers import (
     collect_profile_args,
     parse_comma_separated,
+    parse_hash_backend,
     parse_hash_workers,
     parse_int_mapping,
+    parse_jobs,
     parse_key_value_entries,
     print_summary,
     render_data,
@@ -40,6 +42,7 @@ from ratchetr.cli.helpers.formatting import (
 )
 from ratchetr.core.model_types import (
     DataFormat,
+    HashBackend,
     HotspotKind,
     ReadinessLevel,
     ReadinessStatus,
@@ -98,6 +101,31 @@ def test_parse_hash_workers_rejects_invalid() -> None:
         _ = parse_hash_workers("fast")
 
 
+def test_parse_hash_workers_with_backend_option() -> None:
+    assert parse_hash_workers("auto,backend=process") == "auto"
+    assert parse_hash_workers("backend=process") is None
+    assert parse_hash_backend("8, backend=Process") is HashBackend.PROCESS
+    assert parse_hash_backend("backend=thread") is HashBackend.THREAD
+    assert parse_hash_backend("4") is None
+    with pytest.raises(SystemExit, match=r"Unknown hash backend"):
+        _ = parse_hash_backend("auto,backend=gpu")
+    with pytest.raises(SystemExit, match=r"does not support option"):
+        _ = parse_hash_workers("auto,chunk=4")
+
+
+def test_parse_jobs_accepts_values() -> None:
+    assert parse_jobs("4") == 4
+    assert parse_jobs(" 0 ") == 0
+    assert parse_jobs(None) is None
+
+
+def test_parse_jobs_rejects_invalid() -> None:
+    with pytest.raises(SystemExit, match=r".*"):
+        _ = parse_jobs("-2")
+    with pytest.raises(SystemExit, match=r".*"):
+        _ = parse_jobs("auto")
+
+
 def test_render_data_accepts_enum() -> None:
     rows = render_data({"key": "value"}, DataFormat.TABLE)
     assert rows[0].startswith("key")
@@ -16,6 +16,10 @@
 
 from __future__ import annotations
 
+import shutil
+
+# ignore JUSTIFIED: the git override tests initialise a throwaway repository
+import subprocess  # noqa: S404  # nosec B404
 from pathlib import Path
 from typing import cast
 
@@ -44,7 +48,14 @@ from ratchetr.config import (
     UnsupportedConfigVersionError,
     load_config,
 )
-from ratchetr.core.model_types import FailOnPolicy, SeverityLevel, SignaturePolicy
+from ratchetr.core.model_types import (
+    FailOnPolicy,
+    FingerprintSource,
+    HashBackend,
+    RawRetention,
+    SeverityLevel,
+    SignaturePolicy,
+)
 from ratchetr.core.type_aliases import EngineName, ProfileName, RunId, RunnerName
 
 pytestmark = pytest.mark.unit
@@ -85,6 +96,21 @@ dashboard_html = "reports/dashboard.html"
     assert cfg.audit.runners == [RunnerName(PYRIGHT)]
 
 
+def test_load_config_reads_hash_backend(tmp_path: Path) -> None:
+    config_path = tmp_path / "ratchetr.toml"
+    consume(config_path.write_text('[audit]\nhash_backend = "Process"\n', encoding="utf-8"))
+
+    cfg = load_config(config_path)
+
+    assert cfg.audit.hash_backend is HashBackend.PROCESS
+    assert merge_audit_configs(cfg.audit, AuditConfig()).hash_backend is HashBackend.PROCESS
+    assert merge_audit_configs(cfg.audit, AuditConfig(hash_backend=HashBackend.THREAD)).hash_backend is (
+        HashBackend.THREAD
+    )
+    with pytest.raises(ValidationError, match="hash_backend must be one of"):
+        _ = AuditConfigModel.model_validate({"hash_backend": "gpu"})
+
+
 def test_load_config_engine_profiles(tmp_path: Path) -> None:
     config_path = tmp_path / "ratchetr.toml"
     consume(
@@ -213,6 +239,100 @@ exclude = ["legacy"]
     assert settings.include == ["."]
 
 
+_RICH_OVERRIDE = """
+[active_profiles]
+pyright = "strict"
+
+[engines.pyright]
+plugin_args = ["--project", "pyrightconfig.billing.json"]
+config_file = "pyrightconfig.billing.json"
+default_profile = "strict"
+
+[engines.pyright.profiles.strict]
+inherit = "base"
+plugin_args = ["--strict"]
+config_file = "strict.json"
+include = ["src"]
+
+[engines.pyright.profiles.base]
+exclude = ["legacy"]
+"""
+
+
+def _write_override(directory: Path, body: str = _RICH_OVERRIDE, name: str = "ratchetr.dir.toml") -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    override = directory / name
+    consume(override.write_text(body, encoding="utf-8"))
+    return override
+
+
+def test_load_config_skips_vendor_directories_for_overrides(tmp_path: Path) -> None:
+    config_path = tmp_path / "ratchetr.toml"
+    consume(config_path.write_text("[audit]\n", encoding="utf-8"))
+    consume(_write_override(tmp_path / "pkg"))
+    consume(_write_override(tmp_path / "pkg", name=".ratchetrdir.toml"))
+    for vendored in ("node_modules/lib", ".venv/lib", "build"):
+        consume(_write_override(tmp_path / vendored))
+
+    cfg = load_config(config_path)
+
+    assert [override.path for override in cfg.audit.path_overrides] == [tmp_path / "pkg", tmp_path / "pkg"]
+
+
+def test_load_config_reuses_cached_overrides(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    config_path = tmp_path / "ratchetr.toml"
+    consume(config_path.write_text("[audit]\n", encoding="utf-8"))
+    override_path = _write_override(tmp_path / "pkg")
+    parsed = load_config(config_path).audit.path_overrides
+    assert (tmp_path / ".ratchetr_cache" / config_module.loader.OVERRIDE_CACHE_FILENAME).exists()
+
+    def _fail_parse(path: Path) -> PathOverride:
+        msg = f"unchanged override {path} should come from the cache"
+        raise AssertionError(msg)
+
+    with monkeypatch.context() as patch:
+        patch.setattr("ratchetr.config.loader._parse_path_override", _fail_parse)
+        cached = load_config(config_path).audit.path_overrides
+    assert cached == parsed
+    assert cached[0].engine_settings[PYRIGHT].profiles[STRICT].config_file == tmp_path / "pkg" / "strict.json"
+
+    consume(override_path.write_text('[active_profiles]\npyright = "lenient"\n', encoding="utf-8"))
+    edited = load_config(config_path).audit.path_overrides
+    assert edited[0].active_profiles == {PYRIGHT: LENIENT}
+
+
+def test_load_config_ignores_gitignored_overrides(tmp_path: Path) -> None:
+    git_cmd = shutil.which("git")
+    if git_cmd is None:
+        pytest.skip("git is not installed")
+    # ignore JUSTIFIED: drives a throwaway repository created by the test
+    consume(subprocess.run([git_cmd, "init", "-q", str(tmp_path)], check=True))  # noqa: S603  # nosec B603
+    consume((tmp_path / ".gitignore").write_text("generated/\n", encoding="utf-8"))
+    config_path = tmp_path / "ratchetr.toml"
+    consume(config_path.write_text("[audit]\n", encoding="utf-8"))
+    consume(_write_override(tmp_path / "pkg"))
+    consume(_write_override(tmp_path / "generated"))
+
+    cfg = load_config(config_path)
+
+    assert [override.path for override in cfg.audit.path_overrides] == [tmp_path / "pkg"]
+
+
+def test_load_config_keeps_git_tracked_overrides_in_pruned_directories(tmp_path: Path) -> None:
+    git_cmd = shutil.which("git")
+    if git_cmd is None:
+        pytest.skip("git is not installed")
+    # ignore JUSTIFIED: drives a throwaway repository created by the test
+    consume(subprocess.run([git_cmd, "init", "-q", str(tmp_path)], check=True))  # noqa: S603  # nosec B603
+    config_path = tmp_path / "ratchetr.toml"
+    consume(config_path.write_text("[audit]\n", encoding="utf-8"))
+    consume(_write_override(tmp_path / "build"))
+
+    cfg = load_config(config_path)
+
+    assert [override.path for override in cfg.audit.path_overrides] == [tmp_path / "build"]
+
+
 def test_load_config_defaults_without_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     monkeypatch.chdir(tmp_path)
     cfg = load_config()
@@ -286,6 +406,22 @@ def test_audit_config_model_coerces_limits_and_fail_on() -> None:
         _ = AuditConfigModel.model_validate({"fail_on": 123})
 
 
+def test_audit_config_model_coerces_raw_retention() -> None:
+    model = AuditConfigModel.model_validate({"raw_retention": " FULL "})
+    assert model.raw_retention is RawRetention.FULL
+    with pytest.raises(ValidationError, match="raw_retention must be one of"):
+        _ = AuditConfigModel.model_validate({"raw_retention": "some"})
+    with pytest.raises(ValidationError, match="raw_retention must be a string"):
+        _ = AuditConfigModel.model_validate({"raw_retention": 1})
+
+
+def test_audit_config_model_coerces_fingerprint_source() -> None:
+    model = AuditConfigModel.model_validate({"fingerprint_source": "Git"})
+    assert model.fingerprint_source is FingerprintSource.GIT
+    with pytest.raises(ValidationError, match="fingerprint_source must be one of"):
+        _ = AuditConfigModel.model_validate({"fingerprint_source": "svn"})
+
+
 def test_audit_config_model_coerces_plugin_args_non_dict() -> None:
     model = AuditConfigModel.model_validate({"plugin_args": ["not-a-dict"]})
     assert model.plugin_args == {}
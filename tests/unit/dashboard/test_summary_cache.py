@@ -0,0 +1,211 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the dashboard summary cache."""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ratchetr.core.model_types import ManifestValidation, Mode
+from ratchetr.dashboard import build_summary, load_manifest
+from ratchetr.dashboard import cache as cache_module
+from ratchetr.dashboard.cache import SummaryCache, manifest_digest
+from ratchetr.manifest import trust as trust_module
+from ratchetr.manifest.builder import ManifestBuilder
+from ratchetr.manifest.trust import stamp_path_for
+from ratchetr.services import dashboard as dashboard_service
+from ratchetr.services.dashboard import load_summary_from_manifest
+from tests.fixtures.builders import build_sample_run
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ratchetr.core.summary_types import SummaryData
+
+pytestmark = pytest.mark.unit
+
+
+def _write_manifest(tmp_path: Path, name: str = "typing_audit.json") -> Path:
+    builder = ManifestBuilder(tmp_path, tool_versions={})
+    current = build_sample_run(num_files=6, diagnostics_per_file=4)
+    builder.add_run(current)
+    builder.add_run(replace(current, mode=Mode.FULL))
+    output_path = tmp_path / name
+    builder.write(output_path)
+    return output_path
+
+
+def _failing_build() -> SummaryData:
+    msg = "summary should have been served from the cache"
+    raise AssertionError(msg)
+
+
+def test_cached_summary_matches_built_summary(tmp_path: Path) -> None:
+    # Arrange
+    manifest_path = _write_manifest(tmp_path)
+    cache = SummaryCache(tmp_path / "summaries", version="1.0")
+    expected = build_summary(load_manifest(manifest_path))
+    _ = cache.load(manifest_path, lambda: expected)
+
+    # Act
+    cached = cache.load(manifest_path, _failing_build)
+
+    # Assert
+    assert cached == expected
+
+
+def test_changed_manifest_or_version_misses(tmp_path: Path) -> None:
+    # Arrange
+    manifest_path = _write_manifest(tmp_path)
+    summary = build_summary(load_manifest(manifest_path))
+    SummaryCache(tmp_path / "summaries", version="1.0").store(manifest_path, summary)
+    calls: list[str] = []
+
+    def _build() -> SummaryData:
+        calls.append("built")
+        return summary
+
+    # Act
+    _ = SummaryCache(tmp_path / "summaries", version="2.0").load(manifest_path, _build)
+    _ = manifest_path.write_text(json.dumps(load_manifest(manifest_path)), encoding="utf-8")
+    _ = SummaryCache(tmp_path / "summaries", version="1.0").load(manifest_path, _build)
+
+    # Assert
+    assert calls == ["built", "built"]
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    # Arrange
+    cache = SummaryCache(tmp_path / "summaries", version="1.0", max_entries=2)
+    summary = build_summary(load_manifest(_write_manifest(tmp_path)))
+    for position, key in enumerate(("a", "b")):
+        cache.put(key, summary)
+        os.utime(cache.directory / f"{key}.json", ns=(position, position))
+    assert cache.get("a") is not None
+
+    # Act
+    cache.put("c", summary)
+
+    # Assert
+    assert sorted(path.stem for path in cache.directory.glob("*.json")) == ["a", "c"]
+
+
+def test_corrupt_entry_is_discarded(tmp_path: Path) -> None:
+    # Arrange
+    manifest_path = _write_manifest(tmp_path)
+    cache = SummaryCache(tmp_path / "summaries", version="1.0")
+    key = manifest_digest(manifest_path, version="1.0")
+    cache.directory.mkdir()
+    entry = cache.directory / f"{key}.json"
+    _ = entry.write_text('{"tabs": []}', encoding="utf-8")
+
+    # Act
+    summary = cache.get(key)
+
+    # Assert
+    assert summary is None
+    assert not entry.exists()
+
+
+def test_unchanged_manifest_is_not_rehashed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    manifest_path = _write_manifest(tmp_path)
+    cache = SummaryCache(tmp_path / "summaries", version="1.0")
+    hashed: list[Path] = []
+
+    def counting_digest(path: Path, *, version: str) -> str:
+        hashed.append(path)
+        return manifest_digest(path, version=version)
+
+    monkeypatch.setattr(cache_module, "manifest_digest", counting_digest)
+    first = cache.key_for(manifest_path)
+
+    # Act
+    second = cache.key_for(manifest_path)
+    os.utime(manifest_path, ns=(1, 1))
+    touched = cache.key_for(manifest_path)
+
+    # Assert
+    assert first == second == touched
+    assert hashed == [manifest_path, manifest_path]
+
+
+def test_manifest_outside_a_project_is_not_cached(tmp_path: Path) -> None:
+    manifest_path = _write_manifest(tmp_path)
+
+    assert SummaryCache.for_manifest(manifest_path) is None
+    assert not (tmp_path / ".ratchetr_cache").exists()
+
+
+def test_unwritable_cache_directory_disables_caching(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _ = (tmp_path / "pyproject.toml").write_text("", encoding="utf-8")
+    manifest_path = _write_manifest(tmp_path)
+
+    def read_only(_path: Path, mode: int) -> bool:
+        return not mode & os.W_OK
+
+    monkeypatch.setattr(cache_module.os, "access", read_only)
+
+    assert SummaryCache.for_manifest(manifest_path) is None
+
+
+def test_load_summary_from_manifest_uses_project_cache(tmp_path: Path) -> None:
+    # Arrange
+    _ = (tmp_path / "pyproject.toml").write_text("", encoding="utf-8")
+    manifest_path = _write_manifest(tmp_path)
+    cache = SummaryCache.for_manifest(manifest_path)
+    assert cache is not None
+
+    # Act
+    first = load_summary_from_manifest(manifest_path, cache=cache)
+    indexed = load_summary_from_manifest(manifest_path, indexed=True, cache=cache)
+
+    # Assert
+    assert cache.directory == tmp_path / ".ratchetr_cache" / "summaries"
+    assert len(list(cache.directory.glob("*.json"))) == 1
+    assert indexed == first == build_summary(load_manifest(manifest_path))
+
+
+@pytest.mark.parametrize("stamped", [True, False])
+def test_cached_summary_is_served_without_validating_or_hashing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, *, stamped: bool
+) -> None:
+    # Arrange
+    _ = (tmp_path / "pyproject.toml").write_text("", encoding="utf-8")
+    manifest_path = _write_manifest(tmp_path)
+    if not stamped:
+        stamp_path_for(manifest_path).unlink()
+    cache = SummaryCache.for_manifest(manifest_path)
+    assert cache is not None
+    first = load_summary_from_manifest(manifest_path, cache=cache)
+
+    def unexpected(*_args: object, **_kwargs: object) -> str:
+        msg = "an unchanged manifest should not be validated or hashed again"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(dashboard_service, "load_manifest", unexpected)
+    monkeypatch.setattr(trust_module, "manifest_file_digest", unexpected)
+    monkeypatch.setattr(cache_module, "manifest_digest", unexpected)
+
+    # Act
+    second = load_summary_from_manifest(manifest_path, cache=cache, validation=ManifestValidation.FAST)
+
+    # Assert
+    assert second == first
@@ -21,11 +21,12 @@ from typing import TYPE_CHECKING
 import pytest
 
 from ratchetr.config import AuditConfig
-from ratchetr.core.model_types import CategoryMapping, Mode
+from ratchetr.core.model_types import CategoryMapping, Mode, RawRetention
 from ratchetr.core.type_aliases import ProfileName, RelPath, ToolName
 from ratchetr.engines.base import EngineContext, EngineOptions, EngineResult
 from ratchetr.engines.builtin.mypy import MypyEngine
 from ratchetr.engines.builtin.pyright import PyrightEngine
+from ratchetr.runtime import DaemonRegistry
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -40,6 +41,7 @@ def _make_context(
     mode: Mode = Mode.CURRENT,
     plugin_args: Sequence[str] | None = None,
     config_file: Path | None = None,
+    daemon: bool | None = None,
 ) -> EngineContext:
     options = EngineOptions(
         plugin_args=list(plugin_args or []),
@@ -50,7 +52,7 @@ def _make_context(
     )
     return EngineContext(
         project_root=project_root,
-        audit_config=AuditConfig(),
+        audit_config=AuditConfig(daemon=daemon),
         mode=mode,
         engine_options=options,
     )
@@ -62,9 +64,10 @@ def test_mypy_engine_builds_command_with_defaults(tmp_path: Path, monkeypatch: p
     monkeypatch.setattr("ratchetr.engines.builtin.mypy.python_executable", lambda: "py")
     context = _make_context(tmp_path, plugin_args=["--strict"])
 
-    def fake_run_mypy(root: Path, *, mode: Mode, command: list[str]) -> EngineResult:
+    def fake_run_mypy(root: Path, *, mode: Mode, command: list[str], raw_retention: RawRetention) -> EngineResult:
         assert root == tmp_path
         assert mode == Mode.CURRENT
+        assert raw_retention is RawRetention.MINIMAL
         assert "--config-file" in command
         assert "--no-pretty" in command
         return EngineResult(
@@ -86,7 +89,7 @@ def test_mypy_engine_full_mode_appends_paths(tmp_path: Path, monkeypatch: pytest
     context = _make_context(tmp_path, mode=Mode.FULL)
     paths = [RelPath("pkg/app.py"), RelPath("pkg/utils.py")]
 
-    def fake_run_mypy(root: Path, *, mode: Mode, command: list[str]) -> EngineResult:
+    def fake_run_mypy(root: Path, *, mode: Mode, command: list[str], **_: object) -> EngineResult:
         assert root == tmp_path
         assert mode == Mode.FULL
         assert command[-2:] == ["pkg/app.py", "pkg/utils.py"]
@@ -104,12 +107,52 @@ def test_mypy_engine_full_mode_appends_paths(tmp_path: Path, monkeypatch: pytest
     _ = engine.run(context, paths)
 
 
+def test_mypy_engine_daemon_mode_uses_registered_dmypy(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    engine = MypyEngine()
+    monkeypatch.setattr("ratchetr._internal.daemons.python_executable", lambda: "py")
+    context = _make_context(tmp_path, mode=Mode.FULL, daemon=True)
+    captured: dict[str, list[str]] = {}
+
+    def fake_run_mypy(root: Path, *, mode: Mode, command: list[str], **_: object) -> EngineResult:
+        assert root == tmp_path
+        captured["command"] = command
+        return EngineResult(
+            engine=ToolName("mypy"), mode=mode, command=command, exit_code=0, duration_ms=1.0, diagnostics=[]
+        )
+
+    monkeypatch.setattr("ratchetr.engines.builtin.mypy.run_mypy", fake_run_mypy)
+    _ = engine.run(context, [RelPath("pkg/app.py")])
+
+    registry = DaemonRegistry(tmp_path)
+    status_file = str(registry.status_file("mypy:full"))
+    command = captured["command"]
+    assert command[:7] == ["py", "-m", "mypy.dmypy", "--status-file", status_file, "run", "--timeout"]
+    assert command[8] == "--"
+    assert command[-1] == "pkg/app.py"
+    (record,) = registry.records()
+    assert record.name == "mypy:full"
+    assert record.stop_command == ("py", "-m", "mypy.dmypy", "--status-file", status_file, "stop")
+    assert not record.running
+
+
+def test_mypy_engine_plan_command_does_not_register_daemon(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    engine = MypyEngine()
+    monkeypatch.setattr("ratchetr._internal.daemons.python_executable", lambda: "py")
+    context = _make_context(tmp_path, mode=Mode.FULL, daemon=True)
+
+    command = engine.plan_command(context, [RelPath("pkg/app.py")])
+
+    assert command[:3] == ["py", "-m", "mypy.dmypy"]
+    assert command[-1] == "pkg/app.py"
+    assert not DaemonRegistry(tmp_path).records()
+
+
 def test_mypy_engine_run_invokes_runner(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     engine = MypyEngine()
     context = _make_context(tmp_path)
     captured: dict[str, object] = {}
 
-    def fake_run_mypy(root: Path, *, mode: Mode, command: list[str]) -> object:
+    def fake_run_mypy(root: Path, *, mode: Mode, command: list[str], **_: object) -> object:
         captured["root"] = root
         captured["mode"] = mode
         captured["command"] = command
@@ -129,7 +172,7 @@ def test_pyright_engine_current_prefers_default_config(tmp_path: Path, monkeypat
 
     recorded: dict[str, list[str] | str] = {}
 
-    def fake_run_pyright(root: Path, *, mode: Mode, command: list[str]) -> EngineResult:
+    def fake_run_pyright(root: Path, *, mode: Mode, command: list[str], **_: object) -> EngineResult:
         recorded["command"] = list(command)
         recorded["root"] = str(root)
         return EngineResult(
@@ -153,7 +196,7 @@ def test_pyright_engine_full_with_paths(tmp_path: Path, monkeypatch: pytest.Monk
     paths = [RelPath("src/app.py")]
     context_no_paths = _make_context(tmp_path, mode=Mode.FULL)
 
-    def fake_run_pyright(root: Path, *, mode: Mode, command: list[str]) -> EngineResult:
+    def fake_run_pyright(root: Path, *, mode: Mode, command: list[str], **_: object) -> EngineResult:
         assert root == tmp_path
         assert mode == Mode.FULL
         # When explicit paths are provided, the last argument should be the path.
@@ -215,7 +258,7 @@ def test_pyright_engine_current_without_config_uses_project_root(
     engine = PyrightEngine()
     context = _make_context(tmp_path)
 
-    def fake_run_pyright(root: Path, *, mode: Mode, command: list[str]) -> EngineResult:
+    def fake_run_pyright(root: Path, *, mode: Mode, command: list[str], **_: object) -> EngineResult:
         assert root == tmp_path
         assert mode == Mode.CURRENT
         assert str(tmp_path) in command
@@ -16,18 +16,20 @@
 
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 
-from ratchetr.core.model_types import Mode, SeverityLevel
+from ratchetr.core.model_types import Mode, RawRetention, SeverityLevel
 from ratchetr.engines.execution import run_mypy, run_pyright
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
     from collections.abc import Set as AbstractSet
+    from typing import IO
 
 pytestmark = [pytest.mark.unit, pytest.mark.engine]
 
@@ -41,6 +43,27 @@ class _CommandResult:
         self.duration_ms = 12.5
 
 
+def _fake_stream_command(
+    expected_cwd: Path,
+    *,
+    stdout: str = "",
+    stderr: str = "",
+) -> Callable[..., tuple[_CommandResult, object]]:
+    def fake(
+        argv: Sequence[str],
+        cwd: Path,
+        *,
+        allowed: AbstractSet[str],
+        consumer: Callable[[IO[str]], object],
+    ) -> tuple[_CommandResult, object]:
+        assert "pyright" in argv[0]
+        assert cwd == expected_cwd
+        assert allowed == {"pyright"}
+        return _CommandResult(stderr=stderr), consumer(io.StringIO(stdout))
+
+    return fake
+
+
 def test_run_pyright_parses_payload_and_warns_on_summary_mismatch(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -58,16 +81,6 @@ def test_run_pyright_parses_payload_and_warns_on_summary_mismatch(
     }
     captured_warning: dict[str, tuple[int, int, int, int, int, int]] = {}
 
-    def fake_run_command(
-        argv: Sequence[str],
-        cwd: Path,
-        allowed: AbstractSet[str],
-    ) -> _CommandResult:
-        assert "pyright" in argv[0]
-        assert cwd == tmp_path
-        assert allowed == {"pyright"}
-        return _CommandResult(stdout=json.dumps(payload))
-
     # ignore JUSTIFIED: helper mirrors logging signature; long params keep coverage
     def fake_warning(  # noqa: PLR0917, FIX002, TD003  # TODO@PantherianCodeX: Reduce positional parameters in fake warning helper
         _msg: str,
@@ -90,7 +103,10 @@ def test_run_pyright_parses_payload_and_warns_on_summary_mismatch(
             tool_total,
         )
 
-    monkeypatch.setattr("ratchetr.engines.execution.run_command", fake_run_command)
+    monkeypatch.setattr(
+        "ratchetr.engines.execution.stream_command",
+        _fake_stream_command(tmp_path, stdout=json.dumps(payload)),
+    )
     monkeypatch.setattr("ratchetr.engines.execution.logger.warning", fake_warning)
     result = run_pyright(tmp_path, mode=Mode.CURRENT, command=["pyright", "--outputjson"])
     assert len(result.diagnostics) == 1
@@ -100,6 +116,81 @@ def test_run_pyright_parses_payload_and_warns_on_summary_mismatch(
     assert captured_warning["payload"] == (1, 0, 1, 2, 0, 2)
 
 
+def test_run_pyright_counts_severities_while_streaming(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    severities = ["error", "warning", "information", "error"]
+    payload = {
+        "version": "1.1.400",
+        "generalDiagnostics": [
+            {
+                "file": str(tmp_path / f"pkg/mod_{index}.py"),
+                "range": {"start": {"line": index, "character": 0}},
+                "severity": severity,
+                "message": f"issue {index}",
+            }
+            for index, severity in enumerate(severities)
+        ],
+        "summary": {"errorCount": 2, "warningCount": 1, "informationCount": 1},
+    }
+    warnings: list[str] = []
+    monkeypatch.setattr(
+        "ratchetr.engines.execution.stream_command",
+        _fake_stream_command(tmp_path, stdout=json.dumps(payload)),
+    )
+    monkeypatch.setattr("ratchetr.engines.execution.logger.warning", lambda msg, *_, **__: warnings.append(msg))
+
+    result = run_pyright(tmp_path, mode=Mode.CURRENT, command=["pyright", "--outputjson"])
+
+    assert [diag.line for diag in result.diagnostics] == [1, 2, 3, 4]
+    assert result.tool_summary == {"errors": 2, "warnings": 1, "information": 1, "total": 4}
+    assert not warnings
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected_raw"),
+    [
+        (RawRetention.NONE, {}),
+        (RawRetention.MINIMAL, {"range": {"start": {"line": 2, "character": 0}}}),
+    ],
+)
+def test_run_pyright_applies_raw_retention_and_shares_paths(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    policy: RawRetention,
+    expected_raw: dict[str, object],
+) -> None:
+    item = {
+        "file": str(tmp_path / "pkg/app.py"),
+        "range": {"start": {"line": 2, "character": 0}},
+        "severity": "error",
+        "message": "duplicate",
+        "rule": "reportGeneral",
+    }
+    monkeypatch.setattr(
+        "ratchetr.engines.execution.stream_command",
+        _fake_stream_command(tmp_path, stdout=json.dumps({"generalDiagnostics": [item, item]})),
+    )
+
+    result = run_pyright(tmp_path, mode=Mode.CURRENT, command=["pyright"], raw_retention=policy)
+
+    first, second = result.diagnostics
+    assert first.raw == expected_raw
+    assert first.path is second.path
+    assert first.message is second.message
+
+
+def test_run_pyright_falls_back_to_stderr_payload(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = {"generalDiagnostics": [], "summary": {"errorCount": 0}}
+    monkeypatch.setattr(
+        "ratchetr.engines.execution.stream_command",
+        _fake_stream_command(tmp_path, stderr=json.dumps(payload)),
+    )
+
+    result = run_pyright(tmp_path, mode=Mode.CURRENT, command=["pyright", "--outputjson"])
+
+    assert result.diagnostics == []
+    assert result.tool_summary == {"errors": 0, "warnings": 0, "information": 0, "total": 0}
+
+
 def test_run_mypy_parses_stdout_and_stderr(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     stdout = "\n".join([
         f"{tmp_path / 'pkg' / 'app.py'}:10:5: error: failure [E001]",
@@ -124,3 +215,20 @@ def test_run_mypy_parses_stdout_and_stderr(tmp_path: Path, monkeypatch: pytest.M
     assert any("config error" in message for message in messages)
     assert any("invalid line" in message for message in messages)
     assert any("failure" in message for message in messages)
+
+
+def test_run_mypy_skips_dmypy_lifecycle_lines(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    stdout = (
+        "Daemon started\n"
+        "Restarting: configuration changed\n"
+        "pkg/app.py:3: error: boom  [misc]\n"
+        "Found 1 error in 1 file (checked 1 source file)\n"
+    )
+
+    def fake_run_command(argv: Sequence[str], cwd: Path, allowed: AbstractSet[str]) -> _CommandResult:
+        _ = (argv, cwd, allowed)
+        return _CommandResult(stdout=stdout, stderr="", exit_code=1)
+
+    monkeypatch.setattr("ratchetr.engines.execution.run_command", fake_run_command)
+    result = run_mypy(tmp_path, mode=Mode.FULL, command=["python", "-m", "mypy.dmypy", "run", "--"])
+    assert [(diag.code, diag.message) for diag in result.diagnostics] == [("misc", "boom")]
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from importlib import metadata
 from typing import TYPE_CHECKING
 
 import pytest
@@ -27,15 +28,18 @@ from ratchetr.core.type_aliases import EngineName, RelPath
 from ratchetr.engines.base import EngineContext, EngineOptions
 from ratchetr.engines.registry import (
     ENTRY_POINT_GROUP,
+    ENTRY_POINTS_FILENAME,
     EngineDescriptor,
     builtin_engines,
+    clear_engine_discovery_cache,
     describe_engines,
+    engine_entry_points,
     entrypoint_engines,
     resolve_engines,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
     from pathlib import Path
 
 pytestmark = [pytest.mark.unit, pytest.mark.engine]
@@ -43,10 +47,10 @@ pytestmark = [pytest.mark.unit, pytest.mark.engine]
 
 @pytest.fixture(autouse=True)
 def clear_engine_caches() -> Generator[None, None, None]:
-    entrypoint_engines.cache_clear()
+    clear_engine_discovery_cache()
     builtin_engines.cache_clear()
     yield
-    entrypoint_engines.cache_clear()
+    clear_engine_discovery_cache()
     builtin_engines.cache_clear()
 
 
@@ -117,6 +121,91 @@ def test_entrypoint_engines_ignores_invalid(monkeypatch: pytest.MonkeyPatch) ->
     assert engines == {}
 
 
+class OtherEngine(DummyEngine):
+    """Plugin engine that resolving other engines should not need to load."""
+
+    name = "other"
+
+
+class PyrightOverride(DummyEngine):
+    """Plugin engine replacing the builtin pyright engine."""
+
+    name = "pyright"
+
+
+_LOADED_PLUGINS: list[str] = []
+
+
+def _load_other_engine() -> OtherEngine:
+    _LOADED_PLUGINS.append("other")
+    return OtherEngine()
+
+
+def _entry_point(name: str, target: Callable[[], object]) -> metadata.EntryPoint:
+    return metadata.EntryPoint(name=name, value=f"{__name__}:{target.__name__}", group=ENTRY_POINT_GROUP)
+
+
+def test_resolve_engines_loads_only_selected_plugins(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    entry_points = metadata.EntryPoints([
+        _entry_point("dummy", DummyEngine),
+        _entry_point("other", _load_other_engine),
+    ])
+
+    def fake_metadata_entry_points() -> metadata.EntryPoints:
+        return entry_points
+
+    monkeypatch.setattr("ratchetr.engines.registry.metadata.entry_points", fake_metadata_entry_points)
+    _LOADED_PLUGINS.clear()
+    first = resolve_engines(["dummy", "pyright"], cache_dir=tmp_path)
+    clear_engine_discovery_cache()
+
+    # Act
+    engines = resolve_engines(["dummy", "pyright"], cache_dir=tmp_path)
+
+    # Assert
+    assert [engine.name for engine in first] == [engine.name for engine in engines] == ["dummy", "pyright"]
+    assert type(engines[0]).__name__ == "DummyEngine"
+    assert engines[1] is builtin_engines()[EngineName("pyright")]
+    # The first run had to load "other" to learn it does not override pyright.
+    assert _LOADED_PLUGINS == ["other"]
+
+
+def test_resolve_engines_honours_plugin_overriding_builtin(monkeypatch: pytest.MonkeyPatch) -> None:
+    entry_points = metadata.EntryPoints([_entry_point("fancy-pyright", PyrightOverride)])
+
+    def fake_metadata_entry_points() -> metadata.EntryPoints:
+        return entry_points
+
+    monkeypatch.setattr("ratchetr.engines.registry.metadata.entry_points", fake_metadata_entry_points)
+
+    engines = resolve_engines(["pyright"])
+
+    assert [type(engine).__name__ for engine in engines] == ["PyrightOverride"]
+
+
+def test_engine_entry_points_persist_per_environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    entry_point = metadata.EntryPoint(name="dummy", value=f"{__name__}:DummyEngine", group=ENTRY_POINT_GROUP)
+    scans: list[str] = []
+
+    def fake_metadata_entry_points() -> metadata.EntryPoints:
+        scans.append("scan")
+        return metadata.EntryPoints([entry_point])
+
+    monkeypatch.setattr("ratchetr.engines.registry.metadata.entry_points", fake_metadata_entry_points)
+    assert engine_entry_points(cache_dir=tmp_path) == (entry_point,)
+    assert (tmp_path / ENTRY_POINTS_FILENAME).exists()
+
+    clear_engine_discovery_cache()
+    assert engine_entry_points(cache_dir=tmp_path) == (entry_point,)
+    assert scans == ["scan"]
+
+    clear_engine_discovery_cache()
+    monkeypatch.setattr("ratchetr.engines.registry._environment_key", lambda: "changed")
+    assert engine_entry_points(cache_dir=tmp_path) == (entry_point,)
+    assert scans == ["scan", "scan"]
+
+
 def test_describe_engines_reports_builtin(monkeypatch: pytest.MonkeyPatch) -> None:
     def fake_entrypoint_engines() -> dict[EngineName, object]:
         return {}
@@ -21,14 +21,14 @@ from collections import Counter
 import pytest
 
 from ratchetr.core.model_types import RecommendationCode, SeverityLevel
-from ratchetr.core.type_aliases import RuleName
 from ratchetr.manifest.aggregate import (
     FileSummary,
     FolderSummary,
+    _add_severity_counts,
     _canonical_category_mapping,
     _Categoriser,
+    _shared_categoriser,
     _split_rel_path,
-    _update_file_summary,
 )
 
 pytestmark = pytest.mark.unit
@@ -62,6 +62,21 @@ def test_categoriser_matches_fallback_and_custom_patterns() -> None:
     assert categoriser.categorise("unknown-type") == "unknownChecks"
 
 
+def test_categoriser_keeps_category_order_and_escapes_patterns() -> None:
+    categoriser = _Categoriser({"unusedSymbols": ["a.b", "zz"], "optionalChecks": ["(opt"]})
+    # "(opt" occurs first in the code, but custom categories are checked in mapping order.
+    assert categoriser.categorise("(opt-zz") == "unusedSymbols"
+    assert categoriser.categorise("axb") == "general"
+    assert categoriser.categorise("reportOptionalMemberAccess") == "optionalChecks"
+    assert categoriser.categorise(None) == "general"
+
+
+def test_shared_categoriser_is_reused_for_identical_mappings() -> None:
+    mapping = (("optionalChecks", ("opt",)),)
+    assert _shared_categoriser(mapping) is _shared_categoriser((("optionalChecks", ("opt",)),))
+    assert _shared_categoriser(mapping) is not _shared_categoriser(())
+
+
 def test_split_rel_path_normalises_and_caches() -> None:
     path = "src/module/app.py"
     parts = _split_rel_path(path)
@@ -69,27 +84,12 @@ def test_split_rel_path_normalises_and_caches() -> None:
     assert _split_rel_path(path) == parts
 
 
-def test_update_file_summary_increments_counts() -> None:
+def test_add_severity_counts_updates_file_and_folder_summaries() -> None:
+    counts = Counter({SeverityLevel.ERROR: 2, SeverityLevel.WARNING: 1, SeverityLevel.INFORMATION: 3})
     file_summary = FileSummary(path="src/app.py")
-    severity_totals = Counter()
-    rule_totals: Counter[RuleName] = Counter()
-    category_totals = Counter()
-    categoriser = _Categoriser({})
-    _update_file_summary(
-        file_summary,
-        severity=SeverityLevel.ERROR,
-        code="E",
-        diagnostic={
-            "line": 1,
-            "column": 1,
-            "severity": "error",
-            "code": "E",
-            "message": "msg",
-        },
-        severity_totals=severity_totals,
-        rule_totals=rule_totals,
-        category_totals=category_totals,
-        categoriser=categoriser,
-    )
-    assert file_summary.errors == 1
-    assert rule_totals[RuleName("E")] == 1
+    folder_summary = FolderSummary(path="src", depth=1)
+    _add_severity_counts(file_summary, counts)
+    _add_severity_counts(folder_summary, counts)
+    _add_severity_counts(folder_summary, {SeverityLevel.ERROR: 1})
+    assert (file_summary.errors, file_summary.warnings, file_summary.information) == (2, 1, 3)
+    assert (folder_summary.errors, folder_summary.warnings, folder_summary.information) == (3, 1, 3)
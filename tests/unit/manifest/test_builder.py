@@ -17,19 +17,24 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING
+from enum import Enum
+from typing import TYPE_CHECKING, cast
 
 import pytest
 
-from ratchetr.core.model_types import Mode, SeverityLevel
+from ratchetr.core.model_types import Mode, RawRetention, SeverityLevel
 from ratchetr.core.type_aliases import RelPath, ToolName
-from ratchetr.core.types import Diagnostic, RunResult
+from ratchetr.core.types import Diagnostic, DiagnosticTable, RunResult
+from ratchetr.json import normalise_enums_for_json
 from ratchetr.manifest.builder import ManifestBuilder
+from ratchetr.manifest.writer import write_manifest
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
     from pathlib import Path
 
+    from ratchetr.manifest.typed import ManifestData
+
 pytestmark = pytest.mark.unit
 
 
@@ -50,7 +55,7 @@ def _make_run(tmp_path: Path) -> RunResult:
         command=["pyright"],
         exit_code=1,
         duration_ms=10.5,
-        diagnostics=[diagnostic],
+        diagnostics=DiagnosticTable([diagnostic]),
         plugin_args=["--lib"],
         include=[RelPath("src")],
         exclude=[RelPath("tests")],
@@ -82,6 +87,75 @@ def test_manifest_builder_adds_run_and_writes(tmp_path: Path, monkeypatch: pytes
     assert payload["runs"]
 
 
+def test_manifest_builder_reuses_detected_tool_versions(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    builder = ManifestBuilder(tmp_path, tool_versions={"pyright": "1.1.0", "mypy": "1.5.0"})
+    builder.add_run(_make_run(tmp_path))
+
+    def fail_detect_tool_versions(*_: object, **__: object) -> dict[str, str]:
+        pytest.fail("tool versions should not be probed again")
+
+    monkeypatch.setattr("ratchetr.manifest.builder.detect_tool_versions", fail_detect_tool_versions)
+
+    output_path = tmp_path / "typing_audit.json"
+    builder.write(output_path)
+    payload = json.loads(output_path.read_text(encoding="utf-8"))
+    assert payload["toolVersions"] == {"pyright": "1.1.0"}
+
+
+def test_manifest_builder_streams_same_bytes_as_json_dumps(tmp_path: Path) -> None:
+    builder = ManifestBuilder(tmp_path, tool_versions={"pyright": "1.1.0"})
+    builder.add_run(_make_run(tmp_path))
+    builder.add_run(_make_run(tmp_path))
+    builder.data["runs"][1]["perFile"] = []
+    output_path = tmp_path / "typing_audit.json"
+
+    builder.write(output_path)
+
+    expected = json.dumps(normalise_enums_for_json(builder.data), indent=2) + "\n"
+    assert output_path.read_text(encoding="utf-8") == expected
+    # Only the trust stamp remains beside the manifest; no temp files leak.
+    assert [path.name for path in tmp_path.glob(".typing_audit.json.*")] == [".typing_audit.json.stamp"]
+
+
+class _Channel(Enum):
+    STABLE = 1
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_write_manifest_matches_normalised_json_dumps(tmp_path: Path, *, compact: bool) -> None:
+    entry: dict[object, object] = {
+        "path": tmp_path / "pkg" / "app.py",
+        "nested": {_Channel.STABLE: {None: True, True: (1, Mode.FULL), 2: SeverityLevel.ERROR}},
+    }
+    data = cast(
+        "ManifestData",
+        {"runs": [{"perFile": [entry], Mode.CURRENT: {None: "x", False: [Mode.FULL]}}], None: tmp_path},
+    )
+    output_path = tmp_path / "typing_audit.json"
+
+    write_manifest(data, output_path, compact=compact)
+
+    separators = (",", ":") if compact else None
+    indent = None if compact else 2
+    expected = json.dumps(normalise_enums_for_json(data), indent=indent, separators=separators) + "\n"
+    assert output_path.read_text(encoding="utf-8") == expected
+    assert '"None"' in expected
+    assert '"True"' in expected
+
+
+def test_manifest_builder_writes_compact_manifest(tmp_path: Path) -> None:
+    builder = ManifestBuilder(tmp_path, tool_versions={"pyright": "1.1.0"})
+    builder.add_run(_make_run(tmp_path))
+    output_path = tmp_path / "typing_audit.json"
+
+    builder.write(output_path, compact=True)
+
+    text = output_path.read_text(encoding="utf-8")
+    assert text.count("\n") == 1
+    assert json.loads(text) == normalise_enums_for_json(builder.data)
+    assert '"mode":"current"' in text
+
+
 def test_manifest_builder_includes_engine_error_details(tmp_path: Path) -> None:
     builder = ManifestBuilder(tmp_path)
     builder.add_run(_make_run(tmp_path))
@@ -90,3 +164,27 @@ def test_manifest_builder_includes_engine_error_details(tmp_path: Path) -> None:
     assert engine_err["message"] == "crash"
     assert engine_err["stderr"] == "oops"
     assert engine_err["exitCode"] == 2
+
+
+def test_manifest_builder_emits_raw_payloads_only_for_full_retention(tmp_path: Path) -> None:
+    run = _make_run(tmp_path)
+    run.diagnostics[0] = Diagnostic(
+        tool=ToolName("pyright"),
+        severity=SeverityLevel.ERROR,
+        path=tmp_path / "pkg" / "app.py",
+        line=1,
+        column=1,
+        code="E",
+        message="boom",
+        raw={"range": {"end": {"line": 0, "character": 4}}},
+    )
+
+    default_builder = ManifestBuilder(tmp_path)
+    default_builder.add_run(run)
+    full_builder = ManifestBuilder(tmp_path, raw_retention=RawRetention.FULL)
+    full_builder.add_run(run)
+
+    default_diag = default_builder.data["runs"][0]["perFile"][0]["diagnostics"][0]
+    full_diag = full_builder.data["runs"][0]["perFile"][0]["diagnostics"][0]
+    assert "raw" not in default_diag
+    assert full_diag.get("raw") == {"range": {"end": {"line": 0, "character": 4}}}
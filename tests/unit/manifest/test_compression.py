@@ -0,0 +1,123 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for compressed manifest output and loading."""
+
+from __future__ import annotations
+
+import gzip
+import importlib.util
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ratchetr.core.model_types import ManifestCompression
+from ratchetr.dashboard import load_manifest as load_dashboard_manifest
+from ratchetr.json import normalise_enums_for_json
+from ratchetr.manifest.builder import ManifestBuilder
+from ratchetr.manifest.compression import (
+    ManifestCompressionUnavailableError,
+    compression_for_path,
+    detect_compression,
+)
+from ratchetr.ratchet.io import load_manifest as load_ratchet_manifest
+from ratchetr.services.manifest import load_manifest_json
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.unit
+
+HAS_ZSTANDARD = importlib.util.find_spec("zstandard") is not None
+
+
+def _builder(tmp_path: Path) -> ManifestBuilder:
+    builder = ManifestBuilder(tmp_path, tool_versions={})
+    builder.data["runs"] = []
+    return builder
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("typing_audit.json", ManifestCompression.NONE),
+        ("typing_audit.json.gz", ManifestCompression.GZIP),
+        ("typing_audit.json.zst", ManifestCompression.ZSTD),
+        ("typing_audit.JSON.ZSTD", ManifestCompression.ZSTD),
+    ],
+)
+def test_compression_for_path_uses_extension(tmp_path: Path, name: str, expected: ManifestCompression) -> None:
+    assert compression_for_path(tmp_path / name) is expected
+
+
+def test_gzip_manifest_round_trips_through_every_loader(tmp_path: Path) -> None:
+    # Arrange
+    builder = _builder(tmp_path)
+    output_path = tmp_path / "typing_audit.json.gz"
+
+    # Act
+    builder.write(output_path)
+
+    # Assert
+    expected = normalise_enums_for_json(builder.data)
+    assert detect_compression(output_path) is ManifestCompression.GZIP
+    assert gzip.decompress(output_path.read_bytes()).decode("utf-8").endswith("}\n")
+    assert load_manifest_json(output_path) == expected
+    assert load_dashboard_manifest(output_path) == expected
+    assert load_ratchet_manifest(output_path) == expected
+    assert [path.name for path in tmp_path.glob(".typing_audit.json.gz.*")] == [".typing_audit.json.gz.stamp"]
+
+
+def test_explicit_compression_overrides_extension(tmp_path: Path) -> None:
+    builder = _builder(tmp_path)
+    output_path = tmp_path / "typing_audit.json"
+
+    builder.write(output_path, compression=ManifestCompression.GZIP)
+
+    assert output_path.read_bytes()[:2] == b"\x1f\x8b"
+    assert load_manifest_json(output_path) == normalise_enums_for_json(builder.data)
+
+
+def test_gzip_output_is_deterministic(tmp_path: Path) -> None:
+    builder = _builder(tmp_path)
+    first = tmp_path / "a.json.gz"
+    second = tmp_path / "b.json.gz"
+
+    builder.write(first)
+    builder.write(second)
+
+    assert first.read_bytes() == second.read_bytes()
+
+
+@pytest.mark.skipif(not HAS_ZSTANDARD, reason="zstandard is not installed")
+def test_zstd_manifest_round_trips(tmp_path: Path) -> None:
+    builder = _builder(tmp_path)
+    output_path = tmp_path / "typing_audit.json.zst"
+
+    builder.write(output_path)
+
+    assert detect_compression(output_path) is ManifestCompression.ZSTD
+    assert load_ratchet_manifest(output_path) == normalise_enums_for_json(builder.data)
+
+
+@pytest.mark.skipif(HAS_ZSTANDARD, reason="zstandard is installed")
+def test_zstd_manifest_requires_zstandard(tmp_path: Path) -> None:
+    builder = _builder(tmp_path)
+    output_path = tmp_path / "typing_audit.json.zst"
+
+    with pytest.raises(ManifestCompressionUnavailableError, match="zstandard"):
+        builder.write(output_path)
+
+    assert not output_path.exists()
+    assert list(tmp_path.iterdir()) == []
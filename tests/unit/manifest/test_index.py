@@ -0,0 +1,129 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the manifest offset index."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ratchetr.core.model_types import Mode
+from ratchetr.core.type_aliases import RunId
+from ratchetr.dashboard import build_summary, build_summary_from_index, load_manifest
+from ratchetr.manifest.builder import ManifestBuilder
+from ratchetr.manifest.index import ManifestIndex, index_path_for
+from ratchetr.ratchet.io import load_manifest as load_ratchet_manifest
+from tests.fixtures.builders import build_sample_run
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.unit
+
+
+def _write_manifest(tmp_path: Path, name: str = "typing_audit.json") -> Path:
+    builder = ManifestBuilder(tmp_path, tool_versions={})
+    current = build_sample_run(num_files=6, diagnostics_per_file=4)
+    builder.add_run(current)
+    builder.add_run(replace(current, mode=Mode.FULL))
+    # Non-ASCII text shifts byte offsets away from character offsets.
+    builder.data["runs"][0]["perFile"][0]["diagnostics"][0]["message"] = "caf\u00e9 \U0001f40d"
+    output_path = tmp_path / name
+    _ = output_path.write_text(json.dumps(builder.data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return output_path
+
+
+def test_index_summary_matches_full_summary(tmp_path: Path) -> None:
+    # Arrange
+    manifest_path = _write_manifest(tmp_path)
+
+    # Act
+    index = ManifestIndex.open(manifest_path)
+
+    # Assert
+    assert index is not None
+    assert [run.run_id for run in index.runs] == ["pyright:current", "pyright:full"]
+    assert build_summary_from_index(index) == build_summary(load_manifest(manifest_path))
+    assert index_path_for(manifest_path).exists()
+
+
+def test_index_reads_individual_runs_and_files(tmp_path: Path) -> None:
+    manifest_path = _write_manifest(tmp_path)
+    full = json.loads(manifest_path.read_text(encoding="utf-8"))
+    index = ManifestIndex.open(manifest_path)
+    assert index is not None
+    run = index.runs[0]
+
+    header = index.read_run(run, per_file=False)
+    entry = index.read_file(run, "pkg/module_0.py")
+
+    assert "perFile" not in header
+    assert header["summary"] == full["runs"][0]["summary"]
+    assert index.read_run(run) == full["runs"][0]
+    assert entry == full["runs"][0]["perFile"][0]
+    assert index.read_file(run, "missing.py") is None
+    assert index.files_for_rule("reportUnknown1")[:2] == [
+        (RunId("pyright:current"), "pkg/module_0.py", 1),
+        (RunId("pyright:current"), "pkg/module_1.py", 1),
+    ]
+
+
+def test_index_is_cached_and_rebuilt_when_manifest_changes(tmp_path: Path) -> None:
+    # Arrange
+    manifest_path = _write_manifest(tmp_path)
+    first = ManifestIndex.open(manifest_path)
+    assert first is not None
+    index_path = index_path_for(manifest_path)
+    cached = json.loads(index_path.read_text(encoding="utf-8"))
+    cached["metadata"]["projectRoot"] = "from-cache"
+    _ = index_path.write_text(json.dumps(cached), encoding="utf-8")
+
+    # Act
+    reused = ManifestIndex.open(manifest_path)
+    payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+    payload["runs"] = payload["runs"][:1]
+    _ = manifest_path.write_text(json.dumps(payload), encoding="utf-8")
+    rebuilt = ManifestIndex.open(manifest_path)
+
+    # Assert
+    assert reused is not None
+    assert reused.metadata["projectRoot"] == "from-cache"
+    assert rebuilt is not None
+    assert len(rebuilt.runs) == 1
+    assert rebuilt.metadata["projectRoot"] == str(tmp_path)
+
+
+def test_ratchet_loader_reads_only_selected_runs(tmp_path: Path) -> None:
+    manifest_path = _write_manifest(tmp_path)
+
+    manifest = load_ratchet_manifest(manifest_path, runs=[RunId("pyright:full")])
+
+    assert [run["mode"] for run in manifest["runs"]] == ["full"]
+
+
+def test_index_unavailable_for_compressed_or_malformed_manifests(tmp_path: Path) -> None:
+    builder = ManifestBuilder(tmp_path, tool_versions={})
+    builder.add_run(build_sample_run(num_files=2, diagnostics_per_file=1))
+    compressed = tmp_path / "typing_audit.json.gz"
+    builder.write(compressed)
+    malformed = tmp_path / "broken.json"
+    _ = malformed.write_text('{"runs": [1, 2]}', encoding="utf-8")
+
+    assert ManifestIndex.open(compressed) is None
+    assert ManifestIndex.open(malformed) is None
+    assert not index_path_for(malformed).exists()
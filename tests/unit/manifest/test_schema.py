@@ -43,7 +43,7 @@ pytestmark = pytest.mark.unit
 
 
 def _patch_engine_resolution(monkeypatch: pytest.MonkeyPatch, engine: RecordingEngine) -> None:
-    def _resolve(_: Sequence[str]) -> list[RecordingEngine]:
+    def _resolve(_: Sequence[str], **_kwargs: object) -> list[RecordingEngine]:
         return [engine]
 
     monkeypatch.setattr("ratchetr.engines.resolve_engines", _resolve)
@@ -0,0 +1,89 @@
+# Copyright 2025 CrownOps Engineering
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for manifest write stamps and validation levels."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ratchetr.core.model_types import ManifestValidation
+from ratchetr.dashboard import load_manifest
+from ratchetr.manifest import loader as manifest_loader
+from ratchetr.manifest.builder import ManifestBuilder
+from ratchetr.manifest.trust import is_trusted_manifest, needs_validation, stamp_path_for
+from ratchetr.ratchet.io import load_manifest as load_ratchet_manifest
+from tests.fixtures.builders import build_sample_run
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.unit
+
+
+def _write_manifest(tmp_path: Path) -> Path:
+    builder = ManifestBuilder(tmp_path, tool_versions={})
+    builder.add_run(build_sample_run(num_files=3, diagnostics_per_file=2))
+    output_path = tmp_path / "typing_audit.json"
+    builder.write(output_path)
+    return output_path
+
+
+def _fail_validation(_raw: object) -> object:
+    msg = "manifest should not have been validated"
+    raise AssertionError(msg)
+
+
+def test_builder_stamps_written_manifest(tmp_path: Path) -> None:
+    manifest_path = _write_manifest(tmp_path)
+
+    assert stamp_path_for(manifest_path).exists()
+    assert is_trusted_manifest(manifest_path)
+    assert not needs_validation(manifest_path, ManifestValidation.FAST)
+    assert needs_validation(manifest_path, ManifestValidation.FULL)
+
+
+def test_edited_or_unstamped_manifest_is_not_trusted(tmp_path: Path) -> None:
+    manifest_path = _write_manifest(tmp_path)
+    payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+    payload["projectRoot"] = "elsewhere"
+    _ = manifest_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+    assert not is_trusted_manifest(manifest_path)
+
+    stamp_path_for(manifest_path).unlink()
+
+    assert not is_trusted_manifest(manifest_path)
+    assert needs_validation(manifest_path, ManifestValidation.FAST)
+    assert not needs_validation(manifest_path, ManifestValidation.OFF)
+
+
+def test_fast_validation_skips_trusted_manifests(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    manifest_path = _write_manifest(tmp_path)
+    expected = json.loads(manifest_path.read_text(encoding="utf-8"))
+    monkeypatch.setattr(manifest_loader, "validate_manifest_payload", _fail_validation)
+
+    assert load_manifest(manifest_path) == expected
+    assert load_ratchet_manifest(manifest_path) == expected
+    with pytest.raises(AssertionError, match="should not have been validated"):
+        _ = load_manifest(manifest_path, validation=ManifestValidation.FULL)
+
+
+def test_manifest_validation_from_str() -> None:
+    assert ManifestValidation.from_str(" Fast ") is ManifestValidation.FAST
+    with pytest.raises(ValueError, match="Unknown manifest validation"):
+        _ = ManifestValidation.from_str("sometimes")
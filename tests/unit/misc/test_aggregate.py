@@ -22,7 +22,7 @@ import pytest
 
 from ratchetr.core.model_types import Mode, SeverityLevel
 from ratchetr.core.type_aliases import ToolName
-from ratchetr.core.types import Diagnostic, RunResult
+from ratchetr.core.types import Diagnostic, DiagnosticTable, RunResult
 from ratchetr.manifest.aggregate import summarise_run
 
 pytestmark = pytest.mark.unit
@@ -66,7 +66,7 @@ def test_summarise_run_typed_output() -> None:
         command=["pyright"],
         exit_code=0,
         duration_ms=10.0,
-        diagnostics=diagnostics,
+        diagnostics=DiagnosticTable(diagnostics),
     )
 
     aggregated = summarise_run(run, max_depth=2)
@@ -82,3 +82,25 @@ def test_summarise_run_typed_output() -> None:
     assert any(entry["path"] == "pkg" for entry in aggregated["perFolder"])
     file_entry = aggregated["perFile"][0]
     assert file_entry["diagnostics"][0]["message"].endswith("message")
+
+
+def test_summarise_run_accepts_plain_diagnostic_list() -> None:
+    diagnostics = [
+        make_diag("pkg/module.py", severity=SeverityLevel.ERROR, code="reportGeneralTypeIssues"),
+        make_diag("pkg/module.py", severity=SeverityLevel.WARNING, line=2),
+    ]
+    run = RunResult(
+        tool=PYRIGHT_TOOL,
+        mode=Mode.FULL,
+        command=["pyright"],
+        exit_code=1,
+        duration_ms=10.0,
+        diagnostics=diagnostics,
+    )
+
+    aggregated = summarise_run(run, max_depth=2)
+
+    assert isinstance(run.diagnostics, DiagnosticTable)
+    assert list(run.diagnostics) == diagnostics
+    assert aggregated["summary"]["errors"] == 1
+    assert aggregated["summary"]["warnings"] == 1
@@ -36,3 +36,29 @@ def test_internal_dir_and_invalid_attribute() -> None:
     assert "cache" in listing
     with pytest.raises(AttributeError, match="has no attribute 'not_real'"):
         _ = internal.not_real
+
+
+@pytest.mark.parametrize(
+    ("package", "name", "module", "attribute"),
+    [
+        ("ratchetr", "ratchet_build", "ratchetr.ratchet", "build_ratchet_from_manifest"),
+        ("ratchetr.engines", "resolve_engines", "ratchetr.engines.registry", "resolve_engines"),
+        ("ratchetr.manifest", "ManifestModel", "ratchetr.manifest.models", "ManifestModel"),
+        ("ratchetr.runtime", "JSONValue", "ratchetr.json", "JSONValue"),
+    ],
+)
+def test_lazy_exports_resolve_and_bind_on_first_access(package: str, name: str, module: str, attribute: str) -> None:
+    package_module = importlib.import_module(package)
+
+    value = getattr(package_module, name)
+
+    assert value is getattr(importlib.import_module(module), attribute)
+    assert vars(package_module)[name] is value
+    assert name in dir(package_module)
+
+
+def test_lazy_exports_reject_unknown_names() -> None:
+    package_module = importlib.import_module("ratchetr")
+
+    with pytest.raises(AttributeError, match="module 'ratchetr' has no attribute 'not_real'"):
+        _ = package_module.not_real
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -27,7 +28,8 @@ from ratchetr.core.model_types import Mode, SeverityLevel
 from ratchetr.engines.execution import run_pyright
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Callable, Mapping, Sequence
+    from typing import IO
 
 pytestmark = pytest.mark.unit
 
@@ -42,26 +44,28 @@ def _command_output(payload: Mapping[str, object], *, exit_code: int = 1) -> Com
     )
 
 
-def _patch_run_command(
+def _patch_stream_command(
     monkeypatch: pytest.MonkeyPatch,
     payload: Mapping[str, object],
     *,
     exit_code: int = 1,
 ) -> None:
-    def _run_command(
+    def _stream_command(
         args: Sequence[str],
         cwd: Path | None = None,
         *,
         allowed: set[str] | None = None,
-    ) -> CommandOutput:
+        consumer: Callable[[IO[str]], object],
+    ) -> tuple[CommandOutput, object]:
         assert args
         if cwd is not None:
             assert isinstance(cwd, Path)
         if allowed is not None:
             assert isinstance(allowed, set)
-        return _command_output(payload, exit_code=exit_code)
+        output = _command_output(payload, exit_code=exit_code)
+        return output, consumer(io.StringIO(output.stdout))
 
-    monkeypatch.setattr("ratchetr.engines.execution.run_command", _run_command)
+    monkeypatch.setattr("ratchetr.engines.execution.stream_command", _stream_command)
 
 
 def test_run_pyright_records_tool_summary(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -80,7 +84,7 @@ def test_run_pyright_records_tool_summary(tmp_path: Path, monkeypatch: pytest.Mo
     }
     (tmp_path / "pkg").mkdir(parents=True, exist_ok=True)
     consume((tmp_path / "pkg" / "module.py").write_text("x = 1\n", encoding="utf-8"))
-    _patch_run_command(monkeypatch, payload)
+    _patch_stream_command(monkeypatch, payload)
 
     result = run_pyright(tmp_path, mode=Mode.FULL, command=["pyright", "--outputjson"])
 
@@ -112,7 +116,7 @@ def test_run_pyright_logs_mismatch(
     }
     (tmp_path / "pkg").mkdir(parents=True, exist_ok=True)
     consume((tmp_path / "pkg" / "module.py").write_text("x = 1\n", encoding="utf-8"))
-    _patch_run_command(monkeypatch, payload)
+    _patch_stream_command(monkeypatch, payload)
     warnings: list[str] = []
 
     def fake_warning(message: str, *args: object, **kwargs: object) -> None:
@@ -27,13 +27,14 @@ from ratchetr.core.model_types import (
     HotspotKind,
     LogFormat,
     Mode,
+    RawRetention,
     ReadinessLevel,
     SeverityLevel,
     SignaturePolicy,
     SummaryStyle,
 )
 from ratchetr.core.type_aliases import ToolName
-from ratchetr.core.types import Diagnostic, RunResult
+from ratchetr.core.types import NO_RAW, Diagnostic, DiagnosticTable, RunResult, apply_raw_retention, retain_raw
 
 pytestmark = pytest.mark.unit
 
@@ -65,7 +66,7 @@ def test_run_result_severity_counts() -> None:
         command=["stub"],
         exit_code=0,
         duration_ms=0.1,
-        diagnostics=diagnostics,
+        diagnostics=DiagnosticTable(diagnostics),
     )
     counts = result.severity_counts()
     assert counts[SeverityLevel.ERROR] == 1
@@ -73,6 +74,89 @@ def test_run_result_severity_counts() -> None:
     assert counts[SeverityLevel.INFORMATION] == 1
 
 
+def test_diagnostic_table_round_trips_and_supports_list_operations() -> None:
+    first = _make_diag("code", SeverityLevel.ERROR)
+    second = Diagnostic(
+        tool=STUB_TOOL,
+        severity=SeverityLevel.WARNING,
+        path=Path("pkg/other.py"),
+        line=3,
+        column=7,
+        code=None,
+        message="other",
+        raw={"hint": "x"},
+    )
+    table = DiagnosticTable([first, second])
+
+    assert table == [first, second]
+    assert table[-1] == second
+    assert table[1:] == [second]
+    assert table.paths == (Path("example.py"), Path("pkg/other.py"))
+
+    table[0] = second
+    table.insert(0, first)
+    del table[1]
+    assert list(table) == [first, second]
+    assert list(table.records())[1] == (Path("pkg/other.py"), 3, 7, SeverityLevel.WARNING, None, "other", {"hint": "x"})
+
+
+def test_diagnostic_table_group_by_counts() -> None:
+    rows = [
+        Diagnostic(
+            tool=STUB_TOOL,
+            severity=SeverityLevel.ERROR if index % 2 else SeverityLevel.WARNING,
+            path=Path(f"pkg/sub{index % 2}/mod.py"),
+            line=index,
+            column=1,
+            code="rule-a" if index % 3 else None,
+            message="msg",
+        )
+        for index in range(6)
+    ]
+    table = DiagnosticTable(rows)
+
+    assert table.severity_counts() == {SeverityLevel.ERROR: 3, SeverityLevel.WARNING: 3}
+    assert table.counts_by_rule() == {None: 2, "rule-a": 4}
+    assert table.counts_by_path() == {Path("pkg/sub0/mod.py"): 3, Path("pkg/sub1/mod.py"): 3}
+    assert table.counts_by_folder(1) == {"pkg": 6}
+    assert table.counts_by_folder(2) == {"pkg/sub0": 3, "pkg/sub1": 3}
+    assert table.severity_counts_by_path()[Path("pkg/sub1/mod.py")] == {SeverityLevel.ERROR: 3}
+    assert table.rule_counts_by_path()[Path("pkg/sub0/mod.py")] == {None: 1, "rule-a": 2}
+    grouped = table.rows_by_path()
+    assert list(grouped) == [Path("pkg/sub0/mod.py"), Path("pkg/sub1/mod.py")]
+    assert [row[0] for row in grouped[Path("pkg/sub1/mod.py")]] == [1, 3, 5]
+    assert grouped[Path("pkg/sub0/mod.py")][0] == (0, 1, SeverityLevel.WARNING, None, "msg", {})
+
+
+def test_retain_raw_applies_policy() -> None:
+    raw = {"file": "a.py", "message": "boom", "severity": "error", "range": {"end": {"line": 3}}}
+
+    assert retain_raw(raw, RawRetention.FULL) is raw
+    assert retain_raw(raw, RawRetention.NONE) is NO_RAW
+    assert retain_raw(raw, RawRetention.MINIMAL) == {"range": {"end": {"line": 3}}}
+    assert retain_raw({"message": "only"}, RawRetention.MINIMAL) is NO_RAW
+
+
+def test_apply_raw_retention_reuses_untouched_diagnostics() -> None:
+    plain = _make_diag("code", SeverityLevel.ERROR)
+    rich = Diagnostic(
+        tool=STUB_TOOL,
+        severity=SeverityLevel.ERROR,
+        path=Path("example.py"),
+        line=1,
+        column=1,
+        code="code",
+        message="msg",
+        raw={"message": "msg", "hint": "try this"},
+    )
+
+    trimmed = apply_raw_retention([plain, rich], RawRetention.MINIMAL)
+
+    assert trimmed[0] is plain
+    assert trimmed[1].raw == {"hint": "try this"}
+    assert not apply_raw_retention([rich], RawRetention.NONE)[0].raw
+
+
 def test_model_type_from_str_helpers() -> None:
     assert LogFormat.from_str(" JSON ") is LogFormat.JSON
     assert DataFormat.from_str("table") is DataFormat.TABLE
@@ -82,6 +166,7 @@ def test_model_type_from_str_helpers() -> None:
     assert SummaryStyle.from_str("full") is SummaryStyle.FULL
     assert SignaturePolicy.from_str(" Warn ") is SignaturePolicy.WARN
     assert FailOnPolicy.from_str("ANY") is FailOnPolicy.ANY
+    assert RawRetention.from_str(" Full ") is RawRetention.FULL
 
     with pytest.raises(ValueError, match="Unknown log format"):
         _ = LogFormat.from_str("binary")
@@ -24,10 +24,18 @@ import pytest
 from ratchetr.services import manifest as manifest_service
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
     from types import ModuleType
 
 
+@pytest.fixture(autouse=True)
+def _clear_schema_validator_cache() -> Iterator[None]:
+    manifest_service._schema_validator.cache_clear()
+    yield
+    manifest_service._schema_validator.cache_clear()
+
+
 def _write_manifest(path: Path, payload: dict[str, object]) -> None:
     path.write_text(json.dumps(payload), encoding="utf-8")
 
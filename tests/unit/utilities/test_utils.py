@@ -16,9 +16,13 @@
 
 from __future__ import annotations
 
+import io
+import json
 import logging
 import math
+import os
 import sys
+import threading
 from typing import TYPE_CHECKING, cast
 
 import pytest
@@ -31,13 +35,24 @@ from ratchetr._internal.utils import (
     file_lock,
     resolve_project_root,
     run_command,
+    stream_command,
 )
 from ratchetr._internal.utils import locks as locks_mod
 from ratchetr._internal.utils import versions as versions_mod
 from ratchetr.core.model_types import ReadinessStatus, SeverityLevel
-from ratchetr.json import as_int, as_list, as_mapping, as_str, normalise_enums_for_json, require_json
+from ratchetr.json import (
+    JSONValue,
+    as_int,
+    as_list,
+    as_mapping,
+    as_str,
+    normalise_enums_for_json,
+    require_json,
+    stream_json_object,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
 pytestmark = pytest.mark.unit
@@ -155,6 +170,42 @@ def test_require_json_uses_fallback_payload() -> None:
     assert data == {"ok": 1}
 
 
+def test_stream_json_object_streams_array_members_across_chunk_boundaries() -> None:
+    items = [{"n": index, "text": "x" * index} for index in range(25)]
+    payload = json.dumps({"version": "1.2.30", "items": items, "summary": {"count": 1234567}}, indent=1)
+    seen: list[JSONValue] = []
+
+    members = stream_json_object(io.StringIO(payload), array_handlers={"items": seen.append}, chunk_size=7)
+
+    assert seen == items
+    assert members == {"version": "1.2.30", "summary": {"count": 1234567}}
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 12))
+def test_stream_json_object_decodes_every_token_type_split_across_chunks(chunk_size: int) -> None:
+    payload = (
+        '{"int": 1234, "neg": -56, "float": 1.25, "exp": 1e5, "neg_exp": -2.5E-3, "zero": 0,'
+        ' "str": "caf\\u00e9 \\"q\\"", "true": true, "false": false, "null": null,'
+        ' "nested": {"a": [1, 2.0, "x"]}, "items": [10, 2.5e1, true, null, "s", [3], {"k": 4}]}'
+    )
+    expected = json.loads(payload)
+    seen: list[JSONValue] = []
+
+    members = stream_json_object(io.StringIO(payload), array_handlers={"items": seen.append}, chunk_size=chunk_size)
+
+    assert seen == expected.pop("items")
+    assert members == expected
+
+
+def test_stream_json_object_handles_empty_and_invalid_streams() -> None:
+    assert stream_json_object(io.StringIO("  \n"), array_handlers={}) is None
+    assert stream_json_object(io.StringIO('{"items": []}'), array_handlers={"items": list.append}) == {}
+    with pytest.raises(ValueError, match=r".*"):
+        _ = stream_json_object(io.StringIO('{"items": [1, 2'), array_handlers={"items": lambda _: None})
+    with pytest.raises(ValueError, match="trailing"):
+        _ = stream_json_object(io.StringIO("{} {}"), array_handlers={})
+
+
 def test_json_cast_helpers_handle_defaults() -> None:
     assert as_mapping({"a": 1}) == {"a": 1}
     assert as_list([1, 2]) == [1, 2]
@@ -234,6 +285,19 @@ def test_run_command_requires_arguments() -> None:
         _ = run_command([""])
 
 
+def test_stream_command_feeds_stdout_to_consumer_and_captures_stderr() -> None:
+    script = "import sys; print('a'); print('b'); print('c'); sys.stderr.write('oops'); sys.exit(3)"
+
+    output, first_line = stream_command([sys.executable, "-c", script], consumer=lambda stream: stream.readline())
+
+    assert first_line.strip() == "a"
+    assert not output.stdout
+    assert output.stderr == "oops"
+    assert output.exit_code == 3
+    with pytest.raises(ValueError, match=r".*"):
+        _ = stream_command([sys.executable, "-c", "pass"], allowed={"python"}, consumer=lambda stream: stream.read())
+
+
 def test_run_command_logs_warning_on_failure(caplog: pytest.LogCaptureFixture) -> None:
     caplog.set_level(logging.WARNING, logger="ratchetr.internal.process")
     result = run_command([sys.executable, "-c", "import sys; sys.exit(1)"])
@@ -241,6 +305,13 @@ def test_run_command_logs_warning_on_failure(caplog: pytest.LogCaptureFixture) -
     assert any("Command failed" in record.message for record in caplog.records)
 
 
+@pytest.fixture(autouse=True)
+def _fresh_tool_version_cache() -> Iterator[None]:
+    versions_mod.clear_tool_version_cache()
+    yield
+    versions_mod.clear_tool_version_cache()
+
+
 def test_detect_tool_versions_parses_outputs(monkeypatch: pytest.MonkeyPatch) -> None:
     def _fake_run_command(args: list[str], **_: object) -> CommandOutput:
         payload = "pyright 1.2.3" if args[0] == "pyright" else "mypy 1.5.0"
@@ -263,3 +334,62 @@ def test_detect_tool_versions_swallows_failures(monkeypatch: pytest.MonkeyPatch)
 
     versions = detect_tool_versions(["pyright"])
     assert versions == {}
+
+
+def _counting_run_command(calls: list[list[str]]) -> Callable[..., CommandOutput]:
+    def _run(args: list[str], **_: object) -> CommandOutput:
+        calls.append(args)
+        return CommandOutput(args=args, stdout="mypy 1.5.0 (compiled: yes)", stderr="", exit_code=0, duration_ms=0.1)
+
+    return _run
+
+
+def test_detect_tool_versions_memoises_per_process(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    interpreter = tmp_path / "python"
+    _ = interpreter.write_text("", encoding="utf-8")
+    calls: list[list[str]] = []
+    monkeypatch.setattr(versions_mod, "run_command", _counting_run_command(calls))
+    monkeypatch.setattr(versions_mod, "python_executable", lambda: str(interpreter))
+
+    assert detect_tool_versions(["mypy"]) == {"mypy": "1.5.0"}
+    assert detect_tool_versions(["mypy"]) == {"mypy": "1.5.0"}
+    assert len(calls) == 1
+
+    os.utime(interpreter, ns=(0, 0))
+    assert detect_tool_versions(["mypy"]) == {"mypy": "1.5.0"}
+    assert len(calls) == 2
+
+
+def test_detect_tool_versions_reuses_disk_cache_within_ttl(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    interpreter = tmp_path / "python"
+    _ = interpreter.write_text("", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    calls: list[list[str]] = []
+    monkeypatch.setattr(versions_mod, "run_command", _counting_run_command(calls))
+    monkeypatch.setattr(versions_mod, "python_executable", lambda: str(interpreter))
+
+    assert detect_tool_versions(["mypy"], cache_dir=cache_dir) == {"mypy": "1.5.0"}
+    assert (cache_dir / versions_mod.TOOL_VERSIONS_FILENAME).exists()
+
+    versions_mod.clear_tool_version_cache()
+    assert detect_tool_versions(["mypy"], cache_dir=cache_dir) == {"mypy": "1.5.0"}
+    assert len(calls) == 1
+
+    versions_mod.clear_tool_version_cache()
+    assert detect_tool_versions(["mypy"], cache_dir=cache_dir, ttl_seconds=-1) == {"mypy": "1.5.0"}
+    assert len(calls) == 2
+
+
+def test_detect_tool_versions_probes_tools_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    threads: set[str] = set()
+
+    def _fake_run_command(args: list[str], **_: object) -> CommandOutput:
+        threads.add(threading.current_thread().name)
+        payload = "pyright 1.2.3" if args[0] == "pyright" else "mypy 1.5.0"
+        return CommandOutput(args=args, stdout=payload, stderr="", exit_code=0, duration_ms=0.1)
+
+    monkeypatch.setattr(versions_mod, "run_command", _fake_run_command)
+
+    assert detect_tool_versions(["pyright", "mypy"]) == {"pyright": "1.2.3", "mypy": "1.5.0"}
+    assert threads
+    assert all(name.startswith("ratchetr-version") for name in threads)